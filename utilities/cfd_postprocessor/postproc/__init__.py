@@ -0,0 +1,20 @@
+"""
+Paquete postproc: post-proceso de casos OpenFOAM de tuberías y codos.
+
+Reemplaza las copias de post_pipe20m.py que había en cada caso. Lee los
+parámetros del propio caso y compara Δp/f de CFD con Darcy–Weisbach usando
+el motor de correlaciones de losses_calculator.
+
+Expuesto:
+- evaluate_cases
+- read_case_parameters
+- load_time_history
+"""
+
+from .analysis import evaluate_cases
+from .case_params import read_case_parameters
+from .timeseries import load_time_history
+
+__all__ = ["evaluate_cases", "read_case_parameters", "load_time_history"]
+
+__version__ = "0.1.0"
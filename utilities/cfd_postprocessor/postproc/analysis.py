@@ -0,0 +1,269 @@
+"""
+Comparación CFD vs teoría Darcy–Weisbach para uno o muchos casos.
+
+evaluate_cases lee los parámetros y los resultados de postProcessing de
+cada caso y luego calcula la teoría de todos juntos en una sola llamada
+vectorizada. Un caso que no se puede leer queda con `error` en vez de
+detener el resto.
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .case_params import CaseParameters, read_case_parameters
+from .convergence import (
+    REL_DRIFT_TOL_DEFAULT,
+    REL_STD_TOL_DEFAULT,
+    WINDOW_DEFAULT,
+    analyze_convergence,
+    difference_history,
+    request_solver_stop,
+)
+from .theory import CorrelationMethod, darcy_weisbach_dp_array
+from .timeseries import (
+    SURFACE_FIELD_VALUE_PREFIX,
+    find_function_dir,
+    read_last_time_rows,
+)
+
+PRESSURE_PREFIXES = ("p", SURFACE_FIELD_VALUE_PREFIX)
+FLOW_RATE_PREFIXES = ("flowRate", SURFACE_FIELD_VALUE_PREFIX)
+
+
+@dataclass
+class CaseResult:
+    """Resultado de un caso: parámetros, CFD (cola de postProcessing) y teoría."""
+
+    params: Optional[CaseParameters]
+    case_dir: Path
+    # CFD (None si el caso no tiene postProcessing)
+    t_end: Optional[float] = None
+    dp_last_pa: Optional[float] = None
+    dp_mean_pa: Optional[float] = None
+    Q_last_m3s: Optional[float] = None
+    Q_mean_m3s: Optional[float] = None
+    dp_convergence: Dict[str, Any] = field(default_factory=dict)
+    Q_convergence: Dict[str, Any] = field(default_factory=dict)
+    # Teoría y comparación
+    Q_used_m3s: Optional[float] = None
+    U_m_s: Optional[float] = None
+    Re: Optional[float] = None
+    f_theory: Optional[float] = None
+    dp_theory_pa: Optional[float] = None
+    f_cfd: Optional[float] = None
+    error_dp_pct: Optional[float] = None
+    error_f_pct: Optional[float] = None
+    error: str = ""
+
+    @property
+    def name(self) -> str:
+        return self.case_dir.name
+
+    @property
+    def steady(self) -> Optional[bool]:
+        if not self.dp_convergence or not self.Q_convergence:
+            return None
+        return bool(self.dp_convergence["steady"] and self.Q_convergence["steady"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict plano apto para JSON."""
+        p = self.params
+        return {
+            "case": self.name,
+            "case_dir": str(self.case_dir),
+            "L_m": p.L_m if p else None,
+            "D_m": p.D_m if p else None,
+            "nu_m2s": p.nu_m2s if p else None,
+            "rho_kgm3": p.rho_kgm3 if p else None,
+            "roughness_m": p.roughness_m if p else None,
+            "U_inlet_ms": p.U_inlet_ms if p else None,
+            "t_end": self.t_end,
+            "dp_last_pa": self.dp_last_pa,
+            "dp_mean_pa": self.dp_mean_pa,
+            "Q_last_m3s": self.Q_last_m3s,
+            "Q_mean_m3s": self.Q_mean_m3s,
+            "steady": self.steady,
+            "dp_convergence": self.dp_convergence,
+            "Q_convergence": self.Q_convergence,
+            "Q_used_m3s": self.Q_used_m3s,
+            "U_m_s": self.U_m_s,
+            "Re": self.Re,
+            "f_theory": self.f_theory,
+            "dp_theory_pa": self.dp_theory_pa,
+            "f_cfd": self.f_cfd,
+            "error_dp_pct": self.error_dp_pct,
+            "error_f_pct": self.error_f_pct,
+            "sources": p.sources if p else {},
+            "error": self.error,
+        }
+
+
+def read_tail_histories(params: CaseParameters, n: int) -> Dict[str, np.ndarray]:
+    """
+    Últimas n filas [t, valor] de Δp (en Pa) y Q (en m³/s, positivo) del caso.
+
+    Si p es cinemática (p/rho, solvers incompresibles) se multiplica por rho.
+    """
+    pp_dir = params.pp_dir
+    p_in = read_last_time_rows(find_function_dir(pp_dir, "patchAverage", params.inlet_patch), PRESSURE_PREFIXES, n=n)
+    p_out = read_last_time_rows(find_function_dir(pp_dir, "patchAverage", params.outlet_patch), PRESSURE_PREFIXES, n=n)
+    q_in = read_last_time_rows(find_function_dir(pp_dir, "patchFlowRate", params.inlet_patch), FLOW_RATE_PREFIXES, n=n)
+
+    dp = difference_history(p_in, p_out)
+    if params.p_kinematic:
+        dp[:, 1] *= params.rho_kgm3
+    q = q_in[:, :2].copy()
+    # En el inlet el caudal sale negativo (normal hacia afuera)
+    q[:, 1] = np.abs(q[:, 1])
+    return {"dp": dp, "Q": q}
+
+
+def tail_convergence(
+    params: CaseParameters,
+    window: int = WINDOW_DEFAULT,
+    rel_std_tol: float = REL_STD_TOL_DEFAULT,
+    rel_drift_tol: float = REL_DRIFT_TOL_DEFAULT,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Convergencia de Δp y Q usando sólo la cola de los archivos. Se leen 2
+    ventanas para poder ubicar desde cuándo es estacionario.
+    """
+    hist = read_tail_histories(params, 2 * window)
+    return {
+        "dp": analyze_convergence(hist["dp"], window, rel_std_tol, rel_drift_tol),
+        "Q": analyze_convergence(hist["Q"], window, rel_std_tol, rel_drift_tol),
+        "histories": hist,
+    }
+
+
+def watch_until_steady(
+    params: CaseParameters,
+    window: int = WINDOW_DEFAULT,
+    rel_std_tol: float = REL_STD_TOL_DEFAULT,
+    rel_drift_tol: float = REL_DRIFT_TOL_DEFAULT,
+    poll_s: float = 30.0,
+    stop_solver: bool = False,
+    timeout_s: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Revisa la cola de postProcessing cada poll_s segundos hasta que Δp y Q
+    sean estacionarios (o se agote timeout_s). Con stop_solver=True pide al
+    solver que escriba y termine (request_solver_stop).
+    """
+    t_start = time.monotonic()
+    while True:
+        try:
+            result = tail_convergence(params, window, rel_std_tol, rel_drift_tol)
+        except RuntimeError:
+            result = None  # el solver todavía no escribe postProcessing
+        if result and result["dp"]["steady"] and result["Q"]["steady"]:
+            if stop_solver:
+                request_solver_stop(params.case_dir)
+            return result
+        if timeout_s is not None and time.monotonic() - t_start > timeout_s:
+            return result or {}
+        time.sleep(poll_s)
+
+
+def read_cfd_result(
+    params: CaseParameters,
+    window: int = WINDOW_DEFAULT,
+    rel_std_tol: float = REL_STD_TOL_DEFAULT,
+    rel_drift_tol: float = REL_DRIFT_TOL_DEFAULT,
+) -> CaseResult:
+    """Parte CFD del resultado; sin postProcessing devuelve sólo los parámetros."""
+    result = CaseResult(params=params, case_dir=params.case_dir)
+    if not params.pp_dir.is_dir():
+        return result
+
+    conv = tail_convergence(params, window, rel_std_tol, rel_drift_tol)
+    dp, q = conv["histories"]["dp"], conv["histories"]["Q"]
+    result.t_end = float(dp[-1, 0])
+    result.dp_last_pa = float(dp[-1, 1])
+    result.Q_last_m3s = float(q[-1, 1])
+    result.dp_mean_pa = conv["dp"]["mean"]
+    result.Q_mean_m3s = conv["Q"]["mean"]
+    result.dp_convergence = conv["dp"]
+    result.Q_convergence = conv["Q"]
+    return result
+
+
+def _relative_pct(value: Optional[float], reference: Optional[float]) -> Optional[float]:
+    if value is None or reference is None or reference == 0:
+        return None
+    return (value - reference) / reference * 100.0
+
+
+def evaluate_cases(
+    case_dirs: Sequence[Path],
+    window: int = WINDOW_DEFAULT,
+    rel_std_tol: float = REL_STD_TOL_DEFAULT,
+    rel_drift_tol: float = REL_DRIFT_TOL_DEFAULT,
+    method: CorrelationMethod = "haaland",
+    overrides: Optional[Dict[str, float]] = None,
+) -> List[CaseResult]:
+    """
+    Evalúa todos los casos en el proceso actual.
+
+    1) Parámetros y cola de postProcessing de cada caso.
+    2) Teoría de todos los casos válidos en una sola llamada vectorizada,
+       con el Q medio de la ventana (o U de entrada · área si no hay CFD).
+    """
+    results: List[CaseResult] = []
+    for case_dir in case_dirs:
+        try:
+            params = read_case_parameters(case_dir, overrides)
+            results.append(read_cfd_result(params, window, rel_std_tol, rel_drift_tol))
+        except (RuntimeError, ValueError, OSError, KeyError) as exc:
+            results.append(CaseResult(params=None, case_dir=Path(case_dir), error=str(exc)))
+
+    ready = []
+    for r in results:
+        p = r.params
+        if r.error or p is None:
+            continue
+        missing = [name for name, value in (("L", p.L_m), ("D", p.D_m)) if value is None]
+        if missing:
+            r.error = (
+                f"Sin {'/'.join(missing)}: no se pudo deducir de la malla ni del "
+                f"blockMeshDict (usar {' '.join('--' + m for m in missing)})"
+            )
+            continue
+        if r.Q_mean_m3s is not None:
+            r.Q_used_m3s = r.Q_mean_m3s
+        elif p.U_inlet_ms is not None:
+            r.Q_used_m3s = p.U_inlet_ms * math.pi * p.D_m ** 2 / 4.0
+        else:
+            r.error = "Sin caudal: no hay postProcessing ni U de entrada uniforme"
+            continue
+        ready.append(r)
+
+    if not ready:
+        return results
+
+    theory = darcy_weisbach_dp_array(
+        Q_m3s=[r.Q_used_m3s for r in ready],
+        D_m=[r.params.D_m for r in ready],
+        L_m=[r.params.L_m for r in ready],
+        nu_m2s=[r.params.nu_m2s for r in ready],
+        rho=[r.params.rho_kgm3 for r in ready],
+        roughness_m=[r.params.roughness_m for r in ready],
+        method=method,
+    )
+    for i, r in enumerate(ready):
+        p = r.params
+        r.U_m_s = float(theory["U_m_s"][i])
+        r.Re = float(theory["Re"][i])
+        r.f_theory = float(theory["f_Darcy"][i])
+        r.dp_theory_pa = float(theory["dp_Pa"][i])
+        if r.dp_mean_pa is not None:
+            dynamic = 0.5 * p.rho_kgm3 * r.U_m_s ** 2
+            r.f_cfd = r.dp_mean_pa * p.D_m / (p.L_m * dynamic)
+            r.error_dp_pct = _relative_pct(r.dp_mean_pa, r.dp_theory_pa)
+            r.error_f_pct = _relative_pct(r.f_cfd, r.f_theory)
+    return results
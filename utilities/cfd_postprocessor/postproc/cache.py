@@ -0,0 +1,321 @@
+"""
+Caché en disco de arrays ya parseados (mallas, campos) como .npy.
+
+La primera lectura de un archivo ASCII de OpenFOAM se parsea y sus arrays se
+guardan en CACHE_DIR/<clave>/<nombre>.npy; las siguientes sólo hacen
+np.load(mmap_mode="r"), sin parsear nada.
+
+Claves:
+  - clave de estado: (ruta, tamaño, mtime) de los archivos fuente. Si
+    coincide con una entrada conocida no se lee ni un byte de la fuente.
+  - clave de contenido: sha1 del contenido de las fuentes. Se calcula sólo
+    cuando cambió la clave de estado; así un `touch` o una copia/hardlink
+    del mismo polyMesh en otro run reutilizan la misma entrada.
+
+El índice (entradas, tamaños y último uso) es un SQLite dentro de la carpeta
+de la caché. Al superar CACHE_MAX_BYTES se borran las entradas usadas hace
+más tiempo.
+
+Carpeta: $CFD_POSTPROC_CACHE_DIR, o $XDG_CACHE_HOME/cfd_postprocessor, o
+~/.cache/cfd_postprocessor. Tamaño máximo: $CFD_POSTPROC_CACHE_MAX_BYTES.
+
+Uso:
+    python3 -m postproc.cache info
+    python3 -m postproc.cache purge                 # todo
+    python3 -m postproc.cache purge --kind polymesh
+    python3 -m postproc.cache purge --max-size 500M # desalojar hasta 500 MB
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+CACHE_DIR_ENV = "CFD_POSTPROC_CACHE_DIR"
+CACHE_MAX_BYTES_ENV = "CFD_POSTPROC_CACHE_MAX_BYTES"
+CACHE_MAX_BYTES_DEFAULT = 2 * 1024 ** 3
+
+# Cambiar al modificar el formato de lo que se guarda (invalida todo)
+CACHE_FORMAT_VERSION = 1
+
+_INDEX_FILE = "index.sqlite"
+_HASH_BLOCK_SIZE = 1 << 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key        TEXT PRIMARY KEY,
+    kind       TEXT,
+    nbytes     INTEGER,
+    created_at REAL,
+    last_used  REAL
+);
+CREATE TABLE IF NOT EXISTS stat_keys (
+    stat_key TEXT PRIMARY KEY,
+    key      TEXT
+);
+"""
+
+_SIZE_SUFFIXES = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def default_cache_dir() -> Path:
+    """Carpeta de la caché según las variables de entorno."""
+    if os.environ.get(CACHE_DIR_ENV):
+        return Path(os.environ[CACHE_DIR_ENV])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "cfd_postprocessor"
+
+
+def parse_size(text: str) -> int:
+    """ "500M", "2G", "1048576" -> bytes."""
+    text = text.strip().upper().rstrip("B")
+    suffix = text[-1:] if text[-1:] in _SIZE_SUFFIXES else ""
+    number = text[: len(text) - len(suffix)]
+    try:
+        return int(float(number) * _SIZE_SUFFIXES[suffix])
+    except ValueError:
+        raise ValueError(f"Tamaño inválido: {text!r}") from None
+
+
+def _stat_key(kind: str, sources: Sequence[Path]) -> str:
+    h = hashlib.sha1(f"{kind}\0{CACHE_FORMAT_VERSION}\n".encode())
+    for path in sources:
+        st = path.stat()
+        h.update(f"{path.resolve()}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
+
+def _content_key(kind: str, sources: Sequence[Path]) -> str:
+    h = hashlib.sha1(f"{kind}\0{CACHE_FORMAT_VERSION}\n".encode())
+    for path in sources:
+        h.update(f"{path.name}\0{path.stat().st_size}\n".encode())
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                h.update(block)
+    return h.hexdigest()
+
+
+class ArrayCache:
+    """Caché de dicts {nombre: array} indexada por las fuentes que los generan."""
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: Optional[int] = None):
+        self.root = Path(root) if root is not None else default_cache_dir()
+        if max_bytes is None:
+            env = os.environ.get(CACHE_MAX_BYTES_ENV)
+            max_bytes = parse_size(env) if env else CACHE_MAX_BYTES_DEFAULT
+        self.max_bytes = int(max_bytes)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.root.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.root / _INDEX_FILE), timeout=30.0)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _load(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        entry_dir = self.root / key
+        if not entry_dir.is_dir():
+            return None
+        try:
+            return {p.stem: np.load(p, mmap_mode="r") for p in sorted(entry_dir.glob("*.npy"))}
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key: str, arrays: Dict[str, np.ndarray]) -> int:
+        """Escribe la entrada en una carpeta temporal y la renombra (atómico)."""
+        tmp = self.root / f".tmp-{key}-{os.getpid()}"
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        for name, arr in arrays.items():
+            np.save(tmp / f"{name}.npy", np.ascontiguousarray(arr))
+        nbytes = sum(p.stat().st_size for p in tmp.iterdir())
+        try:
+            os.replace(tmp, self.root / key)
+        except OSError:
+            # Otro proceso guardó la misma entrada mientras tanto
+            shutil.rmtree(tmp, ignore_errors=True)
+        return nbytes
+
+    def get_or_build(
+        self,
+        kind: str,
+        sources: Sequence[Path],
+        build: Callable[[], Dict[str, np.ndarray]],
+    ) -> Dict[str, np.ndarray]:
+        """
+        Arrays de `build()` para estas fuentes, desde la caché si ya están.
+
+        Los arrays devueltos desde la caché son memmaps de sólo lectura.
+        """
+        sources = [Path(p) for p in sources]
+        stat_key = _stat_key(kind, sources)
+        now = time.time()
+
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT key FROM stat_keys WHERE stat_key = ?", (stat_key,)).fetchone()
+            if row is not None:
+                arrays = self._load(row[0])
+                if arrays is not None:
+                    conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (now, row[0]))
+                    conn.commit()
+                    return arrays
+
+            key = _content_key(kind, sources)
+            arrays = self._load(key)
+            if arrays is None:
+                nbytes = self._store(key, build())
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, kind, nbytes, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, kind, nbytes, now, now),
+                )
+                arrays = self._load(key)
+            else:
+                # La entrada pudo escribirla otro proceso sin registrarla aún
+                nbytes = sum(p.stat().st_size for p in (self.root / key).iterdir())
+                conn.execute(
+                    "INSERT OR IGNORE INTO entries (key, kind, nbytes, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, kind, nbytes, now, now),
+                )
+                conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (now, key))
+            conn.execute("INSERT OR REPLACE INTO stat_keys (stat_key, key) VALUES (?, ?)", (stat_key, key))
+            conn.commit()
+            self._evict(conn, self.max_bytes, keep=key)
+        finally:
+            conn.close()
+        return arrays
+
+    def _delete(self, conn: sqlite3.Connection, keys: Sequence[str]) -> None:
+        for key in keys:
+            shutil.rmtree(self.root / key, ignore_errors=True)
+        conn.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k in keys])
+        conn.executemany("DELETE FROM stat_keys WHERE key = ?", [(k,) for k in keys])
+        conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection, max_bytes: int, keep: Optional[str] = None) -> int:
+        total = conn.execute("SELECT COALESCE(SUM(nbytes), 0) FROM entries").fetchone()[0]
+        if total <= max_bytes:
+            return 0
+        victims = []
+        for key, nbytes in conn.execute("SELECT key, nbytes FROM entries ORDER BY last_used"):
+            if total <= max_bytes:
+                break
+            if key == keep:
+                continue
+            victims.append(key)
+            total -= nbytes
+        self._delete(conn, victims)
+        return len(victims)
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Borra las entradas menos usadas hasta quedar bajo max_bytes."""
+        conn = self._connect()
+        try:
+            return self._evict(conn, self.max_bytes if max_bytes is None else max_bytes)
+        finally:
+            conn.close()
+
+    def purge(self, kind: Optional[str] = None) -> int:
+        """Borra todas las entradas (o sólo las de un tipo). Devuelve cuántas."""
+        conn = self._connect()
+        try:
+            if kind is None:
+                keys = [k for (k,) in conn.execute("SELECT key FROM entries")]
+            else:
+                keys = [k for (k,) in conn.execute("SELECT key FROM entries WHERE kind = ?", (kind,))]
+            self._delete(conn, keys)
+            return len(keys)
+        finally:
+            conn.close()
+
+    def info(self) -> Dict[str, Any]:
+        """Carpeta, número de entradas y bytes, en total y por tipo."""
+        conn = self._connect()
+        try:
+            by_kind = {
+                kind: {"entries": n, "bytes": nbytes}
+                for kind, n, nbytes in conn.execute(
+                    "SELECT kind, COUNT(*), COALESCE(SUM(nbytes), 0) FROM entries GROUP BY kind ORDER BY kind"
+                )
+            }
+        finally:
+            conn.close()
+        return {
+            "root": str(self.root),
+            "max_bytes": self.max_bytes,
+            "entries": sum(v["entries"] for v in by_kind.values()),
+            "bytes": sum(v["bytes"] for v in by_kind.values()),
+            "by_kind": by_kind,
+        }
+
+
+def cached_arrays(
+    kind: str,
+    sources: Sequence[Path],
+    build: Callable[[], Dict[str, np.ndarray]],
+    cache: Optional[ArrayCache] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    get_or_build con la caché por defecto. Si la carpeta de la caché no se
+    puede escribir se parsea directamente (la caché nunca es obligatoria).
+    """
+    try:
+        return (cache or ArrayCache()).get_or_build(kind, sources, build)
+    except (OSError, sqlite3.Error):
+        return build()
+
+
+def _fmt_bytes(n: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024.0
+    return f"{n:.1f} GB"
+
+
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspeccionar o vaciar la caché de mallas y campos parseados.")
+    parser.add_argument("--dir", type=Path, default=None,
+                        help=f"Carpeta de la caché (por defecto ${CACHE_DIR_ENV} o ~/.cache/cfd_postprocessor).")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("info", help="Mostrar tamaño y entradas.")
+    purge = sub.add_parser("purge", help="Borrar entradas.")
+    purge.add_argument("--kind", help="Sólo entradas de este tipo (p.ej. polymesh).")
+    purge.add_argument("--max-size", type=parse_size,
+                       help="En vez de borrar todo, desalojar las menos usadas hasta este tamaño (p.ej. 500M).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Any = None) -> None:
+    args = parse_args(argv)
+    cache = ArrayCache(args.dir)
+
+    if args.command == "info":
+        info = cache.info()
+        print(f"Caché      : {info['root']}")
+        print(f"Entradas   : {info['entries']}")
+        print(f"Tamaño     : {_fmt_bytes(info['bytes'])} (máximo {_fmt_bytes(info['max_bytes'])})")
+        for kind, v in info["by_kind"].items():
+            print(f"  {kind:<12}: {v['entries']} entradas, {_fmt_bytes(v['bytes'])}")
+        return
+
+    if args.max_size is not None:
+        if args.kind:
+            print("[ERROR] --kind y --max-size no se combinan.", file=sys.stderr)
+            sys.exit(1)
+        removed = cache.evict(args.max_size)
+    else:
+        removed = cache.purge(args.kind)
+    print(f"Entradas borradas: {removed}")
+
+
+if __name__ == "__main__":
+    main()
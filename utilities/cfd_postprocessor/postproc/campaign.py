@@ -0,0 +1,309 @@
+"""
+Post-proceso de una campaña completa (cases/runs) con índice SQLite.
+
+Cada run (cada caso bajo la carpeta, p.ej.
+cases/runs/pipe20m__20251125-111607__prueba1 con su run_metadata.json) se evalúa con evaluate_cases en
+un pool de procesos, y el resultado queda en una tabla `runs` con clave
+run_name y columnas base_case y tag. Al volver a correr sólo se procesan los
+runs cuya huella (tamaño y mtime de postProcessing y de los archivos de
+parámetros) cambió desde la última construcción del índice.
+
+Uso:
+    python3 -m postproc.campaign ../../cases/runs
+    python3 -m postproc.campaign ../../cases/runs --db campaign.sqlite --workers 8
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .analysis import evaluate_cases
+from .case_params import discover_cases
+from .convergence import REL_DRIFT_TOL_DEFAULT, REL_STD_TOL_DEFAULT, WINDOW_DEFAULT
+from .theory import CorrelationMethod
+
+RUN_METADATA_FILE = "run_metadata.json"
+LEGACY_SUMMARY_FILE = "dp_error_summary.json"
+INDEX_FILE_DEFAULT = "campaign_index.sqlite"
+
+# Archivos de parámetros que también invalidan el índice si cambian
+_PARAMETER_FILES = (
+    RUN_METADATA_FILE,
+    "constant/physicalProperties",
+    "constant/transportProperties",
+    "constant/polyMesh/boundary",
+    "0/U",
+    "0/p",
+    "system/blockMeshDict",
+)
+
+# Columnas escalares de CaseResult.to_dict() que se guardan en el índice
+RESULT_COLUMNS = (
+    "L_m",
+    "D_m",
+    "nu_m2s",
+    "rho_kgm3",
+    "roughness_m",
+    "U_inlet_ms",
+    "t_end",
+    "dp_last_pa",
+    "dp_mean_pa",
+    "Q_last_m3s",
+    "Q_mean_m3s",
+    "steady",
+    "Q_used_m3s",
+    "U_m_s",
+    "Re",
+    "f_theory",
+    "dp_theory_pa",
+    "f_cfd",
+    "error_dp_pct",
+    "error_f_pct",
+    "error",
+)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    run_name     TEXT PRIMARY KEY,
+    base_case    TEXT,
+    tag          TEXT,
+    created_at   TEXT,
+    run_dir      TEXT,
+    fingerprint  TEXT,
+    processed_at TEXT,
+    {", ".join(f"{c} {'TEXT' if c == 'error' else 'REAL'}" for c in RESULT_COLUMNS)},
+    legacy_summary TEXT,
+    result_json  TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_base_tag ON runs (base_case, tag);
+"""
+
+
+@dataclass
+class RunInfo:
+    """Un run de la campaña y sus metadatos (run_metadata.json)."""
+
+    run_dir: Path
+    run_name: str
+    base_case: str
+    tag: str
+    created_at: str
+
+
+def _parse_run_name(name: str) -> Dict[str, str]:
+    """base__AAAAMMDD-HHMMSS__tag -> base_case, tag (si el nombre sigue ese formato)."""
+    parts = name.split("__")
+    if len(parts) >= 3:
+        return {"base_case": parts[0], "tag": "__".join(parts[2:])}
+    return {"base_case": name, "tag": ""}
+
+
+def discover_runs(runs_root: Path) -> List[RunInfo]:
+    """
+    Runs bajo runs_root (casos con system/controlDict), ordenados por nombre.
+
+    Los metadatos salen de run_metadata.json; si falta, base_case y tag se
+    deducen del nombre "base__AAAAMMDD-HHMMSS__tag".
+    """
+    runs = []
+    for run_dir in sorted(discover_cases([Path(runs_root)])):
+        meta_path = run_dir / RUN_METADATA_FILE
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            meta = {}
+        fallback = _parse_run_name(run_dir.name)
+        runs.append(
+            RunInfo(
+                run_dir=run_dir,
+                run_name=str(meta.get("run_name") or run_dir.name),
+                base_case=str(meta.get("base_case") or fallback["base_case"]),
+                tag=str(meta.get("tag") or fallback["tag"]),
+                created_at=str(meta.get("created_at") or ""),
+            )
+        )
+    return runs
+
+
+def _iter_fingerprint_files(run_dir: Path) -> Iterable[Path]:
+    for rel in _PARAMETER_FILES:
+        path = run_dir / rel
+        if path.is_file():
+            yield path
+    pp_dir = run_dir / "postProcessing"
+    if pp_dir.is_dir():
+        for root, _, files in os.walk(pp_dir):
+            for name in files:
+                # Las cachés (.history_*, .samples_*) y sus temporales (*.tmp)
+                # las escribe este mismo paquete; OpenFOAM no escribe ocultos
+                if not name.startswith(".") and not name.endswith(".tmp"):
+                    yield Path(root) / name
+
+
+def fingerprint_run(run_dir: Path) -> str:
+    """Huella del run: hash de (ruta relativa, tamaño, mtime) de sus archivos."""
+    h = hashlib.sha1()
+    for path in sorted(_iter_fingerprint_files(run_dir)):
+        st = path.stat()
+        h.update(f"{path.relative_to(run_dir)}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
+
+def _evaluate_run(
+    run_dir: str,
+    window: int,
+    rel_std_tol: float,
+    rel_drift_tol: float,
+    method: CorrelationMethod,
+) -> Dict[str, Any]:
+    """Evalúa un run (se ejecuta en un proceso hijo)."""
+    (result,) = evaluate_cases(
+        [Path(run_dir)],
+        window=window,
+        rel_std_tol=rel_std_tol,
+        rel_drift_tol=rel_drift_tol,
+        method=method,
+    )
+    return result.to_dict()
+
+
+def open_index(db_path: Path) -> sqlite3.Connection:
+    """Abre (o crea) el índice SQLite de la campaña."""
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _upsert(conn: sqlite3.Connection, run: RunInfo, fingerprint: str, row: Dict[str, Any]) -> None:
+    legacy = run.run_dir / LEGACY_SUMMARY_FILE
+    legacy_text = legacy.read_text(encoding="utf-8") if legacy.is_file() else None
+    values = {
+        "run_name": run.run_name,
+        "base_case": run.base_case,
+        "tag": run.tag,
+        "created_at": run.created_at,
+        "run_dir": str(run.run_dir),
+        "fingerprint": fingerprint,
+        "processed_at": datetime.now().isoformat(timespec="seconds"),
+        **{c: row.get(c) for c in RESULT_COLUMNS},
+        "legacy_summary": legacy_text,
+        "result_json": json.dumps(row, ensure_ascii=False),
+    }
+    cols = ", ".join(values)
+    marks = ", ".join("?" for _ in values)
+    conn.execute(f"INSERT OR REPLACE INTO runs ({cols}) VALUES ({marks})", list(values.values()))
+
+
+def build_index(
+    runs_root: Path,
+    db_path: Optional[Path] = None,
+    workers: Optional[int] = None,
+    force: bool = False,
+    window: int = WINDOW_DEFAULT,
+    rel_std_tol: float = REL_STD_TOL_DEFAULT,
+    rel_drift_tol: float = REL_DRIFT_TOL_DEFAULT,
+    method: CorrelationMethod = "haaland",
+) -> Dict[str, int]:
+    """
+    Construye o actualiza el índice de la campaña.
+
+    - Sólo se procesan los runs nuevos o con huella distinta (o todos con force).
+    - Los runs que ya no existen se borran del índice.
+    - workers: procesos del pool (None = todos los CPU, 1 = en este proceso).
+
+    Devuelve {"total", "processed", "skipped", "removed"}.
+    """
+    runs_root = Path(runs_root)
+    db_path = Path(db_path) if db_path else runs_root / INDEX_FILE_DEFAULT
+    runs = discover_runs(runs_root)
+
+    conn = open_index(db_path)
+    try:
+        known = dict(conn.execute("SELECT run_name, fingerprint FROM runs"))
+        current = {r.run_name for r in runs}
+        removed = [name for name in known if name not in current]
+        conn.executemany("DELETE FROM runs WHERE run_name = ?", [(n,) for n in removed])
+
+        stale = []
+        for run in runs:
+            fp = fingerprint_run(run.run_dir)
+            if force or known.get(run.run_name) != fp:
+                stale.append((run, fp))
+
+        kwargs = dict(window=window, rel_std_tol=rel_std_tol, rel_drift_tol=rel_drift_tol, method=method)
+        if workers == 1 or len(stale) <= 1:
+            for run, fp in stale:
+                _upsert(conn, run, fp, _evaluate_run(str(run.run_dir), **kwargs))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(_evaluate_run, str(run.run_dir), **kwargs): (run, fp)
+                    for run, fp in stale
+                }
+                for fut in as_completed(futures):
+                    run, fp = futures[fut]
+                    _upsert(conn, run, fp, fut.result())
+        conn.commit()
+    finally:
+        conn.close()
+
+    return {
+        "total": len(runs),
+        "processed": len(stale),
+        "skipped": len(runs) - len(stale),
+        "removed": len(removed),
+    }
+
+
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Post-proceso de todos los runs de una campaña con índice SQLite incremental."
+    )
+    parser.add_argument("runs_root", type=Path, help="Carpeta con los runs (p.ej. cases/runs).")
+    parser.add_argument("--db", type=Path,
+                        help=f"Archivo SQLite del índice (por defecto: RUNS_ROOT/{INDEX_FILE_DEFAULT}).")
+    parser.add_argument("--workers", "-j", type=int, default=None,
+                        help="Procesos en paralelo (por defecto: todos los CPU).")
+    parser.add_argument("--force", action="store_true",
+                        help="Reprocesar todos los runs aunque no hayan cambiado.")
+    parser.add_argument("--method", "-m", choices=("blasius", "haaland", "colebrook", "table"),
+                        default="haaland", help="Correlación para f (por defecto: haaland).")
+    parser.add_argument("--window", type=int, default=WINDOW_DEFAULT,
+                        help="Muestras de la ventana de promedio (por defecto %(default)s).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Any = None) -> None:
+    args = parse_args(argv)
+    if not args.runs_root.is_dir():
+        print(f"[ERROR] No existe la carpeta {args.runs_root}", file=sys.stderr)
+        sys.exit(1)
+
+    t0 = time.perf_counter()
+    summary = build_index(
+        args.runs_root,
+        db_path=args.db,
+        workers=args.workers,
+        force=args.force,
+        window=args.window,
+        method=args.method,
+    )
+    elapsed = time.perf_counter() - t0
+    print(
+        f"Runs: {summary['total']}  procesados: {summary['processed']}  "
+        f"sin cambios: {summary['skipped']}  eliminados: {summary['removed']}  "
+        f"({elapsed:.2f} s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+Parámetros físicos y geométricos leídos del propio caso OpenFOAM.
+
+Reemplaza los valores fijos (L=20, D=0.35, rho=998, nu=1e-6) que tenía cada
+copia de post_pipe20m.py:
+
+  - nu (y rho si existe): constant/physicalProperties o transportProperties
+  - patches de entrada/salida: constant/polyMesh/boundary
+  - velocidad de entrada y eje del flujo: 0/U (patch de entrada, uniform)
+  - si p es cinemática (p/rho): dimensiones de 0/p
+  - L y D: de constant/polyMesh si la malla está completa (D equivalente del
+    inlet; L entre inlet y outlet sólo en tubo recto); si no, de los vértices
+    de system/blockMeshDict (L = largo a lo largo del eje, D = 2 · distancia
+    radial máxima al eje), sólo si el eje coincide con la dirección de U
+
+Cualquier valor se puede forzar con `overrides`.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .foam_io import (
+    read_boundary,
+    read_field_dimensions,
+    read_foam_dict,
+    scalar_value,
+    uniform_value,
+)
+from .polymesh import PolyMesh, has_full_polymesh, read_polymesh
+from .theory import RHO_WATER_20C
+
+# Dimensiones de una presión cinemática p/rho [m²/s²]
+KINEMATIC_PRESSURE_DIMS = (0, 2, -2, 0, 0, 0, 0)
+
+PROPERTIES_FILES = ("physicalProperties", "transportProperties")
+
+# |cos| mínimo entre U de entrada y el eje del blockMeshDict para usarlo
+ALIGNMENT_MIN = 0.9
+
+
+@dataclass
+class CaseParameters:
+    """Parámetros de un caso para comparar CFD contra teoría."""
+
+    case_dir: Path
+    name: str
+    nu_m2s: float
+    rho_kgm3: float = RHO_WATER_20C
+    L_m: Optional[float] = None
+    D_m: Optional[float] = None
+    roughness_m: float = 0.0
+    U_inlet_ms: Optional[float] = None
+    flow_axis: Optional[Tuple[float, float, float]] = None
+    inlet_patch: str = "inlet"
+    outlet_patch: str = "outlet"
+    p_kinematic: bool = True
+    sources: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def pp_dir(self) -> Path:
+        return self.case_dir / "postProcessing"
+
+
+def is_case_dir(path: Path) -> bool:
+    """Un directorio es un caso si tiene system/controlDict."""
+    return (path / "system" / "controlDict").is_file()
+
+
+def discover_cases(paths: List[Path]) -> List[Path]:
+    """
+    Expande una lista de rutas a directorios de caso.
+
+    Cada ruta puede ser un caso o una carpeta que contiene casos a cualquier
+    profundidad (p.ej. todo cases/). El orden es estable y sin repetidos.
+    """
+    found: List[Path] = []
+    seen = set()
+    for path in paths:
+        path = Path(path)
+        if is_case_dir(path):
+            candidates = [path]
+        else:
+            candidates = sorted(p.parent.parent for p in path.glob("**/system/controlDict"))
+        for c in candidates:
+            key = c.resolve()
+            if key not in seen:
+                seen.add(key)
+                found.append(c)
+    return found
+
+
+def _read_properties(case_dir: Path) -> Tuple[Dict[str, Any], str]:
+    for name in PROPERTIES_FILES:
+        path = case_dir / "constant" / name
+        if path.is_file():
+            return read_foam_dict(path), f"constant/{name}"
+    raise RuntimeError(f"No hay physicalProperties ni transportProperties en {case_dir}")
+
+
+def find_patch(names: List[str], keyword: str) -> Optional[str]:
+    for name in names:
+        if keyword in name.lower():
+            return name
+    return None
+
+
+def _block_mesh_vertices(case_dir: Path) -> Optional[np.ndarray]:
+    """Vértices numéricos de system/blockMeshDict en metros (None si no hay)."""
+    path = case_dir / "system" / "blockMeshDict"
+    if not path.is_file():
+        return None
+    data = read_foam_dict(path)
+    try:
+        pts = np.array(data["vertices"], dtype=float)
+    except (KeyError, TypeError, ValueError):
+        return None
+    if pts.ndim != 2 or pts.shape[1] != 3:
+        return None
+    scale = data.get("convertToMeters", data.get("scale", 1.0))
+    return pts * float(scale)
+
+
+def pipe_geometry_from_points(
+    points: np.ndarray,
+    axis: Optional[np.ndarray] = None,
+) -> Tuple[float, float, np.ndarray]:
+    """
+    Largo y diámetro de una tubería recta a partir de puntos de su contorno.
+
+    - axis: dirección del eje; si no se da, la de mayor extensión.
+    - L = extensión de los puntos proyectados sobre el eje.
+    - D = 2 · distancia máxima de los puntos al eje que pasa por su centroide.
+    """
+    if axis is None:
+        axis = np.zeros(3)
+        axis[int(np.argmax(np.ptp(points, axis=0)))] = 1.0
+    axis = np.asarray(axis, dtype=float)
+    axis = axis / np.linalg.norm(axis)
+
+    along = points @ axis
+    center = points.mean(axis=0)
+    rel = points - center
+    radial = rel - np.outer(rel @ axis, axis)
+    return float(np.ptp(along)), float(2.0 * np.linalg.norm(radial, axis=1).max()), axis
+
+
+def _pipe_geometry_from_mesh(
+    mesh: PolyMesh,
+    inlet: str,
+    outlet: str,
+) -> Tuple[Optional[float], Optional[float]]:
+    """
+    L y D desde la malla: D = diámetro equivalente sqrt(4A/π) del inlet;
+    L = distancia entre centros de inlet y outlet sólo si el tubo es recto
+    (normales opuestas y alineadas con esa distancia). En un codo L = None.
+    """
+    try:
+        s_in = mesh.patch_summary(inlet)
+        s_out = mesh.patch_summary(outlet)
+    except KeyError:
+        return None, None
+
+    D = s_in["D_equivalent_m"]
+    span = np.asarray(s_out["centre"]) - np.asarray(s_in["centre"])
+    length = float(np.linalg.norm(span))
+    straight = (
+        length > 0
+        and float(np.dot(s_in["normal"], s_out["normal"])) < -ALIGNMENT_MIN
+        and abs(float(np.dot(span / length, s_out["normal"]))) > ALIGNMENT_MIN
+    )
+    return (length if straight else None), D
+
+
+def read_case_parameters(
+    case_dir: Path,
+    overrides: Optional[Dict[str, float]] = None,
+) -> CaseParameters:
+    """
+    Lee los parámetros de un caso (ver docstring del módulo).
+
+    overrides: claves de CaseParameters (L_m, D_m, rho_kgm3, nu_m2s,
+    roughness_m, ...) que reemplazan lo leído del caso.
+    """
+    case_dir = Path(case_dir)
+    sources: Dict[str, str] = {}
+
+    props, props_src = _read_properties(case_dir)
+    nu = scalar_value(props["nu"])
+    sources["nu_m2s"] = props_src
+    rho = RHO_WATER_20C
+    sources["rho_kgm3"] = "default"
+    if "rho" in props:
+        rho = scalar_value(props["rho"])
+        sources["rho_kgm3"] = props_src
+
+    inlet, outlet = "inlet", "outlet"
+    boundary = case_dir / "constant" / "polyMesh" / "boundary"
+    if boundary.is_file():
+        names = [p.name for p in read_boundary(boundary)]
+        inlet = find_patch(names, "inlet") or inlet
+        outlet = find_patch(names, "outlet") or outlet
+
+    U_inlet = None
+    axis = None
+    u_file = case_dir / "0" / "U"
+    if u_file.is_file():
+        bf = read_foam_dict(u_file).get("boundaryField", {})
+        try:
+            vec = np.array(uniform_value(bf[inlet]["value"]), dtype=float)
+        except (KeyError, TypeError, ValueError):
+            vec = None
+        if vec is not None and vec.shape == (3,) and np.linalg.norm(vec) > 0:
+            U_inlet = float(np.linalg.norm(vec))
+            axis = vec / U_inlet
+            sources["U_inlet_ms"] = "0/U"
+
+    p_kinematic = True
+    p_file = case_dir / "0" / "p"
+    if p_file.is_file():
+        try:
+            p_kinematic = read_field_dimensions(p_file) == KINEMATIC_PRESSURE_DIMS
+            sources["p_kinematic"] = "0/p"
+        except ValueError:
+            pass
+
+    L = D = None
+    if has_full_polymesh(case_dir):
+        L, D = _pipe_geometry_from_mesh(read_polymesh(case_dir), inlet, outlet)
+        if D is not None:
+            sources["D_m"] = "constant/polyMesh"
+        if L is not None:
+            sources["L_m"] = "constant/polyMesh"
+
+    vertices = _block_mesh_vertices(case_dir) if L is None or D is None else None
+    if vertices is not None:
+        L_b, D_b, pipe_axis = pipe_geometry_from_points(vertices)
+        # Si el flujo de 0/U no va a lo largo del tubo del blockMeshDict, ese
+        # blockMeshDict no es el de la malla (p.ej. malla importada de Salome)
+        if axis is None or abs(float(np.dot(axis, pipe_axis))) > ALIGNMENT_MIN:
+            axis = pipe_axis if axis is None else axis
+            if L is None:
+                L = L_b
+                sources["L_m"] = "system/blockMeshDict"
+            if D is None:
+                D = D_b
+                sources["D_m"] = "system/blockMeshDict"
+
+    params = CaseParameters(
+        case_dir=case_dir,
+        name=case_dir.name,
+        nu_m2s=nu,
+        rho_kgm3=rho,
+        L_m=L,
+        D_m=D,
+        U_inlet_ms=U_inlet,
+        flow_axis=tuple(float(x) for x in axis) if axis is not None else None,
+        inlet_patch=inlet,
+        outlet_patch=outlet,
+        p_kinematic=p_kinematic,
+        sources=sources,
+    )
+    for key, value in (overrides or {}).items():
+        if value is None:
+            continue
+        if not hasattr(params, key):
+            raise ValueError(f"Parámetro desconocido: {key}")
+        setattr(params, key, value)
+        params.sources[key] = "override"
+    return params
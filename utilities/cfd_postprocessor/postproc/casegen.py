@@ -0,0 +1,493 @@
+"""
+Generación de runs a partir de una plantilla de cases/base.
+
+Cada fila de una tabla de parámetros produce un run
+<runs>/<base>__AAAAMMDD-HHMMSS__<tag> con su run_metadata.json (mismo
+formato que lee postproc.campaign). Columnas de la tabla (CSV o JSON-lines;
+las que faltan o quedan vacías conservan el valor de la plantilla):
+
+  - tag: sufijo del nombre del run (por defecto, el número de fila)
+  - U_inlet_ms: módulo de la velocidad del patch de entrada en 0/U; se
+    conserva la dirección de la plantilla
+  - nu_m2s: viscosidad en constant/physicalProperties o transportProperties
+  - endTime: system/controlDict
+  - probes: probeLocations de system/controlDict, "x1;x2;..." (distancias a
+    lo largo del flujo desde la primera probe de la plantilla) o
+    "x y z;x y z;..."
+
+Las sustituciones se hacen sobre el texto, así que se conservan comentarios
+y formato. Los archivos pesados de la malla (points, faces, owner,
+neighbour, *Zones) se enlazan con hard links en vez de copiarse: cientos de
+runs ocupan en disco casi lo mismo que la plantilla. Por eso dentro de un
+run no hay que correr herramientas que reescriben la malla en su lugar
+(renumberMesh -overwrite, ...); para eso generar con --link copy.
+
+Uso:
+    python3 -m postproc.casegen ../../cases/base/pipe20m --table params.csv
+    python3 -m postproc.casegen ../../cases/base/elbow20D --tag U5 --U-inlet 5 --end-time 2000
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import shutil
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from .campaign import RUN_METADATA_FILE
+from .case_params import PROPERTIES_FILES, find_patch
+from .foam_io import read_boundary
+
+# Carpetas de la plantilla que se clonan (no se copian tiempos ni postProcessing)
+TEMPLATE_DIRS = ("0", "constant", "system")
+
+# Archivos de constant/polyMesh que se enlazan en vez de copiarse
+MESH_FILES = ("points", "faces", "owner", "neighbour", "cellZones", "faceZones", "pointZones")
+
+LINK_MODES = ("hard", "copy")
+
+TABLE_COLUMNS = ("tag", "U_inlet_ms", "nu_m2s", "endTime", "probes")
+
+_BRACE_RE = re.compile(r"//[^\n]*|/\*.*?\*/|[{}]", re.S)
+_UNIFORM_VECTOR_RE = re.compile(r"uniform\s*\(\s*(\S+)\s+(\S+)\s+(\S+)\s*\)")
+_TAG_RE = re.compile(r"[^\w.-]+")
+
+
+@dataclass
+class RunSpec:
+    """Parámetros de un run; None = valor de la plantilla."""
+
+    tag: str
+    U_inlet_ms: Optional[float] = None
+    nu_m2s: Optional[float] = None
+    end_time: Optional[float] = None
+    probes: Optional[List[Tuple[float, float, float]]] = None
+
+    def parameters(self) -> Dict[str, Any]:
+        """Parámetros cambiados respecto de la plantilla (para run_metadata.json)."""
+        params: Dict[str, Any] = {}
+        if self.U_inlet_ms is not None:
+            params["U_inlet_ms"] = self.U_inlet_ms
+        if self.nu_m2s is not None:
+            params["nu_m2s"] = self.nu_m2s
+        if self.end_time is not None:
+            params["endTime"] = self.end_time
+        if self.probes is not None:
+            params["probes"] = [list(p) for p in self.probes]
+        return params
+
+
+@dataclass
+class CaseTemplate:
+    """Plantilla leída una sola vez: textos a sustituir y lista de archivos."""
+
+    base_dir: Path
+    name: str
+    inlet_patch: str
+    inlet_vector: Tuple[float, float, float]
+    properties_file: str
+    first_probe: Optional[Tuple[float, float, float]]
+    texts: Dict[str, str] = field(default_factory=dict)
+    dirs: List[str] = field(default_factory=list)
+    files: List[str] = field(default_factory=list)
+
+    @property
+    def flow_axis(self) -> Tuple[float, float, float]:
+        norm = sum(c * c for c in self.inlet_vector) ** 0.5
+        return tuple(c / norm for c in self.inlet_vector)
+
+
+# ---------------------------------------------------------------------------
+# Edición de texto de diccionarios OpenFOAM
+# ---------------------------------------------------------------------------
+
+def _fmt(value: float) -> str:
+    return f"{value:.10g}"
+
+
+def _block_span(text: str, name: str, start: int = 0, end: Optional[int] = None) -> Tuple[int, int]:
+    """
+    (inicio, fin) del contenido de "name { ... }" dentro de text[start:end]
+    (sin las llaves). Los comentarios no cuentan para balancear llaves.
+    """
+    end = len(text) if end is None else end
+    m = re.compile(r"(?<![\w.])" + re.escape(name) + r"\s*\{").search(text, start, end)
+    if not m:
+        raise ValueError(f"No se encontró el bloque '{name}'")
+    depth = 1
+    for tok in _BRACE_RE.finditer(text, m.end(), end):
+        t = tok.group()
+        if t == "{":
+            depth += 1
+        elif t == "}":
+            depth -= 1
+            if depth == 0:
+                return m.end(), tok.start()
+    raise ValueError(f"Bloque '{name}' sin cerrar")
+
+
+def _entry_re(key: str) -> "re.Pattern[str]":
+    return re.compile(
+        r"^([ \t]*)" + re.escape(key) + r"(\s+)([^;]*);([ \t]*//[^\n]*)?", re.M
+    )
+
+
+def _find_entry(text: str, key: str, start: int = 0, end: Optional[int] = None):
+    """Primera entrada "key valor;" en el nivel superior de text[start:end]."""
+    end = len(text) if end is None else end
+    for m in _entry_re(key).finditer(text, start, end):
+        depth = text.count("{", start, m.start()) - text.count("}", start, m.start())
+        if depth == 0:
+            return m
+    return None
+
+
+def set_entry(text: str, key: str, value: str, start: int = 0, end: Optional[int] = None) -> str:
+    """
+    Reemplaza el valor de "key valor;" (primer nivel de text[start:end]).
+    El comentario al final de la línea se descarta: describía el valor viejo.
+    """
+    m = _find_entry(text, key, start, end)
+    if m is None:
+        raise ValueError(f"No se encontró la entrada '{key}'")
+    indent, sep = m.group(1), m.group(2)
+    return f"{text[:m.start()]}{indent}{key}{sep}{value};{text[m.end():]}"
+
+
+def _uniform_vector(value_text: str) -> Optional[Tuple[float, float, float]]:
+    m = _UNIFORM_VECTOR_RE.fullmatch(value_text.strip())
+    if not m:
+        return None
+    return tuple(float(x) for x in m.groups())
+
+
+def _vector_text(vec) -> str:
+    return "uniform (" + " ".join(_fmt(c) for c in vec) + ")"
+
+
+def set_inlet_velocity(text: str, patch: str, old: Tuple[float, float, float], U: float) -> str:
+    """
+    0/U con |U| = U en el patch de entrada (misma dirección que la plantilla).
+    Si internalField es uniform e igual a la entrada vieja, también se escala.
+    """
+    norm = sum(c * c for c in old) ** 0.5
+    new = tuple(c / norm * U for c in old)
+    bf_start, bf_end = _block_span(text, "boundaryField")
+    p_start, p_end = _block_span(text, patch, bf_start, bf_end)
+    text = set_entry(text, "value", _vector_text(new), p_start, p_end)
+
+    m = _find_entry(text, "internalField")
+    if m is not None and _uniform_vector(m.group(3)) == tuple(old):
+        text = set_entry(text, "internalField", _vector_text(new))
+    return text
+
+
+def set_viscosity(text: str, nu: float) -> str:
+    """nu en physicalProperties ("nu 1e-06;" o "nu nu [0 2 -1 0 0 0 0] 1e-06;")."""
+    m = _find_entry(text, "nu")
+    if m is None:
+        raise ValueError("No se encontró la entrada 'nu'")
+    value = re.sub(r"\S+$", _fmt(nu), m.group(3).rstrip())
+    return set_entry(text, "nu", value)
+
+
+def set_probe_locations(text: str, points: List[Tuple[float, float, float]]) -> str:
+    """Reemplaza probeLocations de todas las probes de functions { }."""
+    f_start, f_end = _block_span(text, "functions")
+    matches = list(_entry_re("probeLocations").finditer(text, f_start, f_end))
+    if not matches:
+        raise ValueError("No hay probeLocations en system/controlDict")
+    for m in reversed(matches):
+        indent, sep = m.group(1), m.group(2)
+        rows = "".join(f"{indent}    ({' '.join(_fmt(c) for c in p)})\n" for p in points)
+        if "\n" in sep:
+            value = f"(\n{rows}{indent})"
+        else:
+            value = "(" + " ".join(f"({' '.join(_fmt(c) for c in p)})" for p in points) + ")"
+        text = f"{text[:m.start()]}{indent}probeLocations{sep}{value};{text[m.end():]}"
+    return text
+
+
+def _first_probe(text: str) -> Optional[Tuple[float, float, float]]:
+    m = re.search(r"probeLocations\s*\(\s*\(\s*(\S+)\s+(\S+)\s+(\S+)\s*\)", text)
+    return tuple(float(x) for x in m.groups()) if m else None
+
+
+# ---------------------------------------------------------------------------
+# Plantilla y runs
+# ---------------------------------------------------------------------------
+
+def load_template(base_dir: Path) -> CaseTemplate:
+    """Lee la plantilla: patch de entrada, textos a sustituir y árbol de archivos."""
+    base_dir = Path(base_dir)
+    if not (base_dir / "system" / "controlDict").is_file():
+        raise ValueError(f"{base_dir} no es un caso (falta system/controlDict)")
+
+    props = next(
+        (f"constant/{name}" for name in PROPERTIES_FILES if (base_dir / "constant" / name).is_file()),
+        None,
+    )
+    if props is None:
+        raise ValueError(f"No hay physicalProperties ni transportProperties en {base_dir}")
+
+    texts = {
+        rel: (base_dir / rel).read_text(encoding="utf-8")
+        for rel in ("0/U", props, "system/controlDict")
+    }
+
+    inlet = "inlet"
+    boundary = base_dir / "constant" / "polyMesh" / "boundary"
+    if boundary.is_file():
+        inlet = find_patch([p.name for p in read_boundary(boundary)], "inlet") or inlet
+
+    u_text = texts["0/U"]
+    bf_start, bf_end = _block_span(u_text, "boundaryField")
+    p_start, p_end = _block_span(u_text, inlet, bf_start, bf_end)
+    m = _find_entry(u_text, "value", p_start, p_end)
+    vec = _uniform_vector(m.group(3)) if m else None
+    if vec is None or not any(vec):
+        raise ValueError(f"El patch '{inlet}' de 0/U no tiene 'value uniform (x y z)' no nulo")
+
+    template = CaseTemplate(
+        base_dir=base_dir,
+        name=base_dir.name,
+        inlet_patch=inlet,
+        inlet_vector=vec,
+        properties_file=props,
+        first_probe=_first_probe(texts["system/controlDict"]),
+        texts=texts,
+    )
+    for top in TEMPLATE_DIRS:
+        for root, dirs, files in os.walk(base_dir / top):
+            dirs.sort()
+            template.dirs.append(os.path.relpath(root, base_dir))
+            template.files.extend(
+                os.path.relpath(os.path.join(root, f), base_dir) for f in sorted(files)
+            )
+    return template
+
+
+def _is_mesh_file(rel: str) -> bool:
+    parent, name = os.path.split(rel)
+    if name.endswith(".gz"):
+        name = name[:-3]
+    return parent == os.path.join("constant", "polyMesh") and name in MESH_FILES
+
+
+def parse_probes(text: str, template: CaseTemplate) -> List[Tuple[float, float, float]]:
+    """
+    "x1;x2;..." -> puntos a esas distancias a lo largo del flujo desde la
+    primera probe de la plantilla; "x y z;..." -> puntos explícitos.
+    """
+    points = []
+    for item in text.split(";"):
+        coords = [float(c) for c in item.replace(",", " ").split()]
+        if not coords:
+            continue
+        if len(coords) == 3:
+            points.append(tuple(coords))
+        elif len(coords) == 1:
+            origin = template.first_probe or (0.0, 0.0, 0.0)
+            points.append(tuple(o + coords[0] * a for o, a in zip(origin, template.flow_axis)))
+        else:
+            raise ValueError(f"Probe inválida '{item.strip()}': usa 'x' o 'x y z'")
+    if not points:
+        raise ValueError("Lista de probes vacía")
+    return points
+
+
+def render_texts(template: CaseTemplate, spec: RunSpec) -> Dict[str, str]:
+    """Textos modificados del run (sólo los archivos que cambian)."""
+    out: Dict[str, str] = {}
+    if spec.U_inlet_ms is not None:
+        if spec.U_inlet_ms <= 0:
+            raise ValueError(f"U_inlet_ms debe ser > 0 (run '{spec.tag}')")
+        out["0/U"] = set_inlet_velocity(
+            template.texts["0/U"], template.inlet_patch, template.inlet_vector, spec.U_inlet_ms
+        )
+    if spec.nu_m2s is not None:
+        if spec.nu_m2s <= 0:
+            raise ValueError(f"nu_m2s debe ser > 0 (run '{spec.tag}')")
+        out[template.properties_file] = set_viscosity(
+            template.texts[template.properties_file], spec.nu_m2s
+        )
+    control = template.texts["system/controlDict"]
+    if spec.end_time is not None:
+        control = set_entry(control, "endTime", _fmt(spec.end_time))
+    if spec.probes is not None:
+        control = set_probe_locations(control, spec.probes)
+    if control is not template.texts["system/controlDict"]:
+        out["system/controlDict"] = control
+    return out
+
+
+def run_name(base: str, stamp: str, tag: str) -> str:
+    """Nombre "base__AAAAMMDD-HHMMSS__tag" (el que espera postproc.campaign)."""
+    return f"{base}__{stamp}__{tag}"
+
+
+def create_run(
+    template: CaseTemplate,
+    spec: RunSpec,
+    runs_root: Path,
+    stamp: str,
+    link: str = "hard",
+) -> Dict[str, Any]:
+    """
+    Crea un run: directorios, archivos sustituidos, malla enlazada y
+    run_metadata.json. Devuelve los metadatos más los conteos de archivos.
+    """
+    texts = render_texts(template, spec)
+    runs_root = Path(runs_root)
+    name = run_name(template.name, stamp, spec.tag)
+    run_dir = runs_root / name
+    try:
+        run_dir.mkdir(parents=True)
+    except FileExistsError:
+        raise ValueError(f"El run {run_dir} ya existe") from None
+
+    for rel in template.dirs:
+        (run_dir / rel).mkdir(parents=True, exist_ok=True)
+
+    linked = copied = 0
+    for rel in template.files:
+        src, dst = template.base_dir / rel, run_dir / rel
+        if rel in texts:
+            dst.write_text(texts[rel], encoding="utf-8")
+            continue
+        if link == "hard" and _is_mesh_file(rel):
+            try:
+                os.link(src, dst)
+                linked += 1
+                continue
+            except OSError:
+                pass  # otro sistema de archivos o sin permiso: se copia
+        shutil.copyfile(src, dst)
+        copied += 1
+
+    meta = {
+        "run_name": name,
+        "base_case": template.name,
+        "tag": spec.tag,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "cases_root": str(runs_root.resolve().parent),
+        "run_path": str(run_dir.resolve()),
+        "parameters": spec.parameters(),
+    }
+    (run_dir / RUN_METADATA_FILE).write_text(json.dumps(meta, indent=2) + "\n", encoding="utf-8")
+    return {**meta, "linked_files": linked, "copied_files": copied}
+
+
+def _optional_float(row: Dict[str, Any], key: str) -> Optional[float]:
+    value = row.get(key)
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    return float(value)
+
+
+def read_table(stream: TextIO, template: CaseTemplate) -> Iterator[RunSpec]:
+    """
+    Filas de la tabla de parámetros como RunSpec. JSON-lines si la primera
+    línea no vacía empieza con "{"; si no, CSV con encabezado.
+    """
+    lines = [line for line in stream.read().splitlines() if line.strip()]
+    if lines and lines[0].lstrip().startswith("{"):
+        rows = (json.loads(line) for line in lines)
+    else:
+        rows = csv.DictReader(lines)
+    for i, row in enumerate(rows, start=1):
+        try:
+            probes = row.get("probes")
+            if isinstance(probes, list):
+                probes = ";".join(" ".join(str(c) for c in p) if isinstance(p, list) else str(p) for p in probes)
+            yield RunSpec(
+                tag=_TAG_RE.sub("_", str(row.get("tag") or "").strip()) or f"{i:03d}",
+                U_inlet_ms=_optional_float(row, "U_inlet_ms"),
+                nu_m2s=_optional_float(row, "nu_m2s"),
+                end_time=_optional_float(row, "endTime"),
+                probes=parse_probes(probes, template) if probes and str(probes).strip() else None,
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Fila {i} de la tabla inválida: {e}") from None
+
+
+def generate_runs(
+    template: CaseTemplate,
+    specs: List[RunSpec],
+    runs_root: Path,
+    link: str = "hard",
+    stamp: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Crea todos los runs con la misma marca de tiempo. Los textos se validan
+    antes de crear nada, así que una fila inválida no deja runs a medias.
+    """
+    if link not in LINK_MODES:
+        raise ValueError(f"Modo de enlace desconocido '{link}'. Usa uno de: {', '.join(LINK_MODES)}")
+    tags = [s.tag for s in specs]
+    repeated = sorted({t for t in tags if tags.count(t) > 1})
+    if repeated:
+        raise ValueError(f"Tags repetidos en la tabla: {', '.join(repeated)}")
+    for spec in specs:
+        render_texts(template, spec)
+
+    stamp = stamp or datetime.now().strftime("%Y%m%d-%H%M%S")
+    return [create_run(template, spec, runs_root, stamp, link) for spec in specs]
+
+
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Genera runs a partir de una plantilla de cases/base, cambiando "
+            "U de entrada, nu, endTime y probes desde una tabla de parámetros."
+        )
+    )
+    parser.add_argument("base", type=Path, help="Caso plantilla (p.ej. ../../cases/base/pipe20m).")
+    parser.add_argument("--table", "-t", type=argparse.FileType("r", encoding="utf-8"),
+                        help=f"Tabla CSV o JSON-lines con columnas {', '.join(TABLE_COLUMNS)}.")
+    parser.add_argument("--runs-root", type=Path,
+                        help="Carpeta donde crear los runs (por defecto: ../runs junto a la plantilla).")
+    parser.add_argument("--link", choices=LINK_MODES, default="hard",
+                        help="hard: hard links para la malla (por defecto); copy: copiar todo.")
+    parser.add_argument("--tag", help="Sin --table: tag del único run a crear.")
+    parser.add_argument("--U-inlet", dest="U_inlet_ms", type=float, help="Sin --table: |U| de entrada [m/s].")
+    parser.add_argument("--nu", dest="nu_m2s", type=float, help="Sin --table: viscosidad [m²/s].")
+    parser.add_argument("--end-time", dest="end_time", type=float, help="Sin --table: endTime.")
+    parser.add_argument("--probes", help="Sin --table: 'x1;x2;...' o 'x y z;...'.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Any = None) -> None:
+    args = parse_args(argv)
+    runs_root = args.runs_root or args.base.resolve().parent.parent / "runs"
+    try:
+        template = load_template(args.base)
+        if args.table is not None:
+            specs = list(read_table(args.table, template))
+        else:
+            specs = [RunSpec(
+                tag=_TAG_RE.sub("_", args.tag or "") or "001",
+                U_inlet_ms=args.U_inlet_ms,
+                nu_m2s=args.nu_m2s,
+                end_time=args.end_time,
+                probes=parse_probes(args.probes, template) if args.probes else None,
+            )]
+        runs = generate_runs(template, specs, runs_root, link=args.link)
+    except ValueError as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for run in runs:
+        print(run["run_path"])
+    linked = sum(r["linked_files"] for r in runs)
+    copied = sum(r["copied_files"] for r in runs)
+    print(f"Runs creados: {len(runs)} (archivos enlazados: {linked}, copiados: {copied})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
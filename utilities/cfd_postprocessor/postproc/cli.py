@@ -0,0 +1,175 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, List, Optional
+
+from .analysis import CaseResult, evaluate_cases, watch_until_steady
+from .case_params import discover_cases, read_case_parameters
+from .convergence import REL_DRIFT_TOL_DEFAULT, REL_STD_TOL_DEFAULT, WINDOW_DEFAULT
+
+CORRELATION_METHODS = ("blasius", "haaland", "colebrook", "table")
+
+
+def _fmt(x: Optional[float], spec: str = ".6g") -> str:
+    """Formatea flotantes; "-" si no hay valor."""
+    return "-" if x is None else format(x, spec)
+
+
+def print_report(r: CaseResult) -> None:
+    """Reporte detallado de un caso (formato del antiguo post_pipe20m.py)."""
+    p = r.params
+    print("==============================================")
+    print(f"  Post-proceso CFD caso {r.name}")
+    print("==============================================")
+    print(f"Directorio del caso : {r.case_dir}")
+    if r.error:
+        print(f"[ERROR] {r.error}")
+    if p is None:
+        print("")
+        return
+    print(f"Longitud L          : {_fmt(p.L_m, '.3f')} m  ({p.sources.get('L_m', '-')})")
+    print(f"D hidráulico        : {_fmt(p.D_m, '.3f')} m  ({p.sources.get('D_m', '-')})")
+    print(f"rho                 : {p.rho_kgm3:.1f} kg/m3  ({p.sources.get('rho_kgm3', '-')})")
+    print(f"nu                  : {p.nu_m2s:.2e} m2/s  ({p.sources.get('nu_m2s', '-')})")
+    print(f"rugosidad           : {p.roughness_m:.2e} m")
+    print(f"p cinemática        : {'sí (p/rho, se multiplica por rho)' if p.p_kinematic else 'no'}")
+    print("")
+
+    if r.t_end is None:
+        print("Sin postProcessing: sólo teoría con U de entrada (0/U).")
+    else:
+        print("----- CFD (cola de postProcessing) -----")
+        print(f"t final            : {r.t_end:.3f}")
+        print(f"Δp último   [Pa]   : {_fmt(r.dp_last_pa, '.3f')}")
+        print(f"Q último    [m3/s] : {_fmt(r.Q_last_m3s, '.6f')}")
+        for label, unit, c in (("Δp", "Pa", r.dp_convergence), ("Q", "m3/s", r.Q_convergence)):
+            since = f" (desde t={c['t_steady']:.3f})" if c["t_steady"] is not None else ""
+            print(f"{label + ' media [' + unit + ']':<19}: {_fmt(c['mean'])}")
+            print(f"{label + ' std [' + unit + ']':<19}: {_fmt(c['std'], '.3g')}")
+            print(f"{label + ' deriva [' + unit + '/s]':<19}: {_fmt(c['slope'], '.3g')}")
+            print(f"{label + ' estacionario':<19}: {'sí' if c['steady'] else 'no'}{since}")
+    print("")
+
+    if r.Re is not None:
+        print("----- Teoría Darcy–Weisbach -----")
+        print(f"Q usado    [m3/s]  : {r.Q_used_m3s:.6f}")
+        print(f"U media    [m/s]   : {r.U_m_s:.4f}")
+        print(f"Re_teo             : {r.Re:.3e}")
+        print(f"f_teo (Darcy)      : {r.f_theory:.6f}")
+        print(f"Δp_teo     [Pa]    : {r.dp_theory_pa:.3f}")
+        print("")
+    if r.error_dp_pct is not None:
+        print("----- Comparación CFD vs teoría -----")
+        print(f"f CFD              : {r.f_cfd:.6f}")
+        print(f"Error relativo Δp  : {r.error_dp_pct:.2f} %")
+        print(f"Error relativo f   : {r.error_f_pct:.2f} %")
+        print("")
+
+
+def print_table(results: List[CaseResult]) -> None:
+    """Una fila por caso."""
+    header = f"{'caso':<48} {'Re':>10} {'Q [m3/s]':>10} {'Δp CFD':>10} {'Δp teo':>10} {'err %':>8} {'estac.':>6}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        if r.error:
+            print(f"{r.name:<48} [ERROR] {r.error}")
+            continue
+        steady = {None: "-", True: "sí", False: "no"}[r.steady]
+        print(
+            f"{r.name:<48} {_fmt(r.Re, '10.3e')} {_fmt(r.Q_used_m3s, '10.5f')} "
+            f"{_fmt(r.dp_mean_pa, '10.2f')} {_fmt(r.dp_theory_pa, '10.2f')} "
+            f"{_fmt(r.error_dp_pct, '8.2f')} {steady:>6}"
+        )
+
+
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Post-proceso de casos OpenFOAM: Δp y Q de postProcessing contra "
+            "Darcy–Weisbach (motor de correlaciones de losses_calculator)."
+        )
+    )
+    parser.add_argument(
+        "paths", nargs="+", type=Path,
+        help="Casos o carpetas con casos (p.ej. cases/ completo).",
+    )
+    parser.add_argument("--format", "-f", choices=("table", "report", "json"), default="table",
+                        help="Salida: tabla resumen, reporte por caso o JSON (por defecto: table).")
+    parser.add_argument("--method", "-m", choices=CORRELATION_METHODS, default="haaland",
+                        help="Correlación para f en régimen turbulento (por defecto: haaland).")
+    parser.add_argument("--L", dest="L_m", type=float,
+                        help="Forzar longitud [m] en vez de leerla del blockMeshDict.")
+    parser.add_argument("--D", dest="D_m", type=float,
+                        help="Forzar diámetro [m] en vez de leerlo del blockMeshDict.")
+    parser.add_argument("--rho", dest="rho_kgm3", type=float,
+                        help="Forzar densidad [kg/m3].")
+    parser.add_argument("--roughness", dest="roughness_m", type=float,
+                        help="Rugosidad absoluta [m] (por defecto 0, tubería lisa).")
+    parser.add_argument("--window", type=int, default=WINDOW_DEFAULT,
+                        help="Muestras de la ventana de promedio (por defecto %(default)s).")
+    parser.add_argument("--rel-std-tol", type=float, default=REL_STD_TOL_DEFAULT,
+                        help="Tolerancia std/|media| para estado estacionario.")
+    parser.add_argument("--rel-drift-tol", type=float, default=REL_DRIFT_TOL_DEFAULT,
+                        help="Tolerancia |pendiente|·span/|media| para estado estacionario.")
+    parser.add_argument("--watch", action="store_true",
+                        help="Esperar (revisando la cola de postProcessing) hasta que Δp y Q sean estacionarios.")
+    parser.add_argument("--poll", type=float, default=30.0,
+                        help="Segundos entre revisiones con --watch.")
+    parser.add_argument("--stop-solver", action="store_true",
+                        help="Con --watch: poner stopAt writeNow en system/controlDict al converger.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Any = None) -> None:
+    args = parse_args(argv)
+    overrides = {
+        "L_m": args.L_m,
+        "D_m": args.D_m,
+        "rho_kgm3": args.rho_kgm3,
+        "roughness_m": args.roughness_m,
+    }
+
+    case_dirs = discover_cases(args.paths)
+    if not case_dirs:
+        print("[ERROR] No se encontraron casos (carpetas con system/controlDict).", file=sys.stderr)
+        sys.exit(1)
+
+    if args.watch:
+        if len(case_dirs) != 1:
+            print("[ERROR] --watch requiere un solo caso.", file=sys.stderr)
+            sys.exit(1)
+        params = read_case_parameters(case_dirs[0], overrides)
+        print(f"Esperando estado estacionario en {params.pp_dir} ...", file=sys.stderr)
+        watch_until_steady(
+            params,
+            window=args.window,
+            rel_std_tol=args.rel_std_tol,
+            rel_drift_tol=args.rel_drift_tol,
+            poll_s=args.poll,
+            stop_solver=args.stop_solver,
+        )
+        if args.stop_solver:
+            print("Convergido: stopAt writeNow en system/controlDict.", file=sys.stderr)
+
+    results = evaluate_cases(
+        case_dirs,
+        window=args.window,
+        rel_std_tol=args.rel_std_tol,
+        rel_drift_tol=args.rel_drift_tol,
+        method=args.method,
+        overrides=overrides,
+    )
+
+    if args.format == "json":
+        print(json.dumps([r.to_dict() for r in results], indent=2, ensure_ascii=False))
+    elif args.format == "report":
+        for r in results:
+            print_report(r)
+    else:
+        print_table(results)
+
+
+if __name__ == "__main__":
+    main()
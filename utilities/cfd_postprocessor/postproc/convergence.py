@@ -0,0 +1,178 @@
+"""
+Detección de estado estacionario sobre series temporales [t, valor].
+
+Estadísticas en ventana deslizante (media, desviación estándar, pendiente)
+actualizadas en O(1) por muestra, y un criterio relativo a |media| para
+decidir si Δp o Q dejaron de cambiar. request_solver_stop pide a OpenFOAM
+que escriba y termine cambiando stopAt en system/controlDict.
+"""
+
+import math
+import re
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+# Criterios por defecto de estado estacionario (relativos a |media|)
+WINDOW_DEFAULT = 200
+REL_STD_TOL_DEFAULT = 1e-3
+REL_DRIFT_TOL_DEFAULT = 1e-3
+
+
+class RunningWindowStats:
+    """
+    Media, desviación estándar y pendiente (mínimos cuadrados) sobre las
+    últimas `window` muestras, actualizadas en O(1) por muestra.
+
+    Se mantienen las sumas Σt, Σy, Σt², Σy², Σty de la ventana; al entrar
+    una muestra se suma y al salir la más antigua se resta. Tiempos y
+    valores se guardan desplazados respecto de la primera muestra para
+    evitar cancelación numérica en las sumas de cuadrados.
+    """
+
+    def __init__(self, window: int = WINDOW_DEFAULT):
+        if window < 2:
+            raise ValueError("window debe ser >= 2")
+        self.window = window
+        self._buf = deque()
+        self._t0 = None
+        self._y0 = None
+        self._st = self._sy = self._stt = self._syy = self._sty = 0.0
+
+    def push(self, t: float, y: float) -> None:
+        """Agrega una muestra (t, y); descarta la más antigua si la ventana está llena."""
+        if self._t0 is None:
+            self._t0, self._y0 = t, y
+        tt, yy = t - self._t0, y - self._y0
+        self._buf.append((tt, yy))
+        self._st += tt
+        self._sy += yy
+        self._stt += tt * tt
+        self._syy += yy * yy
+        self._sty += tt * yy
+        if len(self._buf) > self.window:
+            ot, oy = self._buf.popleft()
+            self._st -= ot
+            self._sy -= oy
+            self._stt -= ot * ot
+            self._syy -= oy * oy
+            self._sty -= ot * oy
+
+    @property
+    def count(self) -> int:
+        return len(self._buf)
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._buf) >= self.window
+
+    @property
+    def mean(self) -> float:
+        n = len(self._buf)
+        return self._y0 + self._sy / n if n else float("nan")
+
+    @property
+    def std(self) -> float:
+        n = len(self._buf)
+        if n < 2:
+            return float("nan")
+        var = (self._syy - self._sy * self._sy / n) / (n - 1)
+        return math.sqrt(max(var, 0.0))
+
+    @property
+    def slope(self) -> float:
+        """Pendiente dy/dt de la recta de mínimos cuadrados en la ventana."""
+        n = len(self._buf)
+        if n < 2:
+            return float("nan")
+        stt = self._stt - self._st * self._st / n
+        if stt <= 0.0:
+            return float("nan")
+        return (self._sty - self._st * self._sy / n) / stt
+
+    @property
+    def span(self) -> float:
+        """Intervalo de tiempo cubierto por la ventana."""
+        return self._buf[-1][0] - self._buf[0][0] if self._buf else 0.0
+
+    def is_steady(
+        self,
+        rel_std_tol: float = REL_STD_TOL_DEFAULT,
+        rel_drift_tol: float = REL_DRIFT_TOL_DEFAULT,
+    ) -> bool:
+        """
+        Estacionario si la ventana está llena y, relativo a |media|:
+          - std / |media|               < rel_std_tol
+          - |pendiente| · span / |media| < rel_drift_tol
+        """
+        if not self.is_full:
+            return False
+        scale = abs(self.mean)
+        if scale == 0.0:
+            return False
+        drift = abs(self.slope) * self.span if self.span > 0 else 0.0
+        return self.std / scale < rel_std_tol and drift / scale < rel_drift_tol
+
+
+def window_summary(stats: RunningWindowStats, steady: bool, t_steady=None) -> dict:
+    """Resumen en dict de una ventana (para imprimir o guardar en JSON)."""
+    return {
+        "mean": stats.mean,
+        "std": stats.std,
+        "slope": stats.slope,
+        "n_window": stats.count,
+        "steady": steady,
+        "t_steady": t_steady,
+    }
+
+
+def analyze_convergence(
+    history,
+    window: int = WINDOW_DEFAULT,
+    rel_std_tol: float = REL_STD_TOL_DEFAULT,
+    rel_drift_tol: float = REL_DRIFT_TOL_DEFAULT,
+) -> dict:
+    """
+    Recorre un historial (k, >=2) [t, valor] una sola vez y devuelve las
+    estadísticas de la última ventana y el tiempo desde el cual se cumple
+    sin interrupción el criterio de estado estacionario (None si no se cumple).
+    """
+    stats = RunningWindowStats(window)
+    steady = False
+    t_steady = None
+    for t, y in zip(history[:, 0], history[:, 1]):
+        stats.push(float(t), float(y))
+        steady = stats.is_steady(rel_std_tol, rel_drift_tol)
+        if not steady:
+            t_steady = None
+        elif t_steady is None:
+            t_steady = float(t)
+    return window_summary(stats, steady, t_steady)
+
+
+def difference_history(a, b):
+    """
+    Historial [t, a - b] en los tiempos comunes de dos historiales
+    (p.ej. p_in - p_out para Δp).
+    """
+    t, ia, ib = np.intersect1d(a[:, 0], b[:, 0], return_indices=True)
+    return np.column_stack([t, a[ia, 1] - b[ib, 1]])
+
+
+def request_solver_stop(case_dir: Path) -> bool:
+    """
+    Cambia `stopAt` a `writeNow` en system/controlDict.
+
+    Con `runTimeModifiable yes` el solver relee el diccionario, escribe el
+    tiempo actual y termina. Devuelve False si ya estaba en writeNow.
+    """
+    control_dict = case_dir / "system" / "controlDict"
+    text = control_dict.read_text()
+    new_text, n = re.subn(r"^(\s*stopAt\s+)\w+(\s*;)", r"\1writeNow\2", text, count=1, flags=re.M)
+    if n == 0:
+        raise RuntimeError(f"No se encontró stopAt en {control_dict}")
+    if new_text == text:
+        return False
+    control_dict.write_text(new_text)
+    return True
@@ -0,0 +1,360 @@
+"""
+Lector de campos OpenFOAM ASCII (0/U, p, k, omega, nut, yPlus,
+wallShearStress, ... y los de cada tiempo escrito).
+
+Al abrir un campo sólo se indexa el archivo (memory-map): se ubica cada
+entrada de internalField y de boundaryField sin convertir números. Las
+listas "nonuniform List<scalar|vector|...> N ( ... )" se saltan buscando su
+")" final con una regex (C), y se convierten recién cuando se piden, con un
+solo np.fromstring sobre el cuerpo, como en postproc.polymesh. Así, leer el
+yPlus del patch de pared de un caso de 1M de celdas no convierte el campo
+interno.
+
+Valores devueltos:
+  - escalares: array (n,); vectores: (n, 3); tensores: (n, 6) o (n, 9)
+  - "uniform X": array () o (3,), o repetido a (n, ...) si se da el tamaño
+    (vista de sólo lectura)
+
+Uso:
+    python3 -m postproc.fields ../../cases/base/pipe20m yPlus wallShearStress
+    python3 -m postproc.fields CASE U --time 1000 --patch inlet --internal
+"""
+
+import argparse
+import gzip
+import json
+import mmap
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .foam_io import read_boundary
+from .polymesh import parse_numbers
+from .timeseries import list_time_dirs
+
+# Componentes por tipo de valor de OpenFOAM
+FIELD_COMPONENTS = {
+    "scalar": 1,
+    "vector": 3,
+    "sphericalTensor": 1,
+    "symmTensor": 6,
+    "tensor": 9,
+}
+
+_SKIP_RE = re.compile(rb"(?:\s+|//[^\n]*|/\*.*?\*/)*", re.S)
+_WORD_RE = re.compile(rb'"[^"]*"|[^\s{};]+')
+_LIST_HEAD_RE = re.compile(rb"nonuniform\s+List<(\w+)>\s*(\d+)\s*\(")
+_LIST_END_RE = re.compile(rb"\)\s*;")
+_CLASS_RE = re.compile(r"(?:vol|surface|point)(\w+)Field")
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+@dataclass
+class _ListSpan:
+    """Lista nonuniform sin convertir: tipo, tamaño y cuerpo buf[start:end]."""
+
+    value_type: str
+    size: int
+    start: int
+    end: int
+
+
+def _skip(buf: Buffer, pos: int) -> int:
+    return _SKIP_RE.match(buf, pos).end()
+
+
+def _parse_value(buf: Buffer, pos: int) -> Tuple[Any, int]:
+    """Valor de una entrada a partir de pos; devuelve (valor, posición tras ';')."""
+    m = _LIST_HEAD_RE.match(buf, pos)
+    if m:
+        end = _LIST_END_RE.search(buf, m.end())
+        if end is None:
+            raise ValueError("Lista nonuniform sin cerrar")
+        span = _ListSpan(m.group(1).decode(), int(m.group(2)), m.end(), end.start())
+        return span, end.end()
+    if buf[pos:pos + 2] == b"#{":
+        # Código verbatim (#{ ... #}): puede contener ';'
+        end = buf.find(b"#}", pos)
+        if end < 0:
+            raise ValueError("Bloque #{ sin cerrar")
+        pos = end + 2
+    end = buf.find(b";", pos)
+    if end < 0:
+        raise ValueError("Entrada sin ';'")
+    return buf[pos:end].decode("utf-8", errors="replace").strip(), end + 1
+
+
+def _parse_entries(buf: Buffer, pos: int, closing: bool) -> Tuple[Dict[str, Any], int]:
+    """Entradas de un diccionario (anidados como dict, listas como _ListSpan)."""
+    entries: Dict[str, Any] = {}
+    n = len(buf)
+    while True:
+        pos = _skip(buf, pos)
+        if pos >= n:
+            if closing:
+                raise ValueError("Diccionario sin cerrar")
+            return entries, pos
+        c = buf[pos:pos + 1]
+        if c == b"}":
+            if not closing:
+                raise ValueError(f"'}}' sobrante en la posición {pos}")
+            return entries, pos + 1
+        if c == b";":
+            pos += 1
+            continue
+        if c == b"#":
+            # Directiva (#include, #includeEtc, ...): se ignora la línea
+            end = buf.find(b"\n", pos)
+            pos = n if end < 0 else end
+            continue
+
+        m = _WORD_RE.match(buf, pos)
+        if m is None:
+            raise ValueError(f"Entrada inválida en la posición {pos}")
+        key = m.group().decode("utf-8", errors="replace")
+        pos = _skip(buf, m.end())
+        if buf[pos:pos + 1] == b"{":
+            entries[key], pos = _parse_entries(buf, pos + 1, closing=True)
+        else:
+            entries[key], pos = _parse_value(buf, pos)
+
+
+def _open_buffer(path: Path) -> Buffer:
+    if path.suffix == ".gz":
+        return gzip.decompress(path.read_bytes())
+    with open(path, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # archivo vacío
+            return b""
+
+
+@dataclass
+class FoamField:
+    """
+    Campo OpenFOAM indexado; los valores se convierten al pedirlos y quedan
+    guardados (una conversión por entrada).
+    """
+
+    path: Path
+    header: Dict[str, Any]
+    entries: Dict[str, Any]
+    _buf: Buffer = field(repr=False)
+    _values: Dict[Tuple[str, ...], np.ndarray] = field(default_factory=dict, repr=False)
+
+    @property
+    def name(self) -> str:
+        return str(self.header.get("object", self.path.name)).strip('"')
+
+    @property
+    def field_class(self) -> str:
+        return str(self.header.get("class", ""))
+
+    @property
+    def value_type(self) -> str:
+        """scalar, vector, symmTensor, ... (de la clase, p.ej. volVectorField)."""
+        m = _CLASS_RE.fullmatch(self.field_class)
+        if m is None:
+            raise ValueError(f"{self.path}: clase de campo desconocida '{self.field_class}'")
+        t = m.group(1)
+        return t[0].lower() + t[1:]
+
+    @property
+    def n_components(self) -> int:
+        return FIELD_COMPONENTS[self.value_type]
+
+    @property
+    def dimensions(self) -> Tuple[int, ...]:
+        """Dimensiones SI [kg m s K mol A cd]."""
+        text = str(self.entries.get("dimensions", "")).strip("[] ")
+        return tuple(int(float(x)) for x in text.split())
+
+    @property
+    def patch_names(self) -> List[str]:
+        return [k.strip('"') for k in self.entries.get("boundaryField", {})]
+
+    def _patch_entries(self, patch: str) -> Dict[str, Any]:
+        bf = self.entries.get("boundaryField", {})
+        if patch in bf:
+            return bf[patch]
+        # Claves con regex o grupos entre comillas: ".*", "(inlet|outlet)"
+        for key, entries in bf.items():
+            if key.startswith('"') and re.fullmatch(key.strip('"'), patch):
+                return entries
+        raise KeyError(f"{self.path}: no hay patch '{patch}' en boundaryField")
+
+    def patch_type(self, patch: str) -> str:
+        return str(self._patch_entries(patch).get("type", ""))
+
+    def _decode(self, raw: Any, size: Optional[int]) -> np.ndarray:
+        ncomp = self.n_components
+        if isinstance(raw, _ListSpan):
+            values = parse_numbers(self._buf[raw.start:raw.end], np.float64)
+            ncomp = FIELD_COMPONENTS.get(raw.value_type, ncomp)
+            if values.size != raw.size * ncomp:
+                raise ValueError(
+                    f"{self.path}: List<{raw.value_type}> declara {raw.size} valores, hay {values.size / ncomp:g}"
+                )
+            if size is not None and size != raw.size:
+                raise ValueError(f"{self.path}: se esperaban {size} valores, hay {raw.size}")
+            return values if ncomp == 1 else values.reshape(raw.size, ncomp)
+
+        text = str(raw)
+        if text.startswith("$"):
+            return self._decode(self.entries.get(text[1:]), size)
+        if not text.startswith("uniform"):
+            raise ValueError(f"{self.path}: valor no numérico '{text[:40]}'")
+        value = parse_numbers(text[len("uniform"):].encode(), np.float64)
+        if value.size != ncomp:
+            raise ValueError(f"{self.path}: valor uniform inválido '{text}'")
+        value = value.reshape(()) if ncomp == 1 else value
+        return value if size is None else np.broadcast_to(value, (size,) + value.shape)
+
+    def _cached(self, key: Tuple[str, ...], raw: Any, size: Optional[int]) -> np.ndarray:
+        cache_key = key + (str(size),)
+        if cache_key not in self._values:
+            if raw is None:
+                raise KeyError(f"{self.path}: no hay entrada {'/'.join(key)}")
+            self._values[cache_key] = self._decode(raw, size)
+        return self._values[cache_key]
+
+    def internal_field(self, size: Optional[int] = None) -> np.ndarray:
+        """Valores en las celdas (size = número de celdas para expandir uniform)."""
+        return self._cached(("internalField",), self.entries.get("internalField"), size)
+
+    def boundary_field(self, patch: str, size: Optional[int] = None, entry: str = "value") -> np.ndarray:
+        """
+        Valores de una entrada (por defecto "value") de un patch. Los patches
+        sin esa entrada (zeroGradient, noSlip, ...) dan KeyError.
+        """
+        raw = self._patch_entries(patch).get(entry)
+        return self._cached(("boundaryField", patch, entry), raw, size)
+
+
+def read_field(path: Path) -> FoamField:
+    """Indexa un campo (sin convertir sus listas)."""
+    path = Path(path)
+    buf = _open_buffer(path)
+    entries, _ = _parse_entries(buf, 0, closing=False)
+    header = entries.pop("FoamFile", None)
+    if not isinstance(header, dict):
+        raise ValueError(f"Sin cabecera FoamFile en {path}")
+    if header.get("format", "ascii") != "ascii":
+        raise ValueError(f"Sólo se soportan campos ASCII: {path}")
+    return FoamField(path=path, header=header, entries=entries, _buf=buf)
+
+
+def case_times(case_dir: Path) -> List[str]:
+    """Nombres de las carpetas de tiempo del caso ("0", "100", ...), en orden."""
+    return [d.name for d in list_time_dirs(Path(case_dir))]
+
+
+def field_path(case_dir: Path, name: str, time: Optional[str] = None) -> Path:
+    """
+    Archivo del campo `name` en la carpeta de tiempo `time` (por defecto, el
+    último tiempo que lo tiene). Acepta campos comprimidos (name.gz).
+    """
+    case_dir = Path(case_dir)
+    times = [str(time)] if time is not None else case_times(case_dir)[::-1]
+    for t in times:
+        for candidate in (case_dir / t / name, case_dir / t / f"{name}.gz"):
+            if candidate.is_file():
+                return candidate
+    where = f"el tiempo {time}" if time is not None else "ningún tiempo"
+    raise FileNotFoundError(f"No existe el campo {name} en {where} de {case_dir}")
+
+
+def read_case_field(case_dir: Path, name: str, time: Optional[str] = None) -> FoamField:
+    """Campo `name` de un caso (último tiempo escrito por defecto)."""
+    return read_field(field_path(case_dir, name, time))
+
+
+def patch_sizes(case_dir: Path) -> Dict[str, int]:
+    """nFaces de cada patch según constant/polyMesh/boundary ({} si no existe)."""
+    boundary = Path(case_dir) / "constant" / "polyMesh" / "boundary"
+    if not boundary.is_file():
+        return {}
+    return {p.name: p.n_faces for p in read_boundary(boundary)}
+
+
+def _stats(values: np.ndarray, n_components: int, size: Optional[int]) -> Dict[str, Any]:
+    """Mín/media/máx (módulo para vectores); un uniform cuenta como `size` valores."""
+    uniform = values.ndim == (0 if n_components == 1 else 1)
+    mags = np.linalg.norm(values, axis=-1) if n_components > 1 else values
+    mags = np.atleast_1d(mags)
+    return {
+        "n": (size or 1) if uniform else int(mags.size),
+        "min": float(mags.min()) if mags.size else None,
+        "mean": float(mags.mean()) if mags.size else None,
+        "max": float(mags.max()) if mags.size else None,
+    }
+
+
+def summarize_field(
+    case_dir: Path,
+    name: str,
+    time: Optional[str] = None,
+    patches: Optional[List[str]] = None,
+    internal: bool = False,
+) -> Dict[str, Any]:
+    """
+    Mínimo, media y máximo (módulo para vectores) por patch con valores y,
+    si internal, en las celdas. Sólo se convierten las entradas pedidas.
+    """
+    fld = read_case_field(case_dir, name, time)
+    sizes = patch_sizes(case_dir)
+    ncomp = fld.n_components
+    out: Dict[str, Any] = {"field": fld.name, "time": fld.path.parent.name, "regions": {}}
+    if internal:
+        out["regions"]["internalField"] = _stats(fld.internal_field(), ncomp, None)
+    for patch in patches or fld.patch_names:
+        try:
+            values = fld.boundary_field(patch)
+        except KeyError:
+            continue
+        out["regions"][patch] = {"type": fld.patch_type(patch), **_stats(values, ncomp, sizes.get(patch))}
+    return out
+
+
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Resumen (mín/media/máx por patch) de campos OpenFOAM de un caso."
+    )
+    parser.add_argument("case", type=Path, help="Carpeta del caso.")
+    parser.add_argument("fields", nargs="+", help="Campos a leer (p.ej. yPlus wallShearStress U).")
+    parser.add_argument("--time", help="Carpeta de tiempo (por defecto: la última con el campo).")
+    parser.add_argument("--patch", action="append", help="Sólo estos patches (repetible).")
+    parser.add_argument("--internal", action="store_true", help="Incluir el campo interno.")
+    parser.add_argument("--format", choices=("table", "json"), default="table",
+                        help="Formato de salida (por defecto: table).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Any = None) -> None:
+    args = parse_args(argv)
+    try:
+        summaries = [
+            summarize_field(args.case, name, args.time, args.patch, args.internal)
+            for name in args.fields
+        ]
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.format == "json":
+        print(json.dumps(summaries, indent=2))
+        return
+    print(f"{'Campo':<18}{'Tiempo':>8}  {'Región':<16}{'Tipo':<16}{'N':>9}{'Mín':>13}{'Media':>13}{'Máx':>13}")
+    for s in summaries:
+        for region, st in s["regions"].items():
+            cols = [f"{st[k]:13.5g}" if st[k] is not None else f"{'-':>13}" for k in ("min", "mean", "max")]
+            print(f"{s['field']:<18}{s['time']:>8}  {region:<16}{st.get('type', ''):<16}{st['n']:>9}{''.join(cols)}")
+
+
+if __name__ == "__main__":
+    main()
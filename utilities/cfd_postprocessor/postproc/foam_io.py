@@ -0,0 +1,279 @@
+"""
+Lectura mínima de diccionarios ASCII de OpenFOAM.
+
+Sirve para sacar parámetros del propio caso (nu, rho, U de entrada, patches
+del boundary, vértices del blockMeshDict) sin depender de PyFoam ni de una
+instalación de OpenFOAM.
+
+Formato devuelto por parse_foam_dict:
+  - entrada "clave valor;"        -> dict["clave"] = valor
+  - entrada "clave v1 v2 ...;"    -> dict["clave"] = [v1, v2, ...]
+  - subdiccionario "clave { }"    -> dict["clave"] = {...}
+  - lista "( ... )" o "[ ... ]"   -> list
+  - "nombre { ... }" dentro de una lista -> (nombre, {...})
+  - lista de primer nivel sin clave (p.ej. polyMesh/boundary) -> dict["_list"]
+
+Las directivas (#include, #includeFunc, ...) se ignoran.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+_PUNCT = set("(){}[];")
+
+_SKIP_RE = re.compile(r"\s+|//[^\n]*|/\*.*?\*/", re.S)
+_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+_WORD_RE = re.compile(r'[^\s(){}\[\];"]+')
+
+
+def tokenize(text: str) -> List[Any]:
+    """
+    Divide el texto en tokens: puntuación, strings, números y palabras.
+
+    Una palabra seguida inmediatamente por "(" absorbe los paréntesis
+    balanceados (p.ej. "div(phi,U)", "grad(U)"), igual que OpenFOAM.
+    Los números se devuelven como int o float.
+    """
+    tokens: List[Any] = []
+    pos = 0
+    n = len(text)
+    while pos < n:
+        m = _SKIP_RE.match(text, pos)
+        if m:
+            pos = m.end()
+            continue
+
+        c = text[pos]
+        if c == "#" and (pos == 0 or text[pos - 1] in "\n\r \t"):
+            # Directiva: se ignora hasta el final de la línea
+            end = text.find("\n", pos)
+            pos = n if end < 0 else end
+            continue
+        if c in _PUNCT:
+            tokens.append(c)
+            pos += 1
+            continue
+        if c == '"':
+            m = _STRING_RE.match(text, pos)
+            if not m:
+                raise ValueError(f"String sin cerrar en la posición {pos}")
+            tokens.append(m.group()[1:-1])
+            pos = m.end()
+            continue
+
+        m = _WORD_RE.match(text, pos)
+        word = m.group()
+        pos = m.end()
+        number = _to_number(word)
+        if number is not None:
+            tokens.append(number)
+            continue
+
+        # Palabra con paréntesis pegados: div(phi,U), patchFlowRate(patch=inlet)
+        while pos < n and text[pos] == "(":
+            depth = 0
+            start = pos
+            while pos < n:
+                if text[pos] == "(":
+                    depth += 1
+                elif text[pos] == ")":
+                    depth -= 1
+                    if depth == 0:
+                        pos += 1
+                        break
+                pos += 1
+            word += text[start:pos]
+            m = _WORD_RE.match(text, pos)
+            if m:
+                word += m.group()
+                pos = m.end()
+        tokens.append(word)
+    return tokens
+
+
+def _to_number(word: str):
+    """int o float si la palabra es un número; si no, None."""
+    try:
+        return int(word)
+    except ValueError:
+        pass
+    try:
+        return float(word)
+    except ValueError:
+        return None
+
+
+class _Parser:
+    def __init__(self, tokens: List[Any]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset: int = 0):
+        i = self.pos + offset
+        return self.tokens[i] if i < len(self.tokens) else None
+
+    def next(self):
+        tok = self.peek()
+        self.pos += 1
+        return tok
+
+    def parse_dict(self, closing: Optional[str] = None) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        while True:
+            tok = self.peek()
+            if tok is None:
+                if closing:
+                    raise ValueError("Diccionario sin cerrar")
+                return result
+            if tok == closing:
+                self.pos += 1
+                return result
+            if tok == ";":
+                self.pos += 1
+                continue
+
+            # Lista de primer nivel sin clave: "3 ( ... )" o "( ... )"
+            if tok == "(" or (isinstance(tok, int) and self.peek(1) == "("):
+                if tok != "(":
+                    self.pos += 1
+                self.pos += 1
+                result["_list"] = self.parse_list(")")
+                continue
+
+            key = str(self.next())
+            if self.peek() == "{":
+                self.pos += 1
+                result[key] = self.parse_dict("}")
+                continue
+
+            values = []
+            while True:
+                tok = self.peek()
+                if tok is None or tok == ";":
+                    self.pos += 1
+                    break
+                if tok == "}" and closing == "}":
+                    break
+                values.append(self.parse_value())
+            result[key] = values[0] if len(values) == 1 else values
+
+    def parse_value(self):
+        tok = self.next()
+        if tok == "(":
+            return self.parse_list(")")
+        if tok == "[":
+            return self.parse_list("]")
+        return tok
+
+    def parse_list(self, closing: str) -> List[Any]:
+        items: List[Any] = []
+        while True:
+            tok = self.peek()
+            if tok is None:
+                raise ValueError(f"Lista sin cerrar (falta '{closing}')")
+            if tok == closing:
+                self.pos += 1
+                return items
+            if tok == "{":
+                self.pos += 1
+                items.append(self.parse_dict("}"))
+                continue
+            if isinstance(tok, str) and tok not in _PUNCT and self.peek(1) == "{":
+                self.pos += 2
+                items.append((tok, self.parse_dict("}")))
+                continue
+            if isinstance(tok, int) and self.peek(1) == "(":
+                # Lista con tamaño: "N ( ... )"; el tamaño se descarta
+                self.pos += 1
+                continue
+            items.append(self.parse_value())
+
+
+def parse_foam_dict(text: str) -> Dict[str, Any]:
+    """Parsea el texto de un diccionario OpenFOAM (ver formato arriba)."""
+    return _Parser(tokenize(text)).parse_dict()
+
+
+@lru_cache(maxsize=256)
+def _read_foam_dict_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8", errors="replace") as fh:
+        return parse_foam_dict(fh.read())
+
+
+def read_foam_dict(path: Path) -> Dict[str, Any]:
+    """
+    Lee y parsea un diccionario OpenFOAM.
+
+    El resultado se guarda en memoria por (ruta, mtime, tamaño), así que al
+    procesar muchos casos en un mismo proceso cada archivo se parsea una vez.
+    No modificar el dict devuelto.
+    """
+    st = os.stat(path)
+    return _read_foam_dict_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def scalar_value(value: Any) -> float:
+    """
+    Valor escalar de una entrada: admite "nu 1e-06;" y la forma con
+    dimensiones "nu nu [0 2 -1 0 0 0 0] 1e-06;" (se toma el último número).
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, list):
+        for item in reversed(value):
+            if isinstance(item, (int, float)):
+                return float(item)
+    raise ValueError(f"No es un valor escalar: {value!r}")
+
+
+def uniform_value(value: Any):
+    """
+    Valor de "uniform X": float para escalares, lista de floats para vectores.
+    """
+    if isinstance(value, list) and len(value) == 2 and value[0] == "uniform":
+        v = value[1]
+        if isinstance(v, list):
+            return [float(x) for x in v]
+        return float(v)
+    raise ValueError(f"No es un valor uniform: {value!r}")
+
+
+@dataclass
+class BoundaryPatch:
+    """Patch de constant/polyMesh/boundary."""
+
+    name: str
+    type: str
+    n_faces: int
+    start_face: int
+
+
+def read_boundary(path: Path) -> List[BoundaryPatch]:
+    """Lee constant/polyMesh/boundary como lista de BoundaryPatch."""
+    data = read_foam_dict(path)
+    patches = []
+    for item in data.get("_list", []):
+        if not isinstance(item, tuple):
+            continue
+        name, entries = item
+        patches.append(
+            BoundaryPatch(
+                name=name,
+                type=str(entries.get("type", "")),
+                n_faces=int(entries.get("nFaces", 0)),
+                start_face=int(entries.get("startFace", 0)),
+            )
+        )
+    return patches
+
+
+def read_field_dimensions(path: Path) -> Tuple[int, ...]:
+    """Dimensiones SI [kg m s K mol A cd] de un campo (p.ej. 0/p)."""
+    dims = read_foam_dict(path).get("dimensions")
+    if not isinstance(dims, list):
+        raise ValueError(f"Sin 'dimensions' en {path}")
+    return tuple(int(x) for x in dims)
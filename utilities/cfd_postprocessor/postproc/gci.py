@@ -0,0 +1,375 @@
+"""
+Convergencia de malla: orden observado, extrapolación de Richardson y GCI
+(Grid Convergence Index) para una familia de casos con distinta malla.
+
+Procedimiento de Celik et al. (2008), "Procedure for Estimation and
+Reporting of Uncertainty Due to Discretization in CFD Applications":
+
+  h_i   = (1 / N_i)^(1/dim)              (mismo dominio en todas las mallas)
+  r21   = h2 / h1,  r32 = h3 / h2        (1 = la más fina)
+  p     = |ln|ε32/ε21| + q(p)| / ln r21  (punto fijo)
+  q(p)  = ln((r21^p - s) / (r32^p - s)),  s = signo(ε32/ε21)
+  φ_ext = (r21^p φ1 - φ2) / (r21^p - 1)
+  GCI21 = Fs · |(φ1 - φ2)/φ1| / (r21^p - 1),  Fs = 1.25
+
+Con sólo dos mallas se usa el orden formal (2) y Fs = 3.
+
+Las celdas salen de constant/polyMesh (cabecera de owner) o de los bloques
+de system/blockMeshDict (con macros $nombre); Δp y Q, de la cola de
+postProcessing como en analysis.read_cfd_result. Los casos de la familia
+deben tener el mismo D, U de entrada y ν (si no, no es el mismo problema y
+el GCI no tiene sentido): family_convergence lo verifica.
+
+Uso:
+    python3 -m postproc.gci ../../cases/base/elbow20D ../../cases/runs/elbow90d_fine__*
+    python3 -m postproc.gci CASO_GRUESO CASO_MEDIO CASO_FINO --target 2
+"""
+
+import argparse
+import json
+import math
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .analysis import read_cfd_result
+from .case_params import discover_cases, read_case_parameters
+from .convergence import REL_DRIFT_TOL_DEFAULT, REL_STD_TOL_DEFAULT, WINDOW_DEFAULT
+from .foam_io import read_foam_dict
+from .polymesh import mesh_cell_count
+
+SAFETY_FACTOR_3_GRIDS = 1.25
+SAFETY_FACTOR_2_GRIDS = 3.0
+FORMAL_ORDER_DEFAULT = 2.0
+
+# Cantidades disponibles: nombre -> atributo de CaseResult
+QUANTITIES = {"dp": "dp_mean_pa", "Q": "Q_mean_m3s"}
+
+# Parámetros que deben coincidir en la familia: columna -> atributo de CaseParameters
+FAMILY_PARAMETERS = {"D_m": "D_m", "U_inlet_ms": "U_inlet_ms", "nu_m2s": "nu_m2s"}
+FAMILY_PARAMETER_RTOL = 1e-6
+
+
+@dataclass
+class GCIResult:
+    """Resultado del estudio de convergencia para una cantidad."""
+
+    quantity: str
+    n_cells: List[int]           # de la más fina a la más gruesa
+    values: List[float]          # φ1, φ2[, φ3]
+    r21: float
+    r32: Optional[float]
+    order: Optional[float]       # orden observado (o formal con 2 mallas)
+    extrapolated: Optional[float]
+    e_a21: float                 # error relativo aproximado |φ1-φ2|/|φ1|
+    e_ext21: Optional[float]     # error relativo respecto de φ_ext
+    gci_fine: Optional[float]    # GCI21 (fracción, no %)
+    gci_coarse: Optional[float]  # GCI32
+    asymptotic_ratio: Optional[float]  # GCI32 / (r21^p GCI21) ≈ 1 en rango asintótico
+    oscillatory: bool = False
+    notes: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def observed_order(
+    phi1: float,
+    phi2: float,
+    phi3: float,
+    r21: float,
+    r32: float,
+    tol: float = 1e-10,
+    max_iter: int = 200,
+) -> Optional[float]:
+    """Orden aparente p por punto fijo (None si no se puede calcular)."""
+    e21 = phi2 - phi1
+    e32 = phi3 - phi2
+    if e21 == 0 or e32 == 0:
+        return None
+    s = math.copysign(1.0, e32 / e21)
+    log_ratio = math.log(abs(e32 / e21))
+    p = abs(log_ratio) / math.log(r21)
+    for _ in range(max_iter):
+        num = r21 ** p - s
+        den = r32 ** p - s
+        if num <= 0 or den <= 0:
+            return None
+        p_new = abs(log_ratio + math.log(num / den)) / math.log(r21)
+        if abs(p_new - p) < tol:
+            return p_new
+        p = p_new
+    return p
+
+
+def representative_sizes(n_cells: Sequence[int], dim: int = 3) -> List[float]:
+    """h_i = (1/N_i)^(1/dim) (el volumen del dominio se cancela en r)."""
+    return [(1.0 / n) ** (1.0 / dim) for n in n_cells]
+
+
+def grid_convergence(
+    quantity: str,
+    n_cells: Sequence[int],
+    values: Sequence[float],
+    dim: int = 3,
+    formal_order: float = FORMAL_ORDER_DEFAULT,
+) -> GCIResult:
+    """
+    GCI con las 3 mallas más finas (o 2, con el orden formal). El orden de
+    entrada no importa: se ordena por número de celdas.
+    """
+    if len(n_cells) != len(values) or len(n_cells) < 2:
+        raise ValueError("Se necesitan al menos 2 mallas con su valor")
+    pairs = sorted(zip(n_cells, values), key=lambda nv: -nv[0])[:3]
+    if len({n for n, _ in pairs}) != len(pairs):
+        raise ValueError("Dos mallas tienen el mismo número de celdas")
+    ns = [int(n) for n, _ in pairs]
+    phi = [float(v) for _, v in pairs]
+    h = representative_sizes(ns, dim)
+    r21 = h[1] / h[0]
+    r32 = h[2] / h[1] if len(h) == 3 else None
+    notes: List[str] = []
+
+    e_a21 = abs((phi[0] - phi[1]) / phi[0]) if phi[0] != 0 else math.inf
+    if r32 is None:
+        order = formal_order
+        fs = SAFETY_FACTOR_2_GRIDS
+        oscillatory = False
+        notes.append(f"Sólo 2 mallas: orden formal p = {formal_order:g} y Fs = {fs:g}.")
+    else:
+        order = observed_order(phi[0], phi[1], phi[2], r21, r32)
+        fs = SAFETY_FACTOR_3_GRIDS
+        oscillatory = (phi[2] - phi[1]) * (phi[1] - phi[0]) < 0
+        if oscillatory:
+            notes.append("Convergencia oscilatoria (ε32/ε21 < 0).")
+
+    if phi[0] == phi[1]:
+        notes.append("φ1 = φ2: la cantidad ya no cambia con la malla.")
+        return GCIResult(
+            quantity=quantity, n_cells=ns, values=phi, r21=r21, r32=r32,
+            order=order, extrapolated=phi[0], e_a21=0.0, e_ext21=0.0,
+            gci_fine=0.0, gci_coarse=None, asymptotic_ratio=None,
+            oscillatory=oscillatory, notes=notes,
+        )
+    if order is None or order <= 0:
+        notes.append("No se pudo calcular el orden observado; sin extrapolación ni GCI.")
+        return GCIResult(
+            quantity=quantity, n_cells=ns, values=phi, r21=r21, r32=r32,
+            order=None, extrapolated=None, e_a21=e_a21, e_ext21=None,
+            gci_fine=None, gci_coarse=None, asymptotic_ratio=None,
+            oscillatory=oscillatory, notes=notes,
+        )
+
+    rp21 = r21 ** order
+    extrapolated = (rp21 * phi[0] - phi[1]) / (rp21 - 1.0)
+    e_ext21 = abs((extrapolated - phi[0]) / extrapolated) if extrapolated != 0 else None
+    gci_fine = fs * e_a21 / (rp21 - 1.0)
+    gci_coarse = None
+    ratio = None
+    if r32 is not None and phi[1] != 0:
+        e_a32 = abs((phi[1] - phi[2]) / phi[1])
+        gci_coarse = fs * e_a32 / (r32 ** order - 1.0)
+        ratio = gci_coarse / (rp21 * gci_fine) if gci_fine > 0 else None
+    return GCIResult(
+        quantity=quantity, n_cells=ns, values=phi, r21=r21, r32=r32,
+        order=order, extrapolated=extrapolated, e_a21=e_a21, e_ext21=e_ext21,
+        gci_fine=gci_fine, gci_coarse=gci_coarse, asymptotic_ratio=ratio,
+        oscillatory=oscillatory, notes=notes,
+    )
+
+
+def _resolve_macro(value: Any, entries: Dict[str, Any]) -> Any:
+    """"$nombre" -> valor de la entrada de nivel superior (puede encadenarse)."""
+    seen = set()
+    while isinstance(value, str) and value.startswith("$"):
+        name = value[1:]
+        if name in seen or name not in entries:
+            raise ValueError(f"Macro sin resolver en blockMeshDict: {value}")
+        seen.add(name)
+        value = entries[name]
+    return value
+
+
+def _block_mesh_cells(case_dir: Path) -> Optional[int]:
+    """Celdas de los bloques hex de system/blockMeshDict."""
+    path = case_dir / "system" / "blockMeshDict"
+    if not path.is_file():
+        return None
+    entries = read_foam_dict(path)
+    blocks = entries.get("blocks")
+    if not isinstance(blocks, list):
+        return None
+    total = 0
+    for i, item in enumerate(blocks):
+        if item == "hex" and i + 2 < len(blocks) and isinstance(blocks[i + 2], list):
+            total += math.prod(int(_resolve_macro(n, entries)) for n in blocks[i + 2])
+    return total or None
+
+
+def case_cell_count(case_dir: Path) -> Dict[str, Any]:
+    """{"n_cells", "source"} de un caso (polyMesh primero, luego blockMeshDict)."""
+    n = mesh_cell_count(case_dir)
+    if n is not None:
+        return {"n_cells": n, "source": "constant/polyMesh"}
+    n = _block_mesh_cells(case_dir)
+    if n is not None:
+        return {"n_cells": n, "source": "system/blockMeshDict"}
+    raise RuntimeError(f"No se pudo obtener el número de celdas de {case_dir} (sin owner ni blockMeshDict)")
+
+
+def read_family(
+    case_dirs: Sequence[Path],
+    window: int = WINDOW_DEFAULT,
+    rel_std_tol: float = REL_STD_TOL_DEFAULT,
+    rel_drift_tol: float = REL_DRIFT_TOL_DEFAULT,
+) -> List[Dict[str, Any]]:
+    """Celdas y valores CFD (media de la ventana) de cada caso de la familia."""
+    rows = []
+    for case_dir in case_dirs:
+        row: Dict[str, Any] = {"case": Path(case_dir).name, "case_dir": str(case_dir), "error": ""}
+        try:
+            row.update(case_cell_count(Path(case_dir)))
+            params = read_case_parameters(case_dir)
+            for name, attr in FAMILY_PARAMETERS.items():
+                row[name] = getattr(params, attr)
+            result = read_cfd_result(params, window, rel_std_tol, rel_drift_tol)
+            if result.t_end is None:
+                raise RuntimeError("sin postProcessing")
+            for name, attr in QUANTITIES.items():
+                row[name] = getattr(result, attr)
+            row["steady"] = result.steady
+        except (RuntimeError, ValueError, OSError, KeyError) as exc:
+            row["error"] = str(exc)
+        rows.append(row)
+    return rows
+
+
+def check_family_parameters(rows: Sequence[Dict[str, Any]], rtol: float = FAMILY_PARAMETER_RTOL) -> None:
+    """
+    ValueError si los casos sin error difieren en D, U de entrada o ν
+    (los que no se pudieron leer, None, no se comparan).
+    """
+    usable = [r for r in rows if not r["error"]]
+    for name in FAMILY_PARAMETERS:
+        values = {r["case"]: r.get(name) for r in usable if r.get(name) is not None}
+        if not values:
+            continue
+        ref = next(iter(values.values()))
+        if any(not math.isclose(v, ref, rel_tol=rtol) for v in values.values()):
+            detail = ", ".join(f"{case} = {v:.6g}" for case, v in values.items())
+            raise ValueError(f"Los casos no son el mismo problema: {name} distinto ({detail})")
+
+
+def family_convergence(
+    rows: Sequence[Dict[str, Any]],
+    quantities: Sequence[str] = ("dp", "Q"),
+    dim: int = 3,
+) -> Dict[str, GCIResult]:
+    """
+    GCI de cada cantidad con los casos de la familia que tienen valor.
+    ValueError si los casos no comparten D, U de entrada y ν.
+    """
+    check_family_parameters(rows)
+    out = {}
+    for q in quantities:
+        usable = [r for r in rows if not r["error"] and r.get(q) is not None]
+        if len(usable) < 2:
+            continue
+        out[q] = grid_convergence(q, [r["n_cells"] for r in usable], [r[q] for r in usable], dim=dim)
+    return out
+
+
+def _pct(x: Optional[float], spec: str = ".3f") -> str:
+    return "-" if x is None else format(100.0 * x, spec) + " %"
+
+
+def _num(x: Optional[float], spec: str = ".6g") -> str:
+    return "-" if x is None else format(x, spec)
+
+
+def print_family(rows: Sequence[Dict[str, Any]], results: Dict[str, GCIResult], target: Optional[float]) -> None:
+    print(f"{'caso':<48} {'celdas':>10} {'Δp [Pa]':>12} {'Q [m3/s]':>12} {'estac.':>6}")
+    print("-" * 92)
+    for r in sorted(rows, key=lambda r: -(r.get("n_cells") or 0)):
+        if r["error"]:
+            print(f"{r['case']:<48} [ERROR] {r['error']}")
+            continue
+        steady = {None: "-", True: "sí", False: "no"}[r["steady"]]
+        print(f"{r['case']:<48} {r['n_cells']:>10d} {_num(r['dp'], '12.4f')} {_num(r['Q'], '12.6f')} {steady:>6}")
+    print("")
+
+    for q, g in results.items():
+        print(f"----- {q}: {len(g.n_cells)} mallas -----")
+        print(f"r21 / r32          : {g.r21:.4f} / {_num(g.r32, '.4f')}")
+        print(f"orden observado p  : {_num(g.order, '.3f')}")
+        print(f"φ1 (más fina)      : {g.values[0]:.6g}")
+        print(f"φ extrapolado      : {_num(g.extrapolated)}")
+        print(f"e_a21              : {_pct(g.e_a21)}")
+        print(f"e_ext21            : {_pct(g.e_ext21)}")
+        print(f"GCI fina (21)      : {_pct(g.gci_fine)}")
+        print(f"GCI gruesa (32)    : {_pct(g.gci_coarse)}")
+        print(f"rango asintótico   : {_num(g.asymptotic_ratio, '.3f')} (≈ 1)")
+        for note in g.notes:
+            print(f"  - {note}")
+        if target is not None and g.gci_fine is not None:
+            if g.gci_fine * 100.0 <= target:
+                print(f"GCI ≤ {target:g} %: la malla más fina alcanza; no hace falta refinar más.")
+            else:
+                print(f"GCI > {target:g} %: refinar más la malla.")
+        print("")
+
+
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Convergencia de malla (Richardson / GCI) de Δp y Q para una familia "
+            "de casos del mismo problema con distinta malla."
+        )
+    )
+    parser.add_argument("paths", nargs="+", type=Path, help="Casos (o carpetas con casos) de la familia.")
+    parser.add_argument("--quantity", "-q", default="dp,Q",
+                        help=f"Cantidades separadas por coma ({', '.join(QUANTITIES)}; por defecto: dp,Q).")
+    parser.add_argument("--target", type=float,
+                        help="GCI objetivo [%%] para decidir si seguir refinando.")
+    parser.add_argument("--dim", type=int, choices=(2, 3), default=3,
+                        help="Dimensión para h = (1/N)^(1/dim) (por defecto 3).")
+    parser.add_argument("--format", "-f", choices=("table", "json"), default="table",
+                        help="Salida (por defecto: table).")
+    parser.add_argument("--window", type=int, default=WINDOW_DEFAULT,
+                        help="Muestras de la ventana de promedio (por defecto %(default)s).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Any = None) -> None:
+    args = parse_args(argv)
+    quantities = [q.strip() for q in args.quantity.split(",") if q.strip()]
+    unknown = [q for q in quantities if q not in QUANTITIES]
+    if unknown:
+        print(f"[ERROR] Cantidad desconocida: {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(1)
+
+    case_dirs = discover_cases(args.paths)
+    if len(case_dirs) < 2:
+        print("[ERROR] Se necesitan al menos 2 casos (carpetas con system/controlDict).", file=sys.stderr)
+        sys.exit(1)
+
+    rows = read_family(case_dirs, window=args.window)
+    try:
+        results = family_convergence(rows, quantities, dim=args.dim)
+    except ValueError as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.format == "json":
+        print(json.dumps({"cases": rows, "gci": {q: g.to_dict() for q, g in results.items()}},
+                         indent=2, ensure_ascii=False))
+    else:
+        print_family(rows, results, args.target)
+        if not results:
+            print("[ERROR] Menos de 2 casos con postProcessing y número de celdas.", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
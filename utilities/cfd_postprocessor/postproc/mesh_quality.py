@@ -0,0 +1,362 @@
+"""
+Calidad de malla (como checkMesh) calculada en Python sobre PolyMesh.
+
+Todo vectorizado con NumPy: las caras se agrupan por número de vértices
+(en la práctica 3 ó 4) y cada grupo se procesa como arrays (n, k); las
+sumas por celda se hacen con np.bincount. No hay bucles de Python por cara
+ni por celda.
+
+Definiciones (las de primitiveMeshTools de OpenFOAM):
+  - centro y vector área de cara: abanico de triángulos alrededor del
+    promedio de los vértices, centro ponderado por área.
+  - centro y volumen de celda: pirámides cara–centro estimado.
+  - no ortogonalidad: ángulo entre d (owner -> neighbour, o owner -> cara en
+    el contorno) y el vector área Sf.
+  - skewness: distancia entre el centro de la cara y el punto donde d la
+    corta, normalizada con el tamaño de la cara en esa dirección.
+  - aspect ratio: máximo entre la razón de áreas proyectadas por eje y
+    (1/6)·Σ|Sf| / V^(2/3).
+
+Uso:
+    python3 -m postproc.mesh_quality ../../cases/base/elbow20D
+    python3 -m postproc.mesh_quality CASE --check   # código de salida 1 si falla
+    python3 -m postproc.mesh_quality CASE --format json
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .polymesh import PolyMesh, read_polymesh
+
+# Límites por defecto de checkMesh
+MAX_NON_ORTHO_DEFAULT = 70.0
+MAX_SKEWNESS_DEFAULT = 4.0
+MAX_ASPECT_RATIO_DEFAULT = 1000.0
+
+NON_ORTHO_BINS = np.arange(0.0, 95.0, 5.0)
+SKEWNESS_BINS = np.array([0.0, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, np.inf])
+ASPECT_RATIO_BINS = np.array([1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 1000.0, np.inf])
+
+_ROOT_VSMALL = 1e-150
+
+
+def _faces_by_size(mesh: PolyMesh) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Caras agrupadas por número de vértices: (índices de cara, vértices
+    (n, k)). Así cada grupo se procesa como un array 2D sin recorrer caras.
+    """
+    sizes = mesh.face_sizes
+    starts = mesh.face_offsets[:-1]
+    for k in np.unique(sizes):
+        faces = np.flatnonzero(sizes == k)
+        yield faces, mesh.face_points[starts[faces, None] + np.arange(k)]
+
+
+def _row_sum(v: np.ndarray) -> np.ndarray:
+    """Suma por filas de un array (n, k) con k chico (más rápido que sum(axis=1))."""
+    out = v[:, 0].copy()
+    for j in range(1, v.shape[1]):
+        out += v[:, j]
+    return out
+
+
+def _row_max(v: np.ndarray) -> np.ndarray:
+    """Máximo por filas de un array (n, k) con k chico."""
+    out = v[:, 0].copy()
+    for j in range(1, v.shape[1]):
+        np.maximum(out, v[:, j], out=out)
+    return out
+
+
+def _bincount3(index: np.ndarray, values: np.ndarray, n: int) -> np.ndarray:
+    """Suma por índice de un array (m, 3) -> (n, 3)."""
+    return np.column_stack([np.bincount(index, weights=values[:, k], minlength=n) for k in range(3)])
+
+
+def _point_components(mesh: PolyMesh) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """x, y, z de los puntos como arrays contiguos (indexado más rápido)."""
+    return tuple(np.ascontiguousarray(mesh.points[:, j]) for j in range(3))
+
+
+def face_centres_and_areas(mesh: PolyMesh) -> Tuple[np.ndarray, np.ndarray]:
+    """Centros (ponderados por área) y vectores área de todas las caras."""
+    centres = np.empty((mesh.n_faces, 3))
+    areas = np.empty((mesh.n_faces, 3))
+    pts = _point_components(mesh)
+    # Por componente sobre arrays (n, k): menos pasadas por memoria que (n, k, 3)
+    for faces, verts in _faces_by_size(mesh):
+        k = verts.shape[1]
+        a = [p[verts] for p in pts]
+        b = [np.roll(v, -1, axis=1) for v in a]
+        c = [_row_sum(v)[:, None] / k for v in a]
+        u = [bj - aj for aj, bj in zip(a, b)]
+        w = [cj - aj for aj, cj in zip(a, c)]
+        tri_n = [
+            u[1] * w[2] - u[2] * w[1],
+            u[2] * w[0] - u[0] * w[2],
+            u[0] * w[1] - u[1] * w[0],
+        ]
+        tri_a = np.sqrt(tri_n[0] ** 2 + tri_n[1] ** 2 + tri_n[2] ** 2)
+        sum_a = _row_sum(tri_a)
+        degenerate = sum_a <= _ROOT_VSMALL
+        sum_a[degenerate] = 1.0
+        for j in range(3):
+            areas[faces, j] = 0.5 * _row_sum(tri_n[j])
+            centre = _row_sum(tri_a * (a[j] + b[j] + c[j])) / (3.0 * sum_a)
+            centres[faces, j] = np.where(degenerate, c[j][:, 0], centre)
+    return centres, areas
+
+
+def cell_centres_and_volumes(
+    mesh: PolyMesh,
+    face_centres: np.ndarray,
+    face_areas: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Centros y volúmenes de celda por descomposición en pirámides."""
+    n_cells = mesh.n_cells
+    n_int = mesh.n_internal_faces
+    own = mesh.owner
+    nei = mesh.neighbour
+
+    n_faces_cell = np.bincount(own, minlength=n_cells) + np.bincount(nei, minlength=n_cells)
+    estimate = (
+        _bincount3(own, face_centres, n_cells) + _bincount3(nei, face_centres[:n_int], n_cells)
+    ) / n_faces_cell[:, None]
+
+    # 3 · volumen de cada pirámide (positivo si Sf apunta hacia afuera)
+    vol_own = np.einsum("ij,ij->i", face_areas, face_centres - estimate[own])
+    vol_nei = np.einsum("ij,ij->i", face_areas[:n_int], estimate[nei] - face_centres[:n_int])
+    ctr_own = 0.75 * face_centres + 0.25 * estimate[own]
+    ctr_nei = 0.75 * face_centres[:n_int] + 0.25 * estimate[nei]
+
+    vol3 = np.bincount(own, weights=vol_own, minlength=n_cells) + np.bincount(nei, weights=vol_nei, minlength=n_cells)
+    moment = _bincount3(own, ctr_own * vol_own[:, None], n_cells) + _bincount3(nei, ctr_nei * vol_nei[:, None], n_cells)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        centres = np.where(np.abs(vol3)[:, None] > _ROOT_VSMALL, moment / vol3[:, None], estimate)
+    return centres, vol3 / 3.0
+
+
+def cell_to_face_vectors(mesh: PolyMesh, face_centres: np.ndarray, cell_centres: np.ndarray) -> np.ndarray:
+    """d: owner -> neighbour en caras internas, owner -> cara en el contorno."""
+    n_int = mesh.n_internal_faces
+    d = face_centres - cell_centres[mesh.owner]
+    d[:n_int] = cell_centres[mesh.neighbour] - cell_centres[mesh.owner[:n_int]]
+    return d
+
+
+def _norm(v: np.ndarray) -> np.ndarray:
+    return np.sqrt(np.einsum("ij,ij->i", v, v))
+
+
+def non_orthogonality(d: np.ndarray, face_areas: np.ndarray) -> np.ndarray:
+    """No ortogonalidad de cada cara [grados] (las de contorno incluidas)."""
+    cos = np.einsum("ij,ij->i", d, face_areas) / (_norm(d) * _norm(face_areas) + _ROOT_VSMALL)
+    return np.degrees(np.arccos(np.clip(cos, -1.0, 1.0)))
+
+
+def skewness(
+    mesh: PolyMesh,
+    face_centres: np.ndarray,
+    face_areas: np.ndarray,
+    cell_centres: np.ndarray,
+    d: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Skewness de cada cara (definición de OpenFOAM, adimensional)."""
+    n_int = mesh.n_internal_faces
+    cpf = face_centres - cell_centres[mesh.owner]
+    d = cell_to_face_vectors(mesh, face_centres, cell_centres) if d is None else d.copy()
+    # En el contorno d es la proyección normal de owner -> cara
+    normal = face_areas[n_int:] / (_norm(face_areas[n_int:])[:, None] + _ROOT_VSMALL)
+    d[n_int:] = normal * np.einsum("ij,ij->i", normal, cpf[n_int:])[:, None]
+
+    ratio = np.einsum("ij,ij->i", face_areas, cpf) / (np.einsum("ij,ij->i", face_areas, d) + _ROOT_VSMALL)
+    sv = cpf - ratio[:, None] * d
+    sv_mag = _norm(sv)
+    sv_hat = sv / (sv_mag[:, None] + _ROOT_VSMALL)
+
+    # Distancia del centro al borde de la cara en la dirección de sv
+    reach = np.zeros(mesh.n_faces)
+    pts = _point_components(mesh)
+    for faces, verts in _faces_by_size(mesh):
+        proj = sum((pts[j][verts] - face_centres[faces, j, None]) * sv_hat[faces, j, None] for j in range(3))
+        reach[faces] = _row_max(np.abs(proj))
+    d_mag = _norm(d)
+    floor = 0.2 * d_mag
+    floor[n_int:] *= 2.0
+    return sv_mag / (np.maximum(reach, floor) + _ROOT_VSMALL)
+
+
+def aspect_ratio(mesh: PolyMesh, face_areas: np.ndarray, cell_volumes: np.ndarray) -> np.ndarray:
+    """Aspect ratio de cada celda (definición de cellClosedness en OpenFOAM)."""
+    n_cells = mesh.n_cells
+    mag = np.abs(face_areas)
+    sum_mag = _bincount3(mesh.owner, mag, n_cells) + _bincount3(mesh.neighbour, mag[: mesh.n_internal_faces], n_cells)
+    axis_ratio = sum_mag.max(axis=1) / (sum_mag.min(axis=1) + _ROOT_VSMALL)
+    v = np.maximum(cell_volumes, _ROOT_VSMALL)
+    return np.maximum(axis_ratio, sum_mag.sum(axis=1) / 6.0 / v ** (2.0 / 3.0))
+
+
+@dataclass
+class MeshQuality:
+    """Métricas por cara/celda y resumen de calidad de una malla."""
+
+    face_centres: np.ndarray
+    face_areas: np.ndarray
+    cell_centres: np.ndarray
+    cell_volumes: np.ndarray
+    non_orthogonality_deg: np.ndarray   # por cara
+    skewness: np.ndarray                # por cara
+    aspect_ratio: np.ndarray            # por celda
+    n_internal_faces: int
+    limits: Dict[str, float] = field(default_factory=dict)
+
+    def failing_faces(self) -> Dict[str, np.ndarray]:
+        """Caras que superan los límites (como los faceSets de checkMesh)."""
+        internal = self.non_orthogonality_deg[: self.n_internal_faces]
+        return {
+            "nonOrthoFaces": np.flatnonzero(internal > self.limits["max_non_ortho_deg"]),
+            "skewFaces": np.flatnonzero(self.skewness > self.limits["max_skewness"]),
+        }
+
+    @property
+    def ok(self) -> bool:
+        return (
+            all(v.size == 0 for v in self.failing_faces().values())
+            and bool(np.all(self.cell_volumes > 0))
+            and float(self.aspect_ratio.max(initial=0.0)) <= self.limits["max_aspect_ratio"]
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """Resumen apto para JSON (máximos, medias, conteos e histogramas)."""
+        internal = self.non_orthogonality_deg[: self.n_internal_faces]
+        failing = self.failing_faces()
+
+        def hist(values: np.ndarray, bins: np.ndarray) -> Dict[str, list]:
+            counts, _ = np.histogram(values, bins=bins)
+            return {"edges": [float(b) for b in bins], "counts": [int(c) for c in counts]}
+
+        return {
+            "n_cells": int(self.cell_volumes.size),
+            "n_faces": int(self.face_areas.shape[0]),
+            "n_internal_faces": self.n_internal_faces,
+            "volume_total_m3": float(self.cell_volumes.sum()),
+            "volume_min_m3": float(self.cell_volumes.min(initial=np.inf)),
+            "volume_max_m3": float(self.cell_volumes.max(initial=0.0)),
+            "n_negative_volumes": int(np.count_nonzero(self.cell_volumes <= 0)),
+            "non_ortho_max_deg": float(internal.max(initial=0.0)),
+            "non_ortho_mean_deg": float(internal.mean()) if internal.size else 0.0,
+            "n_non_ortho_faces": int(failing["nonOrthoFaces"].size),
+            "skewness_max": float(self.skewness.max(initial=0.0)),
+            "n_skew_faces": int(failing["skewFaces"].size),
+            "aspect_ratio_max": float(self.aspect_ratio.max(initial=0.0)),
+            "aspect_ratio_mean": float(self.aspect_ratio.mean()) if self.aspect_ratio.size else 0.0,
+            "limits": dict(self.limits),
+            "ok": self.ok,
+            "histograms": {
+                "non_ortho_deg": hist(internal, NON_ORTHO_BINS),
+                "skewness": hist(self.skewness, SKEWNESS_BINS),
+                "aspect_ratio": hist(self.aspect_ratio, ASPECT_RATIO_BINS),
+            },
+        }
+
+
+def mesh_quality(
+    mesh: PolyMesh,
+    max_non_ortho_deg: float = MAX_NON_ORTHO_DEFAULT,
+    max_skewness: float = MAX_SKEWNESS_DEFAULT,
+    max_aspect_ratio: float = MAX_ASPECT_RATIO_DEFAULT,
+) -> MeshQuality:
+    """Calcula todas las métricas de calidad de la malla."""
+    fc, sf = face_centres_and_areas(mesh)
+    cc, vol = cell_centres_and_volumes(mesh, fc, sf)
+    d = cell_to_face_vectors(mesh, fc, cc)
+    return MeshQuality(
+        face_centres=fc,
+        face_areas=sf,
+        cell_centres=cc,
+        cell_volumes=vol,
+        non_orthogonality_deg=non_orthogonality(d, sf),
+        skewness=skewness(mesh, fc, sf, cc, d),
+        aspect_ratio=aspect_ratio(mesh, sf, vol),
+        n_internal_faces=mesh.n_internal_faces,
+        limits={
+            "max_non_ortho_deg": max_non_ortho_deg,
+            "max_skewness": max_skewness,
+            "max_aspect_ratio": max_aspect_ratio,
+        },
+    )
+
+
+def _print_histogram(title: str, hist: Dict[str, list]) -> None:
+    print(f"  {title}")
+    total = max(sum(hist["counts"]), 1)
+    edges = hist["edges"]
+    for lo, hi, count in zip(edges[:-1], edges[1:], hist["counts"]):
+        bar = "#" * int(round(40 * count / total))
+        print(f"    [{lo:>7g}, {hi:>7g}) {count:>9d}  {bar}")
+
+
+def print_summary(case_dir: Path, s: Dict[str, Any]) -> None:
+    lim = s["limits"]
+    print("==============================================")
+    print(f"  Calidad de malla {case_dir}")
+    print("==============================================")
+    print(f"Celdas / caras      : {s['n_cells']} / {s['n_faces']} ({s['n_internal_faces']} internas)")
+    print(f"Volumen total [m3]  : {s['volume_total_m3']:.6g}")
+    print(f"Volumen min/max     : {s['volume_min_m3']:.3e} / {s['volume_max_m3']:.3e}"
+          f"  (negativos: {s['n_negative_volumes']})")
+    print(f"No ortogonalidad    : máx {s['non_ortho_max_deg']:.2f}°  media {s['non_ortho_mean_deg']:.2f}°"
+          f"  (> {lim['max_non_ortho_deg']:g}°: {s['n_non_ortho_faces']})")
+    print(f"Skewness            : máx {s['skewness_max']:.3f}  (> {lim['max_skewness']:g}: {s['n_skew_faces']})")
+    print(f"Aspect ratio        : máx {s['aspect_ratio_max']:.2f}  media {s['aspect_ratio_mean']:.2f}")
+    print(f"Resultado           : {'OK' if s['ok'] else 'FALLA'}")
+    print("")
+    _print_histogram("No ortogonalidad [°] (caras internas)", s["histograms"]["non_ortho_deg"])
+    _print_histogram("Skewness", s["histograms"]["skewness"])
+    _print_histogram("Aspect ratio", s["histograms"]["aspect_ratio"])
+    print("")
+
+
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Calidad de malla (no ortogonalidad, skewness, aspect ratio) desde constant/polyMesh."
+    )
+    parser.add_argument("case_dir", type=Path, help="Caso con constant/polyMesh completo.")
+    parser.add_argument("--format", "-f", choices=("report", "json"), default="report",
+                        help="Salida: reporte con histogramas o JSON (por defecto: report).")
+    parser.add_argument("--max-non-ortho", type=float, default=MAX_NON_ORTHO_DEFAULT,
+                        help="Límite de no ortogonalidad [°] (por defecto %(default)s).")
+    parser.add_argument("--max-skewness", type=float, default=MAX_SKEWNESS_DEFAULT,
+                        help="Límite de skewness (por defecto %(default)s).")
+    parser.add_argument("--max-aspect-ratio", type=float, default=MAX_ASPECT_RATIO_DEFAULT,
+                        help="Límite de aspect ratio (por defecto %(default)s).")
+    parser.add_argument("--check", action="store_true",
+                        help="Salir con código 1 si la malla no cumple los límites.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Any] = None) -> None:
+    args = parse_args(argv)
+    quality = mesh_quality(
+        read_polymesh(args.case_dir),
+        max_non_ortho_deg=args.max_non_ortho,
+        max_skewness=args.max_skewness,
+        max_aspect_ratio=args.max_aspect_ratio,
+    )
+    s = quality.summary()
+    if args.format == "json":
+        print(json.dumps(s, indent=2, ensure_ascii=False))
+    else:
+        print_summary(args.case_dir, s)
+    if args.check and not s["ok"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+Lector rápido de mallas OpenFOAM ASCII (constant/polyMesh).
+
+Cada archivo (points, faces, owner, neighbour) se lee de una vez como bytes,
+se le quita la cabecera, los paréntesis se cambian por espacios y los números
+se convierten con un solo np.fromstring (C), sin recorrer líneas en Python.
+
+Las caras quedan en formato CSR:
+    face_points[face_offsets[i]:face_offsets[i + 1]]  -> vértices de la cara i
+El tamaño de cada cara es el número que va pegado a "(" (p.ej. "4(1 2 3 4)");
+esos números se ubican con máscaras sobre los bytes, también vectorizado.
+
+read_polymesh guarda los arrays en la caché de postproc.cache: la segunda
+lectura de la misma malla es sólo un memory-map de .npy.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .cache import ArrayCache, cached_arrays
+from .foam_io import BoundaryPatch, parse_foam_dict, read_boundary
+
+_HEADER_RE = re.compile(rb"FoamFile\s*\{.*?\}", re.S)
+_COMMENT_RE = re.compile(rb"//[^\n]*|/\*.*?\*/", re.S)
+_COUNT_RE = re.compile(rb"\s*(\d+)\s*\(")
+_PARENS_TO_SPACE = bytes.maketrans(b"()", b"  ")
+_NCELLS_RE = re.compile(rb"nCells:\s*(\d+)")
+
+
+def _read_list_body(path: Path) -> Tuple[int, bytes]:
+    """
+    Tamaño declarado y contenido (entre el primer "(" y el último ")") de
+    una lista OpenFOAM ASCII.
+    """
+    raw = Path(path).read_bytes()
+    m = _HEADER_RE.search(raw)
+    if m is None:
+        raise ValueError(f"Sin cabecera FoamFile en {path}")
+    header = parse_foam_dict(m.group().decode("utf-8", errors="replace"))
+    if header.get("FoamFile", {}).get("format", "ascii") != "ascii":
+        raise ValueError(f"Sólo se soportan mallas ASCII: {path}")
+
+    # Los comentarios sólo aparecen antes de la lista; no se toca el cuerpo
+    rest = raw[m.end():]
+    start = 0
+    while True:
+        c = _COMMENT_RE.match(rest, start)
+        ws = re.match(rb"\s+", rest[start:])
+        if c:
+            start = c.end()
+        elif ws:
+            start += ws.end()
+        else:
+            break
+    m = _COUNT_RE.match(rest, start)
+    if m is None:
+        raise ValueError(f"No se encontró la lista 'N (...)' en {path}")
+    end = rest.rfind(b")")
+    return int(m.group(1)), rest[m.end():end]
+
+
+def parse_numbers(body: bytes, dtype) -> np.ndarray:
+    """Números de un cuerpo de lista ASCII (paréntesis ignorados), en un solo paso."""
+    text = body.translate(_PARENS_TO_SPACE).decode("ascii")
+    return np.fromstring(text, dtype=dtype, sep=" ")
+
+
+def read_points(path: Path) -> np.ndarray:
+    """constant/polyMesh/points -> array (n_points, 3) float64."""
+    n, body = _read_list_body(path)
+    pts = parse_numbers(body, np.float64)
+    if pts.size != 3 * n:
+        raise ValueError(f"{path}: se esperaban {n} puntos, hay {pts.size / 3:g}")
+    return pts.reshape(n, 3)
+
+
+def read_labels(path: Path) -> np.ndarray:
+    """owner / neighbour -> array int32."""
+    n, body = _read_list_body(path)
+    labels = parse_numbers(body, np.int64)
+    if labels.size != n:
+        raise ValueError(f"{path}: se esperaban {n} etiquetas, hay {labels.size}")
+    return labels.astype(np.int32)
+
+
+def read_faces(path: Path) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    constant/polyMesh/faces -> (face_offsets int64 (n_faces + 1,),
+                                face_points int32).
+
+    Admite listas mixtas "3(...)" / "4(...)" / polígonos.
+    """
+    n, body = _read_list_body(path)
+    buf = np.frombuffer(body, dtype=np.uint8)
+
+    # Tokens numéricos: comienzan donde un dígito sigue a un no-dígito.
+    # Un token es tamaño de cara si el byte que sigue a su final es "(".
+    is_digit = (buf >= ord("0")) & (buf <= ord("9"))
+    prev_digit = np.concatenate(([False], is_digit[:-1]))
+    next_digit = np.concatenate((is_digit[1:], [False]))
+    token_ends = np.flatnonzero(is_digit & ~next_digit)
+    next_byte = np.concatenate((buf[1:], [0]))[token_ends]
+    is_size = next_byte == ord("(")
+    if int(np.count_nonzero(is_digit & ~prev_digit)) != token_ends.size:
+        raise ValueError(f"{path}: tokens mal formados")
+
+    tokens = parse_numbers(body, np.int64)
+    if tokens.size != token_ends.size:
+        raise ValueError(f"{path}: tokens no numéricos en la lista de caras")
+
+    sizes = tokens[is_size]
+    face_points = tokens[~is_size].astype(np.int32)
+    if sizes.size != n or int(sizes.sum()) != face_points.size:
+        raise ValueError(f"{path}: tamaños de cara inconsistentes")
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    return offsets, face_points
+
+
+@dataclass
+class PolyMesh:
+    """Malla poliédrica OpenFOAM en arrays compactos."""
+
+    points: np.ndarray          # (n_points, 3) float64
+    face_offsets: np.ndarray    # (n_faces + 1,) int64, CSR
+    face_points: np.ndarray     # (sum sizes,) int32
+    owner: np.ndarray           # (n_faces,) int32
+    neighbour: np.ndarray       # (n_internal_faces,) int32
+    patches: List[BoundaryPatch] = field(default_factory=list)
+
+    @property
+    def n_points(self) -> int:
+        return int(self.points.shape[0])
+
+    @property
+    def n_faces(self) -> int:
+        return int(self.face_offsets.size - 1)
+
+    @property
+    def n_internal_faces(self) -> int:
+        return int(self.neighbour.size)
+
+    @property
+    def n_cells(self) -> int:
+        n = int(self.owner.max()) + 1 if self.owner.size else 0
+        if self.neighbour.size:
+            n = max(n, int(self.neighbour.max()) + 1)
+        return n
+
+    @property
+    def face_sizes(self) -> np.ndarray:
+        return np.diff(self.face_offsets)
+
+    def patch(self, name: str) -> BoundaryPatch:
+        for p in self.patches:
+            if p.name == name:
+                return p
+        raise KeyError(f"Patch inexistente: {name}")
+
+    def patch_faces(self, name: str) -> np.ndarray:
+        """Índices de las caras de un patch."""
+        p = self.patch(name)
+        return np.arange(p.start_face, p.start_face + p.n_faces)
+
+    def face_area_vectors(self, faces: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Centros aproximados (promedio de vértices) y vectores área de las
+        caras indicadas (todas por defecto), por abanico de triángulos
+        alrededor del centro. Vectorizado para polígonos mixtos.
+        """
+        if faces is None:
+            faces = np.arange(self.n_faces)
+        starts = self.face_offsets[faces]
+        sizes = self.face_offsets[faces + 1] - starts
+
+        # Posiciones en face_points de los vértices de las caras pedidas
+        local = np.arange(int(sizes.sum())) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        pos = np.repeat(starts, sizes) + local
+        nxt = np.repeat(starts, sizes) + (local + 1) % np.repeat(sizes, sizes)
+
+        seg_starts = np.cumsum(sizes) - sizes
+        p = self.points[self.face_points[pos]]
+        q = self.points[self.face_points[nxt]]
+        centres = np.add.reduceat(p, seg_starts, axis=0) / sizes[:, None]
+        c = np.repeat(centres, sizes, axis=0)
+        areas = 0.5 * np.add.reduceat(np.cross(p - c, q - c), seg_starts, axis=0)
+        return centres, areas
+
+    def patch_area(self, name: str) -> float:
+        """Área total de un patch [m²]."""
+        _, areas = self.face_area_vectors(self.patch_faces(name))
+        return float(np.linalg.norm(areas, axis=1).sum())
+
+    def patch_perimeter(self, name: str) -> float:
+        """
+        Perímetro del patch: suma de las aristas que pertenecen a una sola
+        cara del patch (el borde exterior).
+        """
+        faces = self.patch_faces(name)
+        starts = self.face_offsets[faces]
+        sizes = self.face_offsets[faces + 1] - starts
+        local = np.arange(int(sizes.sum())) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        a = self.face_points[np.repeat(starts, sizes) + local]
+        b = self.face_points[np.repeat(starts, sizes) + (local + 1) % np.repeat(sizes, sizes)]
+        edges = np.sort(np.column_stack([a, b]), axis=1)
+        uniq, counts = np.unique(edges, axis=0, return_counts=True)
+        border = uniq[counts == 1]
+        return float(np.linalg.norm(self.points[border[:, 0]] - self.points[border[:, 1]], axis=1).sum())
+
+    def patch_summary(self, name: str) -> Dict[str, object]:
+        """
+        Área, centro, normal media, diámetro equivalente sqrt(4A/π) y
+        diámetro hidráulico 4A/P de un patch.
+        """
+        centres, areas = self.face_area_vectors(self.patch_faces(name))
+        mags = np.linalg.norm(areas, axis=1)
+        area = float(mags.sum())
+        perimeter = self.patch_perimeter(name)
+        normal = areas.sum(axis=0)
+        norm = np.linalg.norm(normal)
+        return {
+            "area_m2": area,
+            "centre": (centres * mags[:, None]).sum(axis=0) / area if area > 0 else centres.mean(axis=0),
+            "normal": normal / norm if norm > 0 else normal,
+            "perimeter_m": perimeter,
+            "D_equivalent_m": math.sqrt(4.0 * area / math.pi),
+            "D_hydraulic_m": 4.0 * area / perimeter if perimeter > 0 else float("nan"),
+        }
+
+
+def has_full_polymesh(case_dir: Path) -> bool:
+    """True si constant/polyMesh tiene points, faces, owner y neighbour."""
+    mesh_dir = Path(case_dir) / "constant" / "polyMesh"
+    return all((mesh_dir / name).is_file() for name in ("points", "faces", "owner", "neighbour"))
+
+
+def _parse_polymesh_arrays(mesh_dir: Path) -> Dict[str, np.ndarray]:
+    offsets, face_points = read_faces(mesh_dir / "faces")
+    return {
+        "points": read_points(mesh_dir / "points"),
+        "face_offsets": offsets,
+        "face_points": face_points,
+        "owner": read_labels(mesh_dir / "owner"),
+        "neighbour": read_labels(mesh_dir / "neighbour"),
+    }
+
+
+def mesh_cell_count(case_dir: Path) -> Optional[int]:
+    """
+    Número de celdas de constant/polyMesh sin leer la malla: del "note" de
+    la cabecera de owner (lo escriben blockMesh, ideasUnvToFoam, ...) o, si
+    no está, del máximo de owner/neighbour. None si no hay owner.
+    """
+    mesh_dir = Path(case_dir) / "constant" / "polyMesh"
+    owner = mesh_dir / "owner"
+    if not owner.is_file():
+        return None
+    with open(owner, "rb") as f:
+        head = f.read(4096)
+    m = _NCELLS_RE.search(head)
+    if m:
+        return int(m.group(1))
+    n = int(read_labels(owner).max()) + 1
+    if (mesh_dir / "neighbour").is_file():
+        n = max(n, int(read_labels(mesh_dir / "neighbour").max()) + 1)
+    return n
+
+
+def read_polymesh(
+    case_dir: Path,
+    use_cache: bool = True,
+    cache: Optional[ArrayCache] = None,
+) -> PolyMesh:
+    """
+    Lee constant/polyMesh completo de un caso.
+
+    Con use_cache los arrays salen de la caché (memmaps de sólo lectura)
+    si points/faces/owner/neighbour no cambiaron.
+    """
+    mesh_dir = Path(case_dir) / "constant" / "polyMesh"
+    if use_cache:
+        sources = [mesh_dir / name for name in ("points", "faces", "owner", "neighbour")]
+        arrays = cached_arrays("polymesh", sources, lambda: _parse_polymesh_arrays(mesh_dir), cache)
+    else:
+        arrays = _parse_polymesh_arrays(mesh_dir)
+    mesh = PolyMesh(
+        **arrays,
+        patches=read_boundary(mesh_dir / "boundary") if (mesh_dir / "boundary").is_file() else [],
+    )
+    if mesh.owner.size != mesh.n_faces:
+        raise ValueError(f"owner tiene {mesh.owner.size} entradas y faces {mesh.n_faces}")
+    return mesh
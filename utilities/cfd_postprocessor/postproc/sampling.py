@@ -0,0 +1,414 @@
+"""
+Lectura de probes y sets de postProcessing como arrays (tiempo × punto × componente).
+
+Un functionObject "probes" (centerProbes) escribe un archivo por campo y por
+arranque; uno "sets" (profiles, setFormat csv) escribe un CSV por set y por
+tiempo de muestreo, así que una corrida deja miles de archivos chicos. Aquí
+se juntan todos los tiempos en un array por campo:
+
+  - probes: postProcessing/<fo>/<t0>/<campo>, cabecera "# Probe i (x y z)";
+    los reinicios se unen con stitch_histories.
+  - sets: postProcessing/<fo>/<t>/<set>.csv (OpenFOAM >= 9) o
+    <set>_<campos>.csv (ESI y versiones viejas, p.ej. axisLine_p_U.csv o un
+    archivo por tipo de campo). Las primeras columnas (x, y, z o distance)
+    son la coordenada de cada punto; "U_x"/"U_0", ... son componentes de U.
+
+El resultado se guarda una sola vez en postProcessing/<fo>/.samples_<nombre>.npz
+(sin comprimir) junto con la firma (tamaño y mtime) de cada archivo de
+origen. Las siguientes lecturas abren ese único archivo; en los sets sólo se
+parsean los tiempos nuevos o modificados (con el solver corriendo, los
+escritos desde la última lectura). Un CSV a medio escribir (una fila cortada,
+o filas de menos en el último tiempo) se deja fuera y se vuelve a intentar
+en la próxima lectura.
+
+Cada CSV se convierte con un solo np.fromstring, sin np.loadtxt.
+
+Uso:
+    python3 -m postproc.sampling ../../cases/runs/CASE centerProbes
+    python3 -m postproc.sampling CASE profiles --set axisLine --set radialOutlet
+    python3 -m postproc.sampling CASE profiles --format json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .timeseries import list_time_dirs, stitch_histories
+
+# Columnas de coordenada que escribe un set según su "axis"
+SET_AXES = ("x", "y", "z", "distance")
+
+_PROBE_RE = re.compile(r"#\s*Probe\s+(\d+)\s*\(([^)]*)\)")
+_COMPONENT_RE = re.compile(r"^(.+)_([xyz]{1,2}|\d)$")
+_PARENS = bytes.maketrans(b"()", b"  ")
+
+
+@dataclass
+class SampledData:
+    """
+    Todos los tiempos de un probes o de un set.
+
+    fields[nombre]: array (tiempo, punto, componente); los escalares tienen
+    una componente. positions: (punto, len(axes)).
+    """
+
+    name: str
+    kind: str                       # "probes" o "sets"
+    times: np.ndarray
+    positions: np.ndarray
+    axes: List[str]
+    fields: Dict[str, np.ndarray] = field(default_factory=dict)
+    path: Optional[Path] = None     # .npz guardado
+
+    @property
+    def n_points(self) -> int:
+        return self.positions.shape[0]
+
+    def array(self, name: str) -> np.ndarray:
+        if name not in self.fields:
+            raise KeyError(f"'{name}' no está en {self.name} (hay: {', '.join(self.fields)})")
+        return self.fields[name]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "n_times": int(self.times.size),
+            "time_range": [float(self.times[0]), float(self.times[-1])] if self.times.size else None,
+            "n_points": self.n_points,
+            "axes": self.axes,
+            "fields": {k: list(v.shape) for k, v in self.fields.items()},
+            "path": str(self.path) if self.path else None,
+        }
+
+
+def _signature(files: Sequence[Path]) -> List[List[Any]]:
+    sig = []
+    for f in files:
+        st = f.stat()
+        sig.append([f.name, st.st_size, st.st_mtime_ns])
+    return sig
+
+
+def _save_npz(path: Path, data: SampledData, meta: Dict[str, Any]) -> Optional[Path]:
+    """Guarda data en path (escritura atómica); None si no se puede escribir."""
+    arrays = {f"field:{k}": v for k, v in data.fields.items()}
+    meta = {**meta, "kind": data.kind, "axes": data.axes, "fields": list(data.fields)}
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as fh:
+            np.savez(fh, times=data.times, positions=data.positions, meta=np.array(json.dumps(meta)), **arrays)
+        os.replace(tmp, path)
+    except OSError:
+        return None
+    return path
+
+
+def _load_npz(path: Path) -> Optional[Tuple[SampledData, Dict[str, Any]]]:
+    if not path.is_file():
+        return None
+    try:
+        with np.load(path) as npz:
+            meta = json.loads(str(npz["meta"]))
+            data = SampledData(
+                name=meta["name"],
+                kind=meta["kind"],
+                times=npz["times"],
+                positions=npz["positions"],
+                axes=list(meta["axes"]),
+                fields={k: npz[f"field:{k}"] for k in meta["fields"]},
+                path=path,
+            )
+    except (OSError, ValueError, KeyError):
+        return None
+    return data, meta
+
+
+def read_samples(path: Path) -> SampledData:
+    """Abre un .samples_*.npz ya guardado, sin mirar los archivos de origen."""
+    loaded = _load_npz(Path(path))
+    if loaded is None:
+        raise ValueError(f"{path}: no es un .npz de postproc.sampling")
+    return loaded[0]
+
+
+# --------------------------------------------------------------------------
+# probes
+# --------------------------------------------------------------------------
+
+def _read_probe_file(path: Path) -> Tuple[np.ndarray, np.ndarray]:
+    """Posiciones (P, 3) de la cabecera y datos (k, 1 + P·C) de un archivo de probes."""
+    raw = path.read_bytes()
+    # Una última línea sin "\n" es una escritura en curso
+    raw = raw[: raw.rfind(b"\n") + 1]
+    positions, body = [], []
+    for line in raw.splitlines():
+        text = line.strip()
+        if text.startswith(b"#"):
+            m = _PROBE_RE.match(text.decode("utf-8", "replace"))
+            if m:
+                positions.append([float(v) for v in m.group(2).split()])
+        elif text:
+            body.append(line)
+    if not positions:
+        raise ValueError(f"{path}: sin cabecera '# Probe i (x y z)'")
+    if not body:
+        return np.array(positions), np.empty((0, 0))
+    ncols = len(body[0].translate(_PARENS).split())
+    values = np.fromstring(b" ".join(body).translate(_PARENS), sep=" ")
+    if values.size % ncols:
+        raise ValueError(f"{path}: filas de distinto largo")
+    return np.array(positions), values.reshape(-1, ncols)
+
+
+def _probe_sources(fo_dir: Path) -> Dict[str, List[Path]]:
+    """Archivos de cada campo, uno por arranque, en orden de tiempo de inicio."""
+    sources: Dict[str, List[Path]] = {}
+    for d in list_time_dirs(fo_dir) or [fo_dir]:
+        for f in sorted(d.iterdir()):
+            if f.is_file() and not f.name.startswith("."):
+                sources.setdefault(f.name.split(".")[0], []).append(f)
+    if not sources:
+        raise RuntimeError(f"No hay archivos de probes en {fo_dir}")
+    return sources
+
+
+def load_probes(fo_dir: Path, use_cache: bool = True) -> SampledData:
+    """Todos los campos y arranques de un functionObject probes."""
+    fo_dir = Path(fo_dir)
+    sources = _probe_sources(fo_dir)
+    signature = {name: _signature(files) for name, files in sources.items()}
+    npz = fo_dir / f".samples_{fo_dir.name}.npz"
+
+    if use_cache:
+        cached = _load_npz(npz)
+        if cached is not None and cached[1].get("signature") == signature:
+            return cached[0]
+
+    positions = None
+    times = None
+    fields: Dict[str, np.ndarray] = {}
+    for name, files in sources.items():
+        parts = []
+        for f in files:
+            pos, data = _read_probe_file(f)
+            if positions is None:
+                positions = pos
+            elif pos.shape != positions.shape:
+                raise ValueError(f"{f}: {len(pos)} probes y se esperaban {len(positions)}")
+            parts.append(data)
+        history = stitch_histories(parts)
+        n_rows = history.shape[0]
+        if times is not None and n_rows != times.size:
+            # Un campo puede ir una fila adelantado mientras el solver escribe
+            n_rows = min(n_rows, times.size)
+            fields = {k: v[:n_rows] for k, v in fields.items()}
+        times = history[:n_rows, 0] if times is None else times[:n_rows]
+        ncomp = (history.shape[1] - 1) // len(positions) if history.size else 1
+        fields[name] = history[:n_rows, 1:].reshape(n_rows, len(positions), ncomp)
+
+    data = SampledData(fo_dir.name, "probes", np.ascontiguousarray(times), positions, ["x", "y", "z"], fields)
+    if use_cache:
+        data.path = _save_npz(npz, data, {"name": fo_dir.name, "signature": signature})
+    return data
+
+
+# --------------------------------------------------------------------------
+# sets
+# --------------------------------------------------------------------------
+
+def _set_files(time_dir: Path, set_name: str) -> List[Path]:
+    return sorted(
+        f for f in time_dir.glob(f"{set_name}*.csv")
+        if f.stem == set_name or f.stem.startswith(f"{set_name}_")
+    )
+
+
+def list_sets(fo_dir: Path) -> List[str]:
+    """Nombres de los sets de un functionObject sets (del último tiempo)."""
+    dirs = list_time_dirs(Path(fo_dir))
+    if not dirs:
+        return []
+    names = set()
+    for f in dirs[-1].glob("*.csv"):
+        # axisLine.csv -> axisLine; axisLine_p_U.csv (campos p y U) -> axisLine
+        with open(f, encoding="utf-8") as fh:
+            columns = [c.strip() for c in fh.readline().lstrip("#").split(",")]
+        suffix = "_" + "_".join(_group_columns(columns)[1])
+        names.add(f.stem[: -len(suffix)] if f.stem.endswith(suffix) else f.stem)
+    return sorted(names)
+
+
+def _read_set_csv(path: Path) -> Tuple[List[str], np.ndarray]:
+    raw = path.read_bytes()
+    # Una última línea sin "\n" es una escritura en curso
+    raw = raw[: raw.rfind(b"\n") + 1]
+    head, _, body = raw.partition(b"\n")
+    columns = [c.strip() for c in head.decode("utf-8").lstrip("#").split(",")]
+    values = np.fromstring(body.replace(b",", b" "), sep=" ")
+    if values.size % len(columns):
+        raise ValueError(f"{path}: filas incompletas")
+    return columns, values.reshape(-1, len(columns))
+
+
+def _group_columns(columns: List[str]) -> Tuple[List[str], Dict[str, List[int]]]:
+    """Columnas de coordenada y, por campo, los índices de sus componentes."""
+    n_axes = 0
+    while n_axes < len(columns) and columns[n_axes] in SET_AXES:
+        n_axes += 1
+    groups: Dict[str, List[int]] = {}
+    for i, name in enumerate(columns[n_axes:], start=n_axes):
+        m = _COMPONENT_RE.match(name)
+        groups.setdefault(m.group(1) if m else name, []).append(i)
+    return columns[:n_axes], groups
+
+
+def _read_set_time(files: List[Path]) -> Tuple[List[str], np.ndarray, Dict[str, np.ndarray]]:
+    """Coordenadas y campos (P, C) de un set en un tiempo (uno o varios CSV)."""
+    axes: List[str] = []
+    positions = None
+    fields: Dict[str, np.ndarray] = {}
+    for f in files:
+        columns, table = _read_set_csv(f)
+        file_axes, groups = _group_columns(columns)
+        if positions is None:
+            axes, positions = file_axes, table[:, : len(file_axes)]
+        elif table.shape[0] != positions.shape[0]:
+            raise ValueError(f"{f}: {table.shape[0]} puntos y se esperaban {positions.shape[0]}")
+        for name, idx in groups.items():
+            fields[name] = table[:, idx]
+    return axes, positions, fields
+
+
+def load_set(fo_dir: Path, set_name: str, use_cache: bool = True) -> SampledData:
+    """
+    Todos los tiempos de un set de un functionObject sets.
+
+    Sólo se parsean los tiempos cuya firma no está en el .npz guardado.
+    """
+    fo_dir = Path(fo_dir)
+    sources = [(d, _set_files(d, set_name)) for d in list_time_dirs(fo_dir)]
+    sources = [(d, files) for d, files in sources if files]
+    if not sources:
+        raise RuntimeError(f"No hay archivos del set '{set_name}' en {fo_dir}")
+    npz = fo_dir / f".samples_{set_name}.npz"
+
+    known: Dict[str, int] = {}
+    old = None
+    if use_cache:
+        cached = _load_npz(npz)
+        if cached is not None:
+            old, meta = cached
+            known = {
+                json.dumps([name, sig]): i
+                for i, (name, sig) in enumerate(zip(meta["time_names"], meta["signature"]))
+            }
+
+    axes = list(old.axes) if old is not None else []
+    positions = old.positions if old is not None else None
+    rows: List[Tuple[float, str, List[Any], Dict[str, np.ndarray]]] = []
+    parsed = 0
+    for d, files in sources:
+        sig = _signature(files)
+        i = known.get(json.dumps([d.name, sig]))
+        if i is not None:
+            rows.append((float(d.name), d.name, sig, {k: v[i] for k, v in old.fields.items()}))
+            continue
+        try:
+            t_axes, t_pos, t_fields = _read_set_time(files)
+        except ValueError:
+            # CSV a medio escribir: queda para la próxima lectura
+            continue
+        parsed += 1
+        if positions is None:
+            axes, positions = t_axes, t_pos
+        elif t_pos.shape != positions.shape:
+            if d == sources[-1][0]:
+                continue
+            raise ValueError(
+                f"{d}: el set '{set_name}' tiene {t_pos.shape[0]} puntos y antes tenía {positions.shape[0]}"
+            )
+        rows.append((float(d.name), d.name, sig, t_fields))
+    if not rows:
+        raise RuntimeError(f"No hay datos legibles del set '{set_name}' en {fo_dir}")
+
+    names = sorted(set.intersection(*(set(r[3]) for r in rows)))
+    data = SampledData(
+        name=set_name,
+        kind="sets",
+        times=np.array([r[0] for r in rows]),
+        positions=positions,
+        axes=axes,
+        fields={k: np.stack([r[3][k] for r in rows]) for k in names},
+        path=old.path if old is not None else None,
+    )
+    if use_cache and (parsed or old is None or len(rows) != old.times.size):
+        meta = {"name": set_name, "time_names": [r[1] for r in rows], "signature": [r[2] for r in rows]}
+        data.path = _save_npz(npz, data, meta)
+    return data
+
+
+def load_function_object(fo_dir: Path, sets: Optional[List[str]] = None, use_cache: bool = True) -> List[SampledData]:
+    """
+    Todo lo de un functionObject: un SampledData si es probes, uno por set
+    (o sólo los indicados) si es sets.
+    """
+    fo_dir = Path(fo_dir)
+    names = sets or list_sets(fo_dir)
+    if names:
+        return [load_set(fo_dir, name, use_cache) for name in names]
+    return [load_probes(fo_dir, use_cache)]
+
+
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Junta todos los tiempos de un probes o sets de postProcessing en "
+            "arrays (tiempo × punto × componente) guardados en un .npz."
+        )
+    )
+    parser.add_argument("case", type=Path, help="Carpeta del caso.")
+    parser.add_argument("function", help="Nombre del functionObject (p.ej. centerProbes, profiles).")
+    parser.add_argument("--set", action="append", dest="sets",
+                        help="Sólo este set (repetible; por defecto: todos).")
+    parser.add_argument("--no-cache", action="store_true", help="Releer todo sin usar ni escribir el .npz.")
+    parser.add_argument("--format", choices=("table", "json"), default="table",
+                        help="Formato de salida (por defecto: table).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Any = None) -> None:
+    args = parse_args(argv)
+    fo_dir = args.case / "postProcessing" / args.function
+    if not fo_dir.is_dir():
+        print(f"[ERROR] No existe {fo_dir}", file=sys.stderr)
+        sys.exit(1)
+    try:
+        loaded = load_function_object(fo_dir, args.sets, use_cache=not args.no_cache)
+    except (OSError, KeyError, ValueError, RuntimeError) as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        sys.exit(1)
+
+    summaries = [d.summary() for d in loaded]
+    if args.format == "json":
+        print(json.dumps(summaries, indent=2))
+        return
+    print(f"{'Nombre':<16}{'Tipo':<8}{'Tiempos':>9}{'t inicial':>12}{'t final':>12}{'Puntos':>8}  Campos")
+    for s in summaries:
+        t0, t1 = s["time_range"] or (float("nan"), float("nan"))
+        shapes = ", ".join(f"{k}{tuple(v)}" for k, v in s["fields"].items())
+        print(f"{s['name']:<16}{s['kind']:<8}{s['n_times']:>9}{t0:>12.6g}{t1:>12.6g}{s['n_points']:>8}  {shapes}")
+    for s in summaries:
+        if s["path"]:
+            print(f"Guardado en {s['path']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Teoría Darcy–Weisbach usando el motor de correlaciones de losses_calculator.
+
+El factor f se calcula con app.core.correlations.friction_factor_array, el
+mismo código que usa la calculadora de pérdidas, para todos los casos a la
+vez (vectorizado). Si el paquete "app" no está en el PYTHONPATH, se agrega
+la carpeta hermana utilities/losses_calculator.
+"""
+
+import math
+import sys
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+try:
+    from app.core.correlations import CorrelationMethod, friction_factor_array
+except ImportError:
+    _LOSSES_CALCULATOR_DIR = Path(__file__).resolve().parents[2] / "losses_calculator"
+    sys.path.insert(0, str(_LOSSES_CALCULATOR_DIR))
+    from app.core.correlations import CorrelationMethod, friction_factor_array
+
+from app.core.constants import RHO_WATER_20C  # noqa: E402
+from app.services.friction_service import compute_reynolds  # noqa: E402
+
+__all__ = [
+    "CorrelationMethod",
+    "RHO_WATER_20C",
+    "compute_reynolds",
+    "darcy_weisbach_dp_array",
+    "friction_factor_array",
+]
+
+
+def darcy_weisbach_dp_array(
+    Q_m3s,
+    D_m,
+    L_m,
+    nu_m2s,
+    rho: float = RHO_WATER_20C,
+    roughness_m=0.0,
+    method: CorrelationMethod = "haaland",
+) -> Dict[str, np.ndarray]:
+    """
+    Δp teórico Darcy–Weisbach para tubería circular, vectorizado.
+
+    Todas las entradas se combinan por broadcasting (un valor por caso o
+    escalares comunes). Devuelve dict de arrays:
+        A_m2, U_m_s, Re, f_Darcy, dp_Pa.
+    """
+    Q = np.asarray(Q_m3s, dtype=float)
+    D = np.asarray(D_m, dtype=float)
+    L = np.asarray(L_m, dtype=float)
+    nu = np.asarray(nu_m2s, dtype=float)
+    rho = np.asarray(rho, dtype=float)
+
+    A = math.pi * D ** 2 / 4.0
+    U = np.abs(Q) / A
+    Re = U * D / nu
+    f = friction_factor_array(Re, D, roughness_m, method=method)
+    dp = f * (L / D) * 0.5 * rho * U ** 2
+
+    return {"A_m2": A, "U_m_s": U, "Re": Re, "f_Darcy": f, "dp_Pa": dp}
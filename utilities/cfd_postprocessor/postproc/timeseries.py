@@ -0,0 +1,275 @@
+"""
+Lectura de series temporales de postProcessing (functionObjects de OpenFOAM).
+
+- read_last_rows / read_last_time_rows: sólo la cola del archivo, O(1) en
+  el tamaño del archivo.
+- load_time_history: historial completo de todos los reinicios, unido,
+  ordenado por tiempo y cacheado como .npy memory-mapped.
+- find_function_dir: ubica la carpeta de un functionObject por patch, con
+  los nombres "patchAverage_inlet" o "patchAverage(patch=inlet,...)".
+"""
+
+import json
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+# Tamaño del bloque leído desde el final del archivo (bytes)
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def parse_data_line(line: str):
+    """
+    Convierte una línea de datos de postProcessing en una lista de floats.
+
+    Los vectores vienen como "(x y z)"; se quitan los paréntesis y quedan
+    como columnas sueltas.
+    """
+    return [float(tok) for tok in line.replace("(", " ").replace(")", " ").split()]
+
+
+def read_last_rows(path: Path, n: int = 1, block_size: int = TAIL_BLOCK_SIZE):
+    """
+    Lee las últimas n filas de datos de un .dat buscando desde el final.
+
+    Se leen bloques de block_size bytes hacia atrás hasta juntar n líneas
+    válidas (se saltan vacías y cabeceras "#"), así que el costo no depende
+    del tamaño del archivo. Si el solver está escribiendo y la última línea
+    todavía no termina en salto de línea, esa línea se ignora.
+
+    Devuelve un array (k, ncols) con k <= n, en orden temporal.
+    """
+    if n < 1:
+        raise ValueError("n debe ser >= 1")
+
+    rows = []
+    with open(path, "rb") as fh:
+        fh.seek(0, 2)
+        pos = fh.tell()
+        partial = b""
+        # Una última línea sin "\n" es una escritura en curso: se descarta
+        if pos > 0:
+            fh.seek(pos - 1)
+            if fh.read(1) != b"\n":
+                while pos > 0:
+                    step = min(block_size, pos)
+                    fh.seek(pos - step)
+                    cut = fh.read(step).rfind(b"\n")
+                    if cut >= 0:
+                        pos = pos - step + cut + 1
+                        break
+                    pos -= step
+        while pos > 0 and len(rows) < n:
+            step = min(block_size, pos)
+            pos -= step
+            fh.seek(pos)
+            chunk = fh.read(step) + partial
+            lines = chunk.split(b"\n")
+            # La primera línea puede estar incompleta salvo que sea el inicio
+            partial = lines.pop(0) if pos > 0 else b""
+            for raw in reversed(lines):
+                text = raw.strip()
+                if not text or text.startswith(b"#"):
+                    continue
+                try:
+                    values = parse_data_line(text.decode("utf-8"))
+                except (UnicodeDecodeError, ValueError):
+                    continue
+                if rows and len(values) != len(rows[0]):
+                    continue
+                rows.append(values)
+                if len(rows) >= n:
+                    break
+
+    if not rows:
+        raise RuntimeError(f"No hay filas de datos en {path}")
+    return np.array(rows[::-1], dtype=float)
+
+
+def list_time_dirs(folder: Path):
+    """
+    Subcarpetas de tiempo de un functionObject, ordenadas numéricamente.
+
+    Con un sort lexical "1000" queda antes que "500"; aquí se ordena por el
+    valor del tiempo y se ignoran carpetas cuyo nombre no es un número.
+    """
+    dirs = []
+    for d in folder.iterdir():
+        if not d.is_dir():
+            continue
+        try:
+            dirs.append((float(d.name), d))
+        except ValueError:
+            continue
+    return [d for _, d in sorted(dirs)]
+
+
+# Nombre de archivo de los functionObjects surfaceFieldValue en OpenFOAM >= 9
+SURFACE_FIELD_VALUE_PREFIX = "surfaceFieldValue"
+
+
+def _prefixes(field_prefix) -> List[str]:
+    if isinstance(field_prefix, str):
+        return [field_prefix]
+    return list(field_prefix)
+
+
+def find_function_dir(pp_dir: Path, function: str, patch: str) -> Path:
+    """
+    Carpeta de un functionObject aplicado a un patch.
+
+    Acepta el nombre "patchAverage_inlet" y los que genera #includeFunc,
+    p.ej. "patchAverage(patch=inlet,fields=(p))".
+    """
+    exact = pp_dir / f"{function}_{patch}"
+    if exact.is_dir():
+        return exact
+    if pp_dir.is_dir():
+        for d in sorted(pp_dir.iterdir()):
+            name = d.name.replace(" ", "")
+            if d.is_dir() and name.startswith(f"{function}(") and f"patch={patch}" in name:
+                return d
+    raise RuntimeError(f"No existe carpeta de {function} para el patch {patch} en {pp_dir}")
+
+
+def find_data_files(folder: Path, field_prefix):
+    """
+    Archivos {field_prefix}* de un functionObject, uno por tiempo de inicio.
+
+    Muchos functionObjects de OpenFOAM crean subcarpetas por tiempo (una por
+    cada arranque/reinicio); otras veces escriben un .dat directo en la carpeta.
+    field_prefix puede ser una lista de prefijos, probados en orden.
+    """
+    if not folder.exists():
+        raise RuntimeError(f"No existe carpeta {folder}")
+
+    prefixes = _prefixes(field_prefix)
+    search_dirs = list_time_dirs(folder) or [folder]
+    files = []
+    for d in search_dirs:
+        for prefix in prefixes:
+            found = sorted(d.glob(f"{prefix}*"))
+            if found:
+                files.append(found[0])
+                break
+    if not files:
+        raise RuntimeError(f"No hay archivos {'/'.join(prefixes)}* en {folder}")
+    return files
+
+
+def find_data_file(folder: Path, field_prefix) -> Path:
+    """
+    Archivo {field_prefix}* del último arranque (tiempo de inicio mayor).
+    """
+    return find_data_files(folder, field_prefix)[-1]
+
+
+def read_last_time_rows(folder: Path, field_prefix, n: int = 1):
+    """
+    Lee las últimas n filas (tiempo + columnas) de un archivo en postProcessing.
+    """
+    return read_last_rows(find_data_file(folder, field_prefix), n=n)
+
+
+def read_last_time_file(folder: Path, field_prefix):
+    """
+    Lee el ÚLTIMO valor de un archivo en postProcessing.
+
+    - folder: p.ej. postProcessing/patchAverage_inlet
+    - field_prefix: prefijo del archivo, p.ej. "p" o "flowRate"
+
+    Asume formato:
+        time  value
+    en columnas. Sólo se lee el final del archivo (ver read_last_rows).
+    """
+    t, val = read_last_time_rows(folder, field_prefix, n=1)[-1, :2]
+    return float(t), float(val)
+
+
+def load_data_file(path: Path):
+    """
+    Lee un .dat completo como array (k, ncols).
+
+    Se saltan las cabeceras "#", los paréntesis de vectores y una última
+    línea sin "\n" (escritura en curso).
+    """
+    def lines():
+        with open(path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                if line.endswith("\n"):
+                    yield line.replace("(", " ").replace(")", " ")
+
+    return np.loadtxt(lines(), comments="#", ndmin=2)
+
+
+def stitch_histories(arrays):
+    """
+    Une los historiales de varios arranques en uno solo, ordenado por tiempo.
+
+    Cuando un reinicio se solapa con el anterior (p.ej. se relanza desde
+    t=500 y el arranque previo llegó a t=620), manda el arranque posterior:
+    del anterior sólo se conservan filas con t menor al primer t del siguiente.
+    """
+    arrays = [a for a in arrays if a.size]
+    if not arrays:
+        return np.empty((0, 0))
+
+    kept = []
+    for i, a in enumerate(arrays):
+        if i + 1 < len(arrays):
+            a = a[a[:, 0] < arrays[i + 1][0, 0]]
+        kept.append(a)
+
+    ncols = min(a.shape[1] for a in kept)
+    data = np.concatenate([a[:, :ncols] for a in kept])
+    order = np.argsort(data[:, 0], kind="stable")
+    return data[order]
+
+
+def _files_signature(files):
+    """Ruta, tamaño y mtime de cada archivo, para invalidar la caché."""
+    sig = []
+    for f in files:
+        st = f.stat()
+        sig.append([str(f), st.st_size, st.st_mtime_ns])
+    return sig
+
+
+def load_time_history(folder: Path, field_prefix, use_cache: bool = True):
+    """
+    Historial completo (todos los reinicios) de un archivo de postProcessing.
+
+    - folder: p.ej. postProcessing/patchAverage_inlet
+    - field_prefix: prefijo del archivo, p.ej. "p" o "flowRate"
+
+    Las subcarpetas de tiempo se recorren en orden numérico y se unen con
+    stitch_histories. El resultado se guarda en folder/.history_{archivo}.npy
+    y las siguientes llamadas lo abren memory-mapped, sin volver a leer los
+    .dat, mientras ningún archivo de origen cambie de tamaño o de fecha.
+
+    Devuelve un array (k, ncols): columna 0 = tiempo.
+    """
+    files = find_data_files(folder, field_prefix)
+    signature = _files_signature(files)
+    key = files[-1].name.split(".")[0]
+    cache_npy = folder / f".history_{key}.npy"
+    cache_meta = folder / f".history_{key}.json"
+
+    if use_cache and cache_npy.exists() and cache_meta.exists():
+        try:
+            if json.loads(cache_meta.read_text()) == signature:
+                return np.load(cache_npy, mmap_mode="r")
+        except (OSError, ValueError):
+            pass
+
+    data = stitch_histories([load_data_file(f) for f in files])
+
+    if use_cache:
+        try:
+            np.save(cache_npy, data)
+            cache_meta.write_text(json.dumps(signature))
+            return np.load(cache_npy, mmap_mode="r")
+        except OSError:
+            pass
+    return data
@@ -0,0 +1,363 @@
+"""
+Perfil de velocidad a la salida contra los perfiles turbulentos de tubería.
+
+Con los sets de postproc.sampling (radialOutlet y axisLine del
+functionObject "profiles"), para todos los tiempos de muestreo a la vez:
+
+  - u(r): componente de U en la dirección media del perfil; y = R - r con r
+    la distancia al primer punto del set (sobre el eje). Los puntos con
+    r >= R (fuera de la pared) se descartan.
+  - u_τ = U_b √(f/8), con f desde wallShearStress (postproc.wall_friction,
+    último tiempo escrito; f desarrollado si hay malla completa). Sin
+    wallShearStress (o si da f <= 0) se usa f de la correlación.
+  - Re = compute_reynolds(U_b, D, ρ, μ) de losses_calculator.
+  - Ley logarítmica: u+ = ln(y+)/κ + B (κ = 0.41, B = 5.2), comparada en
+    y+ >= 30 e y/R <= 0.2: más lejos de la pared empieza la estela (wake) y
+    el perfil real se aparta de la ley logarítmica aunque esté desarrollado.
+  - Ley de potencia: u/U_c = (y/R)^(1/n), n = 1.8 log10(Re) - 1.7,
+    U_c/U_b = (n + 1)(2n + 1) / (2n²), comparada en todo el radio.
+
+La desviación es el RMS de (u - u_modelo)/u_modelo en %. U_b del perfil
+(2/R² ∫ u r dr) sirve de control de caudal.
+
+Longitud de desarrollo: primer punto de axisLine en el que la velocidad del
+eje llega al 99 % de su asíntota (media del último 10 % de la línea). Si
+sólo la alcanza dentro de ese tramo final, o si en él la velocidad varía
+más de 1 %, queda sin definir (la línea es corta para el caso). Se compara
+con L/D = 4.4 Re^(1/6).
+
+Todo es vectorizado sobre (tiempo, punto); no hay bucle por tiempo.
+
+Uso:
+    python3 -m postproc.velocity_profile ../../cases/runs/CASE
+    python3 -m postproc.velocity_profile CASE --radial radialOutlet --axial axisLine --format json
+"""
+
+import argparse
+import json
+import math
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .case_params import CaseParameters, discover_cases, read_case_parameters
+from .sampling import load_set
+from .theory import compute_reynolds, friction_factor_array
+from .wall_friction import case_wall_friction
+
+KAPPA = 0.41
+B_LOG_LAW = 5.2
+Y_PLUS_LOG_MIN = 30.0
+# Límite exterior de la zona logarítmica (desde ahí, región de estela)
+Y_OVER_R_LOG_MAX = 0.2
+
+DEVELOPED_FRACTION = 0.99
+# Fracción final de axisLine que define la asíntota de la velocidad del eje
+ASYMPTOTE_TAIL = 0.1
+
+FUNCTION_DEFAULT = "profiles"
+RADIAL_SET_DEFAULT = "radialOutlet"
+AXIAL_SET_DEFAULT = "axisLine"
+
+
+@dataclass
+class VelocityProfileReport:
+    """Desviación del perfil radial y longitud de desarrollo, por tiempo."""
+
+    case: str
+    function: str
+    D_m: float
+    U_bulk_ms: float
+    Re: float
+    u_tau_ms: float
+    u_tau_source: str
+    power_law_n: float
+    radial_set: str
+    times: List[float]
+    U_bulk_profile_ms: List[float]
+    U_centre_ms: List[float]
+    dev_log_law_pct: List[Optional[float]]
+    dev_power_law_pct: List[Optional[float]]
+    axial_set: Optional[str] = None
+    axial_times: List[float] = field(default_factory=list)
+    development_length_m: List[Optional[float]] = field(default_factory=list)
+    development_length_corr_m: Optional[float] = None
+    # Perfil del último tiempo, en variables de pared
+    y_plus: List[float] = field(default_factory=list)
+    u_plus: List[float] = field(default_factory=list)
+    u_plus_log_law: List[float] = field(default_factory=list)
+    u_plus_power_law: List[float] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _finite(values: np.ndarray) -> List[Optional[float]]:
+    return [float(v) if math.isfinite(v) else None for v in np.asarray(values, dtype=float)]
+
+
+def power_law_exponent(Re) -> np.ndarray:
+    """n de la ley de potencia en función de Re (n ≈ 7 para Re ≈ 1e5)."""
+    return 1.8 * np.log10(np.asarray(Re, dtype=float)) - 1.7
+
+
+def power_law_velocity(y_over_R, n, U_b) -> np.ndarray:
+    """u = U_c (y/R)^(1/n), con U_c tal que el caudal da U_b."""
+    U_c = U_b * (n + 1.0) * (2.0 * n + 1.0) / (2.0 * n ** 2)
+    return U_c * np.clip(y_over_R, 0.0, 1.0) ** (1.0 / n)
+
+
+def log_law_u_plus(y_plus) -> np.ndarray:
+    """u+ = ln(y+)/κ + B."""
+    return np.log(y_plus) / KAPPA + B_LOG_LAW
+
+
+def line_distance(positions: np.ndarray) -> np.ndarray:
+    """Distancia de cada punto de un set al primero."""
+    positions = np.asarray(positions, dtype=float)
+    return np.linalg.norm(positions - positions[0], axis=1)
+
+
+def streamwise_velocity(U: np.ndarray) -> np.ndarray:
+    """(T, P, 3) -> (T, P): proyección sobre la dirección media de cada tiempo."""
+    direction = U.sum(axis=1)
+    norm = np.linalg.norm(direction, axis=1, keepdims=True)
+    direction = direction / np.where(norm > 0, norm, 1.0)
+    return np.einsum("tpc,tc->tp", U, direction)
+
+
+def _masked_rms(rel: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    n = mask.sum(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return 100.0 * np.sqrt(np.where(mask, rel ** 2, 0.0).sum(axis=-1) / n)
+
+
+def profile_deviation(
+    r: np.ndarray,
+    u: np.ndarray,
+    R: float,
+    u_tau: float,
+    U_b: float,
+    nu: float,
+    Re: float,
+) -> Dict[str, np.ndarray]:
+    """
+    Compara u(r) (T, P) con la ley logarítmica y la de potencia.
+
+    dev_log usa sólo la zona logarítmica (y+ >= Y_PLUS_LOG_MIN e
+    y/R <= Y_OVER_R_LOG_MAX); dev_power, todo el radio.
+
+    Devuelve arrays por tiempo (dev_log, dev_power en %, U_b del perfil,
+    U del eje) y el perfil en variables de pared (y+, u+, modelos), todos
+    restringidos a los puntos dentro de la tubería (r < R).
+    """
+    r = np.asarray(r, dtype=float)
+    u = np.atleast_2d(np.asarray(u, dtype=float))
+    inside = r < R
+    r, u = r[inside], u[:, inside]
+    y = R - r
+    y_plus = y * u_tau / nu
+    u_plus = u / u_tau
+
+    n = float(power_law_exponent(Re))
+    u_plus_log = log_law_u_plus(y_plus)
+    u_plus_pow = power_law_velocity(y / R, n, U_b) / u_tau
+
+    log_zone = np.broadcast_to((y_plus >= Y_PLUS_LOG_MIN) & (y <= Y_OVER_R_LOG_MAX * R), u.shape)
+    all_points = np.broadcast_to(u_plus_pow > 0, u.shape)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dev_log = _masked_rms((u_plus - u_plus_log) / u_plus_log, log_zone)
+        dev_pow = _masked_rms((u_plus - u_plus_pow) / u_plus_pow, all_points)
+
+    # U_b = 2/R² ∫ u r dr (trapecios; entre la pared y el último punto, u lineal a 0)
+    r_ext = np.append(r, R)
+    f = np.concatenate([u * r, np.zeros((u.shape[0], 1))], axis=1)
+    flux = 0.5 * ((f[:, 1:] + f[:, :-1]) * np.diff(r_ext)).sum(axis=1)
+
+    return {
+        "dev_log": dev_log,
+        "dev_power": dev_pow,
+        "U_bulk": 2.0 * flux / R ** 2,
+        "U_centre": u.max(axis=1),
+        "n": n,
+        "y_plus": y_plus,
+        "u_plus": u_plus,
+        "u_plus_log": u_plus_log,
+        "u_plus_power": u_plus_pow,
+    }
+
+
+def development_length(
+    s: np.ndarray,
+    u: np.ndarray,
+    fraction: float = DEVELOPED_FRACTION,
+    tail: float = ASYMPTOTE_TAIL,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Primer s (P,) en el que u (T, P) llega a fraction de su asíntota.
+
+    Devuelve (L (T,), asíntota (T,)); L = nan si sólo se alcanza en el tramo
+    final que define la asíntota o si en ese tramo u varía más que 1 - fraction.
+    """
+    s = np.asarray(s, dtype=float)
+    u = np.atleast_2d(np.asarray(u, dtype=float))
+    n_tail = max(1, int(round(tail * s.size)))
+    u_inf = u[:, -n_tail:].mean(axis=1)
+    reached = u >= fraction * u_inf[:, None]
+    first = np.argmax(reached, axis=1)
+    # Si u todavía varía más que la tolerancia dentro del tramo final, no hay asíntota
+    flat = np.ptp(u[:, -n_tail:], axis=1) <= (1.0 - fraction) * np.abs(u_inf)
+    found = reached.any(axis=1) & (first < s.size - n_tail) & flat
+    return np.where(found, s[first], np.nan), u_inf
+
+
+def _wall_u_tau(case_dir: Path, params: CaseParameters, Re: float) -> Tuple[float, str]:
+    """
+    u_τ desde wallShearStress o, si no hay o da f <= 0 (campo sin
+    calcular), desde f de la correlación.
+    """
+    U_b = params.U_inlet_ms
+    try:
+        wf = case_wall_friction(case_dir, params=params)
+    except (OSError, KeyError, ValueError):
+        wf = None
+    if wf is not None:
+        if wf.f_developed is not None and wf.f_developed > 0:
+            return U_b * math.sqrt(wf.f_developed / 8.0), f"wallShearStress t = {wf.time} (f desarrollado)"
+        if wf.f_developed is None and wf.f_mean > 0:
+            return U_b * math.sqrt(wf.f_mean / 8.0), f"wallShearStress t = {wf.time} (f medio)"
+    f = float(friction_factor_array(Re, params.D_m, params.roughness_m, method="haaland"))
+    return U_b * math.sqrt(f / 8.0), "correlación (haaland)"
+
+
+def analyze_velocity_profiles(
+    case_dir: Path,
+    function: str = FUNCTION_DEFAULT,
+    radial_set: str = RADIAL_SET_DEFAULT,
+    axial_set: Optional[str] = AXIAL_SET_DEFAULT,
+    u_tau: Optional[float] = None,
+    use_cache: bool = True,
+) -> VelocityProfileReport:
+    """Perfil radial contra las leyes de pared y longitud de desarrollo, todos los tiempos."""
+    case_dir = Path(case_dir)
+    params = read_case_parameters(case_dir)
+    if params.D_m is None or params.U_inlet_ms is None:
+        raise ValueError(f"{case_dir}: faltan D o U de entrada")
+    D, U_b, nu = params.D_m, params.U_inlet_ms, params.nu_m2s
+    R = 0.5 * D
+    Re = compute_reynolds(U_b, D, params.rho_kgm3, nu * params.rho_kgm3)
+    if u_tau is None:
+        u_tau, source = _wall_u_tau(case_dir, params, Re)
+    else:
+        source = "dado"
+
+    fo_dir = case_dir / "postProcessing" / function
+    radial = load_set(fo_dir, radial_set, use_cache)
+    u = streamwise_velocity(radial.array("U"))
+    dev = profile_deviation(line_distance(radial.positions), u, R, u_tau, U_b, nu, Re)
+
+    report = VelocityProfileReport(
+        case=params.name,
+        function=function,
+        D_m=D,
+        U_bulk_ms=U_b,
+        Re=Re,
+        u_tau_ms=u_tau,
+        u_tau_source=source,
+        power_law_n=dev["n"],
+        radial_set=radial_set,
+        times=radial.times.tolist(),
+        U_bulk_profile_ms=dev["U_bulk"].tolist(),
+        U_centre_ms=dev["U_centre"].tolist(),
+        dev_log_law_pct=_finite(dev["dev_log"]),
+        dev_power_law_pct=_finite(dev["dev_power"]),
+        y_plus=dev["y_plus"].tolist(),
+        u_plus=dev["u_plus"][-1].tolist(),
+        u_plus_log_law=dev["u_plus_log"].tolist(),
+        u_plus_power_law=dev["u_plus_power"].tolist(),
+    )
+
+    if axial_set:
+        axial = load_set(fo_dir, axial_set, use_cache)
+        L, _ = development_length(line_distance(axial.positions), streamwise_velocity(axial.array("U")))
+        report.axial_set = axial_set
+        report.axial_times = axial.times.tolist()
+        report.development_length_m = _finite(L)
+        report.development_length_corr_m = 4.4 * Re ** (1.0 / 6.0) * D
+    return report
+
+
+def _num(x: Optional[float], spec: str) -> str:
+    return format(x, spec) if x is not None else "-"
+
+
+def print_report(r: VelocityProfileReport, tail: int) -> None:
+    print(f"===== {r.case} ({r.function}/{r.radial_set}) =====")
+    print(f"D = {r.D_m:.4g} m, U_b = {r.U_bulk_ms:.4g} m/s, Re = {r.Re:.4g}, n (ley de potencia) = {r.power_law_n:.2f}")
+    print(f"u_τ = {r.u_tau_ms:.4g} m/s  ({r.u_tau_source})")
+    if r.development_length_corr_m is not None:
+        print(f"Longitud de desarrollo (4.4 Re^(1/6) D): {r.development_length_corr_m:.4g} m "
+              f"({r.development_length_corr_m / r.D_m:.1f} D)")
+    L_by_time = dict(zip(r.axial_times, r.development_length_m))
+    print(f"{'t':>10} {'U_b perfil':>11} {'U eje':>9} {'desv. log %':>12} {'desv. pot. %':>13} {'L_des [m]':>10} {'L/D':>7}")
+    rows = list(zip(r.times, r.U_bulk_profile_ms, r.U_centre_ms, r.dev_log_law_pct, r.dev_power_law_pct))
+    for t, ub, uc, d_log, d_pow in rows[-tail:]:
+        L = L_by_time.get(t)
+        print(f"{t:>10g} {ub:>11.4g} {uc:>9.4g} {_num(d_log, '12.2f')} {_num(d_pow, '13.2f')} "
+              f"{_num(L, '10.4g')} {_num(L / r.D_m if L is not None else None, '7.1f')}")
+    print("")
+
+
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Perfil radial de velocidad a la salida contra la ley logarítmica y la "
+            "de potencia, y longitud de desarrollo desde la velocidad del eje."
+        )
+    )
+    parser.add_argument("paths", nargs="+", type=Path, help="Casos o carpetas con casos.")
+    parser.add_argument("--function", default=FUNCTION_DEFAULT,
+                        help=f"functionObject sets (por defecto: {FUNCTION_DEFAULT}).")
+    parser.add_argument("--radial", default=RADIAL_SET_DEFAULT,
+                        help=f"Set radial (por defecto: {RADIAL_SET_DEFAULT}).")
+    parser.add_argument("--axial", default=AXIAL_SET_DEFAULT,
+                        help=f"Set sobre el eje; '' para omitir (por defecto: {AXIAL_SET_DEFAULT}).")
+    parser.add_argument("--u-tau", type=float, help="u_τ [m/s] (por defecto: desde wallShearStress).")
+    parser.add_argument("--tail", type=int, default=10,
+                        help="Tiempos que se muestran en el reporte (por defecto: los últimos 10).")
+    parser.add_argument("--no-cache", action="store_true", help="Releer los CSV sin usar el .npz.")
+    parser.add_argument("--format", choices=("report", "json"), default="report",
+                        help="Formato de salida (por defecto: report).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Any = None) -> None:
+    args = parse_args(argv)
+    cases = discover_cases(args.paths)
+    if not cases:
+        print("[ERROR] No se encontraron casos (carpetas con system/controlDict).", file=sys.stderr)
+        sys.exit(1)
+
+    reports = []
+    for case_dir in cases:
+        try:
+            reports.append(analyze_velocity_profiles(
+                case_dir, args.function, args.radial, args.axial or None, args.u_tau, not args.no_cache
+            ))
+        except (OSError, KeyError, ValueError, RuntimeError) as e:
+            print(f"[ERROR] {case_dir}: {e}", file=sys.stderr)
+
+    if args.format == "json":
+        print(json.dumps([r.to_dict() for r in reports], indent=2))
+    else:
+        for r in reports:
+            print_report(r, args.tail)
+    if not reports:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+Factor de fricción local a partir del esfuerzo de corte en la pared.
+
+Δp entre inlet y outlet (post_pipe20m.py, analysis) mezcla la entrada, la
+salida y la fricción desarrollada. Aquí se integra wallShearStress sobre el
+patch de pared, ponderado por el área de cada cara (de constant/polyMesh), en
+intervalos a lo largo del eje del flujo:
+
+  τ̄_k  = Σ |τ_i| A_i / Σ A_i        (caras con centro en el intervalo k)
+  f(x) = 8 τ̄ / (ρ U_b²)             (Darcy; con τ cinemático, 8 τ̄ / U_b²)
+
+y se compara con friction_factor de losses_calculator para Re = U_b D / ν.
+También se da el Δp que equilibra la fuerza axial de la pared,
+Δp_pared = |Σ (τ_i · eje) A_i| / (π D² / 4), comparable con el Δp de
+postProcessing en un tubo recto.
+
+El eje es la dirección de U en el inlet y x se mide desde el centro del
+inlet; en un codo sólo el tramo recto de entrada queda bien resuelto.
+Sin malla completa (sólo boundary) no hay áreas ni posiciones y se da la
+media simple de |τ| en el patch.
+
+Por defecto se usa el último tiempo con wallShearStress sin contar el
+inicial (0) si hay tiempos posteriores; un campo inicial con τ = 0 en más
+de UNCOMPUTED_ZERO_FRACTION de las caras de pared es un error (campo sin
+calcular), no f = 0.
+
+Todo es vectorizado sobre las caras (áreas con PolyMesh.face_area_vectors,
+intervalos con np.bincount).
+
+Uso:
+    python3 -m postproc.wall_friction ../../cases/runs/pipecyl20m__20251125-112012__algo --bins 40
+    python3 -m postproc.wall_friction ../../cases/runs --time 1000 --format json
+"""
+
+import argparse
+import json
+import math
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .case_params import CaseParameters, discover_cases, find_patch, read_case_parameters
+from .fields import case_times, field_path, read_case_field
+from .foam_io import read_boundary
+from .polymesh import has_full_polymesh, read_polymesh
+from .theory import CorrelationMethod, friction_factor_array
+
+N_BINS_DEFAULT = 40
+# Fracción del largo a partir de la cual se promedia f "desarrollado"
+DEVELOPED_FROM_DEFAULT = 0.5
+# Con más caras de pared con τ = 0 el campo inicial se toma como no calculado
+UNCOMPUTED_ZERO_FRACTION = 0.5
+
+KINEMATIC_STRESS_DIMS = (0, 2, -2, 0, 0, 0, 0)
+
+
+@dataclass
+class WallFrictionProfile:
+    """f(x) de un caso y su comparación con la correlación."""
+
+    case: str
+    time: str
+    patch: str
+    area_weighted: bool
+    D_m: float
+    U_bulk_ms: float
+    Re: float
+    rho_kgm3: float
+    f_theory: float
+    f_mean: float                   # sobre todo el patch
+    f_developed: Optional[float]    # media de los intervalos con x >= developed_from · L
+    error_developed_pct: Optional[float]
+    dp_wall_pa: Optional[float]     # Δp que equilibra la fuerza axial de la pared
+    x_m: List[float]                # centro de cada intervalo
+    area_m2: List[float]
+    tau_w_pa: List[float]
+    f_darcy: List[float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def friction_profile(
+    x: np.ndarray,
+    area: np.ndarray,
+    tau: np.ndarray,
+    n_bins: int = N_BINS_DEFAULT,
+) -> Dict[str, np.ndarray]:
+    """
+    τ medio ponderado por área en n_bins intervalos iguales de x.
+
+    x, area: (n,) posición axial y área de cada cara; tau: (n,) |τ|.
+    Los intervalos sin caras quedan con τ = nan.
+    """
+    x = np.asarray(x, dtype=float)
+    area = np.asarray(area, dtype=float)
+    tau = np.asarray(tau, dtype=float)
+    lo, hi = float(x.min()), float(x.max())
+    width = (hi - lo) / n_bins if hi > lo else 1.0
+    idx = np.minimum(((x - lo) / width).astype(np.int64), n_bins - 1)
+
+    a_bin = np.bincount(idx, weights=area, minlength=n_bins)
+    ta_bin = np.bincount(idx, weights=tau * area, minlength=n_bins)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tau_bin = np.where(a_bin > 0, ta_bin / a_bin, np.nan)
+    return {
+        "x": lo + (np.arange(n_bins) + 0.5) * width,
+        "area": a_bin,
+        "tau": tau_bin,
+    }
+
+
+def wall_patch_name(case_dir: Path, field_patches: List[str]) -> str:
+    """Patch de pared: el de tipo wall en boundary; si no, el que contiene "wall"."""
+    boundary = case_dir / "constant" / "polyMesh" / "boundary"
+    if boundary.is_file():
+        patches = read_boundary(boundary)
+        for p in patches:
+            if p.type == "wall":
+                return p.name
+        names = [p.name for p in patches]
+    else:
+        names = field_patches
+    name = find_patch(names, "wall")
+    if name is None:
+        raise ValueError(f"No hay patch de pared en {case_dir}")
+    return name
+
+
+def _result_time(case_dir: Path) -> Optional[str]:
+    """
+    Último tiempo con wallShearStress sin contar el inicial; None si sólo
+    hay un tiempo (se usa ese).
+    """
+    times = case_times(case_dir)
+    if len(times) < 2:
+        return None
+    for t in reversed(times[1:]):
+        try:
+            field_path(case_dir, "wallShearStress", t)
+        except FileNotFoundError:
+            continue
+        return t
+    raise ValueError(
+        f"{case_dir}: wallShearStress sólo está en el tiempo inicial {times[0]} "
+        f"(campo inicial sin calcular); ejecutar el solver con -postProcess -func wallShearStress"
+    )
+
+
+def case_wall_friction(
+    case_dir: Path,
+    time: Optional[str] = None,
+    patch: Optional[str] = None,
+    n_bins: int = N_BINS_DEFAULT,
+    developed_from: float = DEVELOPED_FROM_DEFAULT,
+    method: CorrelationMethod = "haaland",
+    params: Optional[CaseParameters] = None,
+) -> WallFrictionProfile:
+    """
+    f(x) desde wallShearStress de un caso (último tiempo calculado por
+    defecto, ver docstring del módulo).
+    """
+    case_dir = Path(case_dir)
+    params = params or read_case_parameters(case_dir)
+    if params.D_m is None or params.U_inlet_ms is None:
+        raise ValueError(f"{case_dir}: faltan D o U de entrada para normalizar τ")
+
+    fld = read_case_field(case_dir, "wallShearStress", time if time is not None else _result_time(case_dir))
+    patch = patch or wall_patch_name(case_dir, fld.patch_names)
+    tau_vec = fld.boundary_field(patch)
+    if tau_vec.ndim != 2:
+        raise ValueError(f"{fld.path}: wallShearStress uniforme en '{patch}' (campo inicial sin calcular)")
+    # Con τ cinemático [m²/s²] f no depende de ρ; en Pa se divide por ρ
+    rho = params.rho_kgm3
+    scale = 1.0 if fld.dimensions == KINEMATIC_STRESS_DIMS else 1.0 / rho
+    tau_kin = np.linalg.norm(tau_vec, axis=1) * scale
+    zero_fraction = float(np.mean(tau_kin == 0.0)) if tau_kin.size else 1.0
+    if zero_fraction > UNCOMPUTED_ZERO_FRACTION and fld.path.parent.name == case_times(case_dir)[0]:
+        raise ValueError(
+            f"{fld.path}: wallShearStress nulo en el {zero_fraction:.1%} de '{patch}' (campo inicial sin calcular)"
+        )
+    u2 = params.U_inlet_ms ** 2
+
+    Re = params.U_inlet_ms * params.D_m / params.nu_m2s
+    f_theory = float(friction_factor_array(Re, params.D_m, params.roughness_m, method=method))
+
+    profile = {"x": np.array([]), "area": np.array([]), "tau": np.array([])}
+    area_weighted = has_full_polymesh(case_dir)
+    f_developed = dp_wall = None
+    if area_weighted:
+        mesh = read_polymesh(case_dir)
+        faces = mesh.patch_faces(patch)
+        if faces.size != tau_vec.shape[0]:
+            raise ValueError(f"{fld.path}: {tau_vec.shape[0]} valores en '{patch}' y la malla tiene {faces.size} caras")
+        centres, area_vec = mesh.face_area_vectors(faces)
+        area = np.linalg.norm(area_vec, axis=1)
+        axis = np.asarray(params.flow_axis, dtype=float)
+        origin = mesh.patch_summary(params.inlet_patch)["centre"]
+        x = (centres - origin) @ axis
+
+        profile = friction_profile(x, area, tau_kin, n_bins)
+        f_mean = 8.0 * float((tau_kin * area).sum() / area.sum()) / u2
+        developed = profile["x"] >= profile["x"][0] + developed_from * (profile["x"][-1] - profile["x"][0])
+        a_dev = profile["area"][developed]
+        if a_dev.sum() > 0:
+            tau_dev = np.nansum(profile["tau"][developed] * a_dev) / a_dev.sum()
+            f_developed = float(8.0 * tau_dev / u2)
+        axial_force = abs(float(((tau_vec * scale) @ axis * area).sum()))
+        dp_wall = axial_force * rho / (math.pi * params.D_m ** 2 / 4.0)
+    else:
+        f_mean = 8.0 * float(tau_kin.mean()) / u2
+
+    return WallFrictionProfile(
+        case=params.name,
+        time=fld.path.parent.name,
+        patch=patch,
+        area_weighted=area_weighted,
+        D_m=params.D_m,
+        U_bulk_ms=params.U_inlet_ms,
+        Re=Re,
+        rho_kgm3=rho,
+        f_theory=f_theory,
+        f_mean=f_mean,
+        f_developed=f_developed,
+        error_developed_pct=(f_developed - f_theory) / f_theory * 100.0 if f_developed is not None else None,
+        dp_wall_pa=dp_wall,
+        x_m=profile["x"].tolist(),
+        area_m2=profile["area"].tolist(),
+        tau_w_pa=(profile["tau"] * rho).tolist(),
+        f_darcy=(8.0 * profile["tau"] / u2).tolist(),
+    )
+
+
+def _num(x: Optional[float], spec: str) -> str:
+    return format(x, spec) if x is not None and math.isfinite(x) else "-"
+
+
+def print_profile(r: WallFrictionProfile) -> None:
+    print(f"===== {r.case} (t = {r.time}, patch {r.patch}) =====")
+    print(f"D = {r.D_m:.4g} m, U_b = {r.U_bulk_ms:.4g} m/s, Re = {r.Re:.4g}")
+    print(f"f correlación          : {r.f_theory:.5f}")
+    print(f"f medio (todo el patch): {r.f_mean:.5f}" + ("" if r.area_weighted else "  (sin malla: media simple)"))
+    print(f"f desarrollado         : {_num(r.f_developed, '.5f')}  (error {_num(r.error_developed_pct, '+.2f')} %)")
+    print(f"Δp de la pared [Pa]    : {_num(r.dp_wall_pa, '.6g')}")
+    if r.x_m:
+        print(f"{'x [m]':>10} {'x/D':>8} {'τw [Pa]':>12} {'f':>10}")
+        for x, tau, f in zip(r.x_m, r.tau_w_pa, r.f_darcy):
+            print(f"{x:10.4f} {x / r.D_m:8.2f} {_num(tau, '12.5g')} {_num(f, '10.5f')}")
+    print("")
+
+
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Factor de fricción local f(x) desde wallShearStress, comparado con la correlación."
+    )
+    parser.add_argument("paths", nargs="+", type=Path, help="Casos o carpetas con casos.")
+    parser.add_argument("--time", help="Carpeta de tiempo (por defecto: la última con wallShearStress).")
+    parser.add_argument("--patch", help="Patch de pared (por defecto: el de tipo wall).")
+    parser.add_argument("--bins", type=int, default=N_BINS_DEFAULT,
+                        help=f"Intervalos a lo largo del eje (por defecto: {N_BINS_DEFAULT}).")
+    parser.add_argument("--developed-from", type=float, default=DEVELOPED_FROM_DEFAULT,
+                        help="Fracción del largo desde la que f se considera desarrollado (por defecto: 0.5).")
+    parser.add_argument("--method", choices=("blasius", "haaland", "colebrook", "table"), default="haaland",
+                        help="Correlación de f (por defecto: haaland).")
+    parser.add_argument("--format", choices=("report", "json"), default="report",
+                        help="Formato de salida (por defecto: report).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Any = None) -> None:
+    args = parse_args(argv)
+    cases = discover_cases(args.paths)
+    if not cases:
+        print("[ERROR] No se encontraron casos (carpetas con system/controlDict).", file=sys.stderr)
+        sys.exit(1)
+
+    results, failed = [], 0
+    for case_dir in cases:
+        try:
+            results.append(case_wall_friction(
+                case_dir, args.time, args.patch, args.bins, args.developed_from, args.method
+            ))
+        except (OSError, KeyError, ValueError, RuntimeError) as e:
+            failed += 1
+            print(f"[ERROR] {case_dir}: {e}", file=sys.stderr)
+
+    if args.format == "json":
+        print(json.dumps([r.to_dict() for r in results], indent=2))
+    else:
+        for r in results:
+            print_profile(r)
+    if failed and not results:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""
+Distribución de y+ en la pared y ajuste de la capa viscosa de meshgen.
+
+Lee el yPlus del patch de pared (último tiempo escrito por defecto), y por
+región calcula percentiles, histograma (intervalos logarítmicos) y la
+fracción de caras fuera del rango del tratamiento de pared:
+
+  - wall_function (nutkWallFunction, ...): 30 <= y+ <= 300
+  - low_re (nutLowReWallFunction, ...):    y+ <= 1
+
+El tratamiento sale del tipo de nut en el patch. Con la malla completa las
+caras se separan en tramo recto y codo: una cara es del tramo recto si su
+centro está a D/2 (± tol) del eje del inlet o del outlet, aguas abajo del
+inlet o aguas arriba del outlet; el resto es codo. Sin malla sólo está la
+región "wall".
+
+Con el estadístico elegido (mediana por defecto) y la capa viscosa con la
+que se malló (la del nivel de meshgen para el D del caso, o la que se
+indique), meshgen.wall_treatment propone un ViscousLayerParams nuevo con la
+primera capa que da el y+ objetivo.
+
+Todo es vectorizado sobre las caras de pared; la malla sale de la caché de
+postproc.cache, así que se puede correr después de cada escritura.
+
+Uso:
+    python3 -m postproc.yplus ../../cases/base/elbow20D
+    python3 -m postproc.yplus CASE --time 1000 --target 40 --level fine --format json
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .case_params import discover_cases, read_case_parameters
+from .fields import read_case_field
+from .polymesh import has_full_polymesh, read_polymesh
+from .wall_friction import wall_patch_name
+
+try:
+    from meshgen.calculator import ViscousLayerParams
+    from meshgen.wall_treatment import (
+        Y_PLUS_RANGES,
+        Y_PLUS_TARGETS,
+        level_viscous_layers,
+        viscous_layers_for_yplus,
+    )
+except ImportError:
+    _MESHGEN_DIR = Path(__file__).resolve().parents[2] / "salome_mesh_generator"
+    sys.path.insert(0, str(_MESHGEN_DIR))
+    from meshgen.calculator import ViscousLayerParams
+    from meshgen.wall_treatment import (
+        Y_PLUS_RANGES,
+        Y_PLUS_TARGETS,
+        level_viscous_layers,
+        viscous_layers_for_yplus,
+    )
+
+PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+STATISTICS = tuple(f"p{q}" for q in PERCENTILES) + ("mean",)
+HISTOGRAM_BINS = 20
+# Tolerancia relativa sobre D/2 para decidir si una cara es del tramo recto
+REGION_TOL_DEFAULT = 0.05
+
+# Tipo de nut en la pared -> tratamiento (el resto: wall_function)
+NUT_WALL_TREATMENT = {
+    "nutLowReWallFunction": "low_re",
+    "nutUSpaldingWallFunction": "low_re",
+}
+
+
+@dataclass
+class YPlusReport:
+    """Distribución de y+ por región y capa viscosa propuesta."""
+
+    case: str
+    time: str
+    patch: str
+    wall_treatment: str
+    y_plus_range: List[float]
+    y_plus_target: float
+    statistic: str
+    viscous_current: Dict[str, Any]
+    regions: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def yplus_stats(values: np.ndarray, lo: float, hi: float) -> Dict[str, Any]:
+    """Percentiles, media, fracción fuera de [lo, hi] e histograma logarítmico."""
+    values = np.asarray(values, dtype=float)
+    pct = np.percentile(values, PERCENTILES)
+    positive = values[values > 0]
+    if positive.size and positive.max() > positive.min():
+        edges = np.geomspace(positive.min(), positive.max(), HISTOGRAM_BINS + 1)
+    else:
+        edges = np.linspace(values.min(), values.max() + 1.0, HISTOGRAM_BINS + 1)
+    counts, edges = np.histogram(values, bins=edges)
+    return {
+        "n": int(values.size),
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "mean": float(values.mean()),
+        **{f"p{q}": float(v) for q, v in zip(PERCENTILES, pct)},
+        "fraction_below": float(np.count_nonzero(values < lo)) / values.size,
+        "fraction_above": float(np.count_nonzero(values > hi)) / values.size,
+        "histogram_edges": edges.tolist(),
+        "histogram_counts": counts.tolist(),
+    }
+
+
+def _on_leg(centres: np.ndarray, origin: np.ndarray, axis: np.ndarray, radius: float, tol: float) -> np.ndarray:
+    """Caras a radius (± tol·radius) de la recta origin + s·axis, con s >= 0."""
+    rel = centres - origin
+    s = rel @ axis
+    dist = np.linalg.norm(rel - s[:, None] * axis, axis=1)
+    return (s >= -tol * radius) & (np.abs(dist - radius) <= tol * radius)
+
+
+def wall_regions(
+    centres: np.ndarray,
+    inlet: Dict[str, Any],
+    outlet: Dict[str, Any],
+    D: float,
+    tol: float = REGION_TOL_DEFAULT,
+) -> Dict[str, np.ndarray]:
+    """
+    Máscaras "straight" y "elbow" de las caras de pared. inlet/outlet son
+    PolyMesh.patch_summary (centro y normal hacia afuera del dominio).
+    """
+    radius = 0.5 * D
+    straight = _on_leg(centres, np.asarray(inlet["centre"]), -np.asarray(inlet["normal"]), radius, tol)
+    straight |= _on_leg(centres, np.asarray(outlet["centre"]), -np.asarray(outlet["normal"]), radius, tol)
+    return {"straight": straight, "elbow": ~straight}
+
+
+def _wall_treatment(case_dir: Path, patch: str, time: Optional[str]) -> str:
+    try:
+        nut_type = read_case_field(case_dir, "nut", time).patch_type(patch)
+    except (OSError, KeyError, ValueError):
+        try:
+            nut_type = read_case_field(case_dir, "nut", "0").patch_type(patch)
+        except (OSError, KeyError, ValueError):
+            return "wall_function"
+    return NUT_WALL_TREATMENT.get(nut_type, "wall_function")
+
+
+def analyze_yplus(
+    case_dir: Path,
+    time: Optional[str] = None,
+    patch: Optional[str] = None,
+    target: Optional[float] = None,
+    statistic: str = "p50",
+    viscous: Optional[ViscousLayerParams] = None,
+    level: str = "medium",
+    tol: float = REGION_TOL_DEFAULT,
+) -> YPlusReport:
+    """y+ por región de un caso y capa viscosa propuesta para cada región."""
+    if statistic not in STATISTICS:
+        raise ValueError(f"Estadístico desconocido '{statistic}'. Usa uno de: {', '.join(STATISTICS)}")
+    case_dir = Path(case_dir)
+    params = read_case_parameters(case_dir)
+
+    fld = read_case_field(case_dir, "yPlus", time)
+    patch = patch or wall_patch_name(case_dir, fld.patch_names)
+    values = fld.boundary_field(patch)
+    if values.ndim != 1:
+        raise ValueError(f"{fld.path}: yPlus uniforme en '{patch}' (campo inicial sin calcular)")
+
+    treatment = _wall_treatment(case_dir, patch, fld.path.parent.name)
+    lo, hi = Y_PLUS_RANGES[treatment]
+    target = target or Y_PLUS_TARGETS[treatment]
+    if viscous is None:
+        if params.D_m is None:
+            raise ValueError(f"{case_dir}: sin D no se puede deducir la capa viscosa; indícala")
+        viscous = level_viscous_layers(params.D_m, level)
+
+    masks = {"wall": np.ones(values.size, dtype=bool)}
+    if has_full_polymesh(case_dir) and params.D_m is not None:
+        mesh = read_polymesh(case_dir)
+        faces = mesh.patch_faces(patch)
+        if faces.size != values.size:
+            raise ValueError(f"{fld.path}: {values.size} valores en '{patch}' y la malla tiene {faces.size} caras")
+        centres, _ = mesh.face_area_vectors(faces)
+        masks.update(wall_regions(
+            centres,
+            mesh.patch_summary(params.inlet_patch),
+            mesh.patch_summary(params.outlet_patch),
+            params.D_m,
+            tol,
+        ))
+
+    report = YPlusReport(
+        case=params.name,
+        time=fld.path.parent.name,
+        patch=patch,
+        wall_treatment=treatment,
+        y_plus_range=[lo, hi],
+        y_plus_target=target,
+        statistic=statistic,
+        viscous_current=asdict(viscous),
+    )
+    for region, mask in masks.items():
+        if not mask.any():
+            continue
+        stats = yplus_stats(values[mask], lo, hi)
+        update = viscous_layers_for_yplus(viscous, stats[statistic], target) if stats[statistic] > 0 else None
+        report.regions[region] = {
+            **stats,
+            "viscous_update": update.to_dict() if update is not None else None,
+        }
+    return report
+
+
+def print_report(r: YPlusReport) -> None:
+    lo, hi = r.y_plus_range
+    print(f"===== {r.case} (t = {r.time}, patch {r.patch}) =====")
+    print(f"Tratamiento de pared: {r.wall_treatment} (y+ válido {lo:g}–{hi:g}, objetivo {r.y_plus_target:g})")
+    cur = r.viscous_current
+    print(f"Capa viscosa actual : T = {cur['total_thickness']:.4g} m, N = {cur['number_of_layers']}, "
+          f"r = {cur['stretch_factor']:.3g}")
+    print("")
+    print(f"{'región':<10}{'caras':>8}{'p5':>10}{'p50':>10}{'p95':>10}{'máx':>10}"
+          f"{'<mín %':>9}{'>máx %':>9}   propuesta ({r.statistic})")
+    for region, s in r.regions.items():
+        u = s["viscous_update"]
+        proposal = "-"
+        if u is not None:
+            new = u["proposed"]
+            proposal = (f"y1 {u['first_layer_current']:.3g} -> {u['first_layer_proposed']:.3g} m, "
+                        f"T = {new['total_thickness']:.4g} m, N = {new['number_of_layers']}")
+        print(f"{region:<10}{s['n']:>8}{s['p5']:>10.4g}{s['p50']:>10.4g}{s['p95']:>10.4g}{s['max']:>10.4g}"
+              f"{100 * s['fraction_below']:>9.1f}{100 * s['fraction_above']:>9.1f}   {proposal}")
+        for note in (u or {}).get("notes", []):
+            print(f"{'':<10}  - {note}")
+    print("")
+
+
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Distribución de y+ en la pared (tramo recto / codo) y capa viscosa "
+            "de meshgen corregida para el y+ objetivo."
+        )
+    )
+    parser.add_argument("paths", nargs="+", type=Path, help="Casos o carpetas con casos.")
+    parser.add_argument("--time", help="Carpeta de tiempo (por defecto: la última con yPlus).")
+    parser.add_argument("--patch", help="Patch de pared (por defecto: el de tipo wall).")
+    parser.add_argument("--target", type=float,
+                        help="y+ objetivo (por defecto: 50 con wall functions, 1 con low-Re).")
+    parser.add_argument("--statistic", choices=STATISTICS, default="p50",
+                        help="Estadístico de y+ que se lleva al objetivo (por defecto: p50).")
+    parser.add_argument("--level", "-l", default="medium",
+                        help="Nivel de meshgen con el que se malló (por defecto: medium).")
+    parser.add_argument("--total-thickness", type=float, help="Espesor total de la capa viscosa actual [m].")
+    parser.add_argument("--layers", type=int, help="Número de capas actual.")
+    parser.add_argument("--stretch", type=float, help="Stretch factor actual.")
+    parser.add_argument("--tol", type=float, default=REGION_TOL_DEFAULT,
+                        help="Tolerancia relativa sobre D/2 para el tramo recto (por defecto: 0.05).")
+    parser.add_argument("--format", choices=("report", "json"), default="report",
+                        help="Formato de salida (por defecto: report).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Any = None) -> None:
+    args = parse_args(argv)
+    viscous = None
+    if args.total_thickness is not None:
+        if args.layers is None or args.stretch is None:
+            print("[ERROR] Con --total-thickness hacen falta --layers y --stretch.", file=sys.stderr)
+            sys.exit(1)
+        viscous = ViscousLayerParams(args.total_thickness, args.layers, args.stretch)
+
+    cases = discover_cases(args.paths)
+    if not cases:
+        print("[ERROR] No se encontraron casos (carpetas con system/controlDict).", file=sys.stderr)
+        sys.exit(1)
+
+    reports = []
+    for case_dir in cases:
+        try:
+            reports.append(analyze_yplus(
+                case_dir, args.time, args.patch, args.target, args.statistic, viscous, args.level, args.tol
+            ))
+        except (OSError, KeyError, ValueError, RuntimeError) as e:
+            print(f"[ERROR] {case_dir}: {e}", file=sys.stderr)
+
+    if args.format == "json":
+        print(json.dumps([r.to_dict() for r in reports], indent=2))
+    else:
+        for r in reports:
+            print_report(r)
+    if not reports:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
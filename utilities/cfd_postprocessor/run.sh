@@ -0,0 +1,28 @@
+#!/usr/bin/env bash
+# Launcher for this specific utility.
+# Always runs relative to this file, so it works from any directory.
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+# Case paths are given relative to the caller, so do not cd; use PYTHONPATH.
+export PYTHONPATH="$SCRIPT_DIR:$SCRIPT_DIR/../losses_calculator:$SCRIPT_DIR/../salome_mesh_generator${PYTHONPATH:+:$PYTHONPATH}"
+
+# Subcomandos: casegen (runs desde una plantilla), campaign (índice de todos
+# los runs), cache (caché de mallas), fields (campos por patch), samples
+# (probes y sets de postProcessing en un .npz), profile (perfil de salida
+# contra leyes de pared), friction (f desde wallShearStress), yplus (y+ y
+# capa viscosa), quality (calidad de malla), gci (convergencia de malla);
+# sin subcomando: comparación de casos contra Darcy–Weisbach
+case "$1" in
+  casegen)  shift; exec python3 -m postproc.casegen "$@" ;;
+  campaign) shift; exec python3 -m postproc.campaign "$@" ;;
+  cache)    shift; exec python3 -m postproc.cache "$@" ;;
+  fields)   shift; exec python3 -m postproc.fields "$@" ;;
+  samples)  shift; exec python3 -m postproc.sampling "$@" ;;
+  profile)  shift; exec python3 -m postproc.velocity_profile "$@" ;;
+  friction) shift; exec python3 -m postproc.wall_friction "$@" ;;
+  yplus)    shift; exec python3 -m postproc.yplus "$@" ;;
+  quality)  shift; exec python3 -m postproc.mesh_quality "$@" ;;
+  gci)      shift; exec python3 -m postproc.gci "$@" ;;
+  *)        exec python3 -m postproc.cli "$@" ;;
+esac
@@ -0,0 +1,51 @@
+import shutil
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+import pytest
+
+from postproc.cache import CACHE_DIR_ENV
+
+CASES_DIR = Path(__file__).resolve().parents[3] / "cases"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    """Cada prueba usa su propia carpeta de caché (nunca ~/.cache)."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "postproc_cache"))
+
+
+@pytest.fixture
+def pipe_case(tmp_path):
+    """
+    Fábrica de copias de cases/base/pipe20m con postProcessing sintético:
+    Δp cinemático constante entre inlet y outlet y caudal q en la entrada.
+    cells reemplaza la grilla (800 20 20) del blockMeshDict.
+    """
+
+    def make(
+        name: str = "pipe20m",
+        dp_kinematic: float = 3.0,
+        q: float = 0.2886,
+        n_times: int = 800,
+        cells: Optional[Tuple[int, int, int]] = None,
+    ) -> Path:
+        case = tmp_path / name
+        shutil.copytree(CASES_DIR / "base" / "pipe20m", case)
+        if cells is not None:
+            bmd = case / "system" / "blockMeshDict"
+            bmd.write_text(bmd.read_text().replace("(800 20 20)", "({} {} {})".format(*cells)))
+        t = np.arange(1, n_times + 1)
+        for func, values in (
+            ("patchAverage(patch=inlet,fields=(p))", np.full(t.size, dp_kinematic)),
+            ("patchAverage(patch=outlet,fields=(p))", np.zeros(t.size)),
+            ("patchFlowRate(patch=inlet)", np.full(t.size, -q)),
+        ):
+            d = case / "postProcessing" / func / "0"
+            d.mkdir(parents=True)
+            rows = "".join(f"{a}\t{b}\n" for a, b in zip(t, values))
+            (d / "surfaceFieldValue.dat").write_text("# Time value\n" + rows)
+        return case
+
+    return make
@@ -0,0 +1,46 @@
+"""
+Pruebas de lectura de parámetros del caso y comparación CFD vs teoría.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from postproc.analysis import evaluate_cases
+from postproc.case_params import discover_cases, read_case_parameters
+
+CASES_DIR = Path(__file__).resolve().parents[3] / "cases"
+
+
+def test_parameters_read_from_case() -> None:
+    params = read_case_parameters(CASES_DIR / "base" / "pipe20m")
+    assert params.L_m == pytest.approx(20.0)
+    assert params.D_m == pytest.approx(0.35)
+    assert params.nu_m2s == pytest.approx(1e-6)
+    assert params.U_inlet_ms == pytest.approx(3.0)
+    assert params.p_kinematic
+    assert params.outlet_patch == "outlet"
+
+    # nu con dimensiones en transportProperties / nu with dimensions
+    assert read_case_parameters(CASES_DIR / "base" / "pipecyl20m").nu_m2s == pytest.approx(1e-6)
+
+
+def test_whole_tree_is_discovered() -> None:
+    names = {c.name for c in discover_cases([CASES_DIR])}
+    assert {"pipe20m", "pipecyl20m", "elbow20D"} <= names
+
+
+def test_cfd_vs_theory_with_kinematic_pressure(pipe_case) -> None:
+    dp_kinematic = 3.0
+    q = 0.2886
+    case = pipe_case(dp_kinematic=dp_kinematic, q=q)
+
+    (result,) = evaluate_cases([case], window=100)
+    assert result.error == ""
+    assert result.dp_mean_pa == pytest.approx(dp_kinematic * 998.0)
+    assert result.Q_used_m3s == pytest.approx(q)
+    assert result.steady
+    assert result.f_theory == pytest.approx(0.0115, rel=0.02)
+    assert result.error_dp_pct == pytest.approx(
+        (result.dp_mean_pa / result.dp_theory_pa - 1.0) * 100.0
+    )
@@ -0,0 +1,78 @@
+"""
+Pruebas de la caché de arrays parseados.
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+from postproc.cache import ArrayCache, parse_size
+from postproc.polymesh import read_polymesh
+
+CASE = Path(__file__).resolve().parents[3] / "cases" / "base" / "elbow20D"
+
+
+def _builder(calls, value):
+    def build():
+        calls.append(1)
+        return {"a": np.arange(1000, dtype=np.float64) * value}
+    return build
+
+
+def test_hit_touch_and_change(tmp_path) -> None:
+    src = tmp_path / "src.txt"
+    src.write_text("uno")
+    cache = ArrayCache(tmp_path / "cache")
+    calls = []
+
+    first = cache.get_or_build("test", [src], _builder(calls, 1.0))
+    second = cache.get_or_build("test", [src], _builder(calls, 1.0))
+    assert len(calls) == 1
+    assert isinstance(second["a"], np.memmap)
+    np.testing.assert_array_equal(first["a"], second["a"])
+
+    # Mismo contenido con otro mtime: se reutiliza por hash
+    st = src.stat()
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    cache.get_or_build("test", [src], _builder(calls, 1.0))
+    assert len(calls) == 1
+
+    # Contenido distinto: se vuelve a parsear
+    src.write_text("dos")
+    third = cache.get_or_build("test", [src], _builder(calls, 2.0))
+    assert len(calls) == 2
+    assert third["a"][1] == 2.0
+
+
+def test_eviction_and_purge(tmp_path) -> None:
+    cache = ArrayCache(tmp_path / "cache", max_bytes=20_000)
+    for i in range(4):
+        src = tmp_path / f"src{i}.txt"
+        src.write_text(str(i))
+        cache.get_or_build("test", [src], _builder([], float(i)))
+    info = cache.info()
+    assert info["bytes"] <= 20_000
+    assert info["entries"] == 2
+
+    assert cache.purge("otro") == 0
+    assert cache.purge() == 2
+    assert cache.info()["entries"] == 0
+
+
+def test_parse_size() -> None:
+    assert parse_size("500M") == 500 * 1024 ** 2
+    assert parse_size("2g") == 2 * 1024 ** 3
+    assert parse_size("1024") == 1024
+
+
+def test_polymesh_from_cache(tmp_path) -> None:
+    cache = ArrayCache(tmp_path / "cache")
+    parsed = read_polymesh(CASE, use_cache=False)
+    read_polymesh(CASE, cache=cache)
+    cached = read_polymesh(CASE, cache=cache)
+    assert isinstance(cached.points, np.memmap)
+    np.testing.assert_array_equal(parsed.face_points, cached.face_points)
+    np.testing.assert_array_equal(parsed.neighbour, cached.neighbour)
+    assert cached.patch_summary("inlet")["area_m2"] == parsed.patch_summary("inlet")["area_m2"]
+    assert cache.info()["by_kind"]["polymesh"]["entries"] == 1
@@ -0,0 +1,52 @@
+"""
+Pruebas del índice de campaña: descubrimiento de runs y reproceso incremental.
+"""
+
+import shutil
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+
+from postproc.campaign import build_index, discover_runs, fingerprint_run
+from postproc.sampling import load_set
+
+RUNS_DIR = Path(__file__).resolve().parents[3] / "cases" / "runs"
+
+
+def test_index_is_incremental(tmp_path) -> None:
+    root = tmp_path / "runs"
+    shutil.copytree(RUNS_DIR, root)
+    n_runs = len(discover_runs(root))
+
+    first = build_index(root, workers=2)
+    assert first["processed"] == n_runs
+
+    second = build_index(root, workers=2)
+    assert second["processed"] == 0 and second["skipped"] == n_runs
+
+    u_file = root / "pipe20m__20251125-111607__prueba1" / "0" / "U"
+    u_file.write_text(u_file.read_text() + "\n")
+    third = build_index(root, workers=1)
+    assert third["processed"] == 1
+
+    with sqlite3.connect(root / "campaign_index.sqlite") as conn:
+        rows = dict(conn.execute("SELECT run_name, base_case FROM runs"))
+    assert rows["pipe20m__20251125-111607__prueba1"] == "pipe20m"
+    assert len(rows) == n_runs
+
+
+def test_sample_caches_do_not_change_fingerprint(tmp_path) -> None:
+    run = tmp_path / "pipecyl20m__20251125-112012__algo"
+    shutil.copytree(RUNS_DIR / run.name, run)
+    fo_dir = run / "postProcessing" / "profiles" / "100"
+    fo_dir.mkdir(parents=True)
+    (fo_dir / "axisLine_p_U.csv").write_text(
+        "x,p,U_0,U_1,U_2\n" + "".join(f"{x},0,3,0,0\n" for x in np.linspace(0.0, 20.0, 5))
+    )
+    before = fingerprint_run(run)
+
+    load_set(fo_dir.parent, "axisLine")
+    assert (fo_dir.parent / ".samples_axisLine.npz").is_file()
+    (fo_dir.parent / "partial.npz.tmp").write_bytes(b"")
+    assert fingerprint_run(run) == before
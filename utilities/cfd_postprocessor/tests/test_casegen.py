@@ -0,0 +1,76 @@
+"""
+Pruebas del generador de runs: sustitución de parámetros, malla enlazada y
+metadatos compatibles con el índice de campaña.
+"""
+
+import io
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from postproc.campaign import discover_runs
+from postproc.case_params import read_case_parameters
+from postproc.casegen import generate_runs, load_template, read_table
+from postproc.foam_io import read_foam_dict
+
+BASE_DIR = Path(__file__).resolve().parents[3] / "cases" / "base"
+
+
+def test_runs_from_table_share_the_mesh(tmp_path) -> None:
+    base = tmp_path / "base" / "elbow20D"
+    shutil.copytree(BASE_DIR / "elbow20D", base)
+    template = load_template(base)
+    table = io.StringIO(
+        "tag,U_inlet_ms,nu_m2s,endTime,probes\n"
+        "U5,5,,2000,0;1.5\n"
+        ",,2e-6,,\n"
+    )
+    specs = list(read_table(table, template))
+    runs = generate_runs(template, specs, tmp_path / "runs", stamp="20250101-000000")
+
+    assert [r["run_name"] for r in runs] == [
+        "elbow20D__20250101-000000__U5",
+        "elbow20D__20250101-000000__002",
+    ]
+    fast, viscous = (Path(r["run_path"]) for r in runs)
+
+    params = read_case_parameters(fast)
+    assert params.U_inlet_ms == pytest.approx(5.0)
+    assert params.flow_axis == pytest.approx((0.0, 1.0, 0.0))
+    assert params.nu_m2s == pytest.approx(1e-6)
+    control = read_foam_dict(fast / "system" / "controlDict")
+    assert control["endTime"] == 2000
+    probes = control["functions"]["centerProbes"]["probeLocations"]
+    assert probes == [[0, 0, 0], [0, 1.5, 0]]
+    assert read_case_parameters(viscous).nu_m2s == pytest.approx(2e-6)
+
+    for run in (fast, viscous):
+        for name in ("points", "faces", "owner"):
+            assert os.path.samefile(run / "constant" / "polyMesh" / name, base / "constant" / "polyMesh" / name)
+        assert not os.path.samefile(run / "system" / "fvSolution", base / "system" / "fvSolution")
+    assert runs[0]["linked_files"] == 4
+
+    found = {r.run_name: (r.base_case, r.tag) for r in discover_runs(tmp_path / "runs")}
+    assert found["elbow20D__20250101-000000__U5"] == ("elbow20D", "U5")
+
+
+def test_dimensioned_viscosity_and_uniform_initial_field(tmp_path) -> None:
+    template = load_template(BASE_DIR / "pipecyl20m")
+    table = io.StringIO('{"tag": "hi", "U_inlet_ms": 1.5, "nu_m2s": 1e-5}\n')
+    (run,) = generate_runs(template, list(read_table(table, template)), tmp_path, link="copy")
+
+    run_dir = Path(run["run_path"])
+    props = read_foam_dict(run_dir / "constant" / "transportProperties")
+    assert props["nu"][-1] == pytest.approx(1e-5)
+    assert read_foam_dict(run_dir / "0" / "U")["internalField"] == ["uniform", [1.5, 0, 0]]
+    assert run["parameters"] == {"U_inlet_ms": 1.5, "nu_m2s": 1e-5}
+
+
+def test_invalid_table_creates_nothing(tmp_path) -> None:
+    template = load_template(BASE_DIR / "pipe20m")
+    table = io.StringIO("tag,U_inlet_ms\na,3\nb,-1\n")
+    with pytest.raises(ValueError):
+        generate_runs(template, list(read_table(table, template)), tmp_path / "runs")
+    assert not (tmp_path / "runs").exists()
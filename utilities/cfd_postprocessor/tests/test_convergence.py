@@ -0,0 +1,43 @@
+"""
+Pruebas de estadísticas en ventana y detección de estado estacionario.
+"""
+
+import numpy as np
+
+from postproc.convergence import (
+    RunningWindowStats,
+    analyze_convergence,
+    request_solver_stop,
+)
+
+
+def test_running_stats_match_numpy() -> None:
+    rng = np.random.default_rng(0)
+    t = np.arange(300) * 0.5
+    y = 1.0e4 + rng.normal(0.0, 1.0, t.size)
+    stats = RunningWindowStats(window=50)
+    for a, b in zip(t, y):
+        stats.push(a, b)
+    assert np.isclose(stats.mean, y[-50:].mean())
+    assert np.isclose(stats.std, y[-50:].std(ddof=1))
+    assert np.isclose(stats.slope, np.polyfit(t[-50:], y[-50:], 1)[0])
+
+
+def test_steady_state_is_detected_after_transient() -> None:
+    t = np.arange(1, 1001, dtype=float)
+    history = np.column_stack([t, 1000.0 + 500.0 * np.exp(-t / 80.0)])
+    result = analyze_convergence(history, window=200)
+    assert result["steady"]
+    assert 300 < result["t_steady"] < 1000
+
+    growing = np.column_stack([t, 1000.0 + t])
+    assert not analyze_convergence(growing, window=200)["steady"]
+
+
+def test_request_solver_stop(tmp_path) -> None:
+    control = tmp_path / "system" / "controlDict"
+    control.parent.mkdir()
+    control.write_text("startFrom latestTime;\nstopAt          endTime;\nendTime 1000;\n")
+    assert request_solver_stop(tmp_path)
+    assert "stopAt          writeNow;" in control.read_text()
+    assert not request_solver_stop(tmp_path)
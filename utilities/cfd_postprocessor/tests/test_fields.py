@@ -0,0 +1,75 @@
+"""
+Pruebas del lector de campos: listas nonuniform, uniform, lectura perezosa
+por patch y búsqueda del último tiempo escrito.
+"""
+
+import gzip
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from postproc.fields import field_path, read_case_field, read_field
+
+BASE_DIR = Path(__file__).resolve().parents[3] / "cases" / "base"
+
+HEADER = """FoamFile
+{
+    format      ascii;
+    class       %s;
+    object      %s;
+}
+dimensions      [0 1 -1 0 0 0 0];
+"""
+
+
+def test_wall_fields_of_a_real_case() -> None:
+    y_plus = read_case_field(BASE_DIR / "elbow20D", "yPlus")
+    assert y_plus.value_type == "scalar"
+    assert y_plus.patch_names == ["inlet", "outlet", "wall"]
+    wall = y_plus.boundary_field("wall")
+    assert wall.shape == (8690,) and wall.min() > 500
+    inlet = y_plus.boundary_field("inlet", size=132)
+    assert inlet.shape == (132,) and not inlet.any()
+
+    tau = read_case_field(BASE_DIR / "elbow20D", "wallShearStress")
+    assert tau.boundary_field("wall").shape == (8690, 3)
+    assert tau.dimensions == (0, 2, -2, 0, 0, 0, 0)
+
+    u = read_case_field(BASE_DIR / "elbow20D", "U")
+    np.testing.assert_allclose(u.boundary_field("inlet"), [0.0, 3.0, 0.0])
+    assert u.patch_type("wall") == "noSlip"
+    with pytest.raises(KeyError):
+        u.boundary_field("wall")
+
+
+def test_patch_is_read_without_converting_the_internal_field(tmp_path) -> None:
+    path = tmp_path / "U"
+    path.write_text(
+        HEADER % ("volVectorField", "U")
+        + "internalField   nonuniform List<vector> 2((1 2 3) (not a number));\n"
+        + "boundaryField\n{\n"
+        + "    #includeEtc \"caseDicts/setConstraintTypes\"\n"
+        + "    wall { type calculated; value nonuniform List<vector>\n3\n(\n(1 0 0)\n(0 2 0)\n(0 0 3)\n)\n; }\n"
+        + "    \"(inlet|outlet)\" { type fixedValue; value $internalField; }\n"
+        + "}\n"
+    )
+    fld = read_field(path)
+    np.testing.assert_array_equal(fld.boundary_field("wall"), np.diag([1.0, 2.0, 3.0]))
+    assert fld.patch_type("outlet") == "fixedValue"
+    with pytest.raises(ValueError):
+        fld.internal_field()
+
+
+def test_latest_time_and_compressed_fields(tmp_path) -> None:
+    for time, value in (("0", 0.0), ("50", 1.0), ("100", 2.0)):
+        (tmp_path / time).mkdir()
+        text = HEADER % ("volScalarField", "p") + f"internalField uniform {value};\nboundaryField\n{{\n}}\n"
+        if time == "100":
+            (tmp_path / time / "p.gz").write_bytes(gzip.compress(text.encode()))
+        else:
+            (tmp_path / time / "p").write_text(text)
+
+    assert field_path(tmp_path, "p").name == "p.gz"
+    assert float(read_case_field(tmp_path, "p").internal_field()) == 2.0
+    assert read_case_field(tmp_path, "p", time="50").internal_field(size=4).tolist() == [1.0] * 4
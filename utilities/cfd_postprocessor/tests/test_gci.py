@@ -0,0 +1,88 @@
+"""
+Pruebas del estudio de convergencia de malla (Richardson / GCI).
+"""
+
+from pathlib import Path
+
+import pytest
+
+from postproc.gci import (
+    _block_mesh_cells,
+    case_cell_count,
+    family_convergence,
+    grid_convergence,
+    read_family,
+)
+
+CASES_DIR = Path(__file__).resolve().parents[3] / "cases"
+
+
+def test_celik_2008_example() -> None:
+    # Tabla 1 de Celik et al. (2008), 2D: N = 18000, 8000, 4500
+    g = grid_convergence("x", [4500, 18000, 8000], [5.863, 6.063, 5.972], dim=2)
+    assert g.r21 == pytest.approx(1.5)
+    assert g.r32 == pytest.approx(1.333, rel=1e-3)
+    assert g.order == pytest.approx(1.53, abs=0.01)
+    assert g.extrapolated == pytest.approx(6.1685, abs=1e-3)
+    assert g.e_a21 == pytest.approx(0.015, abs=5e-4)
+    assert g.e_ext21 == pytest.approx(0.017, abs=5e-4)
+    assert g.gci_fine == pytest.approx(0.022, abs=5e-4)
+    assert not g.oscillatory
+
+
+def test_two_grids_use_formal_order() -> None:
+    g = grid_convergence("x", [1000, 8000], [1.1, 1.025], dim=3)
+    assert g.order == 2.0
+    assert g.r32 is None
+    # h se reduce a la mitad: φ = 1 + 0.1 h² -> extrapolado exacto
+    assert g.extrapolated == pytest.approx(1.0)
+
+
+def _family(pipe_case) -> list:
+    # Refinamiento 4 -> 6 -> 9 (r = 1.5) con Δp = 3 + 0.8 h², h = 4/k
+    return [
+        pipe_case(
+            f"pipe_k{k}", dp_kinematic=3.0 + 0.8 * (4.0 / k) ** 2, n_times=400,
+            cells=(800 * k // 4, 20 * k // 4, 20 * k // 4),
+        )
+        for k in (4, 6, 9)
+    ]
+
+
+def test_family_from_cases(pipe_case) -> None:
+    cases = _family(pipe_case)
+    assert case_cell_count(cases[0]) == {"n_cells": 320000, "source": "system/blockMeshDict"}
+
+    rows = read_family(cases, window=100)
+    assert all(r["error"] == "" for r in rows)
+    results = family_convergence(rows, ["dp", "Q"])
+
+    dp = results["dp"]
+    assert dp.order == pytest.approx(2.0, rel=1e-6)
+    assert dp.extrapolated == pytest.approx(3.0 * 998.0, rel=1e-9)
+    # En rango asintótico GCI32 / (r^p GCI21) = φ1/φ2 (≈ 1)
+    assert dp.asymptotic_ratio == pytest.approx(dp.values[0] / dp.values[1], rel=1e-6)
+    assert results["Q"].gci_fine == 0.0
+
+
+def test_cell_count_from_polymesh_header() -> None:
+    assert case_cell_count(CASES_DIR / "base" / "elbow20D45") == {
+        "n_cells": 205213,
+        "source": "constant/polyMesh",
+    }
+
+
+def test_family_with_different_viscosity_is_rejected(pipe_case) -> None:
+    cases = _family(pipe_case)
+    props = cases[1] / "constant" / "physicalProperties"
+    props.write_text(props.read_text().replace("1e-06;", "2e-06;"))
+
+    rows = read_family(cases, window=100)
+    assert [r["nu_m2s"] for r in rows] == pytest.approx([1e-6, 2e-6, 1e-6])
+    with pytest.raises(ValueError, match="nu_m2s distinto"):
+        family_convergence(rows, ["dp"])
+
+
+def test_block_mesh_cells_with_macros() -> None:
+    # pipecyl20m: 5 bloques ($xcells $ycells $zcells) = (32 32 128)
+    assert _block_mesh_cells(CASES_DIR / "base" / "pipecyl20m") == 5 * 32 * 32 * 128
@@ -0,0 +1,86 @@
+"""
+Pruebas de las métricas de calidad de malla.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from postproc.mesh_quality import mesh_quality
+from postproc.polymesh import PolyMesh, read_labels, read_polymesh
+
+CASE = Path(__file__).resolve().parents[3] / "cases" / "base" / "elbow20D"
+
+
+def box_mesh(nx: int, ny: int, nz: int, dx: float = 1.0, dy: float = 1.0, dz: float = 1.0) -> PolyMesh:
+    """Malla hexaédrica estructurada nx·ny·nz (sin patches)."""
+    ix, iy, iz = np.meshgrid(np.arange(nx + 1), np.arange(ny + 1), np.arange(nz + 1), indexing="ij")
+    points = np.column_stack([ix.ravel() * dx, iy.ravel() * dy, iz.ravel() * dz]).astype(float)
+    pid = np.arange(points.shape[0]).reshape(nx + 1, ny + 1, nz + 1)
+    cid = np.arange(nx * ny * nz).reshape(nx, ny, nz)
+
+    faces, owner, neighbour = [], [], []
+    # Caras normales a x, y, z: (vértices en orden con normal +eje, celdas a cada lado)
+    for axis in range(3):
+        n = [nx, ny, nz]
+        shape = [nx, ny, nz]
+        shape[axis] += 1
+        idx = np.indices(shape).reshape(3, -1).T
+        o = [(axis + 1) % 3, (axis + 2) % 3]
+        quads = []
+        for du, dv in ((0, 0), (1, 0), (1, 1), (0, 1)):
+            j = idx.copy()
+            j[:, o[0]] += du
+            j[:, o[1]] += dv
+            quads.append(pid[j[:, 0], j[:, 1], j[:, 2]])
+        quads = np.column_stack(quads)
+        lo = idx.copy()
+        lo[:, axis] -= 1
+        has_lo = lo[:, axis] >= 0
+        has_hi = idx[:, axis] < n[axis]
+        c_lo = np.where(has_lo, cid[np.clip(lo[:, 0], 0, None), np.clip(lo[:, 1], 0, None), np.clip(lo[:, 2], 0, None)], -1)
+        hi = np.minimum(idx, np.array(n) - 1)
+        c_hi = np.where(has_hi, cid[hi[:, 0], hi[:, 1], hi[:, 2]], -1)
+        internal = has_lo & has_hi
+        faces.append(("int", quads[internal], c_lo[internal], c_hi[internal]))
+        # Contorno: owner es la celda existente, normal hacia afuera
+        faces.append(("bnd", quads[~has_lo][:, ::-1], c_hi[~has_lo], None))
+        faces.append(("bnd", quads[~has_hi], c_lo[~has_hi], None))
+
+    ordered = [f for f in faces if f[0] == "int"] + [f for f in faces if f[0] == "bnd"]
+    quads = np.vstack([f[1] for f in ordered])
+    owner = np.concatenate([f[2] for f in ordered]).astype(np.int32)
+    neighbour = np.concatenate([f[3] for f in ordered if f[0] == "int"]).astype(np.int32)
+    return PolyMesh(
+        points=points,
+        face_offsets=np.arange(0, 4 * quads.shape[0] + 1, 4, dtype=np.int64),
+        face_points=quads.ravel().astype(np.int32),
+        owner=owner,
+        neighbour=neighbour,
+    )
+
+
+def test_uniform_box_is_perfect() -> None:
+    q = mesh_quality(box_mesh(4, 3, 2, dx=0.5, dy=0.5, dz=0.5))
+    s = q.summary()
+    assert s["n_cells"] == 24
+    assert s["volume_total_m3"] == pytest.approx(2.0 * 1.5 * 1.0)
+    np.testing.assert_allclose(q.cell_volumes, 0.125)
+    assert s["non_ortho_max_deg"] == pytest.approx(0.0, abs=1e-6)
+    assert s["skewness_max"] == pytest.approx(0.0, abs=1e-9)
+    assert s["aspect_ratio_max"] == pytest.approx(1.0)
+    assert s["ok"]
+
+
+def test_stretched_cells_aspect_ratio() -> None:
+    q = mesh_quality(box_mesh(2, 2, 2, dx=10.0))
+    np.testing.assert_allclose(q.aspect_ratio, 10.0)
+
+
+def test_elbow_non_ortho_faces_match_checkmesh() -> None:
+    mesh = read_polymesh(CASE)
+    q = mesh_quality(mesh)
+    reference = read_labels(CASE / "constant" / "polyMesh" / "sets" / "nonOrthoFaces")
+    np.testing.assert_array_equal(np.sort(q.failing_faces()["nonOrthoFaces"]), np.sort(reference))
+    assert q.summary()["n_negative_volumes"] == 0
@@ -0,0 +1,57 @@
+"""
+Pruebas del lector de polyMesh con la malla completa del caso elbow20D.
+"""
+
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from postproc.case_params import read_case_parameters
+from postproc.polymesh import read_faces, read_polymesh
+
+CASE = Path(__file__).resolve().parents[3] / "cases" / "base" / "elbow20D"
+
+
+def test_elbow_mesh_is_read_quickly_and_consistently() -> None:
+    t0 = time.perf_counter()
+    mesh = read_polymesh(CASE)
+    elapsed = time.perf_counter() - t0
+
+    assert mesh.n_points == 27030
+    assert mesh.n_faces == 146607
+    assert mesh.n_internal_faces == 137647
+    assert mesh.n_cells == 60201
+    assert set(np.unique(mesh.face_sizes)) <= {3, 4}
+    assert elapsed < 1.0
+
+    # Celdas cerradas: la suma de vectores área por celda es nula
+    _, areas = mesh.face_area_vectors()
+    closure = np.zeros((mesh.n_cells, 3))
+    np.add.at(closure, mesh.owner, areas)
+    np.add.at(closure, mesh.neighbour, -areas[: mesh.n_internal_faces])
+    assert np.abs(closure).max() < 1e-12
+
+    inlet = mesh.patch_summary("inlet")
+    assert inlet["D_equivalent_m"] == pytest.approx(0.35, rel=0.02)
+    assert inlet["D_hydraulic_m"] == pytest.approx(0.35, rel=0.02)
+
+
+def test_mixed_polygon_faces(tmp_path) -> None:
+    f = tmp_path / "faces"
+    f.write_text(
+        "FoamFile\n{\n    format ascii;\n    class faceList;\n}\n"
+        "// comentario\n\n3\n(\n3(0 1 2)\n4(10 11 12 13)\n5(20 21 22 23 24)\n)\n"
+    )
+    offsets, points = read_faces(f)
+    np.testing.assert_array_equal(offsets, [0, 3, 7, 12])
+    np.testing.assert_array_equal(points[3:7], [10, 11, 12, 13])
+
+
+def test_case_diameter_comes_from_mesh() -> None:
+    params = read_case_parameters(CASE)
+    assert params.sources["D_m"] == "constant/polyMesh"
+    assert params.D_m == pytest.approx(0.346, rel=1e-2)
+    # Codo: no hay tramo recto entre inlet y outlet
+    assert params.L_m is None
@@ -0,0 +1,101 @@
+"""
+Pruebas de la lectura de probes y sets en arrays (tiempo × punto × componente).
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import postproc.sampling as sampling
+from postproc.sampling import list_sets, load_probes, load_set, read_samples
+
+PROBE_HEADER = "# Probe 0 (0 0 0)\n# Probe 1 (2.5 0 0)\n#       Probe   0   1\n#        Time\n"
+
+
+def _write_probes(fo_dir: Path, start: str, times) -> None:
+    d = fo_dir / start
+    d.mkdir(parents=True)
+    (d / "p").write_text(PROBE_HEADER + "".join(f"{t} {t} {-t}\n" for t in times))
+    (d / "U").write_text(PROBE_HEADER + "".join(f"{t} ({t} 0 0) (0 {t} 0)\n" for t in times))
+
+
+def _write_set_time(fo_dir: Path, time: int, n: int = 5) -> None:
+    d = fo_dir / str(time)
+    d.mkdir(parents=True)
+    x = np.linspace(0.0, 20.0, n)
+    # Formato ESI (un archivo con todos los campos) y OpenFOAM >= 9 (<set>.csv)
+    (d / "axisLine_p_U.csv").write_text(
+        "x,p,U_0,U_1,U_2\n" + "".join(f"{xi},{time},{xi + time},0,0\n" for xi in x)
+    )
+    (d / "radialOutlet.csv").write_text(
+        "y,p,U_x,U_y,U_z\n" + "".join(f"{xi / 100},1,{time},0,0\n" for xi in x)
+    )
+
+
+def test_probes_restarts_are_stitched(tmp_path) -> None:
+    fo_dir = tmp_path / "centerProbes"
+    _write_probes(fo_dir, "0", range(10, 110, 10))
+    _write_probes(fo_dir, "50", range(60, 160, 10))   # reinicio desde t = 50
+
+    data = load_probes(fo_dir)
+    np.testing.assert_array_equal(data.times, np.arange(10, 160, 10))
+    np.testing.assert_array_equal(data.positions, [[0, 0, 0], [2.5, 0, 0]])
+    assert data.array("p").shape == (15, 2, 1) and data.array("U").shape == (15, 2, 3)
+    np.testing.assert_array_equal(data.array("U")[:, 1, 1], data.times)
+    assert data.path.name == ".samples_centerProbes.npz"
+    np.testing.assert_array_equal(read_samples(data.path).array("p"), data.array("p"))
+
+
+def test_sets_in_both_file_layouts(tmp_path) -> None:
+    fo_dir = tmp_path / "profiles"
+    for t in (50, 100, 1000, 150):
+        _write_set_time(fo_dir, t)
+
+    assert list_sets(fo_dir) == ["axisLine", "radialOutlet"]
+    axis = load_set(fo_dir, "axisLine")
+    assert axis.axes == ["x"] and axis.positions.shape == (5, 1)
+    np.testing.assert_array_equal(axis.times, [50, 100, 150, 1000])
+    assert axis.array("U").shape == (4, 5, 3)
+    np.testing.assert_allclose(axis.array("U")[:, :, 0] - axis.positions[:, 0], axis.times[:, None] * np.ones(5))
+
+    radial = load_set(fo_dir, "radialOutlet")
+    assert radial.axes == ["y"]
+    np.testing.assert_array_equal(radial.array("p"), np.ones((4, 5, 1)))
+
+
+def test_set_line_being_written_is_dropped(tmp_path) -> None:
+    # "2,25" sin "\n" puede ser "2,250" a medio escribir: no se lee
+    path = tmp_path / "line.csv"
+    path.write_text("x,p\n0,1\n1,2\n2,25")
+    columns, table = sampling._read_set_csv(path)
+    assert columns == ["x", "p"]
+    np.testing.assert_array_equal(table, [[0, 1], [1, 2]])
+
+
+def test_only_new_times_are_parsed(tmp_path, monkeypatch) -> None:
+    fo_dir = tmp_path / "profiles"
+    for t in (50, 100):
+        _write_set_time(fo_dir, t)
+    load_set(fo_dir, "axisLine")
+
+    calls = []
+    read_csv = sampling._read_set_csv
+    monkeypatch.setattr(sampling, "_read_set_csv", lambda path: calls.append(path) or read_csv(path))
+    _write_set_time(fo_dir, 150)
+    # CSV a medio escribir: se deja fuera y no se guarda su firma
+    _write_set_time(fo_dir, 200)
+    partial = fo_dir / "200" / "axisLine_p_U.csv"
+    partial.write_text(partial.read_text()[:-12])
+
+    data = load_set(fo_dir, "axisLine")
+    assert [p.parent.name for p in calls] == ["150", "200"]
+    np.testing.assert_array_equal(data.times, [50, 100, 150])
+
+    partial.write_text("x,p,U_0,U_1,U_2\n" + "".join(f"{x},200,{x + 200},0,0\n" for x in np.linspace(0, 20, 5)))
+    calls.clear()
+    data = load_set(fo_dir, "axisLine")
+    assert [p.parent.name for p in calls] == ["200"]
+    assert data.times[-1] == 200 and read_samples(data.path).times.size == 4
+    with pytest.raises(KeyError):
+        data.array("k")
@@ -0,0 +1,55 @@
+"""
+Pruebas de lectura de postProcessing: cola del archivo y unión de reinicios.
+"""
+
+import numpy as np
+
+from postproc.timeseries import (
+    find_function_dir,
+    load_time_history,
+    read_last_rows,
+    read_last_time_file,
+)
+
+
+def _write_dat(path, times, values, tail=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = "".join(f"{t}\t{v}\n" for t, v in zip(times, values))
+    path.write_text("# Time  areaAverage(p)\n" + lines + tail)
+
+
+def test_read_last_rows_skips_headers_and_partial_line(tmp_path) -> None:
+    f = tmp_path / "p.dat"
+    _write_dat(f, range(1000), np.arange(1000) * 0.5, tail="1000\t12")
+    rows = read_last_rows(f, n=3, block_size=16)
+    np.testing.assert_array_equal(rows[:, 0], [997, 998, 999])
+    np.testing.assert_array_equal(rows[:, 1], [498.5, 499.0, 499.5])
+
+
+def test_read_last_rows_vectors_and_short_file(tmp_path) -> None:
+    f = tmp_path / "U.dat"
+    f.write_text("# Time U\n1 (1 2 3)\n2 (4 5 6)\n")
+    rows = read_last_rows(f, n=10)
+    np.testing.assert_array_equal(rows, [[1, 1, 2, 3], [2, 4, 5, 6]])
+
+
+def test_restarts_are_stitched_numerically(tmp_path) -> None:
+    folder = tmp_path / "patchAverage_inlet"
+    for start, stop in [(0, 620), (500, 1100), (1000, 1500)]:
+        t = np.arange(start + 1, stop + 1)
+        _write_dat(folder / str(start) / "p.dat", t, start + t * 1e-3)
+
+    hist = load_time_history(folder, "p")
+    assert hist.shape == (1500, 2)
+    assert np.all(np.diff(hist[:, 0]) == 1)
+    # El reinicio posterior manda en el solape / later restart wins the overlap
+    assert hist[500, 1] == 500 + 501e-3
+    # Segunda lectura desde la caché memory-mapped / second read from cache
+    assert isinstance(load_time_history(folder, "p"), np.memmap)
+    assert read_last_time_file(folder, "p") == (1500.0, 1000 + 1.5)
+
+
+def test_find_function_dir_accepts_include_func_names(tmp_path) -> None:
+    d = tmp_path / "patchAverage(patch=inlet,fields=(p))"
+    d.mkdir()
+    assert find_function_dir(tmp_path, "patchAverage", "inlet") == d
@@ -0,0 +1,109 @@
+"""
+Pruebas de la comparación del perfil de velocidad con las leyes de pared.
+"""
+
+import math
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import postproc.velocity_profile as velocity_profile
+from postproc.case_params import read_case_parameters
+from postproc.velocity_profile import (
+    Y_OVER_R_LOG_MAX,
+    analyze_velocity_profiles,
+    development_length,
+    log_law_u_plus,
+    power_law_exponent,
+    power_law_velocity,
+    profile_deviation,
+)
+
+RUNS_DIR = Path(__file__).resolve().parents[3] / "cases" / "runs"
+
+
+def test_log_law_profile_has_no_log_deviation() -> None:
+    R, u_tau, nu = 0.175, 0.12, 1e-6
+    r = np.linspace(0.0, R, 101)
+    y_plus = np.maximum(R - r, 1e-9) * u_tau / nu
+    u_log = u_tau * log_law_u_plus(y_plus)
+    # Dos tiempos en una pasada: el exacto y uno 5 % más rápido
+    u = np.stack([u_log, 1.05 * u_log])
+
+    dev = profile_deviation(r, u, R, u_tau, 3.0, nu, 1e6)
+    assert dev["dev_log"] == pytest.approx([0.0, 5.0], abs=1e-9)
+    assert dev["y_plus"].shape == (100,) and dev["u_plus"].shape == (2, 100)
+    assert dev["U_bulk"][1] == pytest.approx(1.05 * dev["U_bulk"][0])
+    assert dev["U_centre"][0] == pytest.approx(u_log[0])
+
+
+def test_wake_is_outside_the_log_law_comparison() -> None:
+    R, u_tau, nu = 0.175, 0.12, 1e-6
+    r = np.linspace(0.0, R, 201)
+    y = R - r
+    u_log = u_tau * log_law_u_plus(np.maximum(y, 1e-9) * u_tau / nu)
+    # Estela: +10 % lejos de la pared, la zona logarítmica intacta
+    u = np.where(y > Y_OVER_R_LOG_MAX * R, 1.1 * u_log, u_log)
+
+    dev = profile_deviation(r, u, R, u_tau, 3.0, nu, 1e6)
+    assert dev["dev_log"] == pytest.approx([0.0], abs=1e-9)
+
+
+def test_non_positive_wall_friction_falls_back_to_correlation(monkeypatch) -> None:
+    case = RUNS_DIR / "pipecyl20m__20251125-112012__algo"
+    params = read_case_parameters(case)
+    Re = params.U_inlet_ms * params.D_m / params.nu_m2s
+    zero = SimpleNamespace(time="0", f_developed=0.0, f_mean=1e-7)
+    monkeypatch.setattr(velocity_profile, "case_wall_friction", lambda *a, **k: zero)
+
+    u_tau, source = velocity_profile._wall_u_tau(case, params, Re)
+    assert source == "correlación (haaland)"
+    assert u_tau == pytest.approx(params.U_inlet_ms * math.sqrt(0.0115 / 8.0), rel=0.05)
+
+
+def test_power_law_bulk_velocity_and_development_length() -> None:
+    n = float(power_law_exponent(1e5))
+    assert n == pytest.approx(7.3)
+    r = np.linspace(0.0, 1.0, 20001)
+    u = power_law_velocity(1.0 - r, n, 3.0)
+    f = u * r
+    # Trapecios explícitos (np.trapezoid requiere NumPy >= 2)
+    assert (f[1:] + f[:-1]) @ np.diff(r) == pytest.approx(3.0, rel=1e-3)
+
+    s = np.linspace(0.0, 20.0, 401)
+    scales = np.array([1.0, 2.0, 20.0])[:, None]
+    L, u_inf = development_length(s, 3.0 * (1.0 - 0.3 * np.exp(-s / scales)))
+    # 0.3 e^(-s/a) = 0.01 -> s = a ln 30 (con a = 20 la línea es corta)
+    assert L[:2] == pytest.approx(np.array([1.0, 2.0]) * math.log(30.0), abs=0.06)
+    assert u_inf[0] == pytest.approx(3.0)
+    assert np.isnan(L[2])
+
+
+def test_case_with_sampled_power_law_profiles(tmp_path) -> None:
+    case = tmp_path / "pipecyl20m"
+    shutil.copytree(RUNS_DIR / "pipecyl20m__20251125-112012__algo", case)
+    D, U_b = 0.35000088612459257, 3.0
+    R, n = D / 2, float(power_law_exponent(U_b * D / 1e-6))
+    x, y = np.linspace(0.0, 20.0, 200), np.linspace(0.0, 0.175, 100)
+    for t in (50, 100, 150):
+        d = case / "postProcessing" / "profiles" / str(t)
+        d.mkdir(parents=True)
+        u_axis = power_law_velocity(1.0, n, U_b) * (1.0 - 0.2 * np.exp(-x * t / 200.0))
+        (d / "axisLine_p_U.csv").write_text("x,p,U_0,U_1,U_2\n" + "".join(f"{a},0,{b},0,0\n" for a, b in zip(x, u_axis)))
+        u = power_law_velocity((R - y) / R, n, U_b)
+        (d / "radialOutlet_p_U.csv").write_text("y,p,U_0,U_1,U_2\n" + "".join(f"{a},0,{b},0,0\n" for a, b in zip(y, u)))
+
+    r = analyze_velocity_profiles(case)
+    assert r.Re == pytest.approx(U_b * D / 1e-6)
+    assert r.u_tau_source.startswith("wallShearStress")
+    assert r.u_tau_ms == pytest.approx(U_b * math.sqrt(0.0146 / 8.0), rel=0.02)
+    assert r.times == [50.0, 100.0, 150.0]
+    assert r.dev_power_law_pct == pytest.approx([0.0] * 3, abs=1e-6)
+    assert all(d > 1.0 for d in r.dev_log_law_pct)
+    assert r.U_bulk_profile_ms[-1] == pytest.approx(U_b, rel=0.01)
+    L = r.development_length_m
+    assert L[0] > L[1] > L[2] > 0
+    assert r.development_length_corr_m == pytest.approx(4.4 * r.Re ** (1 / 6) * D)
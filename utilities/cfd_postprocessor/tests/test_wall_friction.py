@@ -0,0 +1,81 @@
+"""
+Pruebas del factor de fricción desde wallShearStress.
+"""
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from postproc.theory import friction_factor_array
+from postproc.wall_friction import case_wall_friction, friction_profile
+
+CASES_DIR = Path(__file__).resolve().parents[3] / "cases"
+
+
+def test_profile_is_area_weighted_per_bin() -> None:
+    rng = np.random.default_rng(1)
+    x = rng.uniform(0.0, 10.0, 5000)
+    area = rng.uniform(0.5, 2.0, x.size)
+    # Dos valores de τ en cada intervalo de largo 1: la media depende de las áreas
+    tau = np.floor(x) + np.where(rng.random(x.size) < 0.5, 0.0, 1.0)
+
+    prof = friction_profile(x, area, tau, n_bins=10)
+    idx = np.minimum(((x - x.min()) / ((x.max() - x.min()) / 10)).astype(int), 9)
+    for k in range(10):
+        sel = idx == k
+        assert prof["tau"][k] == pytest.approx(np.average(tau[sel], weights=area[sel]))
+    assert prof["area"].sum() == pytest.approx(area.sum())
+
+
+def _write_wall_shear(case: Path, n_wall: int, tau: float, time: str = "0") -> None:
+    rows = "\n".join([f"({tau} 0 0)"] * n_wall)
+    (case / time).mkdir(exist_ok=True)
+    (case / time / "wallShearStress").write_text(
+        "FoamFile\n{\n    format ascii;\n    class volVectorField;\n    object wallShearStress;\n}\n"
+        "dimensions [0 2 -2 0 0 0 0];\ninternalField uniform (0 0 0);\nboundaryField\n{\n"
+        "    inlet { type calculated; value uniform (0 0 0); }\n"
+        "    outlet { type calculated; value uniform (0 0 0); }\n"
+        f"    wall {{ type calculated; value nonuniform List<vector> {n_wall}\n(\n{rows}\n)\n; }}\n}}\n"
+    )
+
+
+def test_uniform_shear_on_real_mesh(tmp_path) -> None:
+    case = tmp_path / "elbow20D"
+    shutil.copytree(CASES_DIR / "base" / "elbow20D", case)
+    _write_wall_shear(case, 8690, 0.018)
+
+    r = case_wall_friction(case, n_bins=12)
+    assert r.area_weighted and r.patch == "wall"
+    assert r.f_mean == pytest.approx(8 * 0.018 / 3.0 ** 2)
+    filled = [f for f in r.f_darcy if np.isfinite(f)]
+    assert len(filled) == 12 and filled == pytest.approx([r.f_mean] * 12)
+    assert sum(r.area_m2) == pytest.approx(np.pi * r.D_m * 14.0, rel=0.1)
+    assert r.f_theory == pytest.approx(float(friction_factor_array(r.Re, r.D_m, 0.0, method="haaland")))
+
+
+def test_case_without_mesh_uses_plain_mean() -> None:
+    r = case_wall_friction(CASES_DIR / "runs" / "pipecyl20m__20251125-112012__algo")
+    assert not r.area_weighted and r.x_m == []
+    assert r.f_mean == pytest.approx(0.0146, abs=5e-4)
+    assert r.f_developed is None and r.dp_wall_pa is None
+
+
+def test_initial_field_is_not_a_result(tmp_path) -> None:
+    # 0/wallShearStress de elbow20D es casi todo ceros: no es f = 0
+    with pytest.raises(ValueError, match="campo inicial sin calcular"):
+        case_wall_friction(CASES_DIR / "base" / "elbow20D")
+
+    case = tmp_path / "elbow20D"
+    shutil.copytree(CASES_DIR / "base" / "elbow20D", case)
+    (case / "100").mkdir()
+    (case / "100" / "U").write_text("")
+    # Hay un tiempo posterior sin wallShearStress: no se usa el inicial
+    with pytest.raises(ValueError, match="sólo está en el tiempo inicial"):
+        case_wall_friction(case)
+
+    _write_wall_shear(case, 8690, 0.018, time="100")
+    r = case_wall_friction(case)
+    assert r.time == "100"
+    assert r.f_mean == pytest.approx(8 * 0.018 / 3.0 ** 2)
@@ -0,0 +1,50 @@
+"""
+Pruebas de la distribución de y+ y de la capa viscosa propuesta.
+"""
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from postproc.yplus import analyze_yplus, yplus_stats
+
+BASE_DIR = Path(__file__).resolve().parents[3] / "cases" / "base"
+
+
+def test_stats_percentiles_and_out_of_range_fractions() -> None:
+    values = np.concatenate([np.full(10, 10.0), np.linspace(40.0, 200.0, 80), np.full(10, 500.0)])
+    s = yplus_stats(values, 30.0, 300.0)
+    assert s["n"] == 100 and s["min"] == 10.0 and s["max"] == 500.0
+    assert s["p50"] == pytest.approx(np.median(values))
+    assert s["fraction_below"] == pytest.approx(0.1) and s["fraction_above"] == pytest.approx(0.1)
+    assert sum(s["histogram_counts"]) == 100
+    assert s["histogram_edges"][0] == 10.0 and s["histogram_edges"][-1] == pytest.approx(500.0)
+
+
+def test_elbow_case_is_split_and_layer_reaches_target() -> None:
+    r = analyze_yplus(BASE_DIR / "elbow20D")
+    assert r.wall_treatment == "wall_function" and r.y_plus_target == 50.0
+    wall, straight, elbow = r.regions["wall"], r.regions["straight"], r.regions["elbow"]
+    assert straight["n"] + elbow["n"] == wall["n"] == 8690
+    assert 0 < elbow["n"] < straight["n"]
+    assert wall["fraction_above"] == 1.0
+
+    u = wall["viscous_update"]
+    # y+ ∝ primera capa: lo predicho queda en el objetivo o apenas por debajo
+    assert u["y_plus_predicted"] <= 50.0
+    assert u["y_plus_predicted"] == pytest.approx(50.0, rel=0.25)
+    assert u["proposed"]["total_thickness"] == pytest.approx(r.viscous_current["total_thickness"])
+    assert u["proposed"]["number_of_layers"] > r.viscous_current["number_of_layers"]
+
+
+def test_low_re_treatment_from_nut(tmp_path) -> None:
+    case = tmp_path / "elbow20D"
+    shutil.copytree(BASE_DIR / "elbow20D", case)
+    nut = case / "0" / "nut"
+    nut.write_text(nut.read_text().replace("nutkWallFunction", "nutLowReWallFunction"))
+
+    r = analyze_yplus(case)
+    assert r.wall_treatment == "low_re" and r.y_plus_target == 1.0
+    assert r.regions["wall"]["fraction_above"] == 1.0
@@ -0,0 +1,181 @@
+"""
+Modo por lotes (no interactivo) de la CLI de pérdidas de carga.
+Batch (non-interactive) mode of the head loss CLI.
+
+Lee casos desde un archivo CSV o JSON-lines, calcula cada uno con
+app.services.batch_service y escribe los resultados en CSV o JSON-lines,
+fila por fila, a un archivo o a stdout. Nada se acumula en memoria, así que
+un archivo de 1e6 filas se procesa con memoria acotada.
+
+Reads cases from a CSV or JSON-lines file, computes each one with
+app.services.batch_service and writes the results as CSV or JSON-lines,
+row by row, to a file or to stdout. Nothing is accumulated in memory, so a
+1e6-row file is processed with bounded memory.
+
+Ejemplo de uso / Example usage:
+
+    python3 -m app.cli.main_cli --batch cases.csv -o results.csv
+    python3 -m app.cli.main_cli --batch cases.jsonl --output-format jsonl
+    python3 -m app.cli.main_cli --batch cases.csv -o results.csv --workers 8
+"""
+
+import csv
+import json
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, TextIO, Tuple
+
+from app.core.constants import G_DEFAULT, MU_WATER_20C, RHO_WATER_20C
+from app.core.correlations import CorrelationMethod
+from app.services.batch_service import (
+    BATCH_OUTPUT_FIELDS,
+    INVALID_RECORD_KEY,
+    iter_batch_results,
+)
+from app.services.parallel import CHUNK_SIZE_DEFAULT
+
+BatchFormat = str  # "csv" | "jsonl"
+
+_FORMAT_BY_SUFFIX = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".json": "jsonl",
+}
+
+
+def detect_format(path: str, explicit: Optional[str], default: str = "csv") -> BatchFormat:
+    """
+    Formato de un archivo: el explícito, o según la extensión.
+    Format of a file: the explicit one, or from the extension.
+    """
+    if explicit:
+        return explicit
+    if path == "-":
+        return default
+    return _FORMAT_BY_SUFFIX.get(Path(path).suffix.lower(), default)
+
+
+def iter_records(stream: TextIO, fmt: BatchFormat) -> Iterator[Dict[str, object]]:
+    """
+    Genera los registros de entrada uno a uno (CSV con cabecera o JSON-lines).
+    Yields input records one by one (CSV with header or JSON-lines).
+    """
+    if fmt == "csv":
+        for row in csv.DictReader(stream):
+            yield row
+        return
+
+    for line_no, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            # Se pasa como registro inválido para que aparezca en "error".
+            # Passed on as an invalid record so it shows up under "error".
+            yield {"id": str(line_no), INVALID_RECORD_KEY: f"Invalid JSON: {exc.msg}"}
+            continue
+        if not isinstance(record, dict):
+            record = {"id": str(line_no), INVALID_RECORD_KEY: "JSON line is not an object"}
+        yield record
+
+
+def make_writer(stream: TextIO, fmt: BatchFormat) -> Callable[[Dict[str, object]], None]:
+    """
+    Devuelve una función que escribe una fila de resultados en el stream.
+    Returns a function that writes one result row to the stream.
+    """
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=BATCH_OUTPUT_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        return writer.writerow
+
+    def write_jsonl(row: Dict[str, object]) -> None:
+        stream.write(json.dumps(row, ensure_ascii=False))
+        stream.write("\n")
+
+    return write_jsonl
+
+
+def run_batch(
+    input_path: str,
+    output_path: str = "-",
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None,
+    method: CorrelationMethod = "haaland",
+    rho: float = RHO_WATER_20C,
+    mu: float = MU_WATER_20C,
+    g: float = G_DEFAULT,
+    workers: Optional[int] = 1,
+    chunk_size: int = CHUNK_SIZE_DEFAULT,
+) -> Tuple[int, int]:
+    """
+    Ejecuta el modo por lotes completo en streaming.
+    Runs the whole batch mode in streaming fashion.
+
+    Parameters
+    ----------
+    input_path : str
+        Archivo de casos ("-" = stdin) / Case file ("-" = stdin).
+    output_path : str
+        Archivo de resultados ("-" = stdout) / Results file ("-" = stdout).
+    input_format, output_format : str, optional
+        "csv" o "jsonl"; por defecto según la extensión.
+        "csv" or "jsonl"; by default from the extension.
+    method : CorrelationMethod
+        Método por defecto para filas sin columna "method".
+        Default method for rows without a "method" column.
+    rho, mu, g : float
+        Propiedades del fluido y gravedad / Fluid properties and gravity.
+    workers : int, optional
+        Procesos de cálculo (1 = secuencial, None/0 = todos los CPU).
+        Compute processes (1 = sequential, None/0 = all CPUs).
+    chunk_size : int, optional
+        Filas por bloque enviado a cada proceso / Rows per chunk sent to each process.
+
+    Returns
+    -------
+    (int, int)
+        Número de casos procesados y número de casos con error.
+        Number of processed cases and number of cases with errors.
+    """
+    in_fmt = detect_format(input_path, input_format)
+    out_fmt = detect_format(output_path, output_format, default=in_fmt)
+
+    n_rows = 0
+    n_errors = 0
+    with ExitStack() as stack:
+        if input_path == "-":
+            in_stream: TextIO = sys.stdin
+        else:
+            in_stream = stack.enter_context(
+                open(input_path, "r", encoding="utf-8", newline="")
+            )
+        if output_path == "-":
+            out_stream: TextIO = sys.stdout
+        else:
+            out_stream = stack.enter_context(
+                open(output_path, "w", encoding="utf-8", newline="")
+            )
+
+        write = make_writer(out_stream, out_fmt)
+        records = iter_records(in_stream, in_fmt)
+        results = iter_batch_results(
+            records,
+            rho=rho,
+            mu=mu,
+            g=g,
+            default_method=method,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+        for row in results:
+            write(row)
+            n_rows += 1
+            if row["error"]:
+                n_errors += 1
+
+    return n_rows, n_errors
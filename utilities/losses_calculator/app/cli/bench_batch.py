@@ -0,0 +1,130 @@
+"""
+Benchmark del modo por lotes: filas por segundo según el número de procesos.
+Batch mode benchmark: rows per second versus number of processes.
+
+Genera casos sintéticos en memoria (sin E/S de disco) y los calcula con
+app.services.batch_service.iter_batch_results para cada número de procesos
+pedido, verificando que todas las corridas entreguen los mismos resultados.
+
+Generates synthetic cases in memory (no disk I/O) and computes them with
+app.services.batch_service.iter_batch_results for each requested number of
+processes, checking that every run returns the same results.
+
+Ejemplo de uso / Example usage:
+
+    python3 -m app.cli.bench_batch --rows 200000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import random
+import time
+from typing import Any, Dict, List
+
+from app.core.constants import G_DEFAULT, MU_WATER_20C, RHO_WATER_20C
+from app.core.local_losses import ELBOWS
+from app.services.batch_service import iter_batch_results
+from app.services.parallel import CHUNK_SIZE_DEFAULT
+
+
+def make_synthetic_records(n_rows: int, seed: int = 0) -> List[Dict[str, object]]:
+    """
+    Casos aleatorios pero reproducibles, con y sin codo.
+    Random but reproducible cases, with and without elbow.
+    """
+    rng = random.Random(seed)
+    elbows = [""] + list(ELBOWS)
+    methods = ["blasius", "haaland", "colebrook"]
+    return [
+        {
+            "id": str(i),
+            "diameter_m": rng.uniform(0.02, 0.6),
+            "velocity_ms": rng.uniform(0.05, 4.0),
+            "length_m": rng.uniform(1.0, 500.0),
+            "elbow": rng.choice(elbows),
+            "method": rng.choice(methods),
+        }
+        for i in range(n_rows)
+    ]
+
+
+def run_benchmark(
+    n_rows: int,
+    workers_list: List[int],
+    chunk_size: int = CHUNK_SIZE_DEFAULT,
+) -> List[Dict[str, float]]:
+    """
+    Mide filas/s para cada número de procesos.
+    Measures rows/s for each number of processes.
+    """
+    records = make_synthetic_records(n_rows)
+    reference = None
+    results: List[Dict[str, float]] = []
+
+    for workers in workers_list:
+        t0 = time.perf_counter()
+        hf = [
+            row["hf_total_m"]
+            for row in iter_batch_results(
+                records,
+                rho=RHO_WATER_20C,
+                mu=MU_WATER_20C,
+                g=G_DEFAULT,
+                workers=workers,
+                chunk_size=chunk_size,
+            )
+        ]
+        elapsed = time.perf_counter() - t0
+
+        if reference is None:
+            reference = hf
+        elif hf != reference:
+            raise RuntimeError(
+                f"Results with {workers} workers differ from the first run "
+                f"(los resultados con {workers} procesos difieren)."
+            )
+
+        results.append(
+            {"workers": workers, "seconds": elapsed, "rows_per_s": n_rows / elapsed}
+        )
+    return results
+
+
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    """Argumentos del benchmark / Benchmark command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark del modo --batch / --batch mode benchmark."
+    )
+    parser.add_argument("--rows", type=int, default=100_000,
+                        help="Filas sintéticas / Synthetic rows.")
+    parser.add_argument("--workers", type=int, nargs="+", default=None,
+                        help="Números de procesos a medir / Process counts to measure.")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE_DEFAULT,
+                        help="Filas por bloque / Rows per chunk.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Any = None) -> None:
+    """
+    Mide el modo --batch con cada número de procesos e imprime la tabla.
+    Benchmarks --batch mode for each process count and prints the table.
+    """
+    args = parse_args(argv)
+    workers_list = args.workers
+    if not workers_list:
+        n_cpu = os.cpu_count() or 1
+        workers_list = sorted(w for w in {1, 2, 4, n_cpu} if w <= n_cpu)
+
+    print(f"rows = {args.rows}, chunk_size = {args.chunk_size}, cpus = {os.cpu_count()}")
+    print(f"{'workers':>8} {'seconds':>10} {'rows/s':>12} {'speedup':>8}")
+    results = run_benchmark(args.rows, workers_list, chunk_size=args.chunk_size)
+    base = results[0]["seconds"]
+    for r in results:
+        print(
+            f"{r['workers']:>8d} {r['seconds']:>10.3f} "
+            f"{r['rows_per_s']:>12.0f} {base / r['seconds']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,9 @@
 """
 CLI para calcular pérdidas de carga por fricción en tuberías
-usando correlaciones de Blasius o Haaland.
+usando correlaciones de Blasius, Haaland o Colebrook-White.
 
 CLI to compute head losses due to friction in pipes
-using Blasius or Haaland correlations.
+using Blasius, Haaland or Colebrook-White correlations.
 
 Flujo de la CLI / CLI flow:
   1) Eliges tipo de problema (tubería recta / con codo)
@@ -12,8 +12,8 @@ Flujo de la CLI / CLI flow:
      You enter D and v -> Q is computed
   3) Se calcula Re con agua a 20 °C y se muestra el régimen
      Re is computed with water at 20 °C and the regime is shown
-  4) A partir de ese Re eliges Blasius o Haaland
-     Based on that Re, you choose Blasius or Haaland
+  4) A partir de ese Re eliges Blasius, Haaland o Colebrook
+     Based on that Re, you choose Blasius, Haaland or Colebrook
   5) Luego se piden longitudes, rugosidad y tipo de codo (si aplica)
      Then lengths, roughness, and elbow type are requested (if applicable)
 
@@ -37,11 +37,19 @@ Ejemplo de uso / Example usage:
 
     cd /ruta/al/proyecto
     python3 -m app.cli.main_cli
+
+Modo por lotes (sin preguntas) / Batch mode (no prompts):
+
+    python3 -m app.cli.main_cli --batch cases.csv -o results.csv
+    (ver / see app.cli.batch_cli)
 """
 
+import argparse
 import math
-from typing import Tuple, Optional
+import sys
+from typing import Any, Tuple, Optional
 
+from app.cli.batch_cli import run_batch
 from app.core.constants import (
     RHO_WATER_20C,
     MU_WATER_20C,
@@ -53,8 +61,10 @@ from app.core.local_losses import get_elbow_k
 from app.geometry.pipe_geometries import PipeSegment
 from app.services.friction_service import (
     compute_single_segment_head_loss,
+    compute_pipe_with_elbow_head_loss,
     compute_reynolds,
 )
+from app.services.parallel import CHUNK_SIZE_DEFAULT
 
 # ==========================
 # Idioma global / Global language
@@ -290,8 +300,8 @@ def _select_elbow_type() -> Tuple[str, float, str]:
 
 def _select_correlation_method(Re: float) -> CorrelationMethod:
     """
-    Elige Blasius o Haaland después de mostrar el Re estimado.
-    Choose Blasius or Haaland after showing the estimated Re.
+    Elige Blasius, Haaland o Colebrook después de mostrar el Re estimado.
+    Choose Blasius, Haaland or Colebrook after showing the estimated Re.
     """
     regime_raw = classify_regime(Re)
     regime = _localize_regime(regime_raw)
@@ -323,13 +333,15 @@ def _select_correlation_method(Re: float) -> CorrelationMethod:
         print("\nSeleccione el método de correlación para flujo turbulento:")
         print("  1) Blasius")
         print("  2) Haaland")
-        prompt = f"Opción [1/2, por defecto {suggested}]: "
+        print("  3) Colebrook-White (implícita, referencia)")
+        prompt = f"Opción [1/2/3, por defecto {suggested}]: "
         invalid = "  Opción no válida, intente nuevamente."
     else:
         print("\nSelect correlation method for turbulent flow:")
         print("  1) Blasius")
         print("  2) Haaland")
-        prompt = f"Option [1/2, default {suggested}]: "
+        print("  3) Colebrook-White (implicit, reference)")
+        prompt = f"Option [1/2/3, default {suggested}]: "
         invalid = "  Invalid option, please try again."
 
     while True:
@@ -342,6 +354,8 @@ def _select_correlation_method(Re: float) -> CorrelationMethod:
             return "blasius"
         elif choice == "2":
             return "haaland"
+        elif choice == "3":
+            return "colebrook"
         else:
             print(invalid)
 
@@ -625,25 +639,23 @@ def _handle_pipe_with_elbow_case(
         name=seg_name,
     )
 
-    fric = compute_single_segment_head_loss(
+    fric = compute_pipe_with_elbow_head_loss(
         q_m3s=q_m3s,
         segment=segment,
+        elbow_k=K,
         rho=rho,
         mu=mu,
         g=g,
         method=method,
     )
 
-    v = fric["velocity_ms"]
-    head_velocity = v ** 2 / (2.0 * g)
+    hf_elbow = fric["hf_elbow_m"]
+    delta_p_elbow_pa = fric["delta_p_elbow_pa"]
+    delta_p_elbow_bar = fric["delta_p_elbow_bar"]
 
-    hf_elbow = K * head_velocity
-    delta_p_elbow_pa = rho * g * hf_elbow
-    delta_p_elbow_bar = delta_p_elbow_pa / 1.0e5
-
-    hf_total = fric["hf_m"] + hf_elbow
-    delta_p_total_pa = fric["delta_p_pa"] + delta_p_elbow_pa
-    delta_p_total_bar = delta_p_total_pa / 1.0e5
+    hf_total = fric["hf_total_m"]
+    delta_p_total_pa = fric["delta_p_total_pa"]
+    delta_p_total_bar = fric["delta_p_total_bar"]
 
     q_lps = q_m3s * 1000.0
     regime_label = _localize_regime(fric["regime"])
@@ -739,14 +751,102 @@ def _handle_pipe_with_elbow_case(
 # ==========================
 
 
-def main() -> None:
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    """Argumentos de línea de comandos / Command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Calculadora de pérdidas por fricción (Darcy-Weisbach). "
+            "Sin argumentos abre el asistente interactivo. / "
+            "Friction head loss calculator (Darcy-Weisbach). "
+            "Without arguments it opens the interactive wizard."
+        )
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="INPUT",
+        help=(
+            "Archivo CSV o JSON-lines de casos ('-' = stdin). / "
+            "CSV or JSON-lines case file ('-' = stdin)."
+        ),
+    )
+    parser.add_argument(
+        "--output", "-o",
+        default="-",
+        help="Archivo de resultados ('-' = stdout). / Results file ('-' = stdout).",
+    )
+    parser.add_argument(
+        "--input-format",
+        choices=("csv", "jsonl"),
+        help="Formato de entrada (por defecto según extensión). / Input format (default: from extension).",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=("csv", "jsonl"),
+        help="Formato de salida (por defecto según extensión). / Output format (default: from extension).",
+    )
+    parser.add_argument(
+        "--method",
+        choices=("blasius", "haaland", "colebrook", "table"),
+        default="haaland",
+        help=(
+            "Método para filas sin columna 'method' (por defecto: haaland). / "
+            "Method for rows without a 'method' column (default: haaland)."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Procesos para --batch (1 = secuencial, 0 = todos los CPU). / "
+            "Processes for --batch (1 = sequential, 0 = all CPUs)."
+        ),
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=CHUNK_SIZE_DEFAULT,
+        help="Filas por bloque en --batch. / Rows per chunk in --batch.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Any = None) -> None:
     """Punto de entrada principal / Main entry point."""
+    args = parse_args(argv)
+
+    if args.batch:
+        try:
+            n_rows, n_errors = run_batch(
+                input_path=args.batch,
+                output_path=args.output,
+                input_format=args.input_format,
+                output_format=args.output_format,
+                method=args.method,
+                rho=RHO_WATER_20C,
+                mu=MU_WATER_20C,
+                g=G_DEFAULT,
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+            )
+        except (OSError, ValueError) as exc:
+            print(f"[ERROR] {exc}", file=sys.stderr)
+            sys.exit(1)
+        print(
+            f"Batch: {n_rows} cases, {n_errors} errors "
+            f"(lote: {n_rows} casos, {n_errors} con error).",
+            file=sys.stderr,
+        )
+        if n_errors:
+            sys.exit(2)
+        return
+
     _set_language()
 
     if LANG == "es":
         print("============================================")
         print("  Calculadora de pérdidas por fricción")
-        print("  (Darcy-Weisbach, Blasius / Haaland)")
+        print("  (Darcy-Weisbach, Blasius / Haaland / Colebrook)")
         print("============================================")
         print("  En cualquier pregunta:")
         print("    - 'm' o 'menu'          -> volver al menú principal")
@@ -754,7 +854,7 @@ def main() -> None:
     else:
         print("============================================")
         print("  Friction head loss calculator")
-        print("  (Darcy-Weisbach, Blasius / Haaland)")
+        print("  (Darcy-Weisbach, Blasius / Haaland / Colebrook)")
         print("============================================")
         print("  At any prompt:")
         print("    - 'm', 'menu', 'main'   -> go back to main menu")
@@ -6,21 +6,365 @@ Incluye:
 - Flujo laminar: f = 64 / Re
 - Flujo turbulento en tubería lisa: Blasius
 - Flujo turbulento en tubería lisa o rugosa: Haaland
+- Flujo turbulento en tubería lisa o rugosa: Colebrook-White (implícita, Newton)
+- Tabla de Moody precalculada e interpolada (ver app.core.moody_table)
 - Régimen transicional: interpolación entre laminar y turbulento.
+- Versiones vectorizadas (NumPy) de todas las correlaciones.
 
 Includes:
 - Laminar flow: f = 64 / Re
 - Turbulent flow in smooth pipe: Blasius
 - Turbulent flow in smooth or rough pipe: Haaland
+- Turbulent flow in smooth or rough pipe: Colebrook-White (implicit, Newton)
+- Precomputed, interpolated Moody table (see app.core.moody_table)
 - Transitional regime: interpolation between laminar and turbulent.
+- Vectorized (NumPy) versions of all the correlations.
+
+Las funciones escalares son envoltorios delgados sobre las versiones
+``*_array``, de modo que ambos caminos entregan exactamente los mismos números.
+The scalar functions are thin wrappers over the ``*_array`` versions,
+so both paths return exactly the same numbers.
 """
 
 import math
-from typing import Literal
+from typing import Callable, Literal, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 # Allowed correlation methods for turbulent flow.
 # Métodos de correlación permitidos para flujo turbulento.
-CorrelationMethod = Literal["blasius", "haaland"]
+CorrelationMethod = Literal["blasius", "haaland", "colebrook", "table"]
+
+# Regime limits on Re (same convention as classify_regime).
+# Límites de régimen en Re (misma convención que classify_regime).
+RE_LAMINAR_MAX: float = 2000.0
+RE_TURBULENT_MIN: float = 4000.0
+
+# Integer regime codes returned by classify_regime_array.
+# Códigos enteros de régimen devueltos por classify_regime_array.
+REGIME_LAMINAR: int = 0
+REGIME_TRANSITIONAL: int = 1
+REGIME_TURBULENT: int = 2
+REGIME_NAMES: tuple[str, str, str] = ("laminar", "transicional", "turbulento")
+
+# Default iteration budget for the implicit Colebrook-White solver.
+# Presupuesto de iteraciones por defecto para el solver implícito de Colebrook-White.
+COLEBROOK_TOL_DEFAULT: float = 1.0e-12
+COLEBROOK_MAX_ITER_DEFAULT: int = 20
+
+
+# ==========================
+# Validación / Validation
+# ==========================
+
+
+def _check_reynolds(Re: np.ndarray) -> None:
+    """Re > 0 en todos los puntos / Re > 0 at every point."""
+    if np.any(~(Re > 0)):
+        raise ValueError(
+            "Re must be > 0 to compute the friction factor "
+            "(Re debe ser > 0 para calcular el factor de fricción)."
+        )
+
+
+def _check_pipe(diameter_m: np.ndarray, roughness_m: np.ndarray) -> None:
+    """D > 0 y ε >= 0 en todos los puntos / D > 0 and ε >= 0 at every point."""
+    if np.any(~(diameter_m > 0)):
+        raise ValueError(
+            "Diameter must be > 0 "
+            "(el diámetro debe ser > 0)."
+        )
+    if np.any(roughness_m < 0):
+        raise ValueError(
+            "Roughness cannot be negative "
+            "(la rugosidad no puede ser negativa)."
+        )
+
+
+# ==========================
+# Versiones vectorizadas / Vectorized versions
+# ==========================
+
+
+def friction_factor_laminar_array(Re: ArrayLike) -> np.ndarray:
+    """
+    Versión vectorizada de friction_factor_laminar.
+    Vectorized version of friction_factor_laminar.
+
+        f = 64 / Re
+    """
+    Re = np.asarray(Re, dtype=float)
+    _check_reynolds(Re)
+    return 64.0 / Re
+
+
+def friction_factor_blasius_array(Re: ArrayLike) -> np.ndarray:
+    """
+    Versión vectorizada de friction_factor_blasius.
+    Vectorized version of friction_factor_blasius.
+
+        f = 0.3164 * Re^(-0.25)
+    """
+    Re = np.asarray(Re, dtype=float)
+    _check_reynolds(Re)
+    return 0.3164 * (Re ** -0.25)
+
+
+def friction_factor_haaland_array(
+    Re: ArrayLike,
+    diameter_m: ArrayLike,
+    roughness_m: ArrayLike,
+) -> np.ndarray:
+    """
+    Versión vectorizada de friction_factor_haaland.
+    Vectorized version of friction_factor_haaland.
+
+        1/sqrt(f) = -1.8 * log10( [ (ε/D)/3.7 ]^1.11 + 6.9/Re )
+
+    Re, D y ε se combinan con las reglas de broadcasting de NumPy.
+    Re, D and ε are combined with NumPy broadcasting rules.
+    """
+    Re = np.asarray(Re, dtype=float)
+    diameter_m = np.asarray(diameter_m, dtype=float)
+    roughness_m = np.asarray(roughness_m, dtype=float)
+    _check_reynolds(Re)
+    _check_pipe(diameter_m, roughness_m)
+
+    eps_over_D = roughness_m / diameter_m
+    term = (eps_over_D / 3.7) ** 1.11 + 6.9 / Re
+    if np.any(~(term > 0)):
+        raise ValueError(
+            "The Haaland log term must be positive "
+            "(el término dentro del logaritmo de Haaland debe ser positivo)."
+        )
+
+    inv_sqrt_f = -1.8 * np.log10(term)
+    return 1.0 / (inv_sqrt_f ** 2)
+
+
+def solve_colebrook_array(
+    Re: ArrayLike,
+    diameter_m: ArrayLike,
+    roughness_m: ArrayLike,
+    tol: float = COLEBROOK_TOL_DEFAULT,
+    max_iter: int = COLEBROOK_MAX_ITER_DEFAULT,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Resuelve la ecuación implícita de Colebrook-White por Newton-Raphson.
+    Solves the implicit Colebrook-White equation by Newton-Raphson.
+
+        1/sqrt(f) = -2.0 * log10( (ε/D)/3.7 + 2.51 / (Re * sqrt(f)) )
+
+    Se itera sobre x = 1/sqrt(f), partiendo de la solución explícita de
+    Haaland; cada punto deja de iterar cuando |Δx| <= tol * |x|.
+
+    Iterates on x = 1/sqrt(f), starting from the explicit Haaland
+    solution; each point stops iterating once |Δx| <= tol * |x|.
+
+    Parameters
+    ----------
+    Re, diameter_m, roughness_m : array_like
+        Reynolds, diámetro [m] y rugosidad absoluta [m] (con broadcasting).
+        Reynolds, diameter [m] and absolute roughness [m] (broadcast).
+    tol : float, optional
+        Tolerancia relativa sobre x / Relative tolerance on x.
+    max_iter : int, optional
+        Máximo de iteraciones de Newton / Maximum Newton iterations.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray)
+        Factor f y número de iteraciones de Newton usadas por punto.
+        Friction factor f and number of Newton iterations used per point.
+    """
+    if tol <= 0:
+        raise ValueError(
+            "Colebrook tolerance must be > 0 "
+            "(la tolerancia de Colebrook debe ser > 0)."
+        )
+    if max_iter < 1:
+        raise ValueError(
+            "Colebrook max_iter must be >= 1 "
+            "(max_iter de Colebrook debe ser >= 1)."
+        )
+
+    f0 = friction_factor_haaland_array(Re, diameter_m, roughness_m)
+    Re, diameter_m, roughness_m = np.broadcast_arrays(
+        np.asarray(Re, dtype=float),
+        np.asarray(diameter_m, dtype=float),
+        np.asarray(roughness_m, dtype=float),
+    )
+
+    a = (roughness_m / diameter_m / 3.7).ravel()
+    b = (2.51 / Re).ravel()
+    x = 1.0 / np.sqrt(f0).ravel()
+    iterations = np.zeros(x.shape, dtype=np.int32)
+    active = np.arange(x.size)
+    two_over_ln10 = 2.0 / math.log(10.0)
+
+    for it in range(1, max_iter + 1):
+        xa = x[active]
+        arg = a[active] + b[active] * xa
+        F = xa + 2.0 * np.log10(arg)
+        dF = 1.0 + two_over_ln10 * b[active] / arg
+        x_new = xa - F / dF
+
+        x[active] = x_new
+        iterations[active] = it
+        active = active[np.abs(x_new - xa) > tol * np.abs(x_new)]
+        if active.size == 0:
+            break
+    else:
+        raise RuntimeError(
+            f"Colebrook did not converge in {max_iter} iterations "
+            f"(Colebrook no convergió en {max_iter} iteraciones)."
+        )
+
+    f = 1.0 / (x ** 2)
+    return f.reshape(Re.shape), iterations.reshape(Re.shape)
+
+
+def friction_factor_colebrook_array(
+    Re: ArrayLike,
+    diameter_m: ArrayLike,
+    roughness_m: ArrayLike,
+    tol: float = COLEBROOK_TOL_DEFAULT,
+    max_iter: int = COLEBROOK_MAX_ITER_DEFAULT,
+) -> np.ndarray:
+    """
+    Versión vectorizada de friction_factor_colebrook (sólo f).
+    Vectorized version of friction_factor_colebrook (f only).
+    """
+    f, _ = solve_colebrook_array(Re, diameter_m, roughness_m, tol=tol, max_iter=max_iter)
+    return f
+
+
+def _friction_factor_table_kernel(
+    Re: np.ndarray,
+    diameter_m: np.ndarray,
+    roughness_m: np.ndarray,
+) -> np.ndarray:
+    """
+    f turbulento desde la tabla de Moody por defecto (import diferido).
+    Turbulent f from the default Moody table (deferred import).
+    """
+    from app.core.moody_table import friction_factor_table_array
+
+    _check_pipe(diameter_m, roughness_m)
+    return friction_factor_table_array(Re, diameter_m, roughness_m)
+
+
+def _turbulent_kernel(
+    method: str,
+) -> Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]:
+    """
+    Devuelve la correlación turbulenta (Re, D, ε) -> f para un método.
+    Returns the turbulent correlation (Re, D, ε) -> f for a method.
+    """
+    if method == "blasius":
+        return lambda Re, D, eps: friction_factor_blasius_array(Re)
+    if method == "haaland":
+        return friction_factor_haaland_array
+    if method == "colebrook":
+        return friction_factor_colebrook_array
+    if method == "table":
+        return _friction_factor_table_kernel
+    raise ValueError(
+        f"Unknown correlation method: {method} "
+        "(método de correlación no reconocido)."
+    )
+
+
+def classify_regime_array(Re: ArrayLike) -> np.ndarray:
+    """
+    Versión vectorizada de classify_regime.
+    Vectorized version of classify_regime.
+
+    Devuelve códigos enteros (REGIME_LAMINAR, REGIME_TRANSITIONAL,
+    REGIME_TURBULENT); ``REGIME_NAMES[code]`` da el texto de classify_regime.
+
+    Returns integer codes (REGIME_LAMINAR, REGIME_TRANSITIONAL,
+    REGIME_TURBULENT); ``REGIME_NAMES[code]`` gives the classify_regime text.
+    """
+    Re = np.asarray(Re, dtype=float)
+    codes = np.full(Re.shape, REGIME_TRANSITIONAL, dtype=np.int8)
+    codes[Re < RE_LAMINAR_MAX] = REGIME_LAMINAR
+    codes[Re > RE_TURBULENT_MIN] = REGIME_TURBULENT
+    return codes
+
+
+def friction_factor_array(
+    Re: ArrayLike,
+    diameter_m: ArrayLike,
+    roughness_m: ArrayLike,
+    method: CorrelationMethod = "haaland",
+) -> np.ndarray:
+    """
+    Versión vectorizada de friction_factor.
+    Vectorized version of friction_factor.
+
+    Re, D y ε se combinan por broadcasting; las máscaras laminar /
+    transicional / turbulenta se aplican en una sola pasada, evaluando
+    cada correlación sólo sobre los puntos que le corresponden.
+
+    Re, D and ε are broadcast together; the laminar / transitional /
+    turbulent masks are applied in a single pass, evaluating each
+    correlation only on the points that belong to it.
+
+    Returns
+    -------
+    numpy.ndarray
+        Factor f con la forma del broadcast de las entradas.
+        Friction factor f with the broadcast shape of the inputs.
+    """
+    kernel = _turbulent_kernel(method)
+
+    Re = np.asarray(Re, dtype=float)
+    _check_reynolds(Re)
+    Re, diameter_m, roughness_m = np.broadcast_arrays(
+        Re,
+        np.asarray(diameter_m, dtype=float),
+        np.asarray(roughness_m, dtype=float),
+    )
+
+    f = np.empty(Re.shape, dtype=float)
+    laminar = Re < RE_LAMINAR_MAX
+    turbulent = Re > RE_TURBULENT_MIN
+    transitional = ~(laminar | turbulent)
+
+    # Laminar region
+    # Región laminar
+    f[laminar] = 64.0 / Re[laminar]
+
+    # Fully turbulent region
+    # Región turbulenta "pura"
+    if turbulent.any():
+        f[turbulent] = kernel(
+            Re[turbulent], diameter_m[turbulent], roughness_m[turbulent]
+        )
+
+    # Transitional region: linear blend between laminar f at Re and
+    # turbulent f at Re = 4000.
+    # Región transicional: mezcla lineal entre f laminar en Re y
+    # f turbulento en Re = 4000.
+    if transitional.any():
+        Re_t = Re[transitional]
+        f_lam = 64.0 / Re_t
+        f_turb_4000 = kernel(
+            np.full_like(Re_t, RE_TURBULENT_MIN),
+            diameter_m[transitional],
+            roughness_m[transitional],
+        )
+        w = (Re_t - RE_LAMINAR_MAX) / 2000.0
+        f[transitional] = (1.0 - w) * f_lam + w * f_turb_4000
+
+    return f
+
+
+# ==========================
+# Versiones escalares / Scalar versions
+# ==========================
 
 
 def friction_factor_laminar(Re: float) -> float:
@@ -40,12 +384,7 @@ def friction_factor_laminar(Re: float) -> float:
     float
         Factor de fricción Darcy-Weisbach / Darcy-Weisbach friction factor.
     """
-    if Re <= 0:
-        raise ValueError(
-            "Re must be > 0 to compute the friction factor "
-            "(Re debe ser > 0 para calcular el factor de fricción)."
-        )
-    return 64.0 / Re
+    return float(friction_factor_laminar_array(Re))
 
 
 def friction_factor_blasius(Re: float) -> float:
@@ -58,12 +397,7 @@ def friction_factor_blasius(Re: float) -> float:
     Válida aproximadamente para / Valid approximately for:
         4e3 < Re < 1e5.
     """
-    if Re <= 0:
-        raise ValueError(
-            "Re must be > 0 to compute the friction factor "
-            "(Re debe ser > 0 para calcular el factor de fricción)."
-        )
-    return 0.3164 * (Re ** -0.25)
+    return float(friction_factor_blasius_array(Re))
 
 
 def friction_factor_haaland(Re: float, diameter_m: float, roughness_m: float) -> float:
@@ -80,33 +414,36 @@ def friction_factor_haaland(Re: float, diameter_m: float, roughness_m: float) ->
       - ε es la rugosidad absoluta [m] / ε is the absolute roughness [m]
       - D el diámetro [m]           / D is the diameter [m]
     """
-    if Re <= 0:
-        raise ValueError(
-            "Re must be > 0 to compute the friction factor "
-            "(Re debe ser > 0 para calcular el factor de fricción)."
-        )
-    if diameter_m <= 0:
-        raise ValueError(
-            "Diameter must be > 0 "
-            "(el diámetro debe ser > 0)."
-        )
-    if roughness_m < 0:
-        raise ValueError(
-            "Roughness cannot be negative "
-            "(la rugosidad no puede ser negativa)."
-        )
+    return float(friction_factor_haaland_array(Re, diameter_m, roughness_m))
 
-    eps_over_D = (roughness_m / diameter_m) if diameter_m > 0 else 0.0
-    term = (eps_over_D / 3.7) ** 1.11 + 6.9 / Re
-    if term <= 0:
-        raise ValueError(
-            "The Haaland log term must be positive "
-            "(el término dentro del logaritmo de Haaland debe ser positivo)."
-        )
 
-    inv_sqrt_f = -1.8 * math.log10(term)
-    f = 1.0 / (inv_sqrt_f ** 2)
-    return f
+def friction_factor_colebrook(
+    Re: float,
+    diameter_m: float,
+    roughness_m: float,
+    tol: float = COLEBROOK_TOL_DEFAULT,
+    max_iter: int = COLEBROOK_MAX_ITER_DEFAULT,
+) -> float:
+    """
+    Ecuación implícita de Colebrook-White para flujo turbulento
+    en tubería lisa o rugosa (referencia de QA).
+
+    Colebrook-White implicit equation for turbulent flow
+    in smooth or rough pipes (QA reference):
+
+        1/sqrt(f) = -2.0 * log10( (ε/D)/3.7 + 2.51 / (Re * sqrt(f)) )
+
+    Se resuelve con solve_colebrook_array (Newton iniciado con Haaland);
+    use esa función directamente para obtener el número de iteraciones.
+
+    Solved with solve_colebrook_array (Newton started from Haaland);
+    call that function directly to get the iteration count.
+    """
+    return float(
+        friction_factor_colebrook_array(
+            Re, diameter_m, roughness_m, tol=tol, max_iter=max_iter
+        )
+    )
 
 
 def classify_regime(Re: float) -> str:
@@ -119,9 +456,9 @@ def classify_regime(Re: float) -> str:
       - 'transicional'
       - 'turbulento'
     """
-    if Re < 2000:
+    if Re < RE_LAMINAR_MAX:
         return "laminar"
-    elif Re <= 4000:
+    elif Re <= RE_TURBULENT_MIN:
         return "transicional"
     else:
         return "turbulento"
@@ -143,46 +480,15 @@ def friction_factor(
     - Re > 4000: flujo turbulento / turbulent flow
         - Blasius: tubería lisa / smooth pipe
         - Haaland: tubería rugosa o lisa / rough or smooth pipe
+        - Colebrook: tubería rugosa o lisa, implícita / rough or smooth pipe, implicit
+        - Table: tabla de Moody interpolada desde Colebrook, guardada en
+          disco / interpolated Colebrook Moody table, persisted on disk
+          (ver / see app.core.moody_table)
     - 2000 <= Re <= 4000: región transicional / transitional region
         -> se interpola linealmente entre laminar y turbulento (en Re=4000).
            linearly interpolate between laminar and turbulent (at Re=4000).
-    """
-    if Re <= 0:
-        raise ValueError(
-            "Re must be > 0 to compute the friction factor "
-            "(Re debe ser > 0 para calcular el factor de fricción)."
-        )
 
-    # Laminar region
-    # Región laminar
-    if Re < 2000.0:
-        return friction_factor_laminar(Re)
-
-    # Fully turbulent region
-    # Región turbulenta "pura"
-    if Re > 4000.0:
-        if method == "blasius":
-            return friction_factor_blasius(Re)
-        elif method == "haaland":
-            return friction_factor_haaland(Re, diameter_m, roughness_m)
-        else:
-            raise ValueError(
-                f"Unknown correlation method: {method} "
-                "(método de correlación no reconocido)."
-            )
-
-    # Transitional region: 2000 <= Re <= 4000
-    # Región transicional: 2000 <= Re <= 4000
-    # Interpolate between:
-    #   - f_lam: laminar f at actual Re
-    #   - f_turb_4000: turbulent f evaluated at Re = 4000
-    f_lam = friction_factor_laminar(Re)
-
-    if method == "blasius":
-        f_turb_4000 = friction_factor_blasius(4000.0)
-    else:
-        f_turb_4000 = friction_factor_haaland(4000.0, diameter_m, roughness_m)
-
-    w = (Re - 2000.0) / 2000.0  # goes from 0 to 1 between Re=2000 and Re=4000
-    f_interp = (1.0 - w) * f_lam + w * f_turb_4000
-    return f_interp
+    Envoltorio escalar de friction_factor_array.
+    Scalar wrapper around friction_factor_array.
+    """
+    return float(friction_factor_array(Re, diameter_m, roughness_m, method=method))
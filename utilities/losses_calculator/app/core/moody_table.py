@@ -0,0 +1,524 @@
+"""
+Tabla de Moody precalculada para el factor de fricción turbulento.
+Precomputed Moody table for the turbulent friction factor.
+
+La tabla guarda log10(f) sobre una grilla uniforme en (log10 Re, log10 ε/D),
+construida una sola vez a partir de Haaland o Colebrook, y se consulta con
+interpolación bilineal en espacio logarítmico. Al construirla se acota el
+error relativo frente a la correlación exacta en cada celda a partir de las
+derivadas segundas de log10(f) (ver error_bound); si se pide un error
+objetivo, la grilla se refina hasta que la cota lo cumpla. Los puntos fuera
+de la grilla se calculan con la correlación exacta.
+
+The table stores log10(f) on a uniform grid in (log10 Re, log10 ε/D), built
+once from Haaland or Colebrook, and is queried with bilinear interpolation
+in log space. When built, the relative error against the exact correlation
+is bounded on every cell from the second derivatives of log10(f) (see
+error_bound); if a target error is requested, the grid is refined until the
+bound meets it. Points outside the grid are computed with the exact
+correlation.
+
+La tabla por defecto (friction_factor(method="table")) se construye desde
+Colebrook, el único caso en que interpolar es más rápido que la correlación
+(Haaland vectorizado ya es más barato que la tabla), y se guarda en disco
+con load_or_build_moody_table para construirla una sola vez por máquina.
+
+The default table (friction_factor(method="table")) is built from
+Colebrook, the only case where interpolating beats the correlation
+(vectorized Haaland is already cheaper than the table), and is stored on
+disk with load_or_build_moody_table so it is built once per machine.
+
+Pensada para lazos de dimensionamiento con pocas rugosidades fijas
+(p.ej. MATERIAL_ROUGHNESS) y millones de evaluaciones.
+Meant for sizing loops with a few fixed roughness values
+(e.g. MATERIAL_ROUGHNESS) and millions of evaluations.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from app.core.correlations import (
+    RE_TURBULENT_MIN,
+    friction_factor_colebrook_array,
+    friction_factor_haaland_array,
+)
+
+# Grid defaults: Re over the turbulent range, ε/D down to an effectively
+# smooth pipe (values below the minimum are clamped to it).
+# Valores por defecto de la grilla: Re en el rango turbulento, ε/D hasta una
+# tubería efectivamente lisa (valores menores se acotan al mínimo).
+RE_RANGE_DEFAULT: Tuple[float, float] = (RE_TURBULENT_MIN, 1.0e8)
+EPS_REL_RANGE_DEFAULT: Tuple[float, float] = (1.0e-10, 5.0e-2)
+POINTS_PER_DECADE_DEFAULT: Tuple[int, int] = (40, 20)
+
+# Maximum grid refinements when chasing a target error.
+# Máximo de refinamientos de grilla al buscar un error objetivo.
+_MAX_REFINEMENTS = 5
+
+_SOURCES = ("haaland", "colebrook")
+
+# Default table: source, on-disk location and format version (bump it when
+# the grid defaults change so stale files are rebuilt).
+# Tabla por defecto: fuente, ubicación en disco y versión de formato (subirla
+# al cambiar los valores por defecto de la grilla para reconstruir archivos viejos).
+DEFAULT_TABLE_SOURCE = "colebrook"
+MOODY_TABLE_PATH_ENV = "LOSSES_CALCULATOR_MOODY_TABLE"
+TABLE_FORMAT_VERSION = 2
+
+# Second derivatives for the error bound: sub-grid refinement per cell and
+# safety factor over the finite-difference curvature.
+# Derivadas segundas para la cota de error: refinamiento de la subgrilla por
+# celda y factor de seguridad sobre la curvatura por diferencias finitas.
+CURVATURE_SUBDIVISIONS = 4
+CURVATURE_SAFETY = 1.5
+
+# How max_rel_error is obtained (stored with the table).
+# Cómo se obtiene max_rel_error (se guarda con la tabla).
+ERROR_METHOD = (
+    f"bound: h^2/8 max|d2 log10 f| per axis and cell, curvature from finite "
+    f"differences on a {CURVATURE_SUBDIVISIONS}x sub-grid times {CURVATURE_SAFETY}, "
+    f"plus the eps/D clamp below the grid"
+)
+
+_DEFAULT_TABLE: Optional["MoodyTable"] = None
+
+
+def _cell_max(values: np.ndarray, k: int, nx: int, ny: int) -> np.ndarray:
+    """
+    Máximo por celda de la grilla (nx, ny) de valores en su subgrilla k veces
+    más fina, bordes de la celda incluidos.
+    Per-cell maximum over the (nx, ny) grid of values on its k-times finer
+    sub-grid, cell edges included.
+    """
+    rows = np.maximum(values[:-1].reshape(nx - 1, k, -1).max(axis=1), values[k::k])
+    return np.maximum(rows[:, :-1].reshape(nx - 1, ny - 1, k).max(axis=2), rows[:, k::k])
+
+
+def _exact(source: str, Re: np.ndarray, eps_rel: np.ndarray) -> np.ndarray:
+    """Correlación exacta con D = 1 / Exact correlation with D = 1."""
+    if source == "haaland":
+        return friction_factor_haaland_array(Re, 1.0, eps_rel)
+    return friction_factor_colebrook_array(Re, 1.0, eps_rel)
+
+
+@dataclass
+class MoodyTable:
+    """
+    Tabla log10(f) sobre una grilla uniforme en (log10 Re, log10 ε/D).
+    Table of log10(f) on a uniform grid in (log10 Re, log10 ε/D).
+
+    Parameters
+    ----------
+    log_re : numpy.ndarray
+        Nodos uniformes en log10(Re) / Uniform nodes in log10(Re).
+    log_eps : numpy.ndarray
+        Nodos uniformes en log10(ε/D) / Uniform nodes in log10(ε/D).
+    log_f : numpy.ndarray
+        log10(f) en los nodos, forma (len(log_re), len(log_eps)).
+        log10(f) at the nodes, shape (len(log_re), len(log_eps)).
+    source : str
+        Correlación usada para construirla ("haaland" o "colebrook").
+        Correlation used to build it ("haaland" or "colebrook").
+    max_rel_error : float
+        Cota del error relativo frente a la correlación exacta
+        (ver error_bound).
+        Bound on the relative error against the exact correlation
+        (see error_bound).
+    error_method : str
+        Cómo se obtuvo max_rel_error / How max_rel_error was obtained.
+    """
+
+    log_re: np.ndarray
+    log_eps: np.ndarray
+    log_f: np.ndarray
+    source: str
+    max_rel_error: float = float("nan")
+    error_method: str = ERROR_METHOD
+
+    @property
+    def re_range(self) -> Tuple[float, float]:
+        """Rango de Re cubierto / Covered Re range."""
+        return float(10.0 ** self.log_re[0]), float(10.0 ** self.log_re[-1])
+
+    @property
+    def eps_rel_range(self) -> Tuple[float, float]:
+        """Rango de ε/D cubierto / Covered ε/D range."""
+        return float(10.0 ** self.log_eps[0]), float(10.0 ** self.log_eps[-1])
+
+    def _interpolate(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Interpolación bilineal de log10(f) en coordenadas log10.
+        Bilinear interpolation of log10(f) in log10 coordinates.
+        """
+        nx, ny = self.log_f.shape
+        dx = (self.log_re[-1] - self.log_re[0]) / (nx - 1)
+        dy = (self.log_eps[-1] - self.log_eps[0]) / (ny - 1)
+
+        sx = (x - self.log_re[0]) / dx
+        sy = (y - self.log_eps[0]) / dy
+        i = np.clip(np.floor(sx).astype(np.intp), 0, nx - 2)
+        j = np.clip(np.floor(sy).astype(np.intp), 0, ny - 2)
+        t = sx - i
+        u = sy - j
+
+        # Flat indices of the four corners (take() is cheaper than 2-D indexing)
+        # Índices planos de las cuatro esquinas (take() es más barato que indexar en 2-D)
+        F = self.log_f.ravel()
+        k = i * ny + j
+        f00 = F.take(k)
+        f01 = F.take(k + 1)
+        f10 = F.take(k + ny)
+        f11 = F.take(k + ny + 1)
+        log_f = f00 + t * (f10 - f00) + u * (f01 - f00) + t * u * (f11 - f10 - f01 + f00)
+        return 10.0 ** log_f
+
+    def lookup(self, Re: ArrayLike, eps_rel: ArrayLike) -> np.ndarray:
+        """
+        Factor f para Re y ε/D (con broadcasting).
+        Friction factor f for Re and ε/D (broadcast).
+
+        ε/D por debajo del mínimo de la grilla se acota al mínimo; Re o ε/D por
+        encima de la grilla (o Re por debajo) se evalúan con la correlación
+        exacta.
+
+        ε/D below the grid minimum is clamped to it; Re or ε/D above the grid
+        (or Re below it) are evaluated with the exact correlation.
+        """
+        Re = np.asarray(Re, dtype=float)
+        eps_rel = np.asarray(eps_rel, dtype=float)
+        if eps_rel.size == 1:
+            shape = np.broadcast_shapes(Re.shape, eps_rel.shape)
+            f = self._lookup_fixed_roughness(Re.ravel(), float(eps_rel.ravel()[0]))
+            return f.reshape(shape)
+
+        Re, eps_rel = np.broadcast_arrays(Re, eps_rel)
+        re_min, re_max = self.re_range
+        eps_min, eps_max = self.eps_rel_range
+
+        eps_clamped = np.maximum(eps_rel, eps_min)
+        inside = (Re >= re_min) & (Re <= re_max) & (eps_clamped <= eps_max)
+
+        if inside.all():
+            return self._interpolate(np.log10(Re), np.log10(eps_clamped))
+
+        f = np.empty(Re.shape, dtype=float)
+        f[inside] = self._interpolate(
+            np.log10(Re[inside]), np.log10(eps_clamped[inside])
+        )
+        outside = ~inside
+        f[outside] = _exact(self.source, Re[outside], eps_rel[outside])
+        return f
+
+    def _lookup_fixed_roughness(self, Re: np.ndarray, eps_rel: float) -> np.ndarray:
+        """
+        Camino rápido para una sola rugosidad relativa: se interpola una vez
+        la columna en ε/D y luego sólo en log10(Re) con np.interp.
+
+        Fast path for a single relative roughness: the column is interpolated
+        once in ε/D and then only in log10(Re) with np.interp.
+        """
+        eps_min, eps_max = self.eps_rel_range
+        eps_clamped = max(eps_rel, eps_min)
+        if eps_clamped > eps_max:
+            return _exact(self.source, Re, np.full_like(Re, eps_rel))
+
+        ny = self.log_f.shape[1]
+        dy = (self.log_eps[-1] - self.log_eps[0]) / (ny - 1)
+        sy = (np.log10(eps_clamped) - self.log_eps[0]) / dy
+        j = min(max(int(np.floor(sy)), 0), ny - 2)
+        u = sy - j
+        column = (1.0 - u) * self.log_f[:, j] + u * self.log_f[:, j + 1]
+        slope = np.diff(column)
+
+        # Uniform grid: the cell index is arithmetic, no search needed.
+        # Grilla uniforme: el índice de celda es aritmético, sin búsqueda.
+        nx = column.size
+        dx = (self.log_re[-1] - self.log_re[0]) / (nx - 1)
+        sx = (np.log10(Re) - self.log_re[0]) / dx
+        i = np.clip(sx.astype(np.intp), 0, nx - 2)
+        f = 10.0 ** (column.take(i) + (sx - i) * slope.take(i))
+
+        re_min, re_max = self.re_range
+        if Re.size and (Re.min() < re_min or Re.max() > re_max):
+            outside = (Re < re_min) | (Re > re_max)
+            f[outside] = _exact(self.source, Re[outside], np.full(outside.sum(), eps_rel))
+        return f
+
+    def error_bound(self) -> float:
+        """
+        Cota del error relativo máximo frente a la correlación exacta.
+
+        La interpolación bilineal es lineal en x seguida de lineal en y, así
+        que en una celda de lados hx, hy el error en g = log10(f) cumple
+
+            |g - I g| <= hx²/8 max|g_xx| + hy²/8 max|g_yy|
+
+        (el término cruzado g_xy no aparece: cada paso lineal es exacto para
+        él). max|g_xx| y max|g_yy| de cada celda se toman de diferencias
+        segundas en una subgrilla CURVATURE_SUBDIVISIONS veces más fina, por
+        CURVATURE_SAFETY. Para ε/D por debajo de la grilla (acotado al
+        mínimo) se suma el error de ese acote, f(Re, ε_min)/f(Re, 0) - 1, que
+        crece con Re y se toma sobre la subgrilla (incluye Re máximo).
+        Error relativo en f: 10^|Δg| - 1.
+
+        Bound on the maximum relative error against the exact correlation.
+
+        Bilinear interpolation is linear in x followed by linear in y, so on
+        a cell of sides hx, hy the error in g = log10(f) satisfies the bound
+        above (the cross term g_xy does not appear: each linear step is exact
+        for it). max|g_xx| and max|g_yy| per cell come from second
+        differences on a sub-grid CURVATURE_SUBDIVISIONS times finer, times
+        CURVATURE_SAFETY. For ε/D below the grid (clamped to the minimum) the
+        clamp error f(Re, ε_min)/f(Re, 0) - 1 is added; it grows with Re and
+        is taken over the sub-grid (which includes the maximum Re).
+        Relative error in f: 10^|Δg| - 1.
+        """
+        k = CURVATURE_SUBDIVISIONS
+        nx, ny = self.log_f.shape
+        x = np.linspace(self.log_re[0], self.log_re[-1], k * (nx - 1) + 1)
+        y = np.linspace(self.log_eps[0], self.log_eps[-1], k * (ny - 1) + 1)
+        g = np.log10(_exact(self.source, 10.0 ** x[:, None], 10.0 ** y[None, :]))
+
+        # Second differences, extended to the edges of the sub-grid
+        # Diferencias segundas, extendidas a los bordes de la subgrilla
+        gxx = np.abs(g[2:] - 2.0 * g[1:-1] + g[:-2]) / (x[1] - x[0]) ** 2
+        gyy = np.abs(g[:, 2:] - 2.0 * g[:, 1:-1] + g[:, :-2]) / (y[1] - y[0]) ** 2
+        gxx = np.pad(gxx, ((1, 1), (0, 0)), mode="edge")
+        gyy = np.pad(gyy, ((0, 0), (1, 1)), mode="edge")
+
+        hx = self.log_re[1] - self.log_re[0]
+        hy = self.log_eps[1] - self.log_eps[0]
+        dg = CURVATURE_SAFETY * (
+            hx ** 2 / 8.0 * _cell_max(gxx, k, nx, ny)
+            + hy ** 2 / 8.0 * _cell_max(gyy, k, nx, ny)
+        )
+
+        Re = 10.0 ** x
+        clamp = np.abs(
+            _exact(self.source, Re, np.full_like(Re, 10.0 ** self.log_eps[0]))
+            / _exact(self.source, Re, np.zeros_like(Re))
+            - 1.0
+        ).max()
+        return float(10.0 ** dg.max() * (1.0 + clamp) - 1.0)
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """
+        Guarda la tabla en un archivo .npz.
+        Saves the table to a .npz file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as fh:
+            np.savez(
+                fh,
+                log_re=self.log_re,
+                log_eps=self.log_eps,
+                log_f=self.log_f,
+                source=np.array(self.source),
+                max_rel_error=np.array(self.max_rel_error),
+                error_method=np.array(self.error_method),
+                format_version=np.array(TABLE_FORMAT_VERSION),
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "MoodyTable":
+        """
+        Carga una tabla guardada con save().
+        Loads a table saved with save().
+
+        Raises ValueError si el archivo es de otra versión de formato
+        (p.ej. con el error muestreado en vez de acotado).
+        Raises ValueError if the file has another format version
+        (e.g. with a sampled error instead of a bound).
+        """
+        with np.load(Path(path)) as data:
+            version = int(data["format_version"]) if "format_version" in data else 0
+            if version != TABLE_FORMAT_VERSION:
+                raise ValueError(
+                    f"Moody table format {version}, expected {TABLE_FORMAT_VERSION} "
+                    f"(formato de tabla {version}, se esperaba {TABLE_FORMAT_VERSION})."
+                )
+            return cls(
+                log_re=data["log_re"],
+                log_eps=data["log_eps"],
+                log_f=data["log_f"],
+                source=str(data["source"]),
+                max_rel_error=float(data["max_rel_error"]),
+                error_method=str(data["error_method"]),
+            )
+
+
+def build_moody_table(
+    source: str = "haaland",
+    re_range: Tuple[float, float] = RE_RANGE_DEFAULT,
+    eps_rel_range: Tuple[float, float] = EPS_REL_RANGE_DEFAULT,
+    points_per_decade: Tuple[int, int] = POINTS_PER_DECADE_DEFAULT,
+    target_rel_error: Optional[float] = None,
+) -> MoodyTable:
+    """
+    Construye una tabla de Moody y acota su error de interpolación.
+    Builds a Moody table and bounds its interpolation error.
+
+    Parameters
+    ----------
+    source : str
+        "haaland" o "colebrook".
+    re_range : (float, float)
+        Rango de Re de la grilla / Grid Re range.
+    eps_rel_range : (float, float)
+        Rango de ε/D de la grilla (mínimo > 0) / Grid ε/D range (minimum > 0).
+    points_per_decade : (int, int)
+        Densidad de nodos por década en Re y en ε/D.
+        Node density per decade in Re and in ε/D.
+    target_rel_error : float, optional
+        Si se da, la grilla se duplica hasta que la cota max_rel_error <= objetivo.
+        If given, the grid is doubled until the bound max_rel_error <= target.
+    """
+    if source not in _SOURCES:
+        raise ValueError(
+            f"Unknown table source: {source} "
+            f"(fuente de tabla no reconocida, use una de {_SOURCES})."
+        )
+    re_min, re_max = re_range
+    eps_min, eps_max = eps_rel_range
+    if not (0 < re_min < re_max) or not (0 < eps_min < eps_max):
+        raise ValueError(
+            "Table ranges must satisfy 0 < min < max "
+            "(los rangos de la tabla deben cumplir 0 < min < max)."
+        )
+
+    x_span = np.log10(re_max) - np.log10(re_min)
+    y_span = np.log10(eps_max) - np.log10(eps_min)
+    ppd_re, ppd_eps = points_per_decade
+
+    for _ in range(_MAX_REFINEMENTS + 1):
+        n_re = max(2, int(np.ceil(ppd_re * x_span)) + 1)
+        n_eps = max(2, int(np.ceil(ppd_eps * y_span)) + 1)
+        log_re = np.linspace(np.log10(re_min), np.log10(re_max), n_re)
+        log_eps = np.linspace(np.log10(eps_min), np.log10(eps_max), n_eps)
+        log_f = np.log10(
+            _exact(source, 10.0 ** log_re[:, None], 10.0 ** log_eps[None, :])
+        )
+
+        table = MoodyTable(log_re=log_re, log_eps=log_eps, log_f=log_f, source=source)
+        table.max_rel_error = table.error_bound()
+
+        if target_rel_error is None or table.max_rel_error <= target_rel_error:
+            return table
+        ppd_re *= 2
+        ppd_eps *= 2
+
+    raise RuntimeError(
+        f"Could not reach target error {target_rel_error:g} "
+        f"(no se alcanzó el error objetivo {target_rel_error:g}); "
+        f"best max_rel_error = {table.max_rel_error:.3e}."
+    )
+
+
+def _matches(table: MoodyTable, kwargs: dict) -> bool:
+    """
+    True si la tabla cargada tiene la fuente y los rangos pedidos.
+    True if the loaded table has the requested source and ranges.
+    """
+    if table.source != kwargs.get("source", "haaland"):
+        return False
+    re_range = kwargs.get("re_range", RE_RANGE_DEFAULT)
+    eps_range = kwargs.get("eps_rel_range", EPS_REL_RANGE_DEFAULT)
+    return bool(
+        np.allclose(table.re_range, re_range, rtol=1e-9)
+        and np.allclose(table.eps_rel_range, eps_range, rtol=1e-9)
+    )
+
+
+def load_or_build_moody_table(path: Union[str, Path], **kwargs) -> MoodyTable:
+    """
+    Carga la tabla desde ``path`` o, si no existe (o no coincide con la
+    fuente y rangos pedidos), la construye y la guarda. Si no se puede
+    escribir ``path``, se devuelve la tabla construida sin guardarla.
+
+    Loads the table from ``path`` or, if missing (or not matching the
+    requested source and ranges), builds and saves it. If ``path`` is not
+    writable, the built table is returned without saving it.
+
+    ``kwargs`` se pasan a build_moody_table / are passed to build_moody_table.
+    """
+    path = Path(path)
+    if path.exists():
+        try:
+            table = MoodyTable.load(path)
+            if _matches(table, kwargs):
+                return table
+        except (OSError, ValueError, KeyError):
+            pass
+    table = build_moody_table(**kwargs)
+    try:
+        table.save(path)
+    except OSError:
+        pass
+    return table
+
+
+def default_table_path() -> Path:
+    """
+    Archivo de la tabla por defecto: $LOSSES_CALCULATOR_MOODY_TABLE, o
+    moody_<fuente>_v<versión>.npz en $XDG_CACHE_HOME/losses_calculator
+    (~/.cache/losses_calculator si no está definida).
+
+    Default table file: $LOSSES_CALCULATOR_MOODY_TABLE, or
+    moody_<source>_v<version>.npz in $XDG_CACHE_HOME/losses_calculator
+    (~/.cache/losses_calculator if unset).
+    """
+    if os.environ.get(MOODY_TABLE_PATH_ENV):
+        return Path(os.environ[MOODY_TABLE_PATH_ENV])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return (
+        Path(base) / "losses_calculator"
+        / f"moody_{DEFAULT_TABLE_SOURCE}_v{TABLE_FORMAT_VERSION}.npz"
+    )
+
+
+def get_default_table() -> MoodyTable:
+    """
+    Tabla usada por friction_factor(method="table"): Colebrook, cargada de
+    default_table_path() o construida y guardada allí en el primer uso, salvo
+    que se haya fijado otra con set_default_table.
+
+    Table used by friction_factor(method="table"): Colebrook, loaded from
+    default_table_path() or built and saved there on first use, unless
+    another one was set with set_default_table.
+    """
+    global _DEFAULT_TABLE
+    if _DEFAULT_TABLE is None:
+        _DEFAULT_TABLE = load_or_build_moody_table(
+            default_table_path(), source=DEFAULT_TABLE_SOURCE
+        )
+    return _DEFAULT_TABLE
+
+
+def set_default_table(table: Optional[MoodyTable]) -> None:
+    """
+    Fija la tabla usada por friction_factor(method="table") (None la reinicia).
+    Sets the table used by friction_factor(method="table") (None resets it).
+    """
+    global _DEFAULT_TABLE
+    _DEFAULT_TABLE = table
+
+
+def friction_factor_table_array(
+    Re: ArrayLike,
+    diameter_m: ArrayLike,
+    roughness_m: ArrayLike,
+) -> np.ndarray:
+    """
+    Factor f turbulento desde la tabla por defecto (con broadcasting).
+    Turbulent friction factor from the default table (broadcast).
+    """
+    diameter_m = np.asarray(diameter_m, dtype=float)
+    roughness_m = np.asarray(roughness_m, dtype=float)
+    return get_default_table().lookup(Re, roughness_m / diameter_m)
@@ -0,0 +1,137 @@
+"""
+Topología de redes de tuberías: nudos, tuberías y la red que los une.
+Pipe network topology: nodes, pipes and the network joining them.
+
+Incluye:
+- NetworkNode: nudo con demanda, altura fija opcional y cota
+- NetworkPipe: tubería entre dos nudos (PipeSegment + coeficiente K)
+- PipeNetwork: red validada al construirla (nombres y nudos)
+
+Includes:
+- NetworkNode: node with demand, optional fixed head and elevation
+- NetworkPipe: pipe between two nodes (PipeSegment + K coefficient)
+- PipeNetwork: network validated on construction (names and nodes)
+
+El solver está en app.services.network_service.
+The solver lives in app.services.network_service.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from app.geometry.pipe_geometries import PipeSegment
+
+
+@dataclass
+class NetworkNode:
+    """
+    Nudo de una red de tuberías.
+    Node of a pipe network.
+
+    Parameters
+    ----------
+    name : str
+        Nombre único del nudo / Unique node name.
+    demand_m3s : float, optional
+        Caudal que sale de la red en el nudo [m³/s] (negativo = aporte).
+        Flow leaving the network at the node [m³/s] (negative = inflow).
+    fixed_head_m : float, optional
+        Altura piezométrica impuesta [m] (estanque, fuente). None = incógnita.
+        Imposed hydraulic head [m] (reservoir, source). None = unknown.
+    elevation_m : float, optional
+        Cota del nudo [m], sólo para informar la presión.
+        Node elevation [m], only used to report pressure.
+    """
+
+    name: str
+    demand_m3s: float = 0.0
+    fixed_head_m: Optional[float] = None
+    elevation_m: float = 0.0
+
+
+@dataclass
+class NetworkPipe:
+    """
+    Tubería que une dos nudos; el sentido positivo del caudal es start -> end.
+    Pipe joining two nodes; positive flow direction is start -> end.
+
+    Parameters
+    ----------
+    name : str
+        Nombre único de la tubería / Unique pipe name.
+    start, end : str
+        Nudos inicial y final / Start and end nodes.
+    segment : PipeSegment
+        Geometría y rugosidad / Geometry and roughness.
+    minor_loss_k : float, optional
+        Suma de coeficientes K de pérdidas locales (codos, válvulas...).
+        Sum of local-loss K coefficients (elbows, valves...).
+    """
+
+    name: str
+    start: str
+    end: str
+    segment: PipeSegment
+    minor_loss_k: float = 0.0
+
+
+@dataclass
+class PipeNetwork:
+    """
+    Red de tuberías mallada o ramificada.
+    Looped or branched pipe network.
+
+    Se valida al construirla: nombres únicos, nudos existentes y al menos
+    un nudo de altura fija.
+    Validated on construction: unique names, existing nodes and at least
+    one fixed-head node.
+    """
+
+    nodes: List[NetworkNode]
+    pipes: List[NetworkPipe]
+    node_index: Dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """
+        Validación básica de la topología.
+        Basic topology validation.
+        """
+        self.node_index = {}
+        for i, node in enumerate(self.nodes):
+            if node.name in self.node_index:
+                raise ValueError(
+                    f"Duplicate node name: {node.name} "
+                    f"(nombre de nudo repetido: {node.name})."
+                )
+            self.node_index[node.name] = i
+
+        if not any(node.fixed_head_m is not None for node in self.nodes):
+            raise ValueError(
+                "At least one fixed-head node is required "
+                "(se requiere al menos un nudo de altura fija)."
+            )
+
+        pipe_names = set()
+        for pipe in self.pipes:
+            if pipe.name in pipe_names:
+                raise ValueError(
+                    f"Duplicate pipe name: {pipe.name} "
+                    f"(nombre de tubería repetido: {pipe.name})."
+                )
+            pipe_names.add(pipe.name)
+            for node_name in (pipe.start, pipe.end):
+                if node_name not in self.node_index:
+                    raise ValueError(
+                        f"Pipe {pipe.name} references unknown node {node_name} "
+                        f"(la tubería {pipe.name} usa un nudo inexistente)."
+                    )
+            if pipe.start == pipe.end:
+                raise ValueError(
+                    f"Pipe {pipe.name} starts and ends at the same node "
+                    f"(la tubería {pipe.name} empieza y termina en el mismo nudo)."
+                )
+            if pipe.minor_loss_k < 0:
+                raise ValueError(
+                    f"Pipe {pipe.name}: minor_loss_k must be >= 0 "
+                    f"(minor_loss_k debe ser >= 0)."
+                )
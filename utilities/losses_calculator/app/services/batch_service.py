@@ -0,0 +1,347 @@
+"""
+Servicio de cálculo por lotes (sin interacción) de pérdidas de carga.
+Batch (non-interactive) head loss computation service.
+
+Cada caso describe un tramo recto, opcionalmente con un codo, igual que las
+opciones del asistente interactivo. Los casos se procesan uno a uno como un
+flujo (generador), de modo que la memoria usada no depende del número de casos.
+
+Each case describes a straight segment, optionally with one elbow, just like
+the options of the interactive wizard. Cases are processed one by one as a
+stream (generator), so memory use does not depend on the number of cases.
+
+Con ``workers > 1`` el flujo se reparte en bloques entre varios procesos
+(ver app.services.parallel), conservando el orden de salida.
+With ``workers > 1`` the stream is split into chunks across several
+processes (see app.services.parallel), preserving the output order.
+
+Campos de entrada / Input fields:
+  - id           : identificador (opcional, por defecto el nº de fila)
+                   identifier (optional, defaults to the row number)
+  - diameter_m   : diámetro interno [m] / internal diameter [m]
+  - velocity_ms  : velocidad media [m/s] (o q_m3s) / mean velocity [m/s] (or q_m3s)
+  - q_m3s        : caudal [m³/s] (o velocity_ms) / flow rate [m³/s] (or velocity_ms)
+  - length_m     : longitud del tramo, o L1 antes del codo [m]
+                   segment length, or L1 before the elbow [m]
+  - length2_m    : L2 después del codo [m] (opcional) / L2 after the elbow [m] (optional)
+  - roughness_m  : rugosidad absoluta [m] (opcional) / absolute roughness [m] (optional)
+  - material     : clave de MATERIAL_ROUGHNESS si no hay roughness_m
+                   MATERIAL_ROUGHNESS key if roughness_m is not given
+  - elbow        : código de codo, p.ej. "elbow_90_LR" (opcional)
+                   elbow code, e.g. "elbow_90_LR" (optional)
+  - method       : "blasius", "haaland", "colebrook" o "table" (opcional)
+"""
+
+import math
+from dataclasses import dataclass
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from app.core.constants import EPSILON_HDPE_DEFAULT, MATERIAL_ROUGHNESS
+from app.core.correlations import CorrelationMethod
+from app.core.local_losses import get_elbow_k
+from app.geometry.pipe_geometries import PipeSegment
+from app.services.friction_service import (
+    compute_area,
+    compute_pipe_with_elbow_head_loss,
+    compute_single_segment_head_loss,
+)
+from app.services.parallel import CHUNK_SIZE_DEFAULT, iter_chunked_map
+
+# Métodos aceptados en la columna "method" / Accepted values of the "method" column.
+BATCH_METHODS = ("blasius", "haaland", "colebrook", "table")
+
+# Clave con la que los lectores marcan un registro que no se pudo leer.
+# Key used by readers to flag a record that could not be read.
+INVALID_RECORD_KEY = "_invalid"
+
+# Orden fijo de columnas de salida / Fixed order of output columns.
+BATCH_OUTPUT_FIELDS: List[str] = [
+    "id",
+    "method",
+    "elbow",
+    "diameter_m",
+    "length_m",
+    "roughness_m",
+    "q_m3s",
+    "velocity_ms",
+    "reynolds",
+    "regime",
+    "friction_factor",
+    "hf_friction_m",
+    "elbow_k",
+    "hf_elbow_m",
+    "hf_total_m",
+    "delta_p_total_pa",
+    "delta_p_total_bar",
+    "error",
+]
+
+
+@dataclass
+class BatchCase:
+    """
+    Un caso del lote ya validado.
+    One validated batch case.
+
+    Parameters
+    ----------
+    case_id : str
+        Identificador del caso / Case identifier.
+    q_m3s : float
+        Caudal volumétrico [m³/s] / Volumetric flow rate [m³/s].
+    segment : PipeSegment
+        Tramo con la longitud total (L1 + L2) / Segment with total length (L1 + L2).
+    elbow : str
+        Código de codo, "" si no hay codo / Elbow code, "" if there is no elbow.
+    method : CorrelationMethod
+        Método de correlación para f / Correlation method for f.
+    """
+
+    case_id: str
+    q_m3s: float
+    segment: PipeSegment
+    elbow: str = ""
+    method: CorrelationMethod = "haaland"
+
+
+def _field(record: Mapping[str, object], name: str) -> Optional[object]:
+    """
+    Valor de un campo, tratando "" y None como ausentes (celdas CSV vacías).
+    Field value, treating "" and None as missing (empty CSV cells).
+    """
+    value = record.get(name)
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+    return value
+
+
+def _float_field(record: Mapping[str, object], name: str) -> Optional[float]:
+    """Campo numérico opcional / Optional numeric field."""
+    value = _field(record, name)
+    if value is None:
+        return None
+    try:
+        result = float(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(
+            f"Field '{name}' must be a number, got {value!r} "
+            f"(el campo '{name}' debe ser un número)."
+        ) from exc
+    if not math.isfinite(result):
+        raise ValueError(
+            f"Field '{name}' must be finite "
+            f"(el campo '{name}' debe ser finito)."
+        )
+    return result
+
+
+def parse_case(
+    record: Mapping[str, object],
+    index: int,
+    default_method: CorrelationMethod = "haaland",
+) -> BatchCase:
+    """
+    Convierte un registro (fila CSV u objeto JSON) en un BatchCase.
+    Converts a record (CSV row or JSON object) into a BatchCase.
+
+    Lanza ValueError si faltan campos o son inválidos.
+    Raises ValueError if fields are missing or invalid.
+    """
+    case_id = str(_field(record, "id") or index)
+    if INVALID_RECORD_KEY in record:
+        raise ValueError(str(record[INVALID_RECORD_KEY]))
+
+    diameter_m = _float_field(record, "diameter_m")
+    length_m = _float_field(record, "length_m")
+    if diameter_m is None or length_m is None:
+        raise ValueError(
+            "Fields 'diameter_m' and 'length_m' are required "
+            "(los campos 'diameter_m' y 'length_m' son obligatorios)."
+        )
+    length_m += _float_field(record, "length2_m") or 0.0
+
+    roughness_m = _float_field(record, "roughness_m")
+    if roughness_m is None:
+        material = _field(record, "material")
+        if material is None:
+            roughness_m = EPSILON_HDPE_DEFAULT
+        elif str(material) in MATERIAL_ROUGHNESS:
+            roughness_m = MATERIAL_ROUGHNESS[str(material)]
+        else:
+            raise ValueError(
+                f"Unknown material: {material} "
+                f"(material desconocido: {material})."
+            )
+
+    segment = PipeSegment(
+        length_m=length_m,
+        diameter_m=diameter_m,
+        roughness_m=roughness_m,
+        name=case_id,
+    )
+
+    q_m3s = _float_field(record, "q_m3s")
+    velocity_ms = _float_field(record, "velocity_ms")
+    if q_m3s is None:
+        if velocity_ms is None:
+            raise ValueError(
+                "Either 'q_m3s' or 'velocity_ms' is required "
+                "(se requiere 'q_m3s' o 'velocity_ms')."
+            )
+        q_m3s = velocity_ms * compute_area(diameter_m)
+
+    method = str(_field(record, "method") or default_method).lower()
+    if method not in BATCH_METHODS:
+        raise ValueError(
+            f"Unknown correlation method: {method} "
+            "(método de correlación no reconocido)."
+        )
+
+    elbow = str(_field(record, "elbow") or "")
+    if elbow:
+        get_elbow_k(elbow)  # valida el código / validates the code
+
+    return BatchCase(
+        case_id=case_id,
+        q_m3s=q_m3s,
+        segment=segment,
+        elbow=elbow,
+        method=method,  # type: ignore[arg-type]
+    )
+
+
+def evaluate_case(
+    case: BatchCase,
+    rho: float,
+    mu: float,
+    g: float,
+) -> Dict[str, object]:
+    """
+    Calcula un caso y devuelve una fila con las columnas BATCH_OUTPUT_FIELDS.
+    Computes one case and returns a row with the BATCH_OUTPUT_FIELDS columns.
+    """
+    seg = case.segment
+    if case.elbow:
+        res = compute_pipe_with_elbow_head_loss(
+            q_m3s=case.q_m3s,
+            segment=seg,
+            elbow_k=get_elbow_k(case.elbow),
+            rho=rho,
+            mu=mu,
+            g=g,
+            method=case.method,
+        )
+    else:
+        res = compute_single_segment_head_loss(
+            q_m3s=case.q_m3s,
+            segment=seg,
+            rho=rho,
+            mu=mu,
+            g=g,
+            method=case.method,
+        )
+        res = {
+            **res,
+            "elbow_k": 0.0,
+            "hf_elbow_m": 0.0,
+            "hf_total_m": res["hf_m"],
+            "delta_p_total_pa": res["delta_p_pa"],
+            "delta_p_total_bar": res["delta_p_bar"],
+        }
+
+    return {
+        "id": case.case_id,
+        "method": case.method,
+        "elbow": case.elbow,
+        "diameter_m": seg.diameter_m,
+        "length_m": seg.length_m,
+        "roughness_m": seg.roughness_m,
+        "q_m3s": case.q_m3s,
+        "velocity_ms": res["velocity_ms"],
+        "reynolds": res["reynolds"],
+        "regime": res["regime"],
+        "friction_factor": res["friction_factor"],
+        "hf_friction_m": res["hf_m"],
+        "elbow_k": res["elbow_k"],
+        "hf_elbow_m": res["hf_elbow_m"],
+        "hf_total_m": res["hf_total_m"],
+        "delta_p_total_pa": res["delta_p_total_pa"],
+        "delta_p_total_bar": res["delta_p_total_bar"],
+        "error": "",
+    }
+
+
+def evaluate_record(
+    record: Mapping[str, object],
+    index: int,
+    rho: float,
+    mu: float,
+    g: float,
+    default_method: CorrelationMethod = "haaland",
+) -> Dict[str, object]:
+    """
+    Valida y calcula un registro; los errores se informan en la columna
+    "error" en vez de detener el lote.
+
+    Validates and computes one record; errors are reported in the "error"
+    column instead of stopping the batch.
+    """
+    try:
+        case = parse_case(record, index, default_method=default_method)
+        return evaluate_case(case, rho=rho, mu=mu, g=g)
+    except (ValueError, RuntimeError) as exc:
+        row: Dict[str, object] = {name: None for name in BATCH_OUTPUT_FIELDS}
+        row["id"] = str(_field(record, "id") or index)
+        row["error"] = str(exc)
+        return row
+
+
+def _evaluate_records_chunk(
+    chunk: List[Tuple[int, Mapping[str, object]]],
+    rho: float,
+    mu: float,
+    g: float,
+    default_method: CorrelationMethod,
+) -> List[Dict[str, object]]:
+    """
+    Calcula un bloque de registros numerados (se ejecuta en un proceso hijo).
+    Computes a chunk of numbered records (runs in a child process).
+    """
+    return [
+        evaluate_record(record, index, rho=rho, mu=mu, g=g, default_method=default_method)
+        for index, record in chunk
+    ]
+
+
+def iter_batch_results(
+    records: Iterable[Mapping[str, object]],
+    rho: float,
+    mu: float,
+    g: float,
+    default_method: CorrelationMethod = "haaland",
+    workers: Optional[int] = 1,
+    chunk_size: int = CHUNK_SIZE_DEFAULT,
+) -> Iterator[Dict[str, object]]:
+    """
+    Genera una fila de resultados por registro, en el mismo orden.
+    Yields one result row per record, in the same order.
+
+    ``workers`` y ``chunk_size`` controlan el reparto en procesos
+    (ver iter_chunked_map); el resultado no depende de ellos.
+    ``workers`` and ``chunk_size`` control the process sharding
+    (see iter_chunked_map); the result does not depend on them.
+    """
+    func = partial(
+        _evaluate_records_chunk, rho=rho, mu=mu, g=g, default_method=default_method
+    )
+    yield from iter_chunked_map(
+        func,
+        enumerate(records, start=1),
+        workers=workers,
+        chunk_size=chunk_size,
+    )
@@ -8,6 +8,9 @@ Incluye funciones para:
 - Número de Reynolds
 - Pérdida de carga en un tramo
 - Pérdida de carga total en varios tramos en serie
+- Lo mismo para muchos caudales, opcionalmente en varios procesos
+- Pérdida de carga en un tramo para muchos caudales (versión vectorizada)
+- Pérdida de carga en un tramo con un codo (fricción + pérdida localizada K)
 
 Includes functions for:
 - Circular cross-section area
@@ -15,13 +18,27 @@ Includes functions for:
 - Reynolds number
 - Head loss in a single segment
 - Total head loss in several segments in series
+- The same for many flow rates, optionally across several processes
+- Head loss in a single segment for many flow rates (vectorized version)
+- Head loss in a single segment with one elbow (friction + local K loss)
 """
 
 import math
-from typing import Dict, List
-
-from app.core.correlations import friction_factor, classify_regime, CorrelationMethod
+from functools import partial
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from app.core.correlations import (
+    friction_factor,
+    friction_factor_array,
+    classify_regime,
+    classify_regime_array,
+    CorrelationMethod,
+)
 from app.geometry.pipe_geometries import PipeSegment
+from app.services.parallel import iter_chunked_map
 
 
 def compute_area(diameter_m: float) -> float:
@@ -187,6 +204,176 @@ def compute_single_segment_head_loss(
     }
 
 
+def compute_pipe_with_elbow_head_loss(
+    q_m3s: float,
+    segment: PipeSegment,
+    elbow_k: float,
+    rho: float,
+    mu: float,
+    g: float,
+    method: CorrelationMethod = "haaland",
+) -> Dict[str, float]:
+    """
+    Pérdida de carga en un tramo recto con un codo: fricción en todo el tramo
+    más la pérdida localizada K·v²/(2g) del codo.
+
+    Head loss in a straight segment with one elbow: friction over the whole
+    segment plus the local loss K·v²/(2g) of the elbow.
+
+    Parameters
+    ----------
+    q_m3s : float
+        Caudal volumétrico [m³/s] / Volumetric flow rate [m³/s].
+    segment : PipeSegment
+        Tramo con la longitud total (antes + después del codo).
+        Segment with the total length (before + after the elbow).
+    elbow_k : float
+        Coeficiente K del codo (ver app.core.local_losses).
+        Elbow K coefficient (see app.core.local_losses).
+    rho, mu, g : float
+        Densidad, viscosidad dinámica y gravedad / Density, viscosity and gravity.
+    method : CorrelationMethod, optional
+        Método de correlación para f / Correlation method for f.
+
+    Returns
+    -------
+    Dict[str, float]
+        Las claves de compute_single_segment_head_loss más:
+        The keys of compute_single_segment_head_loss plus:
+
+          - elbow_k           : coeficiente K / K coefficient
+          - hf_elbow_m        : pérdida en el codo [m] / elbow head loss [m]
+          - delta_p_elbow_pa  : ΔP en el codo [Pa] / elbow pressure drop [Pa]
+          - delta_p_elbow_bar : ΔP en el codo [bar] / elbow pressure drop [bar]
+          - hf_total_m        : fricción + codo [m] / friction + elbow [m]
+          - delta_p_total_pa  : ΔP total [Pa] / total pressure drop [Pa]
+          - delta_p_total_bar : ΔP total [bar] / total pressure drop [bar]
+    """
+    if elbow_k < 0:
+        raise ValueError(
+            "Elbow K must be >= 0 (el K del codo debe ser >= 0)."
+        )
+
+    fric = compute_single_segment_head_loss(
+        q_m3s=q_m3s,
+        segment=segment,
+        rho=rho,
+        mu=mu,
+        g=g,
+        method=method,
+    )
+
+    v = fric["velocity_ms"]
+    head_velocity = v ** 2 / (2.0 * g)
+
+    hf_elbow = elbow_k * head_velocity
+    delta_p_elbow_pa = rho * g * hf_elbow
+
+    hf_total = fric["hf_m"] + hf_elbow
+    delta_p_total_pa = fric["delta_p_pa"] + delta_p_elbow_pa
+
+    return {
+        **fric,
+        "elbow_k": elbow_k,
+        "hf_elbow_m": hf_elbow,
+        "delta_p_elbow_pa": delta_p_elbow_pa,
+        "delta_p_elbow_bar": delta_p_elbow_pa / 1.0e5,
+        "hf_total_m": hf_total,
+        "delta_p_total_pa": delta_p_total_pa,
+        "delta_p_total_bar": delta_p_total_pa / 1.0e5,
+    }
+
+
+def compute_single_segment_head_loss_batch(
+    q_m3s: ArrayLike,
+    segment: PipeSegment,
+    rho: ArrayLike,
+    mu: ArrayLike,
+    g: float,
+    method: CorrelationMethod = "haaland",
+) -> Dict[str, np.ndarray]:
+    """
+    Versión vectorizada de compute_single_segment_head_loss para muchos caudales.
+    Vectorized version of compute_single_segment_head_loss for many flow rates.
+
+    La validación se hace una sola vez sobre todo el lote y los resultados se
+    devuelven como columnas NumPy (una entrada por caudal), útil para construir
+    curvas del sistema hf(Q).
+
+    Validation is done once for the whole batch and results are returned as
+    NumPy columns (one entry per flow rate), handy for building system
+    curves hf(Q).
+
+    Parameters
+    ----------
+    q_m3s : array_like
+        Caudales volumétricos [m³/s] / Volumetric flow rates [m³/s].
+    segment : PipeSegment
+        Tramo de tubería / Pipe segment definition.
+    rho : array_like
+        Densidad [kg/m³], escalar o un valor por caudal.
+        Density [kg/m³], scalar or one value per flow rate.
+    mu : array_like
+        Viscosidad dinámica [Pa·s], escalar o un valor por caudal.
+        Dynamic viscosity [Pa·s], scalar or one value per flow rate.
+    g : float
+        Aceleración de la gravedad [m/s²] / Gravity acceleration [m/s²].
+    method : CorrelationMethod, optional
+        Método de correlación para f / Correlation method for f.
+
+    Returns
+    -------
+    Dict[str, numpy.ndarray]
+        Mismas claves que compute_single_segment_head_loss, pero con arrays;
+        ``regime`` se reemplaza por ``regime_code`` (ver REGIME_NAMES).
+        Same keys as compute_single_segment_head_loss, but with arrays;
+        ``regime`` is replaced by ``regime_code`` (see REGIME_NAMES).
+    """
+    q = np.asarray(q_m3s, dtype=float)
+    rho_arr = np.asarray(rho, dtype=float)
+    mu_arr = np.asarray(mu, dtype=float)
+
+    if np.any(~(q > 0)):
+        raise ValueError(
+            "Flow rate must be > 0 (el caudal debe ser > 0)."
+        )
+    if np.any(~(rho_arr > 0)) or np.any(~(mu_arr > 0)):
+        raise ValueError(
+            "rho and mu must be > 0 (rho y mu deben ser > 0)."
+        )
+    if g <= 0:
+        raise ValueError(
+            "g must be > 0 (g debe ser > 0)."
+        )
+
+    L = segment.length_m
+    D = segment.diameter_m
+    eps = segment.roughness_m
+
+    area_m2 = compute_area(D)
+    velocity_ms = q / area_m2
+    reynolds = (rho_arr * velocity_ms * D) / mu_arr
+    f = friction_factor_array(reynolds, D, eps, method=method)
+    regime_code = classify_regime_array(reynolds)
+
+    head_velocity = (velocity_ms ** 2) / (2.0 * g)
+    hf_m = f * (L / D) * head_velocity
+
+    delta_p_pa = rho_arr * g * hf_m
+    delta_p_bar = delta_p_pa / 1.0e5
+
+    return {
+        "area_m2": np.full(reynolds.shape, area_m2),
+        "velocity_ms": np.broadcast_to(velocity_ms, reynolds.shape).copy(),
+        "reynolds": reynolds,
+        "regime_code": regime_code,
+        "friction_factor": f,
+        "hf_m": hf_m,
+        "delta_p_pa": delta_p_pa,
+        "delta_p_bar": delta_p_bar,
+    }
+
+
 def compute_series_head_loss(
     q_m3s: float,
     segments: List[PipeSegment],
@@ -271,3 +458,79 @@ def compute_series_head_loss(
         "delta_p_total_pa": total_dp_pa,
         "delta_p_total_bar": delta_p_total_bar,
     }
+
+
+def _series_head_loss_chunk(
+    q_chunk: List[float],
+    segments: List[PipeSegment],
+    rho: float,
+    mu: float,
+    g: float,
+    method: CorrelationMethod,
+) -> List[Dict[str, object]]:
+    """
+    compute_series_head_loss para un bloque de caudales (proceso hijo).
+    compute_series_head_loss for a chunk of flow rates (child process).
+    """
+    return [
+        compute_series_head_loss(q, segments, rho=rho, mu=mu, g=g, method=method)
+        for q in q_chunk
+    ]
+
+
+def compute_series_head_loss_many(
+    q_values: Iterable[float],
+    segments: List[PipeSegment],
+    rho: float,
+    mu: float,
+    g: float,
+    method: CorrelationMethod = "haaland",
+    workers: Optional[int] = 1,
+    chunk_size: int = 256,
+) -> List[Dict[str, object]]:
+    """
+    compute_series_head_loss para muchos caudales, repartido opcionalmente
+    en varios procesos.
+
+    compute_series_head_loss for many flow rates, optionally sharded across
+    several processes.
+
+    Parameters
+    ----------
+    q_values : Iterable[float]
+        Caudales volumétricos [m³/s] / Volumetric flow rates [m³/s].
+    segments : List[PipeSegment]
+        Tramos en serie / Pipe segments in series.
+    rho, mu, g : float
+        Densidad, viscosidad dinámica y gravedad / Density, viscosity and gravity.
+    method : CorrelationMethod, optional
+        Método de correlación para f / Correlation method for f.
+    workers : int, optional
+        Procesos (1 = secuencial, None/0 = todos los CPU).
+        Processes (1 = sequential, None/0 = all CPUs).
+    chunk_size : int, optional
+        Caudales por bloque enviado a cada proceso.
+        Flow rates per chunk sent to each process.
+
+    Returns
+    -------
+    List[Dict[str, object]]
+        Un resultado de compute_series_head_loss por caudal, en el orden de
+        entrada; idéntico para cualquier valor de workers/chunk_size.
+        One compute_series_head_loss result per flow rate, in input order;
+        identical for any workers/chunk_size.
+    """
+    if not segments:
+        raise ValueError(
+            "At least one pipe segment must be provided "
+            "(debe proporcionar al menos un tramo de tubería)."
+        )
+    func = partial(
+        _series_head_loss_chunk,
+        segments=list(segments),
+        rho=rho,
+        mu=mu,
+        g=g,
+        method=method,
+    )
+    return list(iter_chunked_map(func, q_values, workers=workers, chunk_size=chunk_size))
@@ -0,0 +1,269 @@
+"""
+Solver de redes de tuberías (malladas o ramificadas).
+Pipe network solver (looped or branched).
+
+Método del gradiente global (Todini-Pilati): Newton-Raphson simultáneo sobre
+caudales en tuberías y alturas en nudos, con matrices dispersas. En cada
+iteración se resuelve un sistema simétrico sólo en las alturas,
+
+    (A21 D⁻¹ A12) ΔH = F2 - A21 D⁻¹ F1
+
+donde F1 es el balance de energía por tubería, F2 el balance de masa por nudo
+y D la derivada de la pérdida de carga respecto del caudal. El factor f se
+evalúa con las correlaciones vectorizadas de app.core.correlations.
+
+Global gradient method (Todini-Pilati): simultaneous Newton-Raphson on pipe
+flows and node heads, with sparse matrices. Each iteration solves a
+symmetric system in the heads only,
+
+    (A21 D⁻¹ A12) ΔH = F2 - A21 D⁻¹ F1
+
+where F1 is the energy balance per pipe, F2 the mass balance per node and D
+the derivative of the head loss with respect to flow. The friction factor f
+is evaluated with the vectorized correlations in app.core.correlations.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import spsolve
+
+from app.core.correlations import CorrelationMethod, RE_LAMINAR_MAX, friction_factor_array
+from app.geometry.pipe_network import PipeNetwork
+
+# Initial guess: mean velocity of 1 m/s in the start -> end direction.
+# Estimación inicial: velocidad media de 1 m/s en el sentido start -> end.
+_INITIAL_VELOCITY_MS = 1.0
+
+# Flow floor used to keep the head-loss derivative positive at Q = 0.
+# Piso de caudal para que la derivada de la pérdida sea positiva con Q = 0.
+_Q_FLOOR_M3S = 1.0e-12
+
+
+def _nodes_without_fixed_head(
+    n_nodes: int, start: np.ndarray, end: np.ndarray, fixed: np.ndarray
+) -> np.ndarray:
+    """
+    Índices de los nudos sin camino a un nudo de altura fija.
+    Indices of the nodes with no path to a fixed-head node.
+
+    Componentes conexas del grafo de la red (BFS sobre la incidencia); un
+    nudo cuya componente no tiene altura fija deja singular la matriz del
+    sistema en alturas.
+    Connected components of the network graph (BFS over the incidence); a
+    node whose component has no fixed head makes the head system singular.
+    """
+    graph = sp.coo_matrix(
+        (np.ones(start.size), (start, end)), shape=(n_nodes, n_nodes)
+    )
+    _, labels = connected_components(graph, directed=False)
+    anchored = np.unique(labels[fixed])
+    return np.flatnonzero(~np.isin(labels, anchored))
+
+
+@dataclass
+class NetworkSolution:
+    """
+    Resultado del solver de redes, en el orden de network.nodes / network.pipes.
+    Network solver result, in the order of network.nodes / network.pipes.
+    """
+
+    node_names: List[str]
+    pipe_names: List[str]
+    heads_m: np.ndarray             # altura piezométrica / hydraulic head [m]
+    pressure_heads_m: np.ndarray    # altura de presión H - z / pressure head [m]
+    flows_m3s: np.ndarray           # caudal start -> end / flow start -> end [m³/s]
+    velocities_ms: np.ndarray       # velocidad media / mean velocity [m/s]
+    reynolds: np.ndarray            # número de Reynolds / Reynolds number
+    friction_factors: np.ndarray    # factor f de Darcy / Darcy f
+    head_losses_m: np.ndarray       # pérdida fricción + local / friction + local loss [m]
+    iterations: int
+    residual_history: List[float]   # Σ|ΔQ| / Σ|Q| por iteración / per iteration
+    converged: bool
+    max_mass_residual_m3s: float
+    max_energy_residual_m: float
+
+    def head(self, node_name: str) -> float:
+        """Altura de un nudo [m] / Head of a node [m]."""
+        return float(self.heads_m[self.node_names.index(node_name)])
+
+    def flow(self, pipe_name: str) -> float:
+        """Caudal de una tubería [m³/s] / Flow of a pipe [m³/s]."""
+        return float(self.flows_m3s[self.pipe_names.index(pipe_name)])
+
+
+def solve_network(
+    network: PipeNetwork,
+    rho: float,
+    mu: float,
+    g: float,
+    method: CorrelationMethod = "haaland",
+    tol: float = 1.0e-8,
+    max_iter: int = 100,
+) -> NetworkSolution:
+    """
+    Resuelve caudales y alturas de una red con el método del gradiente global.
+    Solves flows and heads of a network with the global gradient method.
+
+    Parameters
+    ----------
+    network : PipeNetwork
+        Nudos, tuberías (PipeSegment) y coeficientes K.
+        Nodes, pipes (PipeSegment) and K coefficients.
+    rho : float
+        Densidad [kg/m³] / Density [kg/m³].
+    mu : float
+        Viscosidad dinámica [Pa·s] / Dynamic viscosity [Pa·s].
+    g : float
+        Aceleración de la gravedad [m/s²] / Gravity acceleration [m/s²].
+    method : CorrelationMethod, optional
+        Método de correlación para f / Correlation method for f.
+    tol : float, optional
+        Criterio Σ|ΔQ| / Σ|Q| < tol / Criterion Σ|ΔQ| / Σ|Q| < tol.
+    max_iter : int, optional
+        Máximo de iteraciones de Newton / Maximum Newton iterations.
+
+    Returns
+    -------
+    NetworkSolution
+        Alturas, caudales, iteraciones e historial de residuos.
+        Heads, flows, iterations and residual history.
+
+    Raises
+    ------
+    ValueError
+        Si algún nudo no está conectado a un nudo de altura fija.
+        If any node is not connected to a fixed-head node.
+    """
+    if rho <= 0 or mu <= 0:
+        raise ValueError(
+            "rho and mu must be > 0 (rho y mu deben ser > 0)."
+        )
+    if g <= 0:
+        raise ValueError(
+            "g must be > 0 (g debe ser > 0)."
+        )
+    if not network.pipes:
+        raise ValueError(
+            "The network has no pipes (la red no tiene tuberías)."
+        )
+
+    nodes = network.nodes
+    pipes = network.pipes
+    n_pipes = len(pipes)
+    nu = mu / rho
+
+    fixed = np.array([n.fixed_head_m is not None for n in nodes])
+    fixed_head = np.array([n.fixed_head_m if n.fixed_head_m is not None else 0.0 for n in nodes])
+    elevation = np.array([n.elevation_m for n in nodes])
+    demand = np.array([n.demand_m3s for n in nodes])
+
+    # Column of each unknown-head node in A12 (-1 for fixed-head nodes).
+    # Columna de cada nudo de altura desconocida en A12 (-1 si es fijo).
+    unknown = np.flatnonzero(~fixed)
+    col = np.full(len(nodes), -1, dtype=np.intp)
+    col[unknown] = np.arange(unknown.size)
+
+    start = np.array([network.node_index[p.start] for p in pipes], dtype=np.intp)
+    end = np.array([network.node_index[p.end] for p in pipes], dtype=np.intp)
+    L = np.array([p.segment.length_m for p in pipes])
+    D = np.array([p.segment.diameter_m for p in pipes])
+    eps = np.array([p.segment.roughness_m for p in pipes])
+    K = np.array([p.minor_loss_k for p in pipes])
+
+    orphans = _nodes_without_fixed_head(len(nodes), start, end, fixed)
+    if orphans.size:
+        names = ", ".join(nodes[i].name for i in orphans)
+        raise ValueError(
+            f"Nodes with no path to a fixed-head node: {names} "
+            f"(nudos sin camino a un nudo de altura fija: {names})."
+        )
+    area = math.pi * D ** 2 / 4.0
+
+    # Incidence matrix A12 (pipes x unknown nodes): -1 at start, +1 at end,
+    # so that h(Q) + A12 H + a0 = 0 is H_start - H_end = h(Q).
+    # Matriz de incidencia A12 (tuberías x nudos incógnita): -1 en start, +1 en end.
+    pipe_idx = np.arange(n_pipes)
+    s_mask = col[start] >= 0
+    e_mask = col[end] >= 0
+    A12 = sp.csr_matrix(
+        (
+            np.concatenate([-np.ones(s_mask.sum()), np.ones(e_mask.sum())]),
+            (
+                np.concatenate([pipe_idx[s_mask], pipe_idx[e_mask]]),
+                np.concatenate([col[start[s_mask]], col[end[e_mask]]]),
+            ),
+        ),
+        shape=(n_pipes, unknown.size),
+    )
+    A21 = A12.T.tocsr()
+    a0 = np.where(fixed[start], -fixed_head[start], 0.0) + np.where(fixed[end], fixed_head[end], 0.0)
+    d = demand[unknown]
+
+    Q = _INITIAL_VELOCITY_MS * area
+    H = np.full(unknown.size, fixed_head[fixed].mean())
+
+    def head_loss(Q: np.ndarray):
+        """Pérdida h(Q), derivada dh/dQ, Re y f / Loss h(Q), dh/dQ, Re and f."""
+        q_abs = np.maximum(np.abs(Q), _Q_FLOOR_M3S)
+        Re = q_abs / area * D / nu
+        f = friction_factor_array(Re, D, eps, method=method)
+        r = (f * L / D + K) / (2.0 * g * area ** 2)
+        # h ∝ Q² in turbulent flow, h ∝ Q in laminar flow.
+        # h ∝ Q² en turbulento, h ∝ Q en laminar.
+        exponent = np.where(Re < RE_LAMINAR_MAX, 1.0, 2.0)
+        return r * Q * q_abs, exponent * r * q_abs, Re, f
+
+    residual_history: List[float] = []
+    converged = False
+    iterations = 0
+
+    for iterations in range(1, max_iter + 1):
+        h, dh, _, _ = head_loss(Q)
+        F1 = h + A12 @ H + a0
+        F2 = A21 @ Q - d
+
+        inv_dh = 1.0 / dh
+        if unknown.size:
+            S = (A21 @ sp.diags(inv_dh) @ A12).tocsc()
+            dH = spsolve(S, F2 - A21 @ (inv_dh * F1))
+            dH = np.atleast_1d(dH)
+        else:
+            dH = np.zeros(0)
+        dQ = -(F1 + A12 @ dH) * inv_dh
+
+        Q = Q + dQ
+        H = H + dH
+
+        rel_change = float(np.abs(dQ).sum() / max(np.abs(Q).sum(), _Q_FLOOR_M3S))
+        residual_history.append(rel_change)
+        if rel_change < tol:
+            converged = True
+            break
+
+    h, _, Re, f = head_loss(Q)
+    heads = fixed_head.copy()
+    heads[unknown] = H
+    energy_residual = h - (heads[start] - heads[end])
+    mass_residual = A21 @ Q - d
+
+    return NetworkSolution(
+        node_names=[n.name for n in nodes],
+        pipe_names=[p.name for p in pipes],
+        heads_m=heads,
+        pressure_heads_m=heads - elevation,
+        flows_m3s=Q,
+        velocities_ms=Q / area,
+        reynolds=Re,
+        friction_factors=f,
+        head_losses_m=h,
+        iterations=iterations,
+        residual_history=residual_history,
+        converged=converged,
+        max_mass_residual_m3s=float(np.abs(mass_residual).max()) if mass_residual.size else 0.0,
+        max_energy_residual_m=float(np.abs(energy_residual).max()),
+    )
@@ -0,0 +1,103 @@
+"""
+Ejecución por bloques, opcionalmente en varios procesos.
+Chunked execution, optionally across several processes.
+
+Los elementos de entrada se agrupan en bloques de ``chunk_size``; cada bloque
+se procesa con una función de nivel de módulo (para que pueda enviarse a un
+proceso hijo) y los resultados se entregan en el mismo orden de la entrada,
+sin importar qué proceso termine primero. Sólo hay ``2 * workers`` bloques en
+vuelo a la vez, así que la memoria queda acotada aunque la entrada sea un
+flujo de millones de filas.
+
+Input items are grouped into chunks of ``chunk_size``; each chunk is processed
+with a module-level function (so it can be sent to a child process) and the
+results are yielded in input order, regardless of which process finishes
+first. Only ``2 * workers`` chunks are in flight at a time, so memory stays
+bounded even when the input is a stream of millions of rows.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+CHUNK_SIZE_DEFAULT: int = 2000
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """
+    Número efectivo de procesos: None o 0 = todos los CPU disponibles.
+    Effective number of processes: None or 0 = all available CPUs.
+    """
+    if workers is None or workers == 0:
+        return os.cpu_count() or 1
+    if workers < 0:
+        raise ValueError(
+            "workers must be >= 0 (workers debe ser >= 0)."
+        )
+    return workers
+
+
+def iter_chunks(items: Iterable[T], chunk_size: int) -> Iterator[List[T]]:
+    """
+    Agrupa un iterable en listas de hasta ``chunk_size`` elementos.
+    Groups an iterable into lists of up to ``chunk_size`` items.
+    """
+    if chunk_size < 1:
+        raise ValueError(
+            "chunk_size must be >= 1 (chunk_size debe ser >= 1)."
+        )
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_chunked_map(
+    func: Callable[[List[T]], List[R]],
+    items: Iterable[T],
+    workers: Optional[int] = 1,
+    chunk_size: int = CHUNK_SIZE_DEFAULT,
+) -> Iterator[R]:
+    """
+    Aplica ``func`` a bloques de ``items`` y entrega los resultados en orden.
+    Applies ``func`` to chunks of ``items`` and yields the results in order.
+
+    Parameters
+    ----------
+    func : callable
+        Función de nivel de módulo: lista de entradas -> lista de resultados.
+        Module-level function: list of inputs -> list of results.
+    items : iterable
+        Entradas (puede ser un generador) / Inputs (may be a generator).
+    workers : int, optional
+        1 = en el proceso actual; N > 1 = ProcessPoolExecutor con N procesos;
+        None o 0 = todos los CPU.
+        1 = in the current process; N > 1 = ProcessPoolExecutor with N
+        processes; None or 0 = all CPUs.
+    chunk_size : int, optional
+        Elementos por bloque / Items per chunk.
+    """
+    workers = resolve_workers(workers)
+    chunks = iter_chunks(items, chunk_size)
+
+    if workers == 1:
+        for chunk in chunks:
+            yield from func(chunk)
+        return
+
+    max_pending = 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(func, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
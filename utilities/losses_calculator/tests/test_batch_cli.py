@@ -0,0 +1,72 @@
+"""
+Tests for the batch mode of the CLI.
+
+Pruebas para el modo por lotes de la CLI.
+Verifica que los casos se calculen igual que en el asistente interactivo y
+que las filas inválidas se informen sin detener el lote.
+"""
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from app.cli.batch_cli import run_batch
+from app.core.constants import G_DEFAULT, MU_WATER_20C, RHO_WATER_20C
+from app.core.local_losses import get_elbow_k
+from app.geometry.pipe_geometries import PipeSegment
+from app.services.friction_service import compute_pipe_with_elbow_head_loss
+
+
+def test_batch_csv_to_jsonl(tmp_path: Path) -> None:
+    """
+    CSV input, JSON-lines output, one valid elbow case and one invalid row.
+    Entrada CSV, salida JSON-lines, un caso con codo válido y una fila inválida.
+    """
+    src = tmp_path / "cases.csv"
+    src.write_text(
+        "id,diameter_m,q_m3s,length_m,length2_m,elbow,method\n"
+        "ok,0.35,0.2886,7,7,elbow_90_LR,colebrook\n"
+        "bad,0.35,,7,,,\n",
+        encoding="utf-8",
+    )
+    out = tmp_path / "results.jsonl"
+
+    n_rows, n_errors = run_batch(str(src), str(out))
+
+    assert (n_rows, n_errors) == (2, 1)
+    rows = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert [r["id"] for r in rows] == ["ok", "bad"]
+    assert rows[1]["error"] and rows[1]["hf_total_m"] is None
+
+    expected = compute_pipe_with_elbow_head_loss(
+        q_m3s=0.2886,
+        segment=PipeSegment(length_m=14.0, diameter_m=0.35, roughness_m=1.0e-5),
+        elbow_k=get_elbow_k("elbow_90_LR"),
+        rho=RHO_WATER_20C,
+        mu=MU_WATER_20C,
+        g=G_DEFAULT,
+        method="colebrook",
+    )
+    assert rows[0]["hf_total_m"] == pytest.approx(expected["hf_total_m"], rel=1e-12)
+    assert rows[0]["delta_p_total_pa"] == pytest.approx(expected["delta_p_total_pa"], rel=1e-12)
+
+
+def test_batch_jsonl_to_csv(tmp_path: Path) -> None:
+    """
+    JSON-lines input with velocity instead of Q, CSV output.
+    Entrada JSON-lines con velocidad en vez de Q, salida CSV.
+    """
+    src = tmp_path / "cases.jsonl"
+    src.write_text(
+        json.dumps({"id": "v", "diameter_m": 0.1, "velocity_ms": 2.0, "length_m": 20}) + "\n",
+        encoding="utf-8",
+    )
+    out = tmp_path / "results.csv"
+
+    assert run_batch(str(src), str(out)) == (1, 0)
+    with out.open(encoding="utf-8", newline="") as fh:
+        (row,) = list(csv.DictReader(fh))
+    assert float(row["velocity_ms"]) == pytest.approx(2.0)
+    assert row["regime"] == "turbulento"
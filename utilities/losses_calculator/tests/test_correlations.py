@@ -0,0 +1,77 @@
+"""
+Tests for the correlations module.
+
+Pruebas para el módulo correlations.
+Verifica que las versiones vectorizadas y escalares del factor de fricción
+entreguen los mismos números.
+"""
+
+import numpy as np
+import pytest
+
+from app.core.constants import EPSILON_HDPE_DEFAULT
+from app.core.correlations import (
+    REGIME_NAMES,
+    classify_regime,
+    classify_regime_array,
+    friction_factor,
+    friction_factor_array,
+    solve_colebrook_array,
+)
+
+
+@pytest.mark.parametrize("method", ["blasius", "haaland", "colebrook"])
+def test_array_matches_scalar(method: str) -> None:
+    """
+    Array and scalar paths agree across laminar, transitional and turbulent Re.
+    Los caminos vectorizado y escalar coinciden en los tres regímenes.
+    """
+    Re = np.concatenate([np.logspace(2, 8, 200), [2000.0, 3000.0, 4000.0]])
+    diameter = np.linspace(0.02, 0.5, Re.size)
+
+    f_arr = friction_factor_array(Re, diameter, EPSILON_HDPE_DEFAULT, method=method)
+    f_scalar = [
+        friction_factor(r, d, EPSILON_HDPE_DEFAULT, method=method)
+        for r, d in zip(Re, diameter)
+    ]
+
+    assert f_arr.shape == Re.shape
+    assert f_arr.tolist() == f_scalar
+
+
+def test_regime_codes_match_labels() -> None:
+    """
+    Regime codes map back to the classify_regime labels.
+    Los códigos de régimen corresponden a las etiquetas de classify_regime.
+    """
+    Re = np.array([500.0, 2000.0, 4000.0, 4000.1, 1e6])
+    codes = classify_regime_array(Re)
+    assert [REGIME_NAMES[c] for c in codes] == [classify_regime(r) for r in Re]
+
+
+def test_array_rejects_non_positive_re() -> None:
+    """
+    A single invalid Re invalidates the whole batch.
+    Un solo Re inválido invalida todo el lote.
+    """
+    with pytest.raises(ValueError):
+        friction_factor_array([1e5, 0.0], 0.05, 0.0)
+
+
+def test_colebrook_satisfies_implicit_equation() -> None:
+    """
+    Colebrook solutions satisfy the implicit equation within a few iterations.
+    Las soluciones de Colebrook cumplen la ecuación implícita en pocas iteraciones.
+    """
+    Re = np.logspace(np.log10(4.0e3), 8, 50)[:, None]
+    eps_rel = np.array([0.0, 1.0e-5, 1.0e-3, 5.0e-2])[None, :]
+
+    f, iterations = solve_colebrook_array(Re, 1.0, eps_rel)
+
+    rhs = -2.0 * np.log10(eps_rel / 3.7 + 2.51 / (Re * np.sqrt(f)))
+    np.testing.assert_allclose(1.0 / np.sqrt(f), rhs, rtol=1e-12)
+    assert f.shape == iterations.shape == (50, 4)
+    assert iterations.max() <= 6
+    assert friction_factor(1.0e5, 1.0, 1.0e-4, method="colebrook") == pytest.approx(
+        0.01850, rel=1e-3
+    )
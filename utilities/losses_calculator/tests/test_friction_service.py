@@ -6,14 +6,23 @@ Verifica que el cálculo de pérdidas de carga en un solo tramo
 devuelva valores físicos razonables.
 """
 
+import numpy as np
+import pytest
+
 from app.core.constants import (
     RHO_WATER_20C,
     MU_WATER_20C,
     G_DEFAULT,
     EPSILON_HDPE_DEFAULT,
 )
+from app.core.correlations import REGIME_NAMES
 from app.geometry.pipe_geometries import PipeSegment
-from app.services.friction_service import compute_single_segment_head_loss
+from app.services.friction_service import (
+    compute_single_segment_head_loss,
+    compute_series_head_loss,
+    compute_series_head_loss_many,
+    compute_single_segment_head_loss_batch,
+)
 
 
 def test_single_segment_basic() -> None:
@@ -40,3 +49,52 @@ def test_single_segment_basic() -> None:
     assert res["hf_m"] > 0.0
     assert res["velocity_ms"] > 0.0
     assert res["reynolds"] > 0.0
+
+
+def test_batch_matches_single_segment() -> None:
+    """
+    The batch API reproduces the per-Q results of the scalar API.
+    La API por lotes reproduce los resultados por caudal de la API escalar.
+    """
+    seg = PipeSegment(length_m=100.0, diameter_m=0.1, roughness_m=EPSILON_HDPE_DEFAULT)
+    q = np.array([1.0e-5, 2.0e-4, 5.0e-3, 0.05])
+
+    batch = compute_single_segment_head_loss_batch(
+        q_m3s=q,
+        segment=seg,
+        rho=RHO_WATER_20C,
+        mu=MU_WATER_20C,
+        g=G_DEFAULT,
+    )
+
+    for i, qi in enumerate(q):
+        res = compute_single_segment_head_loss(
+            q_m3s=float(qi),
+            segment=seg,
+            rho=RHO_WATER_20C,
+            mu=MU_WATER_20C,
+            g=G_DEFAULT,
+        )
+        assert REGIME_NAMES[batch["regime_code"][i]] == res["regime"]
+        for key in ("velocity_ms", "reynolds", "friction_factor", "hf_m", "delta_p_pa"):
+            assert batch[key][i] == pytest.approx(res[key], rel=1e-12)
+
+
+def test_series_many_parallel_matches_sequential() -> None:
+    """
+    Sharding over processes preserves order and values.
+    Repartir en procesos conserva el orden y los valores.
+    """
+    segments = [
+        PipeSegment(length_m=50.0, diameter_m=0.2, roughness_m=EPSILON_HDPE_DEFAULT),
+        PipeSegment(length_m=30.0, diameter_m=0.15, roughness_m=0.0),
+    ]
+    q_values = list(np.linspace(0.001, 0.08, 25))
+    kwargs = dict(rho=RHO_WATER_20C, mu=MU_WATER_20C, g=G_DEFAULT)
+
+    parallel = compute_series_head_loss_many(
+        q_values, segments, workers=2, chunk_size=4, **kwargs
+    )
+    sequential = [compute_series_head_loss(q, segments, **kwargs) for q in q_values]
+
+    assert parallel == sequential
@@ -0,0 +1,103 @@
+"""
+Tests for the moody_table module.
+
+Pruebas para el módulo moody_table.
+Verifica que la tabla interpolada respete el error máximo informado.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from app.core.constants import MATERIAL_ROUGHNESS
+from app.core.correlations import friction_factor, friction_factor_array
+from app.core.moody_table import (
+    MOODY_TABLE_PATH_ENV,
+    MoodyTable,
+    build_moody_table,
+    load_or_build_moody_table,
+    get_default_table,
+    set_default_table,
+)
+
+
+def test_table_respects_reported_error(tmp_path: Path) -> None:
+    """
+    Random lookups stay within max_rel_error and survive a save/load cycle.
+    Consultas aleatorias respetan max_rel_error y sobreviven a guardar/cargar.
+    """
+    table = build_moody_table(source="colebrook", target_rel_error=5.0e-4)
+    assert table.max_rel_error <= 5.0e-4
+
+    loaded = MoodyTable.load(table.save(tmp_path / "moody.npz"))
+    assert loaded.source == "colebrook"
+    assert loaded.max_rel_error == table.max_rel_error
+
+    rng = np.random.default_rng(0)
+    Re = 10.0 ** rng.uniform(np.log10(4.0e3), 8.5, 20_000)
+    eps_rel = np.concatenate([[0.0], 10.0 ** rng.uniform(-9.0, -1.0, 19_999)])
+
+    exact = friction_factor_array(Re, 1.0, eps_rel, method="colebrook")
+    rel_err = np.abs(loaded.lookup(Re, eps_rel) / exact - 1.0)
+    assert rel_err.max() <= table.max_rel_error
+
+
+def test_error_bound_is_tight_and_drives_refinement(tmp_path: Path) -> None:
+    """
+    The bound covers a dense in-cell sweep without being vacuous, the grid
+    is refined until the bound meets the target, and files from the old
+    (sampled-error) format are rebuilt.
+    La cota cubre un barrido denso dentro de las celdas sin ser trivial, la
+    grilla se refina hasta que la cota cumple el objetivo, y los archivos del
+    formato viejo (error muestreado) se reconstruyen.
+    """
+    coarse = build_moody_table(source="haaland", points_per_decade=(10, 5))
+    fine = build_moody_table(
+        source="haaland", points_per_decade=(10, 5), target_rel_error=coarse.max_rel_error / 10
+    )
+    assert fine.max_rel_error <= coarse.max_rel_error / 10
+    assert fine.log_re.size > coarse.log_re.size
+
+    x = np.linspace(coarse.log_re[0], coarse.log_re[-1], 16 * (coarse.log_re.size - 1) + 1)
+    y = np.linspace(coarse.log_eps[0], coarse.log_eps[-1], 16 * (coarse.log_eps.size - 1) + 1)
+    Re, eps_rel = 10.0 ** x[:, None], 10.0 ** y[None, :]
+    exact = friction_factor_array(Re, 1.0, eps_rel, method="haaland")
+    observed = np.abs(coarse.lookup(Re, eps_rel) / exact - 1.0).max()
+    assert observed <= coarse.max_rel_error <= 3.0 * observed
+
+    path = tmp_path / "old.npz"
+    np.savez(path, log_re=coarse.log_re, log_eps=coarse.log_eps, log_f=coarse.log_f,
+             source=np.array("haaland"), max_rel_error=np.array(0.0))
+    rebuilt = load_or_build_moody_table(path, source="haaland")
+    assert rebuilt.max_rel_error > 0.0
+    assert MoodyTable.load(path).error_method.startswith("bound")
+
+
+def test_table_method_in_friction_factor(tmp_path: Path, monkeypatch) -> None:
+    """
+    method="table" tracks Colebrook for every catalogue material, and the
+    default table is built once and persisted.
+    method="table" sigue a Colebrook para cada material del catálogo, y la
+    tabla por defecto se construye una vez y se guarda.
+    """
+    path = tmp_path / "moody_default.npz"
+    monkeypatch.setenv(MOODY_TABLE_PATH_ENV, str(path))
+    set_default_table(None)
+    try:
+        for roughness in MATERIAL_ROUGHNESS.values():
+            for Re in (1.0e3, 3.0e3, 5.0e4, 2.0e6):
+                f_table = friction_factor(Re, 0.1, roughness, method="table")
+                f_colebrook = friction_factor(Re, 0.1, roughness, method="colebrook")
+                assert abs(f_table / f_colebrook - 1.0) < 1.0e-3
+
+        assert path.exists()
+        built = get_default_table()
+        assert built.source == "colebrook"
+
+        set_default_table(None)
+        reloaded = get_default_table()
+        assert reloaded is not built
+        np.testing.assert_array_equal(reloaded.log_f, built.log_f)
+        assert reloaded.error_method.startswith("bound")
+    finally:
+        set_default_table(None)
@@ -0,0 +1,159 @@
+"""
+Tests for the network_service module.
+
+Pruebas para el solver de redes: una tubería sola debe coincidir con
+compute_single_segment_head_loss, y una red mallada debe cumplir los
+balances de masa y energía.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from app.core.constants import (
+    RHO_WATER_20C,
+    MU_WATER_20C,
+    G_DEFAULT,
+    EPSILON_HDPE_DEFAULT,
+)
+from app.geometry.pipe_geometries import PipeSegment
+from app.geometry.pipe_network import NetworkNode, NetworkPipe, PipeNetwork
+from app.services.friction_service import compute_single_segment_head_loss
+from app.services.network_service import solve_network
+
+
+def _segment(length_m: float, diameter_m: float) -> PipeSegment:
+    """
+    Tramo de HDPE para las redes de prueba.
+    HDPE segment for the test networks.
+    """
+    return PipeSegment(
+        length_m=length_m,
+        diameter_m=diameter_m,
+        roughness_m=EPSILON_HDPE_DEFAULT,
+    )
+
+
+def test_single_pipe_matches_segment_head_loss() -> None:
+    """
+    Reservoir -> demand node through one pipe: the head drop equals the
+    single-segment Darcy-Weisbach loss at the demanded flow.
+    Estanque -> nudo de demanda por una tubería: la caída de altura es la
+    pérdida Darcy-Weisbach del tramo con el caudal demandado.
+    """
+    q = 0.05
+    seg = _segment(120.0, 0.2)
+    network = PipeNetwork(
+        nodes=[
+            NetworkNode("R", fixed_head_m=50.0),
+            NetworkNode("J", demand_m3s=q),
+        ],
+        pipes=[NetworkPipe("P1", "R", "J", seg)],
+    )
+    sol = solve_network(network, rho=RHO_WATER_20C, mu=MU_WATER_20C, g=G_DEFAULT)
+    ref = compute_single_segment_head_loss(
+        q_m3s=q, segment=seg, rho=RHO_WATER_20C, mu=MU_WATER_20C, g=G_DEFAULT
+    )
+
+    assert sol.converged
+    assert sol.flow("P1") == pytest.approx(q, rel=1e-10)
+    assert 50.0 - sol.head("J") == pytest.approx(ref["hf_m"], rel=1e-8)
+
+
+def test_looped_network_balances() -> None:
+    """
+    Two-loop network fed by one reservoir: mass is conserved at every node,
+    energy around each pipe closes, and the residual history decreases.
+    Red de dos mallas alimentada por un estanque: se conserva la masa en
+    cada nudo, cierra la energía en cada tubería y el residuo disminuye.
+    """
+    network = PipeNetwork(
+        nodes=[
+            NetworkNode("R", fixed_head_m=60.0),
+            NetworkNode("A", demand_m3s=0.02),
+            NetworkNode("B", demand_m3s=0.03),
+            NetworkNode("C", demand_m3s=0.015),
+            NetworkNode("D", demand_m3s=0.025),
+        ],
+        pipes=[
+            NetworkPipe("RA", "R", "A", _segment(300.0, 0.3), minor_loss_k=0.5),
+            NetworkPipe("AB", "A", "B", _segment(200.0, 0.2)),
+            NetworkPipe("AC", "A", "C", _segment(250.0, 0.2)),
+            NetworkPipe("BD", "B", "D", _segment(200.0, 0.15)),
+            NetworkPipe("CD", "C", "D", _segment(220.0, 0.15)),
+            NetworkPipe("BC", "B", "C", _segment(150.0, 0.1), minor_loss_k=1.2),
+        ],
+    )
+    sol = solve_network(network, rho=RHO_WATER_20C, mu=MU_WATER_20C, g=G_DEFAULT)
+
+    assert sol.converged
+    assert sol.iterations < 20
+    assert sol.max_mass_residual_m3s < 1e-12
+    assert sol.max_energy_residual_m < 1e-6
+    assert sol.flow("RA") == pytest.approx(0.09, rel=1e-10)
+    assert sol.residual_history[-1] < sol.residual_history[0]
+    assert np.all(sol.heads_m <= 60.0)
+
+
+def test_large_grid_solves_quickly() -> None:
+    """
+    A 60x60 looped grid (~7000 pipes) fed from one corner converges in a
+    handful of iterations and well under the time budget.
+    Una grilla mallada de 60x60 (~7000 tuberías) alimentada desde una
+    esquina converge en pocas iteraciones y dentro del tiempo previsto.
+    """
+    n = 60
+    nodes = [NetworkNode("R", fixed_head_m=100.0)]
+    pipes = [NetworkPipe("feed", "R", "n0_0", _segment(50.0, 1.0))]
+    for i in range(n):
+        for j in range(n):
+            nodes.append(NetworkNode(f"n{i}_{j}", demand_m3s=1.0e-4))
+            if i + 1 < n:
+                pipes.append(NetworkPipe(f"v{i}_{j}", f"n{i}_{j}", f"n{i + 1}_{j}", _segment(100.0, 0.3)))
+            if j + 1 < n:
+                pipes.append(NetworkPipe(f"h{i}_{j}", f"n{i}_{j}", f"n{i}_{j + 1}", _segment(100.0, 0.3)))
+
+    t0 = time.perf_counter()
+    sol = solve_network(PipeNetwork(nodes=nodes, pipes=pipes), rho=RHO_WATER_20C, mu=MU_WATER_20C, g=G_DEFAULT)
+    elapsed = time.perf_counter() - t0
+
+    assert sol.converged
+    assert sol.max_mass_residual_m3s < 1e-10
+    assert sol.flow("feed") == pytest.approx(n * n * 1.0e-4, rel=1e-8)
+    assert elapsed < 10.0
+
+
+def test_network_requires_fixed_head() -> None:
+    """
+    A network without any fixed-head node is rejected on construction.
+    Una red sin nudos de altura fija se rechaza al construirla.
+    """
+    with pytest.raises(ValueError):
+        PipeNetwork(
+            nodes=[NetworkNode("A"), NetworkNode("B", demand_m3s=0.01)],
+            pipes=[NetworkPipe("P", "A", "B", _segment(10.0, 0.1))],
+        )
+
+
+def test_disconnected_nodes_are_rejected() -> None:
+    """
+    Nodes with no path to a reservoir are named in a ValueError instead of
+    producing NaN heads.
+    Los nudos sin camino a un estanque se informan en un ValueError en vez
+    de dar alturas NaN.
+    """
+    network = PipeNetwork(
+        nodes=[
+            NetworkNode("R", fixed_head_m=50.0),
+            NetworkNode("A", demand_m3s=0.01),
+            NetworkNode("X", demand_m3s=0.01),
+            NetworkNode("Y"),
+        ],
+        pipes=[
+            NetworkPipe("RA", "R", "A", _segment(100.0, 0.2)),
+            NetworkPipe("XY", "X", "Y", _segment(100.0, 0.2)),
+        ],
+    )
+    with pytest.raises(ValueError, match="X, Y"):
+        solve_network(network, rho=RHO_WATER_20C, mu=MU_WATER_20C, g=G_DEFAULT)
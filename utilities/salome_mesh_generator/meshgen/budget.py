@@ -0,0 +1,100 @@
+"""
+Selección automática del nivel de malla para un presupuesto de celdas o de
+RAM del solver.
+
+En vez de elegir a mano entre coarse/medium/fine, se busca el nivel
+continuo x (interpolate_level_config: N_bulk, N_theta, capas, ...) más fino
+cuya estimación de celdas (estimator) cabe en el presupuesto.
+
+Los enteros redondeados no garantizan que las celdas crezcan con x, así que
+no se biseca sobre todo [0, LEVEL_X_MAX]: primero se recorre una grilla de
+paso SCAN_STEP y se toma el mayor x de la grilla que cabe; la bisección sólo
+refina entre ese punto y el siguiente de la grilla. El resultado siempre
+cabe; si las celdas no fueran monótonas dentro de un paso, puede haber un x
+algo mayor que también quepa.
+"""
+
+import math
+from dataclasses import replace
+from typing import Optional
+
+from .calculator import GeometryInput, MeshRecommendations, compute_mesh_recommendations
+from .config import LEVEL_X_MAX, interpolate_level_config
+
+SCAN_STEP = 0.25
+BISECTION_TOL = 1e-3
+BISECTION_MAX_ITER = 60
+
+
+def _fits(rec: MeshRecommendations, max_cells: Optional[float], max_ram_gb: Optional[float]) -> bool:
+    est = rec.cell_estimate
+    if max_cells is not None and est.cells_total > max_cells:
+        return False
+    if max_ram_gb is not None and est.solver_ram_gb > max_ram_gb:
+        return False
+    return True
+
+
+def _evaluate(geom: GeometryInput, x: float) -> MeshRecommendations:
+    cfg = interpolate_level_config(x)
+    return compute_mesh_recommendations(replace(geom, level=cfg.name), level_config=cfg)
+
+
+def recommend_for_budget(
+    geom: GeometryInput,
+    max_cells: Optional[float] = None,
+    max_ram_gb: Optional[float] = None,
+    tol: float = BISECTION_TOL,
+) -> MeshRecommendations:
+    """
+    Recomendación más fina (mayor x en [0, LEVEL_X_MAX]) que cumple
+    max_cells y/o max_ram_gb. geom.level se ignora.
+
+    Raises ValueError si ni siquiera coarse (x = 0) cabe.
+    """
+    if max_cells is None and max_ram_gb is None:
+        raise ValueError("Se necesita un presupuesto: max_cells o max_ram_gb.")
+
+    lo_rec = _evaluate(geom, 0.0)
+    if not _fits(lo_rec, max_cells, max_ram_gb):
+        raise ValueError(
+            f"Ni el nivel coarse cabe en el presupuesto "
+            f"(≈{lo_rec.cell_estimate.cells_total} celdas, "
+            f"{lo_rec.cell_estimate.solver_ram_gb:.3g} GB)."
+        )
+    # Mayor x de la grilla que cabe (sin suponer monotonía) y el siguiente
+    n_steps = int(math.ceil(LEVEL_X_MAX / SCAN_STEP - 1e-9))
+    grid = [min(k * SCAN_STEP, LEVEL_X_MAX) for k in range(n_steps + 1)]
+    best, x_best = lo_rec, 0.0
+    for x in grid[1:]:
+        rec = _evaluate(geom, x)
+        if _fits(rec, max_cells, max_ram_gb):
+            best, x_best = rec, x
+
+    if x_best < LEVEL_X_MAX:
+        # Invariante: lo cabe, hi no
+        lo = x_best
+        hi = grid[grid.index(x_best) + 1]
+        for _ in range(BISECTION_MAX_ITER):
+            if hi - lo <= tol:
+                break
+            mid = 0.5 * (lo + hi)
+            rec = _evaluate(geom, mid)
+            if _fits(rec, max_cells, max_ram_gb):
+                lo, best, x_best = mid, rec, mid
+            else:
+                hi = mid
+
+    budget = []
+    if max_cells is not None:
+        budget.append(f"{max_cells:.6g} celdas")
+    if max_ram_gb is not None:
+        budget.append(f"{max_ram_gb:.6g} GB")
+    best.notes.insert(
+        0,
+        f"Level chosen for budget ({', '.join(budget)}): x = {x_best:.3f} "
+        f"(coarse = 0, medium = 1, fine = 2), "
+        f"estimated cells = {best.cell_estimate.cells_total}, "
+        f"RAM ≈ {best.cell_estimate.solver_ram_gb:.3g} GB.",
+    )
+    return best
@@ -1,13 +1,15 @@
 import math
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from .config import (
     get_level_config,
     get_algorithm_config,
+    get_solver_config,
     LevelConfig,
     AlgorithmConfig,
 )
+from .estimator import CellCountEstimate, estimate_cell_count
 
 
 @dataclass
@@ -106,6 +108,7 @@ class MeshRecommendations:
     segments_1d: OneDParams
     viscous_layers: ViscousLayerParams
     netgen_arguments: NetgenArgumentsParams
+    cell_estimate: CellCountEstimate
     notes: List[str]
 
     def to_dict(self) -> Dict[str, Any]:
@@ -113,6 +116,18 @@ class MeshRecommendations:
         return asdict(self)
 
 
+def viscous_layer_params(cfg: LevelConfig, D: float) -> ViscousLayerParams:
+    """
+    Capa viscosa del nivel: espesor total proporcional a D.
+    Viscous layer of a level: total thickness proportional to D.
+    """
+    return ViscousLayerParams(
+        total_thickness=cfg.viscous_total_thickness_factor * D,
+        number_of_layers=cfg.viscous_layers,
+        stretch_factor=cfg.viscous_stretch,
+    )
+
+
 def _validate_geometry(g: GeometryInput) -> None:
     """Basic geometry validation."""
     if g.D <= 0:
@@ -125,14 +140,20 @@ def _validate_geometry(g: GeometryInput) -> None:
         raise ValueError("L_in and L_out cannot be negative.")
 
 
-def compute_mesh_recommendations(geom: GeometryInput) -> MeshRecommendations:
+def compute_mesh_recommendations(
+    geom: GeometryInput,
+    level_config: Optional[LevelConfig] = None,
+) -> MeshRecommendations:
     """
     Compute recommended mesh parameters for Salome/NETGEN
     from geometry and mesh level.
+
+    level_config overrides the named level in geom.level (e.g. an
+    interpolated level from interpolate_level_config).
     """
     _validate_geometry(geom)
 
-    cfg: LevelConfig = get_level_config(geom.level)
+    cfg: LevelConfig = level_config or get_level_config(geom.level)
     algo_cfg: AlgorithmConfig = get_algorithm_config()
     notes: List[str] = []
 
@@ -219,12 +240,7 @@ def compute_mesh_recommendations(geom: GeometryInput) -> MeshRecommendations:
     )
 
     # --- Viscous layer ---
-    total_thickness = cfg.viscous_total_thickness_factor * geom.D
-    viscous = ViscousLayerParams(
-        total_thickness=total_thickness,
-        number_of_layers=cfg.viscous_layers,
-        stretch_factor=cfg.viscous_stretch,
-    )
+    viscous = viscous_layer_params(cfg, geom.D)
 
     # --- Local sizes ---
     local = LocalSizeParams(
@@ -254,6 +270,20 @@ def compute_mesh_recommendations(geom: GeometryInput) -> MeshRecommendations:
         alternative_1d_algorithm=algo_cfg.alt_1d_algorithm,
     )
 
+    # --- Estimated mesh size and solver cost ---
+    cell_estimate = estimate_cell_count(
+        D=geom.D,
+        L_in=geom.L_in,
+        L_out=geom.L_out,
+        R=geom.R,
+        theta_deg=geom.theta_deg,
+        s_wall_straight=s_wall_straight,
+        s_wall_elbow=s_wall_elbow,
+        max_size=max_size,
+        viscous_layers=cfg.viscous_layers,
+        solver=get_solver_config(),
+    )
+
     notes.append(
         "Reminder: 'Nb. Segs per Edge' and 'Nb. Segs per Radius' only take effect if "
         "'Limit Size by Surface Curvature' is enabled in the NETGEN hypothesis."
@@ -272,5 +302,6 @@ def compute_mesh_recommendations(geom: GeometryInput) -> MeshRecommendations:
         segments_1d=segments,
         viscous_layers=viscous,
         netgen_arguments=netgen_args,
+        cell_estimate=cell_estimate,
         notes=notes,
     )
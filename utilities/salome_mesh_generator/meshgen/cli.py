@@ -8,6 +8,8 @@ from .calculator import (
     compute_mesh_recommendations,
     MeshRecommendations,
 )
+from .budget import recommend_for_budget
+from .estimator import calibration_report
 
 
 def _fmt_float(x: float) -> str:
@@ -104,6 +106,18 @@ def print_human_readable(rec: MeshRecommendations) -> None:
     print(f"  Stretch factor   = { _fmt_float(rec.viscous_layers.stretch_factor) }")
     print()
 
+    est = rec.cell_estimate
+    print("Estimación de tamaño de malla (antes de mallar):")
+    print(f"  Caras de pared       = {est.wall_faces_straight} (rectos) + {est.wall_faces_elbow} (codo)")
+    print(f"  Celdas tramos rectos = {est.cells_straight}")
+    print(f"  Celdas codo          = {est.cells_elbow}")
+    print(f"  Celdas capa viscosa  = {est.cells_viscous}")
+    print(f"  Celdas totales       ≈ {est.cells_total}")
+    print(f"  RAM del solver       ≈ { _fmt_float(est.solver_ram_gb) }  [GB]")
+    print(f"  Costo por iteración  ≈ { _fmt_float(est.seconds_per_iteration) }  [s en 1 núcleo]"
+          f"  ({est.work_per_iteration:.3g} barridos-celda)")
+    print()
+
     if rec.notes:
         print("Notas:")
         for note in rec.notes:
@@ -111,6 +125,24 @@ def print_human_readable(rec: MeshRecommendations) -> None:
         print()
 
 
+def print_calibration() -> None:
+    """Predicción del estimador vs celdas reales de las mallas de cases/base."""
+    print("Calibración del estimador de celdas (mallas de cases/base):")
+    print(f"  {'caso':<14} {'nivel':<7} {'capas':>7} {'celdas':>9} {'estimadas':>10} {'error %':>8}"
+          f" {'LOO %':>7} {'caras %':>8} {'tets %':>7} {'prismas %':>9}")
+    for row in calibration_report():
+        layers = f"{row['layers_mesh']}/{row['layers_level']}"
+        print(
+            f"  {row['case']:<14} {row['level']:<7} {layers:>7} {row['n_cells']:>9d} "
+            f"{row['predicted_cells']:>10d} {row['error_pct']:>8.2f} {row['loo_error_pct']:>7.2f} "
+            f"{row['error_wall_faces_pct']:>8.2f} {row['error_tets_pct']:>7.2f} "
+            f"{row['error_prisms_pct']:>9.2f}"
+        )
+    print("  (capas: malla/nivel, se estima con las de la malla; "
+          "LOO: coeficientes ajustados sin esa malla, error fuera de muestra)")
+    print()
+
+
 # ===========================
 #  MODO INTERACTIVO
 # ===========================
@@ -338,6 +370,21 @@ def parse_args(argv: Any = None) -> argparse.Namespace:
         default="medium",
         help="Nivel de malla: coarse / medium / fine (por defecto: medium)."
     )
+    parser.add_argument(
+        "--max-cells",
+        type=float,
+        help="Presupuesto de celdas: elige el nivel continuo más fino que cabe (ignora --level).",
+    )
+    parser.add_argument(
+        "--max-ram-gb",
+        type=float,
+        help="Presupuesto de RAM del solver [GB]: idem --max-cells.",
+    )
+    parser.add_argument(
+        "--calibration",
+        action="store_true",
+        help="Muestra el error del estimador de celdas contra las mallas de cases/base y sale.",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -349,6 +396,10 @@ def parse_args(argv: Any = None) -> argparse.Namespace:
 def main(argv: Any = None) -> None:
     args = parse_args(argv)
 
+    if args.calibration:
+        print_calibration()
+        return
+
     # Si está en modo interactivo, o no se ha pasado ningún parámetro geométrico,
     # lanzamos el asistente interactivo.
     if args.interactive or all(
@@ -381,7 +432,10 @@ def main(argv: Any = None) -> None:
     )
 
     try:
-        rec = compute_mesh_recommendations(geom)
+        if args.max_cells is not None or args.max_ram_gb is not None:
+            rec = recommend_for_budget(geom, max_cells=args.max_cells, max_ram_gb=args.max_ram_gb)
+        else:
+            rec = compute_mesh_recommendations(geom)
     except ValueError as e:
         print(f"[ERROR] {e}", file=sys.stderr)
         sys.exit(1)
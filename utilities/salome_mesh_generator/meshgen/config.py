@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 
 @dataclass(frozen=True)
@@ -32,6 +32,21 @@ class AlgorithmConfig:
     optimize: bool                      # marcar / desmarcar "Optimize"
 
 
+@dataclass(frozen=True)
+class SolverConfig:
+    # Setup del solver para estimar RAM y costo por iteración
+    # (system/fvSolution de los casos en cases/base)
+    name: str
+    n_non_orth_correctors: int          # nNonOrthogonalCorrectors (SIMPLE)
+    p_gamg_cycles: float                # ciclos V de GAMG por solución de p (tol 1e-7, relTol 0)
+    gamg_cycle_sweeps: float            # barridos-celda equivalentes por ciclo (sweeps + jerarquía)
+    n_smooth_equations: int             # Ux, Uy, Uz, k, omega con smoothSolver
+    smooth_sweeps: float                # barridos symGaussSeidel por ecuación (relTol 0.1)
+    assembly_sweeps: float              # ensamblado de matrices, gradientes, etc.
+    bytes_per_cell: float               # RAM del solver por celda (k-omega SST incompresible)
+    cell_sweeps_per_second: float       # rendimiento de 1 núcleo
+
+
 LEVEL_CONFIGS = {
     "coarse": LevelConfig(
         name="coarse",
@@ -81,6 +96,12 @@ LEVEL_CONFIGS = {
 }
 
 
+# Orden de los niveles en la escala continua x: coarse = 0, medium = 1, fine = 2.
+# Más allá de fine se extrapola con la pendiente medium -> fine hasta LEVEL_X_MAX.
+LEVEL_ORDER = ("coarse", "medium", "fine")
+LEVEL_X_MAX = 4.0
+
+
 ALGORITHM_CONFIG = AlgorithmConfig(
     # Para un codo 3D típico que va a OpenFOAM:
     main_3d_algorithm="NETGEN 1D-2D-3D",
@@ -99,6 +120,22 @@ ALGORITHM_CONFIG = AlgorithmConfig(
 )
 
 
+SOLVER_CONFIG = SolverConfig(
+    # incompressibleFluid + kOmegaSST con el fvSolution de cases/base:
+    # GAMG/DICGaussSeidel para p, smoothSolver/symGaussSeidel para U, k, omega.
+    # Valores de orden de magnitud (≈1.5 GB por millón de celdas).
+    name="SIMPLE GAMG(p) + smoothSolver(U, k, omega)",
+    n_non_orth_correctors=4,
+    p_gamg_cycles=8.0,
+    gamg_cycle_sweeps=4.0,
+    n_smooth_equations=5,
+    smooth_sweeps=4.0,
+    assembly_sweeps=10.0,
+    bytes_per_cell=1500.0,
+    cell_sweeps_per_second=3.0e7,
+)
+
+
 def get_level_config(name: str) -> LevelConfig:
     """
     Devuelve la configuración para un nivel de mallado dado.
@@ -114,8 +151,39 @@ def get_level_config(name: str) -> LevelConfig:
     return LEVEL_CONFIGS[key]
 
 
+def interpolate_level_config(x: float) -> LevelConfig:
+    """
+    Nivel continuo: interpola linealmente todos los parámetros entre
+    coarse (x=0), medium (x=1) y fine (x=2), y extrapola hasta LEVEL_X_MAX.
+    Los enteros se redondean, así que las celdas crecen a saltos con x y
+    la monotonía no está garantizada (budget no la supone).
+    """
+    if not 0.0 <= x <= LEVEL_X_MAX:
+        raise ValueError(f"Nivel continuo fuera de rango: x = {x} (0 a {LEVEL_X_MAX})")
+
+    i = min(int(x), len(LEVEL_ORDER) - 2)
+    lo = LEVEL_CONFIGS[LEVEL_ORDER[i]]
+    hi = LEVEL_CONFIGS[LEVEL_ORDER[i + 1]]
+    w = x - i
+    values = {}
+    for f in fields(LevelConfig):
+        if f.name == "name":
+            continue
+        a, b = getattr(lo, f.name), getattr(hi, f.name)
+        v = a + w * (b - a)
+        values[f.name] = int(round(v)) if isinstance(a, int) else v
+    return LevelConfig(name=f"x={x:.3f}", **values)
+
+
 def get_algorithm_config() -> AlgorithmConfig:
     """
     Devuelve la configuración general recomendada de algoritmos NETGEN.
     """
     return ALGORITHM_CONFIG
+
+
+def get_solver_config() -> SolverConfig:
+    """
+    Devuelve el setup de solver usado para estimar RAM y costo por iteración.
+    """
+    return SOLVER_CONFIG
@@ -0,0 +1,228 @@
+"""
+Estimación del tamaño de malla (celdas, RAM del solver y costo por
+iteración) antes de mallar en Salome.
+
+Modelo para una malla NETGEN de tetraedros con capas prismáticas:
+
+- Triángulos de pared por tramo: área de pared / área de un triángulo
+  equilátero de lado s_wall (s_wall_straight en rectos, s_wall_elbow en codo).
+- Prismas de la capa viscosa: triángulos de pared × número de capas.
+- Tetraedros del núcleo: C_VOLUME · V / h³, con h la media geométrica entre
+  el tamaño en la pared y Max Size (NETGEN crece desde la pared hacia el
+  centro con el growth rate).
+
+C_SURFACE y C_VOLUME se ajustan (fit_coefficients) por el mismo camino que
+usa la herramienta: los tamaños de compute_mesh_recommendations con la
+geometría y el nivel de cada malla de CALIBRATION_MESHES, comparando
+triángulos de pared y tetraedros con los conteos reales (media geométrica
+de los cocientes). Los prismas se calculan con las capas reales de cada
+malla: el nivel se infiere del tamaño de triángulo medido en su pared (no se
+guardó con qué parámetros se hicieron) y las capas del nivel no son las que
+se usaron.
+
+El ajuste es in-sample y con sólo dos mallas: calibration_report da el
+error con las constantes ajustadas con ambas mallas (~10 %, lo que difieren
+entre sí las densidades de triángulos de las dos mallas) y el error
+leave-one-out (constantes ajustadas con la otra malla, ~20 %), que es la
+referencia honesta para geometrías nuevas.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .config import SolverConfig
+
+SQRT3_4 = math.sqrt(3.0) / 4.0
+
+# Triángulos reales / triángulos equiláteros de lado s_wall (fit_coefficients)
+C_SURFACE = 0.649
+# Tetraedros · h³ / volumen (fit_coefficients)
+C_VOLUME = 1.924
+
+# Mallas de cases/base usadas para calibrar. Geometría aproximada a partir
+# de los puntos de constant/polyMesh; conteos exactos de owner/neighbour/boundary.
+# "level": nivel con N_bulk más cercano (en escala log) a D / h_pared medido
+# (elbow20D: D/h = 5.5 -> coarse; elbow20D45: D/h = 8.1 -> medium).
+CALIBRATION_MESHES: List[Dict[str, Any]] = [
+    {
+        "case": "elbow20D", "level": "coarse",
+        "D": 0.35, "L_in": 6.709, "L_out": 6.475, "R": 0.525, "theta_deg": 90.0,
+        "wall_faces": 8690, "layers": 5, "n_prisms": 43450, "n_tets": 16751, "n_cells": 60201,
+    },
+    {
+        "case": "elbow20D45", "level": "medium",
+        "D": 0.35, "L_in": 6.74, "L_out": 6.81, "R": 0.525, "theta_deg": 45.0,
+        "wall_faces": 18790, "layers": 8, "n_prisms": 150320, "n_tets": 54893, "n_cells": 205213,
+    },
+]
+
+
+@dataclass
+class CellCountEstimate:
+    """
+    Estimación de celdas, memoria y costo por iteración.
+    Estimated cell count, memory and cost per iteration.
+    """
+    wall_faces_straight: int
+    wall_faces_elbow: int
+    cells_straight: int          # tetraedros del núcleo en tramos rectos
+    cells_elbow: int             # tetraedros del núcleo en el codo
+    cells_viscous: int           # prismas de la capa viscosa
+    cells_total: int
+    solver_ram_gb: float
+    work_per_iteration: float    # barridos-celda por iteración SIMPLE
+    seconds_per_iteration: float  # en 1 núcleo (orden de magnitud)
+
+
+def _wall_faces(area: float, size: float, c_surface: float) -> float:
+    return c_surface * area / (SQRT3_4 * size ** 2) if area > 0 else 0.0
+
+
+def _core_cells(volume: float, wall_size: float, max_size: float, c_volume: float) -> float:
+    h = math.sqrt(wall_size * max_size)
+    return c_volume * volume / h ** 3 if volume > 0 else 0.0
+
+
+def solver_cost(n_cells: float, solver: SolverConfig) -> Dict[str, float]:
+    """RAM [GB], trabajo [barridos-celda] y segundos por iteración en 1 núcleo."""
+    p_work = (1 + solver.n_non_orth_correctors) * solver.p_gamg_cycles * solver.gamg_cycle_sweeps
+    smooth_work = solver.n_smooth_equations * solver.smooth_sweeps
+    work = n_cells * (p_work + smooth_work + solver.assembly_sweeps)
+    return {
+        "solver_ram_gb": n_cells * solver.bytes_per_cell / 1e9,
+        "work_per_iteration": work,
+        "seconds_per_iteration": work / solver.cell_sweeps_per_second,
+    }
+
+
+def estimate_cell_count(
+    D: float,
+    L_in: float,
+    L_out: float,
+    R: float,
+    theta_deg: float,
+    s_wall_straight: float,
+    s_wall_elbow: float,
+    max_size: float,
+    viscous_layers: int,
+    solver: SolverConfig,
+    c_surface: Optional[float] = None,
+    c_volume: Optional[float] = None,
+) -> CellCountEstimate:
+    """
+    Estimación de celdas por tramo a partir de los tamaños recomendados.
+    c_surface/c_volume reemplazan a C_SURFACE/C_VOLUME (para calibrar).
+    """
+    c_surface = C_SURFACE if c_surface is None else c_surface
+    c_volume = C_VOLUME if c_volume is None else c_volume
+    L_straight = L_in + L_out
+    L_arc = math.radians(theta_deg) * R
+    section = math.pi * D ** 2 / 4.0
+
+    faces_straight = _wall_faces(math.pi * D * L_straight, s_wall_straight, c_surface)
+    faces_elbow = _wall_faces(math.pi * D * L_arc, s_wall_elbow, c_surface)
+    cells_straight = _core_cells(section * L_straight, s_wall_straight, max_size, c_volume)
+    cells_elbow = _core_cells(section * L_arc, s_wall_elbow, max_size, c_volume)
+    cells_viscous = (faces_straight + faces_elbow) * viscous_layers
+    total = cells_straight + cells_elbow + cells_viscous
+
+    cost = solver_cost(total, solver)
+    return CellCountEstimate(
+        wall_faces_straight=int(round(faces_straight)),
+        wall_faces_elbow=int(round(faces_elbow)),
+        cells_straight=int(round(cells_straight)),
+        cells_elbow=int(round(cells_elbow)),
+        cells_viscous=int(round(cells_viscous)),
+        cells_total=int(round(total)),
+        **cost,
+    )
+
+
+def _calibration_recommendation(m: Dict[str, Any]) -> Any:
+    """compute_mesh_recommendations para la geometría y el nivel de una malla de calibración."""
+    # Import diferido: calculator importa este módulo
+    from .calculator import GeometryInput, compute_mesh_recommendations
+
+    return compute_mesh_recommendations(GeometryInput(
+        D=m["D"], L_in=m["L_in"], L_out=m["L_out"], R=m["R"],
+        theta_deg=m["theta_deg"], level=m["level"],
+    ))
+
+
+def _calibration_estimate(
+    m: Dict[str, Any],
+    c_surface: Optional[float] = None,
+    c_volume: Optional[float] = None,
+) -> CellCountEstimate:
+    """
+    Estimación con los tamaños de compute_mesh_recommendations y las capas
+    reales de una malla de calibración, con coeficientes opcionales.
+    """
+    from .config import get_solver_config
+
+    rec = _calibration_recommendation(m)
+    return estimate_cell_count(
+        D=m["D"], L_in=m["L_in"], L_out=m["L_out"], R=m["R"], theta_deg=m["theta_deg"],
+        s_wall_straight=rec.local_sizes.s_wall_straight,
+        s_wall_elbow=rec.local_sizes.s_wall_elbow,
+        max_size=rec.netgen_3d.max_size,
+        viscous_layers=m["layers"],
+        solver=get_solver_config(),
+        c_surface=c_surface,
+        c_volume=c_volume,
+    )
+
+
+def fit_coefficients(meshes: Sequence[Dict[str, Any]] = CALIBRATION_MESHES) -> Tuple[float, float]:
+    """
+    (C_SURFACE, C_VOLUME) que mejor reproducen (en escala log) los triángulos
+    de pared y los tetraedros de las mallas dadas, con compute_mesh_recommendations
+    en el nivel de cada una.
+    """
+    if not meshes:
+        raise ValueError("Hace falta al menos una malla para ajustar.")
+    log_s, log_v = [], []
+    for m in meshes:
+        raw = _calibration_estimate(m, c_surface=1.0, c_volume=1.0)
+        log_s.append(math.log(m["wall_faces"] / (raw.wall_faces_straight + raw.wall_faces_elbow)))
+        log_v.append(math.log(m["n_tets"] / (raw.cells_straight + raw.cells_elbow)))
+    return math.exp(sum(log_s) / len(log_s)), math.exp(sum(log_v) / len(log_v))
+
+
+def _pct(predicted: float, real: float) -> float:
+    return (predicted - real) / real * 100.0
+
+
+def calibration_report() -> List[Dict[str, Any]]:
+    """
+    Predicción de compute_mesh_recommendations vs conteo real para cada malla
+    de CALIBRATION_MESHES, en el nivel con que se malló y con sus capas
+    reales (layers_mesh; layers_level es lo que recomendaría el nivel):
+
+      - predicted_cells / error_pct: con C_SURFACE y C_VOLUME (in-sample)
+      - loo_predicted_cells / loo_error_pct: con coeficientes ajustados sin
+        esa malla (leave-one-out, fuera de muestra)
+      - error de triángulos de pared, tetraedros y prismas por separado
+    """
+    rows = []
+    for i, m in enumerate(CALIBRATION_MESHES):
+        est = _calibration_estimate(m)
+        others = CALIBRATION_MESHES[:i] + CALIBRATION_MESHES[i + 1:]
+        loo = _calibration_estimate(m, *fit_coefficients(others)) if others else est
+        faces = est.wall_faces_straight + est.wall_faces_elbow
+        rows.append({
+            "case": m["case"],
+            "level": m["level"],
+            "layers_mesh": m["layers"],
+            "layers_level": _calibration_recommendation(m).viscous_layers.number_of_layers,
+            "n_cells": m["n_cells"],
+            "predicted_cells": est.cells_total,
+            "error_pct": _pct(est.cells_total, m["n_cells"]),
+            "loo_predicted_cells": loo.cells_total,
+            "loo_error_pct": _pct(loo.cells_total, m["n_cells"]),
+            "error_wall_faces_pct": _pct(faces, m["wall_faces"]),
+            "error_tets_pct": _pct(est.cells_straight + est.cells_elbow, m["n_tets"]),
+            "error_prisms_pct": _pct(est.cells_viscous, m["n_prisms"]),
+        })
+    return rows
@@ -0,0 +1,246 @@
+"""
+Barrido de parámetros: recomendaciones de mallado para muchas combinaciones
+de D, R/D, θ y nivel en una sola corrida.
+
+La grilla sale de rangos en la línea de comandos o de un CSV, se evalúa con
+compute_mesh_recommendations y se escribe fila por fila (JSON-lines o CSV)
+a medida que se calcula, sin guardar todo en memoria. Con --max-cells /
+--max-ram-gb sólo se escriben los diseños que caben en el presupuesto.
+
+Uso:
+    python3 -m meshgen.sweep --D 0.1:0.5:5 --R-over-D 1,1.5,2 --theta 45,90 \\
+        --level coarse,medium,fine --max-cells 2e6 > sweep.jsonl
+    python3 -m meshgen.sweep --grid designs.csv --format csv --output sweep.csv
+
+Rangos: "a:b:n" (n valores equiespaciados de a a b) o lista "a,b,c".
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from .calculator import GeometryInput, MeshRecommendations, compute_mesh_recommendations
+from .config import LEVEL_CONFIGS
+
+# Columnas de la salida plana (CSV y JSON-lines por defecto)
+ROW_FIELDS = (
+    "D",
+    "L_in",
+    "L_out",
+    "R",
+    "R_over_D",
+    "theta_deg",
+    "level",
+    "max_size",
+    "min_size",
+    "growth_rate",
+    "s_bulk",
+    "s_elbow",
+    "s_theta",
+    "s_wall_elbow",
+    "N_in",
+    "N_out",
+    "N_arc",
+    "viscous_total_thickness",
+    "viscous_layers",
+    "cells_straight",
+    "cells_elbow",
+    "cells_viscous",
+    "cells_total",
+    "solver_ram_gb",
+    "seconds_per_iteration",
+)
+
+
+def parse_values(text: str) -> List[float]:
+    """
+    "a:b:n" -> n valores equiespaciados entre a y b (incluidos);
+    "a,b,c" -> lista; "a" -> [a].
+    """
+    text = text.strip()
+    if ":" in text:
+        parts = text.split(":")
+        if len(parts) != 3:
+            raise ValueError(f"Rango inválido '{text}'. Usa a:b:n")
+        start, stop, n = float(parts[0]), float(parts[1]), int(parts[2])
+        if n < 1:
+            raise ValueError(f"Rango inválido '{text}': n debe ser >= 1")
+        if n == 1:
+            return [start]
+        step = (stop - start) / (n - 1)
+        return [start + i * step for i in range(n)]
+    return [float(v) for v in text.split(",") if v.strip()]
+
+
+def parse_levels(text: str) -> List[str]:
+    levels = [v.strip().lower() for v in text.split(",") if v.strip()]
+    unknown = [v for v in levels if v not in LEVEL_CONFIGS]
+    if unknown:
+        valid = ", ".join(LEVEL_CONFIGS.keys())
+        raise ValueError(f"Nivel desconocido {', '.join(unknown)}. Usa uno de: {valid}")
+    return levels
+
+
+def grid_from_ranges(
+    D: Iterable[float],
+    r_over_d: Iterable[float],
+    theta_deg: Iterable[float],
+    levels: Iterable[str],
+    l_in_over_d: Iterable[float] = (20.0,),
+    l_out_over_d: Iterable[float] = (20.0,),
+) -> Iterator[GeometryInput]:
+    """Producto cartesiano de los rangos (largos y R en múltiplos de D)."""
+    for d, rd, th, lvl, lin, lout in itertools.product(
+        D, r_over_d, theta_deg, levels, l_in_over_d, l_out_over_d
+    ):
+        yield GeometryInput(D=d, L_in=lin * d, L_out=lout * d, R=rd * d, theta_deg=th, level=lvl)
+
+
+def grid_from_csv(stream: TextIO) -> Iterator[GeometryInput]:
+    """
+    Grilla desde un CSV con columnas D, theta_deg (o theta), level y
+    R o R_over_D; L_in/L_out (o L_in_over_D/L_out_over_D, por defecto 20·D).
+    """
+    for lineno, row in enumerate(csv.DictReader(stream), start=2):
+        try:
+            d = float(row["D"])
+            theta = float(row.get("theta_deg") or row["theta"])
+            if row.get("R"):
+                r = float(row["R"])
+            else:
+                r = float(row["R_over_D"]) * d
+            l_in = float(row["L_in"]) if row.get("L_in") else float(row.get("L_in_over_D") or 20.0) * d
+            l_out = float(row["L_out"]) if row.get("L_out") else float(row.get("L_out_over_D") or 20.0) * d
+            level = (row.get("level") or "medium").strip()
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Línea {lineno} del CSV inválida: {e}") from None
+        yield GeometryInput(D=d, L_in=l_in, L_out=l_out, R=r, theta_deg=theta, level=level)
+
+
+def flat_row(rec: MeshRecommendations) -> Dict[str, Any]:
+    """Recomendación como fila plana con las columnas de ROW_FIELDS."""
+    g = rec.geometry
+    est = rec.cell_estimate
+    return {
+        "D": g.D,
+        "L_in": g.L_in,
+        "L_out": g.L_out,
+        "R": g.R,
+        "R_over_D": g.R / g.D,
+        "theta_deg": g.theta_deg,
+        "level": rec.level,
+        "max_size": rec.netgen_3d.max_size,
+        "min_size": rec.netgen_3d.min_size,
+        "growth_rate": rec.netgen_3d.growth_rate,
+        "s_bulk": rec.local_sizes.s_bulk,
+        "s_elbow": rec.local_sizes.s_elbow,
+        "s_theta": rec.local_sizes.s_theta,
+        "s_wall_elbow": rec.local_sizes.s_wall_elbow,
+        "N_in": rec.segments_1d.N_in,
+        "N_out": rec.segments_1d.N_out,
+        "N_arc": rec.segments_1d.N_arc,
+        "viscous_total_thickness": rec.viscous_layers.total_thickness,
+        "viscous_layers": rec.viscous_layers.number_of_layers,
+        "cells_straight": est.cells_straight,
+        "cells_elbow": est.cells_elbow,
+        "cells_viscous": est.cells_viscous,
+        "cells_total": est.cells_total,
+        "solver_ram_gb": est.solver_ram_gb,
+        "seconds_per_iteration": est.seconds_per_iteration,
+    }
+
+
+def sweep(
+    geoms: Iterable[GeometryInput],
+    max_cells: Optional[float] = None,
+    max_ram_gb: Optional[float] = None,
+) -> Iterator[MeshRecommendations]:
+    """Recomendaciones de la grilla que cumplen las restricciones (perezoso)."""
+    for geom in geoms:
+        rec = compute_mesh_recommendations(geom)
+        est = rec.cell_estimate
+        if max_cells is not None and est.cells_total > max_cells:
+            continue
+        if max_ram_gb is not None and est.solver_ram_gb > max_ram_gb:
+            continue
+        yield rec
+
+
+def write_rows(recs: Iterable[MeshRecommendations], out: TextIO, fmt: str, full: bool = False) -> int:
+    """Escribe cada recomendación apenas se calcula. Devuelve cuántas filas."""
+    n = 0
+    writer = csv.DictWriter(out, fieldnames=ROW_FIELDS) if fmt == "csv" else None
+    if writer is not None:
+        writer.writeheader()
+    for rec in recs:
+        if writer is not None:
+            writer.writerow(flat_row(rec))
+        else:
+            out.write(json.dumps(rec.to_dict() if full else flat_row(rec)) + "\n")
+        n += 1
+    return n
+
+
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Barrido de recomendaciones de mallado sobre una grilla de D, R/D, "
+            "theta y nivel (salida JSON-lines o CSV)."
+        )
+    )
+    parser.add_argument("--grid", type=argparse.FileType("r", encoding="utf-8"),
+                        help="CSV con la grilla (columnas D, R o R_over_D, theta_deg, level, ...).")
+    parser.add_argument("--D", help="Diámetros [m]: a:b:n o a,b,c.")
+    parser.add_argument("--R-over-D", dest="R_over_D", default="1.5",
+                        help="R/D: a:b:n o a,b,c (por defecto: 1.5).")
+    parser.add_argument("--theta", default="90",
+                        help="Ángulos del codo [°]: a:b:n o a,b,c (por defecto: 90).")
+    parser.add_argument("--level", "-l", default="medium",
+                        help="Niveles separados por coma (por defecto: medium).")
+    parser.add_argument("--L-in-over-D", dest="L_in_over_D", default="20",
+                        help="Largo de entrada en diámetros (por defecto: 20).")
+    parser.add_argument("--L-out-over-D", dest="L_out_over_D", default="20",
+                        help="Largo de salida en diámetros (por defecto: 20).")
+    parser.add_argument("--max-cells", type=float,
+                        help="Descartar diseños con más celdas estimadas que esto.")
+    parser.add_argument("--max-ram-gb", type=float,
+                        help="Descartar diseños con más RAM estimada del solver [GB].")
+    parser.add_argument("--format", "-f", choices=("jsonl", "csv"), default="jsonl",
+                        help="Formato de salida (por defecto: jsonl).")
+    parser.add_argument("--full", action="store_true",
+                        help="Con jsonl: escribir la recomendación completa, no sólo la fila plana.")
+    parser.add_argument("--output", "-o", type=argparse.FileType("w", encoding="utf-8"), default=sys.stdout,
+                        help="Archivo de salida (por defecto: stdout).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Any = None) -> None:
+    args = parse_args(argv)
+    try:
+        if args.grid is not None:
+            geoms = grid_from_csv(args.grid)
+        elif args.D is not None:
+            geoms = grid_from_ranges(
+                D=parse_values(args.D),
+                r_over_d=parse_values(args.R_over_D),
+                theta_deg=parse_values(args.theta),
+                levels=parse_levels(args.level),
+                l_in_over_d=parse_values(args.L_in_over_D),
+                l_out_over_d=parse_values(args.L_out_over_D),
+            )
+        else:
+            print("Falta la grilla: usa --grid archivo.csv o --D a:b:n.", file=sys.stderr)
+            sys.exit(1)
+
+        n = write_rows(sweep(geoms, args.max_cells, args.max_ram_gb), args.output, args.format, args.full)
+    except ValueError as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Diseños escritos: {n}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Ajuste de la capa viscosa a partir del y+ medido en OpenFOAM.
+
+Con espesor total T, N capas y stretch r (ViscousLayerParams), la primera
+capa mide
+
+    y1 = T (r - 1) / (r^N - 1)        (T / N si r = 1)
+
+y a u_τ fijo y+ es proporcional a y1, así que para pasar del y+ medido al
+objetivo: y1' = y1 · y+_objetivo / y+_medido.
+
+Se conservan T (los prismas siguen cubriendo el mismo espesor) y r, y se
+recalcula N = ceil(log(1 + T (r - 1) / y1') / log r). Si N queda fuera de
+[1, MAX_LAYERS], se fija en el límite y se ajusta T para respetar y1'.
+
+Uso:
+    python3 -m meshgen.wall_treatment --D 0.35 --level medium --y-plus 540
+    python3 -m meshgen.wall_treatment --total-thickness 0.0175 --layers 10 \\
+        --stretch 1.2 --y-plus 0.6 --wall-treatment low_re --json
+"""
+
+import argparse
+import json
+import math
+import sys
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Dict, List, Tuple
+
+from .calculator import ViscousLayerParams, viscous_layer_params
+from .config import get_level_config
+
+MAX_LAYERS = 40
+
+# Rango válido y objetivo de y+ según el tratamiento de pared
+Y_PLUS_RANGES: Dict[str, Tuple[float, float]] = {
+    "wall_function": (30.0, 300.0),   # nutkWallFunction: zona logarítmica
+    "low_re": (0.0, 1.0),             # nutLowReWallFunction: subcapa viscosa resuelta
+}
+Y_PLUS_TARGETS: Dict[str, float] = {
+    "wall_function": 50.0,
+    "low_re": 1.0,
+}
+
+
+@dataclass
+class ViscousLayerUpdate:
+    """
+    Capa viscosa actual y la propuesta para llevar y+ al objetivo.
+    Current viscous layer and the proposed one to reach the target y+.
+    """
+    current: ViscousLayerParams
+    proposed: ViscousLayerParams
+    y_plus_measured: float
+    y_plus_target: float
+    first_layer_current: float
+    first_layer_required: float
+    first_layer_proposed: float
+    y_plus_predicted: float
+    notes: List[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def first_layer_thickness(vl: ViscousLayerParams) -> float:
+    """Espesor de la primera capa prismática [m]."""
+    r, n = vl.stretch_factor, vl.number_of_layers
+    if abs(r - 1.0) < 1e-12:
+        return vl.total_thickness / n
+    return vl.total_thickness * (r - 1.0) / (r ** n - 1.0)
+
+
+def layers_for_first_layer(
+    vl: ViscousLayerParams,
+    first_layer: float,
+    max_layers: int = MAX_LAYERS,
+) -> Tuple[ViscousLayerParams, List[str]]:
+    """
+    Capa viscosa con primera capa <= first_layer, conservando T y r si se
+    puede (ver docstring del módulo).
+    """
+    if first_layer <= 0:
+        raise ValueError("El espesor de la primera capa debe ser > 0.")
+    notes: List[str] = []
+    r, T = vl.stretch_factor, vl.total_thickness
+    if abs(r - 1.0) < 1e-12:
+        n = math.ceil(T / first_layer - 1e-9)
+    else:
+        n = math.ceil(math.log(1.0 + T * (r - 1.0) / first_layer) / math.log(r) - 1e-9)
+
+    if n > max_layers or n < 1:
+        n_raw, n = n, min(max(n, 1), max_layers)
+        growth = n if abs(r - 1.0) < 1e-12 else (r ** n - 1.0) / (r - 1.0)
+        T = first_layer * growth
+        notes.append(
+            f"Con el espesor total actual harían falta {n_raw} capas; "
+            f"se fija N = {n} y el espesor total pasa a {T:.4g} m."
+        )
+    return replace(vl, total_thickness=T, number_of_layers=n), notes
+
+
+def viscous_layers_for_yplus(
+    vl: ViscousLayerParams,
+    y_plus: float,
+    y_plus_target: float,
+    max_layers: int = MAX_LAYERS,
+) -> ViscousLayerUpdate:
+    """Propuesta de capa viscosa para pasar de y_plus (medido) a y_plus_target."""
+    if y_plus <= 0 or y_plus_target <= 0:
+        raise ValueError("y+ medido y objetivo deben ser > 0.")
+    y1 = first_layer_thickness(vl)
+    y1_required = y1 * y_plus_target / y_plus
+    proposed, notes = layers_for_first_layer(vl, y1_required, max_layers)
+    y1_proposed = first_layer_thickness(proposed)
+    return ViscousLayerUpdate(
+        current=vl,
+        proposed=proposed,
+        y_plus_measured=y_plus,
+        y_plus_target=y_plus_target,
+        first_layer_current=y1,
+        first_layer_required=y1_required,
+        first_layer_proposed=y1_proposed,
+        y_plus_predicted=y_plus * y1_proposed / y1,
+        notes=notes,
+    )
+
+
+def level_viscous_layers(D: float, level: str) -> ViscousLayerParams:
+    """Capa viscosa que recomienda compute_mesh_recommendations para D y nivel."""
+    return viscous_layer_params(get_level_config(level), D)
+
+
+def print_update(u: ViscousLayerUpdate) -> None:
+    cur, new = u.current, u.proposed
+    print(f"y+ medido / objetivo : {u.y_plus_measured:.4g} / {u.y_plus_target:.4g}")
+    print(f"Primera capa [m]     : {u.first_layer_current:.4g} -> {u.first_layer_proposed:.4g} "
+          f"(requerida {u.first_layer_required:.4g})")
+    print(f"y+ esperado          : {u.y_plus_predicted:.4g}")
+    print("Viscous Layers (para hipótesis 'Viscous Layers' en NETGEN 3D):")
+    print(f"  Total thickness  = {cur.total_thickness:.6g} -> {new.total_thickness:.6g}  [m]")
+    print(f"  Number of layers = {cur.number_of_layers} -> {new.number_of_layers}")
+    print(f"  Stretch factor   = {new.stretch_factor:.6g}")
+    for note in u.notes:
+        print(f"  - {note}")
+
+
+def parse_args(argv: Any = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Recalcula la capa viscosa (Viscous Layers) para llevar el y+ "
+            "medido en OpenFOAM al objetivo."
+        )
+    )
+    parser.add_argument("--y-plus", type=float, required=True,
+                        help="y+ medido (p.ej. la mediana en la pared).")
+    parser.add_argument("--wall-treatment", choices=sorted(Y_PLUS_TARGETS), default="wall_function",
+                        help="Tratamiento de pared: define el y+ objetivo por defecto.")
+    parser.add_argument("--target", type=float,
+                        help="y+ objetivo (por defecto: 50 con wall_function, 1 con low_re).")
+    parser.add_argument("--D", type=float, help="Diámetro [m], con --level para la capa actual.")
+    parser.add_argument("--level", "-l", default="medium",
+                        help="Nivel con el que se malló (por defecto: medium).")
+    parser.add_argument("--total-thickness", type=float, help="Espesor total actual [m] (en vez de --D/--level).")
+    parser.add_argument("--layers", type=int, help="Número de capas actual.")
+    parser.add_argument("--stretch", type=float, help="Stretch factor actual.")
+    parser.add_argument("--max-layers", type=int, default=MAX_LAYERS,
+                        help=f"Máximo de capas (por defecto: {MAX_LAYERS}).")
+    parser.add_argument("--json", action="store_true", help="Salida JSON.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Any = None) -> None:
+    args = parse_args(argv)
+    try:
+        if args.total_thickness is not None:
+            if args.layers is None or args.stretch is None:
+                raise ValueError("Con --total-thickness hacen falta --layers y --stretch.")
+            vl = ViscousLayerParams(args.total_thickness, args.layers, args.stretch)
+        elif args.D is not None:
+            vl = level_viscous_layers(args.D, args.level)
+        else:
+            raise ValueError("Indica la capa actual: --D y --level, o --total-thickness/--layers/--stretch.")
+        target = args.target or Y_PLUS_TARGETS[args.wall_treatment]
+        update = viscous_layers_for_yplus(vl, args.y_plus, target, args.max_layers)
+    except ValueError as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(update.to_dict(), indent=2))
+    else:
+        print_update(update)
+
+
+if __name__ == "__main__":
+    main()
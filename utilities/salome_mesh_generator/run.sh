@@ -4,9 +4,16 @@
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 cd "$SCRIPT_DIR"
 
-# Si no hay argumentos, entra en modo interactivo
+# Si no hay argumentos, entra en modo interactivo; "sweep" -> barrido de parámetros;
+# "wall" -> capa viscosa corregida a partir del y+ medido
 if [ $# -eq 0 ]; then
   exec python3 -m meshgen.cli --interactive
+elif [ "$1" = "sweep" ]; then
+  shift
+  exec python3 -m meshgen.sweep "$@"
+elif [ "$1" = "wall" ]; then
+  shift
+  exec python3 -m meshgen.wall_treatment "$@"
 else
   exec python3 -m meshgen.cli "$@"
 fi
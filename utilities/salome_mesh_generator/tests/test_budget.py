@@ -0,0 +1,103 @@
+"""
+Tests for the budget module and the continuous level scale.
+
+Pruebas para el módulo budget y la escala continua de niveles.
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from meshgen import budget
+from meshgen.budget import recommend_for_budget
+from meshgen.calculator import GeometryInput, compute_mesh_recommendations
+from meshgen.config import LEVEL_CONFIGS, LEVEL_ORDER, LEVEL_X_MAX, interpolate_level_config
+
+GEOM = GeometryInput(D=0.35, L_in=7.0, L_out=7.0, R=0.525, theta_deg=90.0, level="medium")
+
+
+def _cells(x: float) -> int:
+    """Estimated cells at continuous level x. / Celdas estimadas en el nivel x."""
+    cfg = interpolate_level_config(x)
+    return compute_mesh_recommendations(replace(GEOM, level=cfg.name), level_config=cfg).cell_estimate.cells_total
+
+
+@pytest.mark.parametrize("x, name", [(0.0, "coarse"), (1.0, "medium"), (2.0, "fine")])
+def test_integer_x_reproduces_named_levels(x: float, name: str) -> None:
+    """
+    x = 0, 1, 2 give exactly the coarse, medium and fine parameters and cells.
+    x = 0, 1, 2 dan exactamente los parámetros y celdas de coarse, medium y fine.
+    """
+    assert LEVEL_ORDER[int(x)] == name
+    assert replace(interpolate_level_config(x), name=name) == LEVEL_CONFIGS[name]
+    assert _cells(x) == compute_mesh_recommendations(replace(GEOM, level=name)).cell_estimate.cells_total
+
+
+def test_level_out_of_range_is_rejected() -> None:
+    """
+    x outside [0, LEVEL_X_MAX] raises ValueError.
+    x fuera de [0, LEVEL_X_MAX] lanza ValueError.
+    """
+    with pytest.raises(ValueError, match="fuera de rango"):
+        interpolate_level_config(-0.1)
+    with pytest.raises(ValueError, match="fuera de rango"):
+        interpolate_level_config(LEVEL_X_MAX + 0.1)
+
+
+def test_cells_do_not_decrease_with_x() -> None:
+    """
+    With rounded integers the cell count still grows with x for this geometry.
+    Con enteros redondeados las celdas siguen creciendo con x en esta geometría.
+    """
+    cells = [_cells(0.01 * k) for k in range(int(LEVEL_X_MAX * 100) + 1)]
+    assert all(b >= a for a, b in zip(cells, cells[1:]))
+
+
+def test_budget_picks_finest_fitting_level() -> None:
+    """
+    The result fits the budget and a slightly finer level does not.
+    El resultado cabe en el presupuesto y un nivel algo más fino no.
+    """
+    max_cells = 0.5 * (_cells(1.0) + _cells(2.0))
+    rec = recommend_for_budget(GEOM, max_cells=max_cells)
+    x = float(rec.level.split("=")[1])
+
+    assert 1.0 < x < 2.0
+    assert rec.cell_estimate.cells_total <= max_cells
+    assert _cells(min(x + 2 * budget.BISECTION_TOL, LEVEL_X_MAX)) > max_cells
+    assert "Level chosen for budget" in rec.notes[0]
+
+
+def test_budget_beyond_fine_returns_max_level() -> None:
+    """
+    A budget larger than LEVEL_X_MAX needs returns LEVEL_X_MAX.
+    Un presupuesto mayor que lo que pide LEVEL_X_MAX devuelve LEVEL_X_MAX.
+    """
+    rec = recommend_for_budget(GEOM, max_cells=10 * _cells(LEVEL_X_MAX))
+    assert rec.level == f"x={LEVEL_X_MAX:.3f}"
+
+
+def test_budget_does_not_assume_monotonic_cells(monkeypatch) -> None:
+    """
+    A fitting level past a non-fitting one is still found (scan before bisection).
+    Se encuentra un nivel que cabe después de uno que no (grilla antes de bisecar).
+    """
+    def fits(rec, max_cells, max_ram_gb):
+        x = float(rec.level.split("=")[1])
+        return x <= 0.5 or 2.0 <= x <= 2.6
+
+    monkeypatch.setattr(budget, "_fits", fits)
+    rec = recommend_for_budget(GEOM, max_cells=1.0)
+    x = float(rec.level.split("=")[1])
+    assert 2.5 <= x <= 2.6
+
+
+def test_budget_coarse_does_not_fit() -> None:
+    """
+    A budget below the coarse estimate raises ValueError.
+    Un presupuesto menor que la estimación de coarse lanza ValueError.
+    """
+    with pytest.raises(ValueError, match="Ni el nivel coarse cabe"):
+        recommend_for_budget(GEOM, max_cells=_cells(0.0) - 1)
+    with pytest.raises(ValueError, match="presupuesto"):
+        recommend_for_budget(GEOM)
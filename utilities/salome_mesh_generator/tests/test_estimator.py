@@ -0,0 +1,38 @@
+"""
+Tests for the estimator module.
+
+Pruebas para el módulo estimator.
+Acota el error de calibración contra las mallas de cases/base.
+"""
+
+import pytest
+
+from meshgen.estimator import C_SURFACE, C_VOLUME, calibration_report, fit_coefficients
+
+
+def test_constants_match_fit() -> None:
+    """
+    C_SURFACE and C_VOLUME are the in-sample fit on CALIBRATION_MESHES.
+    C_SURFACE y C_VOLUME son el ajuste in-sample sobre CALIBRATION_MESHES.
+    """
+    c_surface, c_volume = fit_coefficients()
+    assert C_SURFACE == pytest.approx(c_surface, rel=1e-3)
+    assert C_VOLUME == pytest.approx(c_volume, rel=1e-3)
+
+
+def test_calibration_error_is_bounded() -> None:
+    """
+    With each mesh's real layer count, in-sample and leave-one-out errors of
+    the total cell count stay within bounds, and prisms follow wall faces.
+    Con las capas reales de cada malla, los errores in-sample y leave-one-out
+    del total de celdas quedan acotados, y los prismas siguen a las caras.
+    """
+    rows = {row["case"]: row for row in calibration_report()}
+    assert set(rows) == {"elbow20D", "elbow20D45"}
+
+    for row in rows.values():
+        assert abs(row["error_pct"]) < 15.0
+        assert abs(row["loo_error_pct"]) < 25.0
+        assert abs(row["error_wall_faces_pct"]) < 15.0
+        assert abs(row["error_tets_pct"]) < 20.0
+        assert row["error_prisms_pct"] == pytest.approx(row["error_wall_faces_pct"], abs=0.1)
@@ -0,0 +1,91 @@
+"""
+Tests for the sweep module.
+
+Pruebas para el módulo sweep.
+"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from meshgen.sweep import (
+    ROW_FIELDS,
+    grid_from_csv,
+    grid_from_ranges,
+    main,
+    parse_levels,
+    parse_values,
+    sweep,
+    write_rows,
+)
+
+
+def test_parse_values() -> None:
+    """
+    Ranges "a:b:n" and lists "a,b,c" are expanded; bad ranges raise.
+    Se expanden rangos "a:b:n" y listas "a,b,c"; rangos inválidos lanzan.
+    """
+    assert parse_values("0.1:0.5:5") == pytest.approx([0.1, 0.2, 0.3, 0.4, 0.5])
+    assert parse_values("1,1.5, 2") == [1.0, 1.5, 2.0]
+    assert parse_values("3:9:1") == [3.0]
+    with pytest.raises(ValueError):
+        parse_values("1:2")
+    with pytest.raises(ValueError):
+        parse_values("1:2:0")
+    with pytest.raises(ValueError, match="Nivel desconocido"):
+        parse_levels("medium,ultra")
+
+
+def test_grid_from_ranges_and_csv() -> None:
+    """
+    The range grid is the cartesian product; the CSV accepts R or R_over_D.
+    La grilla de rangos es el producto cartesiano; el CSV acepta R o R_over_D.
+    """
+    grid = list(grid_from_ranges([0.1, 0.2], [1.5], [45.0, 90.0], ["coarse", "fine"]))
+    assert len(grid) == 8
+    assert grid[0].R == pytest.approx(0.15)
+    assert grid[0].L_in == pytest.approx(2.0)
+
+    text = "D,R,R_over_D,theta_deg,level\n0.2,0.5,,90,fine\n0.2,,2,45,\n"
+    rows = list(grid_from_csv(io.StringIO(text)))
+    assert [g.R for g in rows] == pytest.approx([0.5, 0.4])
+    assert [g.level for g in rows] == ["fine", "medium"]
+    assert rows[1].L_out == pytest.approx(4.0)
+
+    with pytest.raises(ValueError, match="Línea 2"):
+        list(grid_from_csv(io.StringIO("D,theta_deg\nx,90\n")))
+
+
+def test_sweep_filters_by_budget_and_writes_rows() -> None:
+    """
+    Only designs within max_cells are written, as CSV or JSON-lines.
+    Sólo se escriben los diseños dentro de max_cells, en CSV o JSON-lines.
+    """
+    grid = list(grid_from_ranges([0.1, 0.3], [1.5], [90.0], ["coarse", "fine"]))
+    all_cells = sorted(r.cell_estimate.cells_total for r in sweep(grid))
+    assert len(all_cells) == 4
+
+    limit = all_cells[1]
+    out = io.StringIO()
+    assert write_rows(sweep(grid, max_cells=limit), out, "csv") == 2
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert list(rows[0]) == list(ROW_FIELDS)
+    assert all(int(r["cells_total"]) <= limit for r in rows)
+
+    out = io.StringIO()
+    assert write_rows(sweep(grid), out, "jsonl") == 4
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [set(line) for line in lines] == [set(ROW_FIELDS)] * 4
+
+
+def test_main_without_grid_exits(capsys) -> None:
+    """
+    main() without --grid or --D reports the error and exits with 1.
+    main() sin --grid ni --D informa el error y sale con 1.
+    """
+    with pytest.raises(SystemExit) as exc:
+        main([])
+    assert exc.value.code == 1
+    assert "Falta la grilla" in capsys.readouterr().err
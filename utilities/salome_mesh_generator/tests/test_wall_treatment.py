@@ -0,0 +1,75 @@
+"""
+Tests for the wall_treatment module.
+
+Pruebas para el módulo wall_treatment.
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from meshgen.calculator import ViscousLayerParams
+from meshgen.wall_treatment import (
+    MAX_LAYERS,
+    first_layer_thickness,
+    layers_for_first_layer,
+    viscous_layers_for_yplus,
+)
+
+VL = ViscousLayerParams(total_thickness=0.0175, number_of_layers=10, stretch_factor=1.2)
+
+
+def test_first_layer_thickness() -> None:
+    """
+    Geometric series for r != 1 and T / N for r = 1.
+    Serie geométrica para r != 1 y T / N para r = 1.
+    """
+    assert first_layer_thickness(VL) == pytest.approx(0.0175 * 0.2 / (1.2 ** 10 - 1.0))
+    uniform = ViscousLayerParams(total_thickness=0.01, number_of_layers=4, stretch_factor=1.0)
+    assert first_layer_thickness(uniform) == pytest.approx(0.0025)
+
+
+def test_layers_keep_thickness_when_possible() -> None:
+    """
+    Within [1, MAX_LAYERS], T and r are kept and y1 <= the requested value.
+    Dentro de [1, MAX_LAYERS] se conservan T y r, y y1 <= el pedido.
+    """
+    y1 = 0.5 * first_layer_thickness(VL)
+    vl, notes = layers_for_first_layer(VL, y1)
+    assert notes == []
+    assert vl.total_thickness == VL.total_thickness
+    assert vl.stretch_factor == VL.stretch_factor
+    assert VL.number_of_layers < vl.number_of_layers <= MAX_LAYERS
+    assert first_layer_thickness(vl) <= y1 * (1 + 1e-9)
+    assert first_layer_thickness(replace(vl, number_of_layers=vl.number_of_layers - 1)) > y1
+
+    thick, notes = layers_for_first_layer(VL, 10.0 * VL.total_thickness)
+    assert (thick.number_of_layers, thick.total_thickness, notes) == (1, VL.total_thickness, [])
+
+
+@pytest.mark.parametrize("max_layers", [MAX_LAYERS, 12])
+def test_layers_are_clamped_and_thickness_adjusted(max_layers: int) -> None:
+    """
+    Above max_layers, N is clamped and T shrinks so y1 is exact.
+    Por encima de max_layers se fija N en el límite y T baja para respetar y1.
+    """
+    y1 = 1e-6 * VL.total_thickness
+    vl, notes = layers_for_first_layer(VL, y1, max_layers=max_layers)
+    assert vl.number_of_layers == max_layers
+    assert vl.total_thickness < VL.total_thickness
+    assert first_layer_thickness(vl) == pytest.approx(y1)
+    assert len(notes) == 1 and f"N = {max_layers}" in notes[0]
+
+
+def test_yplus_update_and_invalid_input() -> None:
+    """
+    Predicted y+ scales with y1 and non-positive y+ is rejected.
+    El y+ previsto escala con y1 y se rechaza y+ no positivo.
+    """
+    u = viscous_layers_for_yplus(VL, y_plus=540.0, y_plus_target=50.0)
+    assert u.y_plus_predicted <= 50.0 * (1 + 1e-9)
+    assert u.y_plus_predicted == pytest.approx(540.0 * u.first_layer_proposed / u.first_layer_current)
+    with pytest.raises(ValueError):
+        viscous_layers_for_yplus(VL, y_plus=0.0, y_plus_target=50.0)
+    with pytest.raises(ValueError):
+        layers_for_first_layer(VL, 0.0)